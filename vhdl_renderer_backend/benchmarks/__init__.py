@@ -0,0 +1 @@
+# 성능 측정 스크립트 (pytest 대상 아님)
@@ -0,0 +1,86 @@
+"""
+Architecture 추출 규모 벤치마크: signal/instance 수를 늘려 가며 파싱·추출 시간이 파일 크기에 선형인지 확인.
+최대 규모 = signal 10k, instance 2k (각 인스턴스 port map 4개 연결).
+사용: python -m vhdl_renderer_backend.benchmarks.arch_scaling [최대 signal 수] [최대 instance 수]
+"""
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    from vhdl_renderer_backend.core.arch_parser import extract_architectures_from_tree
+    from vhdl_renderer_backend.core.ast_parser import parse_to_tree
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.arch_parser import extract_architectures_from_tree
+    from core.ast_parser import parse_to_tree
+
+
+def synthetic_architecture(n_signals: int, n_instances: int) -> str:
+    """component 1개, signal n_signals 개, 인스턴스 n_instances 개(이름 지정 port map)짜리 VHDL 소스."""
+    lines = [
+        "library ieee;",
+        "use ieee.std_logic_1164.all;",
+        "entity big is",
+        "  port ( clk : in std_logic; rst : in std_logic );",
+        "end entity big;",
+        "architecture rtl of big is",
+        "  component cell is",
+        "    generic ( W : integer := 8 );",
+        "    port ( clk : in std_logic; d : in std_logic_vector(7 downto 0); q : out std_logic_vector(7 downto 0); en : in std_logic );",
+        "  end component;",
+    ]
+    n = max(1, n_signals)
+    for i in range(n_signals):
+        if i % 2:
+            lines.append(f"  signal s{i} : std_logic_vector(7 downto 0);")
+        else:
+            lines.append(f"  signal s{i} : std_logic;")
+    lines.append("begin")
+    for i in range(n_instances):
+        lines.append(
+            f"  u{i} : cell generic map ( W => 8 ) port map ( clk => clk, d => s{(2 * i + 1) % n}, "
+            f"q => s{(2 * i + 3) % n}, en => s{(2 * i) % n} );"
+        )
+    lines.append("end architecture rtl;")
+    return "\n".join(lines) + "\n"
+
+
+def measure(n_signals: int, n_instances: int, repeat: int = 3) -> Tuple[int, float, float, int, int]:
+    """(바이트 수, 파싱 초, 추출 초, 추출 signal 수, 추출 instance 수). 시간은 repeat 회 중 최솟값."""
+    source = synthetic_architecture(n_signals, n_instances).encode("utf-8")
+    parse_s = extract_s = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        tree = parse_to_tree(source)
+        parse_s = min(parse_s, time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        [arch] = extract_architectures_from_tree(tree, source)
+        extract_s = min(extract_s, time.perf_counter() - t0)
+    return len(source), parse_s, extract_s, len(arch.signals), len(arch.instances)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    max_signals = int(argv[0]) if argv else 10_000
+    max_instances = int(argv[1]) if len(argv) > 1 else 2_000
+    print(f"{'signals':>8} {'instances':>9} {'KB':>8} {'parse ms':>9} {'extract ms':>10} {'us/KB':>7}")
+    measure(100, 20, repeat=1)  # 워밍업 (Language/Parser 생성)
+    base = None
+    for frac in (1, 2, 4, 8):
+        n_sig, n_inst = max_signals * frac // 8, max_instances * frac // 8
+        size, parse_s, extract_s, got_sig, got_inst = measure(n_sig, n_inst)
+        assert (got_sig, got_inst) == (n_sig, n_inst)
+        per_kb = extract_s * 1e6 / (size / 1024)
+        base = base or per_kb
+        print(
+            f"{n_sig:8d} {n_inst:9d} {size / 1024:8.1f} {parse_s * 1000:9.1f} {extract_s * 1000:10.1f} "
+            f"{per_kb:7.1f}  (x{per_kb / base:.2f})"
+        )
+    print("\nus/KB = KB 당 추출 시간. 규모가 8배가 되어도 거의 일정하면 선형")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+벤치마크용 합성 VHDL 코퍼스 생성기 (결정적: 같은 CorpusSpec → 같은 바이트열).
+
+entity 1개 = 주석 머리 + generic + port + architecture(signal, component 인스턴스, process).
+process 본문은 depth 단계까지 if/elsif/else 와 case 를 번갈아 중첩한다.
+generate_to_size 는 목표 바이트(수십 MB 까지)에 닿을 때까지 entity 를 이어 붙인다.
+사용: python -m vhdl_renderer_backend.benchmarks.corpus 출력.vhd [MB] [--files N]
+"""
+import argparse
+import random
+import sys
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+_TYPES = ("std_logic", "std_logic_vector({hi} downto 0)", "unsigned({hi} downto 0)", "integer range 0 to {hi}")
+_MODES = ("in", "in", "out", "inout", "buffer")
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """생성 규모. entities 는 generate_vhdl 에서만 쓰이고 generate_to_size 는 크기로 개수를 정한다."""
+
+    entities: int = 10
+    ports: int = 16
+    signals: int = 16
+    processes: int = 4
+    depth: int = 3
+    seed: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _type(rng: random.Random) -> str:
+    return rng.choice(_TYPES).format(hi=rng.choice((1, 7, 15, 31, "W-1")))
+
+
+def _statements(rng: random.Random, signals: List[str], depth: int, indent: str) -> Iterator[str]:
+    """대입문 + depth 단계 중첩 if/case."""
+    a, b = rng.sample(signals, 2) if len(signals) > 1 else (signals[0], signals[0])
+    yield f"{indent}{a} <= {b};"
+    if depth <= 0:
+        return
+    if depth % 2:
+        yield f"{indent}if {a} = {b} then"
+        yield from _statements(rng, signals, depth - 1, indent + "  ")
+        yield f"{indent}elsif rst = '1' then"
+        yield f"{indent}  {b} <= {a};"
+        yield f"{indent}else"
+        yield from _statements(rng, signals, depth - 1, indent + "  ")
+        yield f"{indent}end if;"
+    else:
+        yield f"{indent}case state is"
+        for i in range(3):
+            yield f"{indent}  when {i} =>"
+            yield from _statements(rng, signals, depth - 1, indent + "    ")
+        yield f"{indent}  when others => null;"
+        yield f"{indent}end case;"
+
+
+def generate_entity(spec: CorpusSpec, index: int) -> str:
+    """entity 1개 + architecture. (seed, index) 로만 결정되므로 개수를 바꿔도 앞쪽 entity 는 같다."""
+    rng = random.Random(spec.seed * 1_000_003 + index)
+    name = f"ent_{index}"
+    lines = [
+        f"-- {name}: 합성 벤치마크 entity (ports={spec.ports}, signals={spec.signals})",
+        "/* 블록 주석: 전처리 비용 측정용 */",
+        f"entity {name} is",
+        f"  generic ( W : integer := {rng.choice((8, 16, 32))}; DEPTH : natural := {rng.randint(1, 64)} );",
+        "  port (",
+        "    clk : in std_logic;",
+    ]
+    ports = [f"    p{i} : {rng.choice(_MODES)} {_type(rng)}" for i in range(spec.ports)]
+    lines.append(";\n".join(["    rst : in std_logic"] + ports))
+    lines += ["  );", f"end entity {name};", "", f"architecture rtl of {name} is"]
+    signals = [f"s{i}" for i in range(max(2, spec.signals))]
+    lines += [f"  signal {s} : std_logic; -- 내부 신호" for s in signals]
+    lines.append("  signal state : integer range 0 to 3;")
+    lines.append("begin")
+    if index > 0:
+        lines.append(f"  u_prev : entity work.ent_{index - 1} generic map ( W => W ) port map ( clk => clk, rst => rst );")
+    for p in range(spec.processes):
+        lines.append(f"  proc{p} : process (clk, rst)")
+        lines.append("  begin")
+        lines.append("    if rising_edge(clk) then")
+        lines.extend(_statements(rng, signals, spec.depth, "      "))
+        lines.append("    end if;")
+        lines.append(f"  end process proc{p};")
+    lines.append("end architecture rtl;")
+    return "\n".join(lines) + "\n\n"
+
+
+def generate_vhdl(spec: CorpusSpec = CorpusSpec()) -> str:
+    """spec.entities 개 entity 로 된 VHDL 소스."""
+    header = "library ieee;\nuse ieee.std_logic_1164.all;\nuse ieee.numeric_std.all;\n\n"
+    return header + "".join(generate_entity(spec, i) for i in range(spec.entities))
+
+
+def generate_to_size(target_bytes: int, spec: CorpusSpec = CorpusSpec()) -> str:
+    """UTF-8 크기가 target_bytes 이상이 될 때까지 entity 를 이어 붙인 소스 (entity 경계에서 끝남)."""
+    parts = ["library ieee;\nuse ieee.std_logic_1164.all;\nuse ieee.numeric_std.all;\n\n"]
+    size = len(parts[0])
+    index = 0
+    while size < target_bytes:
+        unit = generate_entity(spec, index)
+        parts.append(unit)
+        size += len(unit.encode("utf-8"))
+        index += 1
+    return "".join(parts)
+
+
+def write_corpus(directory, files: int, bytes_per_file: int, spec: CorpusSpec = CorpusSpec()) -> List[Path]:
+    """files 개 파일 (파일마다 seed 를 달리함) 을 directory 에 기록하고 경로 목록 반환."""
+    out = Path(directory)
+    out.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(files):
+        path = out / f"synthetic_{i:04d}.vhd"
+        path.write_text(generate_to_size(bytes_per_file, replace(spec, seed=spec.seed + i)), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="합성 VHDL 코퍼스 생성 (결정적)")
+    parser.add_argument("output", type=Path, help="출력 .vhd 파일 (--files 지정 시 디렉터리)")
+    parser.add_argument("mb", type=float, nargs="?", default=1.0, help="파일당 크기 MB (기본: 1)")
+    parser.add_argument("--files", type=int, default=None, help="여러 파일로 생성")
+    parser.add_argument("--ports", type=int, default=CorpusSpec.ports)
+    parser.add_argument("--signals", type=int, default=CorpusSpec.signals)
+    parser.add_argument("--processes", type=int, default=CorpusSpec.processes)
+    parser.add_argument("--depth", type=int, default=CorpusSpec.depth)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    spec = CorpusSpec(ports=args.ports, signals=args.signals, processes=args.processes, depth=args.depth, seed=args.seed)
+    target = int(args.mb * 1024 * 1024)
+    if args.files:
+        paths = write_corpus(args.output, args.files, target, spec)
+        print(f"{len(paths)}개 파일: {args.output}")
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(generate_to_size(target, spec), encoding="utf-8")
+        print(f"저장: {args.output} ({args.output.stat().st_size:,} B)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+노드 방문 수 벤치마크: 재귀 _find_first/_find_all 방식(이전) vs TreeCursor 단일 순회(이후).
+포트 1개 추출당 방문 노드 수와 소요 시간을 비교한다.
+사용: python -m vhdl_renderer_backend.benchmarks.node_visits [포트 수]
+"""
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    from vhdl_renderer_backend.core.ast_parser import parse_to_tree, extract_design_from_tree
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.ast_parser import parse_to_tree, extract_design_from_tree
+
+DATA = Path(__file__).resolve().parent.parent / "tests" / "test_data"
+
+
+class _LegacyCounter:
+    """이전 구현(_find_first/_find_all 반복 호출)을 그대로 재현하며 방문 노드 수를 센다."""
+
+    def __init__(self) -> None:
+        self.visits = 0
+
+    def find_first(self, node, typ: str):
+        for c in node.children:
+            self.visits += 1
+            if c.type == typ:
+                return c
+            found = self.find_first(c, typ)
+            if found:
+                return found
+        return None
+
+    def find_all(self, node, typ: str) -> list:
+        self.visits += 1
+        out = [node] if node.type == typ else []
+        for c in node.children:
+            out.extend(self.find_all(c, typ))
+        return out
+
+    def extract_ports(self, tree) -> int:
+        entity_decl = self.find_first(tree.root_node, "entity_declaration")
+        if not entity_decl:
+            return 0
+        self.find_first(entity_decl, "identifier")
+        head = self.find_first(entity_decl, "entity_head")
+        port_clause = self.find_first(head, "port_clause") if head else None
+        interface_list = self.find_first(port_clause, "interface_list") if port_clause else None
+        if not interface_list:
+            return 0
+        n = 0
+        for iface in self.find_all(interface_list, "interface_declaration"):
+            self.find_first(iface, "identifier")
+            mode_ind = self.find_first(iface, "simple_mode_indication") or self.find_first(iface, "mode_indication")
+            if mode_ind:
+                self.find_first(mode_ind, "mode")
+            self.find_first(iface, "subtype_indication")
+            n += 1
+        return n
+
+
+def synthetic_entity(n_ports: int, n_signals: int = 0, n_processes: int = 0) -> str:
+    """포트 n_ports 개짜리 entity (+ 선택적 signal/process) VHDL 소스 생성."""
+    lines = ["library ieee;", "use ieee.std_logic_1164.all;", "entity wide is", "  port ("]
+    decls = []
+    for i in range(n_ports):
+        if i % 3 == 0:
+            decls.append(f"    p{i} : in std_logic_vector({i % 32} downto 0)")
+        else:
+            decls.append(f"    p{i} : {'out' if i % 3 == 1 else 'in'} std_logic")
+    lines.append(";\n".join(decls))
+    lines += ["  );", "end entity wide;", "architecture rtl of wide is"]
+    lines += [f"  signal s{i} : std_logic;" for i in range(n_signals)]
+    lines.append("begin")
+    for i in range(n_processes):
+        lines += [
+            f"  proc{i} : process (p1, s{i % max(1, n_signals)})",
+            "  begin",
+            f"    if p1 = '1' then s{i % max(1, n_signals)} <= '0'; end if;",
+            f"  end process proc{i};",
+        ]
+    lines.append("end architecture rtl;")
+    return "\n".join(lines) + "\n"
+
+
+def measure(code: str) -> Tuple[int, int, float, int, float, int]:
+    """(포트 수, 이전 방문 수, 이전 시간, 이후 방문 수, 이후 시간, 전체 노드 수)."""
+    tree = parse_to_tree(code)
+    legacy = _LegacyCounter()
+    t0 = time.perf_counter()
+    n_ports = legacy.extract_ports(tree)
+    legacy_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    summary = extract_design_from_tree(tree, code)
+    cursor_s = time.perf_counter() - t0
+    ports = sum(len(e.ports) for e in summary.entities) or n_ports
+    return ports, legacy.visits, legacy_s, summary.visits, cursor_s, tree.root_node.descendant_count
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    n_ports = int(argv[0]) if argv else 2000
+    cases = [(p.name, p.read_text(encoding="utf-8")) for p in [DATA / "and_gate.vhd", DATA / "vhdl_project" / "top.vhd"] if p.exists()]
+    cases.append((f"synthetic({n_ports} ports)", synthetic_entity(n_ports, n_signals=n_ports // 2, n_processes=n_ports // 10)))
+    print(f"{'case':28} {'ports':>6} {'nodes':>8} {'before/port':>12} {'after/port':>11} {'before ms':>10} {'after ms':>9}")
+    for name, code in cases:
+        ports, before, before_s, after, after_s, nodes = measure(code)
+        per = max(1, ports)
+        print(
+            f"{name:28} {ports:6d} {nodes:8d} {before / per:12.1f} {after / per:11.1f} "
+            f"{before_s * 1000:10.2f} {after_s * 1000:9.2f}"
+        )
+    print("\nbefore = 재귀 _find_first/_find_all (entity/port 만), after = TreeCursor 단일 순회 (entity/port/generic/signal/process)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
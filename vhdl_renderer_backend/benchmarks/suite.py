@@ -0,0 +1,224 @@
+"""
+규모별 파싱 벤치마크 묶음: 합성 코퍼스(corpus.py) 크기를 바꿔 가며 단계별 처리량·최대 메모리 측정.
+
+케이스 (CASES)
+    preprocess                     원문 → 정제 텍스트
+    parse_entity                   정제 텍스트 → 첫 entity (정규식)
+    parse_entities                 정제 텍스트 → 전체 entity (정규식 단일 스캔)
+    parse_to_tree                  원문 → Tree-sitter Tree
+    extract_entity_ports_from_tree Tree → 첫 entity
+    ast_to_dict                    Tree → 전체 AST dict (Full Dump)
+결과 행: 케이스·크기별 최소/평균 시간, MB/s (원문 바이트 기준), nodes/s (전체 트리를 다루는 케이스만, AST 노드 수 기준),
+최대 메모리. parse_entity / extract_entity_ports_from_tree 는 첫 entity 만 보므로 시간이 크기와 거의 무관하다.
+최대 메모리는 tracemalloc 으로 따로 1회 실행해 잰 할당 증가분이다 (py-tree-sitter 는 PyMem 할당자를 쓰므로 Tree 포함).
+
+사용:
+    python -m vhdl_renderer_backend.benchmarks.suite --sizes 0.1,1,4 -o bench.json
+    python -m vhdl_renderer_backend.benchmarks.suite --compare bench.json --tolerance 0.25   # 느려지면 종료 코드 1
+"""
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from vhdl_renderer_backend.benchmarks.corpus import CorpusSpec, generate_to_size
+    from vhdl_renderer_backend.core import parse_entities, parse_entity, preprocess
+    from vhdl_renderer_backend.core.ast_parser import ast_to_dict, extract_entity_ports_from_tree, parse_to_tree
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from benchmarks.corpus import CorpusSpec, generate_to_size
+    from core import parse_entities, parse_entity, preprocess
+    from core.ast_parser import ast_to_dict, extract_entity_ports_from_tree, parse_to_tree
+
+RESULT_VERSION = 1
+
+# 케이스 이름 → (준비: 원문 → 입력 튜플, 측정 대상 함수, AST 노드 수 기준 처리량 보고 여부)
+_Prepare = Callable[[str], tuple]
+CASES: Dict[str, Tuple[_Prepare, Callable[..., Any], bool]] = {
+    "preprocess": (lambda src: (src,), preprocess, False),
+    "parse_entity": (lambda src: (preprocess(src),), parse_entity, False),
+    "parse_entities": (lambda src: (preprocess(src),), parse_entities, False),
+    "parse_to_tree": (lambda src: (src,), parse_to_tree, True),
+    "extract_entity_ports_from_tree": (lambda src: (parse_to_tree(src), src), extract_entity_ports_from_tree, False),
+    "ast_to_dict": (lambda src: (parse_to_tree(src), src), ast_to_dict, True),
+}
+
+
+def _time(fn: Callable[..., Any], args: tuple, repeat: int) -> List[float]:
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        result = fn(*args)
+        times.append(time.perf_counter() - t0)
+        del result
+    return times
+
+
+def _peak_bytes(fn: Callable[..., Any], args: tuple) -> int:
+    """fn 1회 실행 중 tracemalloc 추적 할당의 최대 증가량 (결과 객체 포함)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        result = fn(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del result
+    return max(0, peak - base)
+
+
+def run_case(name: str, source: str, repeat: int = 3, memory: bool = True, nodes: Optional[int] = None) -> Dict[str, Any]:
+    """케이스 1개 × 소스 1개 측정 결과 행."""
+    prepare, fn, per_node = CASES[name]
+    args = prepare(source)
+    size = len(source.encode("utf-8"))
+    times = _time(fn, args, repeat)
+    best = min(times)
+    row: Dict[str, Any] = {
+        "case": name,
+        "bytes": size,
+        "best_s": round(best, 6),
+        "mean_s": round(statistics.fmean(times), 6),
+        "mb_s": round(size / (1024 * 1024) / best, 3) if best > 0 else None,
+    }
+    if per_node:
+        if nodes is None:
+            nodes = parse_to_tree(source).root_node.descendant_count
+        row["nodes"] = nodes
+        row["nodes_s"] = round(nodes / best) if best > 0 else None
+    if memory:
+        row["peak_bytes"] = _peak_bytes(fn, args)
+    return row
+
+
+def run_suite(
+    sizes_mb: Sequence[float] = (0.1, 1.0),
+    cases: Sequence[str] = tuple(CASES),
+    spec: CorpusSpec = CorpusSpec(),
+    repeat: int = 3,
+    memory: bool = True,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """크기 × 케이스 전체 측정. 반환 dict 는 그대로 JSON 저장·compare() 입력으로 쓴다."""
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        raise ValueError(f"알 수 없는 케이스: {', '.join(unknown)} (가능: {', '.join(CASES)})")
+    parse_to_tree("entity warm is end entity;")  # Language/Parser 생성 비용 제외
+    results = []
+    for mb in sizes_mb:
+        source = generate_to_size(int(mb * 1024 * 1024), spec)
+        nodes = parse_to_tree(source).root_node.descendant_count
+        for name in cases:
+            row = run_case(name, source, repeat=repeat, memory=memory, nodes=nodes)
+            row["size_mb"] = mb
+            results.append(row)
+            if progress is not None:
+                progress(row)
+    return {"version": RESULT_VERSION, "meta": _meta(spec, repeat), "results": results}
+
+
+def _meta(spec: CorpusSpec, repeat: int) -> Dict[str, Any]:
+    try:
+        from importlib.metadata import version
+        ts_version = version("tree-sitter")
+    except Exception:
+        ts_version = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "tree_sitter": ts_version,
+        "spec": spec.to_dict(),
+        "repeat": repeat,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.25) -> List[Dict[str, Any]]:
+    """
+    (case, size_mb) 가 같은 행끼리 best_s 비율 (current / baseline).
+    ratio > 1 + tolerance 인 행은 "regression": True.
+    """
+    base = {(r["case"], r["size_mb"]): r for r in baseline.get("results", [])}
+    rows = []
+    for r in current.get("results", []):
+        b = base.get((r["case"], r["size_mb"]))
+        if b is None or not b["best_s"]:
+            continue
+        ratio = r["best_s"] / b["best_s"]
+        rows.append({
+            "case": r["case"],
+            "size_mb": r["size_mb"],
+            "baseline_s": b["best_s"],
+            "current_s": r["best_s"],
+            "ratio": round(ratio, 3),
+            "regression": ratio > 1 + tolerance,
+        })
+    return rows
+
+
+def _format_row(row: Dict[str, Any]) -> str:
+    nodes_s = f"{row['nodes_s']:>12,}" if row.get("nodes_s") is not None else f"{'-':>12}"
+    peak = f"{row['peak_bytes'] / (1024 * 1024):9.1f}" if "peak_bytes" in row else f"{'-':>9}"
+    return (
+        f"{row['case']:32} {row['size_mb']:7.2f} {row['best_s'] * 1000:10.1f} "
+        f"{row['mb_s'] or 0:8.2f} {nodes_s} {peak}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="합성 코퍼스 규모별 파싱 벤치마크 (JSON 저장, 기준 결과와 비교)")
+    parser.add_argument("--sizes", default="0.1,1", help="코퍼스 크기 MB 목록, 쉼표 구분 (기본: 0.1,1)")
+    parser.add_argument("--cases", default=",".join(CASES), help="측정 케이스, 쉼표 구분 (기본: 전체)")
+    parser.add_argument("--repeat", type=int, default=3, help="케이스당 반복 횟수, 최솟값 보고 (기본: 3)")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 최대 메모리 측정 생략")
+    parser.add_argument("--ports", type=int, default=CorpusSpec.ports)
+    parser.add_argument("--signals", type=int, default=CorpusSpec.signals)
+    parser.add_argument("--processes", type=int, default=CorpusSpec.processes)
+    parser.add_argument("--depth", type=int, default=CorpusSpec.depth)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", type=Path, default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", type=Path, default=None, help="기준 결과 JSON. 느려진 케이스가 있으면 종료 코드 1")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="회귀 판정 허용 비율 (기본: 0.25 = 25%% 느려짐까지 허용)")
+    args = parser.parse_args(argv)
+
+    spec = CorpusSpec(ports=args.ports, signals=args.signals, processes=args.processes, depth=args.depth, seed=args.seed)
+    sizes = [float(s) for s in args.sizes.split(",") if s.strip()]
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    print(f"{'case':32} {'MB':>7} {'best ms':>10} {'MB/s':>8} {'nodes/s':>12} {'peak MB':>9}")
+    try:
+        result = run_suite(sizes, cases, spec, repeat=args.repeat, memory=not args.no_memory,
+                           progress=lambda row: print(_format_row(row), flush=True))
+    except ValueError as exc:
+        print(f"오류: {exc}", file=sys.stderr)
+        return 1
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"저장: {args.output}")
+    if args.compare is None:
+        return 0
+    baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+    rows = compare(baseline, result, args.tolerance)
+    print(f"\n{'case':32} {'MB':>7} {'base ms':>10} {'now ms':>10} {'ratio':>7}")
+    for r in rows:
+        flag = "  << 회귀" if r["regression"] else ""
+        print(f"{r['case']:32} {r['size_mb']:7.2f} {r['baseline_s'] * 1000:10.1f} {r['current_s'] * 1000:10.1f} "
+              f"{r['ratio']:7.2f}{flag}")
+    regressions = [r for r in rows if r["regression"]]
+    if regressions:
+        print(f"\n회귀 {len(regressions)}건 (허용 {args.tolerance:.0%} 초과)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,29 @@
-from .preprocessor import preprocess
-from .entity_parser import parse_entity
+from .preprocessor import preprocess, preprocess_with_offsets
+from .entity_parser import parse_entity, parse_entities
+from .diff import apply_patch, diff
+from .budget import CancelToken, ParseBudget, ParseBudgetExceeded
 
-__all__ = ["preprocess", "parse_entity"]
+__all__ = [
+    "preprocess", "preprocess_with_offsets",
+    "parse_entity", "parse_entities",
+    "diff", "apply_patch",
+    "CancelToken", "ParseBudget", "ParseBudgetExceeded",
+]
 
 try:
-    from .ast_parser import parse_to_tree, ast_to_dict, ast_dump_json, extract_entity_ports_from_tree, parse_vhdl
-    __all__ = list(__all__) + ["parse_to_tree", "ast_to_dict", "ast_dump_json", "extract_entity_ports_from_tree", "parse_vhdl"]
+    from .ast_parser import (
+        parse_to_tree, ast_to_dict, ast_dump_json, ast_dump_stream, extract_entity_ports_from_tree,
+        extract_design_from_tree, parse_vhdl, ParseResult, VhdlDocument,
+    )
+    from .parser_pool import ParserPool, get_parser_pool
+    from .ast_query import query_design
+    from .arch_parser import parse_architecture, extract_architectures_from_tree
+    __all__ = list(__all__) + [
+        "parse_to_tree", "ast_to_dict", "ast_dump_json", "ast_dump_stream", "extract_entity_ports_from_tree",
+        "extract_design_from_tree", "parse_vhdl", "ParseResult", "VhdlDocument",
+        "ParserPool", "get_parser_pool",
+        "query_design",
+        "parse_architecture", "extract_architectures_from_tree",
+    ]
 except ImportError:
     pass
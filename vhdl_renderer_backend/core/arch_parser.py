@@ -1,22 +1,222 @@
 """
 Architecture 파서: architecture 블록 내 Signal, Component, Port Map 추출.
-(1단계 스켈레톤 — 추후 구현)
+Tree-sitter AST 를 TreeCursor 로 한 번만 순회하며 architecture 마다 signal/component 선언,
+인스턴스(generic map, port map), process 를 모은다. 파일 크기에 선형.
 """
-from typing import Any
+from typing import Any, Dict, List, Optional, Union
 
-# from ..models.vhdl_types import ...
+try:
+    from tree_sitter import Node, Tree
+except ImportError:
+    Node = Tree = None
 
+try:
+    from ..models.vhdl_types import Architecture, Association, Component, Generic, Instance, Port
+except ImportError:
+    from models.vhdl_types import Architecture, Association, Component, Generic, Instance, Port
 
-def parse_architecture(vhdl_text: str, entity_result: Any = None) -> Any:
+from .ast_parser import (
+    generic_env_of,
+    label_of,
+    node_text,
+    parse_interface_declaration,
+    parse_to_tree,
+    process_from_node,
+    signals_from_declaration,
+)
+from .ast_walker import SKIP, NodeDispatcher
+from .const_eval import eval_expr, subtype_width
+
+# architecture 밖이거나 signal/component/instance/process 를 포함할 수 없는 서브트리
+_ARCH_SKIP_TYPES = (
+    "library_clause",
+    "use_clause",
+    "context_declaration",
+    "line_comment",
+    "block_comment",
+    "package_declaration",
+    "package_definition",
+    "configuration_declaration",
+    "constant_declaration",
+    "type_declaration",
+    "subprogram_declaration",
+    "subprogram_body",
+    "attribute_specification",
+    "alias_declaration",
+    "concurrent_simple_signal_assignment",
+    "concurrent_conditional_signal_assignment",
+    "concurrent_selected_signal_assignment",
+    "concurrent_assertion_statement",
+    "concurrent_procedure_call_statement",
+    "end_architecture",
+)
+
+
+def _associations(aspect: Node, source: bytes) -> List[Association]:
+    """generic_map_aspect / port_map_aspect → Association 목록 (위치 연결은 formal=None, open 은 actual=None)."""
+    out: List[Association] = []
+    for child in aspect.children:
+        if child.type != "association_list":
+            continue
+        for element in child.named_children:
+            if element.type != "association_element":
+                continue
+            named = any(part.type == "=>" for part in element.children)
+            formal: Optional[str] = None
+            actual: Optional[str] = None
+            for part in element.children:
+                if part.type in ("=>", "OPEN", ",") or not part.is_named:
+                    continue
+                if named and formal is None:
+                    formal = node_text(part, source)
+                else:
+                    actual = node_text(part, source)
+            out.append(Association(formal=formal, actual=actual))
+    return out
+
+
+def _component_from_node(node: Node, source: bytes) -> Component:
+    """component_declaration → Component (port/generic 은 component_body 의 clause 에서 직접 읽음)."""
+    ident = next((c for c in node.children if c.type == "identifier"), None)
+    component = Component(name=node_text(ident, source) if ident is not None else "")
+    body = next((c for c in node.children if c.type == "component_body"), None)
+    env: Dict[str, int] = {}  # generic 기본값 (포트 폭 계산용)
+    for clause in body.children if body is not None else ():
+        if clause.type not in ("generic_clause", "port_clause"):
+            continue
+        for ilist in clause.children:
+            if ilist.type != "interface_list":
+                continue
+            for iface in ilist.named_children:
+                if iface.type != "interface_declaration":
+                    continue
+                names, direction, subtype, default = parse_interface_declaration(iface, source)
+                if clause.type == "port_clause":
+                    type_name, width, rng = subtype_width(node_text(subtype, source), env) if subtype else ("unknown", 1, None)
+                    component.ports.extend(Port(n, direction, type_name, width, rng) for n in names)
+                else:
+                    type_name = node_text(subtype, source) if subtype else "unknown"
+                    component.generics.extend(Generic(n, type_name, default) for n in names)
+                    value = eval_expr(default, env) if default else None
+                    if value is not None:
+                        env.update((n.lower(), value) for n in names)
+    return component
+
+
+def _instance_from_node(node: Node, source: bytes) -> Instance:
+    """component_instantiation_statement → Instance."""
+    instance = Instance(label=label_of(node, source), unit="")
+    for child in node.children:
+        t = child.type
+        if t == "name":
+            instance.unit = node_text(child, source)
+        elif t == "instantiated_unit":
+            for c in child.children:
+                if c.type in ("entity", "component", "configuration"):
+                    instance.kind = c.type
+                elif c.type == "library_namespace":
+                    instance.library = node_text(c, source)
+                elif c.type == "name":
+                    instance.unit = node_text(c, source)
+                elif c.type == "identifier":
+                    instance.architecture = node_text(c, source)
+        elif t == "generic_map_aspect":
+            instance.generic_map = _associations(child, source)
+        elif t == "port_map_aspect":
+            instance.port_map = _associations(child, source)
+    if instance.library is None and "." in instance.unit:
+        instance.library, _, instance.unit = instance.unit.rpartition(".")
+    return instance
+
+
+class _ArchCollector:
+    """NodeDispatcher 핸들러 묶음. architecture 하나당 서브트리를 한 번만 방문."""
+
+    def __init__(self, source: bytes):
+        self.source = source
+        self.architectures: List[Architecture] = []
+        self._arch: Optional[Architecture] = None
+        self._entity_envs: Dict[str, Dict[str, int]] = {}  # entity 이름 소문자 → generic 기본값 (signal 폭 계산용)
+        self._generic_env: Dict[str, int] = {}
+
+    def dispatcher(self) -> NodeDispatcher:
+        d = NodeDispatcher()
+        d.skip(*_ARCH_SKIP_TYPES)
+        d.on_enter("entity_declaration", self._enter_entity)
+        d.on_enter("architecture_definition", self._enter_architecture)
+        d.on_leave("architecture_definition", self._leave_architecture)
+        d.on_enter("signal_declaration", self._enter_signal)
+        d.on_enter("component_declaration", self._enter_component)
+        d.on_enter("component_instantiation_statement", self._enter_instance)
+        d.on_enter("process_statement", self._enter_process)
+        return d
+
+    def _enter_entity(self, node: Node) -> str:
+        name = node.child_by_field_name("entity")
+        if name is not None:
+            self._entity_envs[node_text(name, self.source).lower()] = generic_env_of(node, self.source)
+        return SKIP
+
+    def _enter_architecture(self, node: Node) -> None:
+        name = node.child_by_field_name("architecture")
+        if name is None:
+            name = next((c for c in node.children if c.type == "identifier"), None)
+        entity = node.child_by_field_name("entity")
+        self._arch = Architecture(
+            name=node_text(name, self.source) if name is not None else "",
+            entity=node_text(entity, self.source) if entity is not None else "",
+        )
+        self._generic_env = self._entity_envs.get(self._arch.entity.lower(), {})
+        self.architectures.append(self._arch)
+        return None
+
+    def _leave_architecture(self, node: Node) -> None:
+        self._arch = None
+        return None
+
+    def _enter_signal(self, node: Node) -> str:
+        if self._arch is not None:
+            self._arch.signals.extend(signals_from_declaration(node, self.source, self._generic_env))
+        return SKIP
+
+    def _enter_component(self, node: Node) -> str:
+        if self._arch is not None:
+            self._arch.components.append(_component_from_node(node, self.source))
+        return SKIP
+
+    def _enter_instance(self, node: Node) -> str:
+        if self._arch is not None:
+            self._arch.instances.append(_instance_from_node(node, self.source))
+        return SKIP
+
+    def _enter_process(self, node: Node) -> str:
+        if self._arch is not None:
+            self._arch.processes.append(process_from_node(node, self.source))
+        return SKIP
+
+
+def extract_architectures_from_tree(tree: Tree, source: Union[str, bytes]) -> List[Architecture]:
+    """AST 단일 순회로 모든 architecture 의 signal/component/instance(port map)/process 추출."""
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    collector = _ArchCollector(source)
+    collector.dispatcher().walk(tree)
+    return collector.architectures
+
+
+def parse_architecture(vhdl_text: str, entity_result: Any = None) -> List[Architecture]:
     """
-    정제된 VHDL에서 architecture 구간을 찾아 signal, component, port map 을 추출한다.
+    VHDL 소스에서 architecture 를 찾아 signal, component, port map 을 추출한다.
 
     Args:
-        vhdl_text: 정제된 VHDL 텍스트
-        entity_result: Entity 파서 결과 (필요 시 참조)
+        vhdl_text: VHDL 텍스트 (원문 또는 정제본 — 주석은 AST 에서 무시됨)
+        entity_result: Entity 파서 결과. 지정 시 해당 entity 의 architecture 만 (대소문자 무시)
 
     Returns:
-        Signal 목록, Component 인스턴스 목록, Port Map 연결 정보 (추후 데이터 모델로 구체화)
+        Architecture 목록 (signals, components, instances[generic_map, port_map], processes)
     """
-    # TODO: architecture ... of ... is 구간 식별, signal/component/port map 파싱
-    return None
+    archs = extract_architectures_from_tree(parse_to_tree(vhdl_text), vhdl_text)
+    if entity_result is not None:
+        target = getattr(entity_result, "module_name", entity_result).lower()
+        archs = [a for a in archs if a.entity.lower() == target]
+    return archs
@@ -5,56 +5,311 @@ VHDL 원문 → AST 구축, 전체 덤프(JSON), Entity/Port 세분화 추출.
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional
+import time
+import warnings
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple, Union
 
 try:
-    from tree_sitter import Language, Parser, Tree, Node
-    from tree_sitter_vhdl import language as vhdl_language
+    from tree_sitter import Tree, Node
 except ImportError:
-    Language = Parser = Tree = Node = None
-    vhdl_language = None
+    Tree = Node = None
 
 try:
-    from ..models.vhdl_types import Entity, Port
+    from ..models.vhdl_types import Entity, Generic, Port, Process, Signal
 except ImportError:
-    from models.vhdl_types import Entity, Port
+    from models.vhdl_types import Entity, Generic, Port, Process, Signal
 
+from .ast_walker import SKIP, STOP, NodeDispatcher
+from .budget import CancelToken, ParseBudget, ParseBudgetExceeded
+from .const_eval import eval_expr, subtype_width
+from .parser_pool import get_parser_pool
+from .profile import active, stage
 
-def _get_parser() -> Parser:
-    if Parser is None or vhdl_language is None:
-        raise RuntimeError("tree-sitter, tree-sitter-vhdl 패키지가 필요합니다. pip install tree-sitter tree-sitter-vhdl")
-    lang = Language(vhdl_language())
-    p = Parser(lang)
-    return p
+__all__ = [
+    # 파싱·덤프·추출
+    "parse_to_tree", "VhdlDocument", "ast_to_dict", "ast_dump_json", "ast_dump_stream",
+    "DesignSummary", "extract_design_from_tree", "extract_entity_ports_from_tree", "ParseResult", "parse_vhdl",
+    # 노드 헬퍼 (arch_parser, ast_query, elaborate, symbol_index, lsp_server 공용)
+    "node_text", "subtype_type_and_width", "identifier_names", "parse_interface_declaration", "label_of",
+    "generic_env_of", "signals_from_declaration", "process_from_node",
+]
 
+# 예산 파싱의 읽기 청크: 이 크기마다 마감 시간·취소 여부를 확인 (약 수 ms 간격)
+_READ_CHUNK = 16 * 1024
 
-def parse_to_tree(vhdl_source: str) -> Tree:
-    """VHDL 소스를 파싱하여 Tree-sitter AST(Tree) 반환."""
-    parser = _get_parser()
+
+def parse_to_tree(
+    vhdl_source: str,
+    budget: Optional[ParseBudget] = None,
+    cancel: Optional[CancelToken] = None,
+) -> Tree:
+    """
+    VHDL 소스를 파싱하여 Tree-sitter AST(Tree) 반환. Parser 는 공유 풀에서 체크아웃.
+
+    budget / cancel 을 주면 읽기 콜백으로 청크마다 마감 시간·취소를 확인하고,
+    초과 시 ParseBudgetExceeded (reason: "time" | "size" | "cancelled") 를 던진다.
+    """
     if isinstance(vhdl_source, str):
         vhdl_source = vhdl_source.encode("utf-8")
-    return parser.parse(vhdl_source)
+    if budget or cancel is not None:
+        tree = _parse_bounded(vhdl_source, budget or ParseBudget(), cancel)
+    else:
+        with stage("parse_tree"), get_parser_pool().parser() as parser:
+            tree = parser.parse(vhdl_source)
+    profiler = active()
+    if profiler is not None:
+        profiler.count("nodes", tree.root_node.descendant_count)
+    return tree
+
+
+def _set_timeout(parser, micros: int) -> None:
+    # py-tree-sitter 0.25 의 progress_callback 은 읽기 콜백 파싱에서 프로세스가 죽으므로(0.25.2 확인)
+    # 청크 안에서 멈춘 경우의 상한은 deprecated 인 timeout_micros 로 건다
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        parser.timeout_micros = micros
+
+
+def _parse_bounded(source: bytes, budget: ParseBudget, cancel: Optional[CancelToken]) -> Tree:
+    if budget.max_bytes is not None and len(source) > budget.max_bytes:
+        raise ParseBudgetExceeded("size", f"{len(source)} B > {budget.max_bytes} B")
+    if cancel is not None and cancel.cancelled:
+        raise ParseBudgetExceeded("cancelled")
+    deadline = time.perf_counter() + budget.time_s if budget.time_s is not None else None
+    stopped: List[str] = []
+
+    def read(offset: int, _point) -> bytes:
+        # 빈 bytes = 입력 끝: 파서가 지금까지 읽은 만큼으로 바로 끝낸다
+        if cancel is not None and cancel.cancelled:
+            stopped.append("cancelled")
+            return b""
+        if deadline is not None and time.perf_counter() > deadline:
+            stopped.append("time")
+            return b""
+        return source[offset : offset + _READ_CHUNK]
+
+    with stage("parse_tree"), get_parser_pool().parser() as parser:
+        if budget.time_s is not None:
+            _set_timeout(parser, max(1, int(budget.time_s * 1_000_000)))
+        try:
+            tree = parser.parse(read)
+        except ValueError:  # timeout_micros 초과 ("Parsing failed")
+            parser.reset()  # 다음 parse 가 중단 지점부터 이어 하지 않도록
+            stopped.append("time")
+        finally:
+            if budget.time_s is not None:
+                _set_timeout(parser, 0)
+    if stopped:
+        reason = stopped[0]
+        detail = f"{budget.time_s}s 초과" if reason == "time" else ""
+        raise ParseBudgetExceeded(reason, detail)
+    return tree
+
+
+def _point_at(source: bytes, offset: int) -> Tuple[int, int]:
+    """바이트 오프셋 → Tree-sitter Point(row, column). column 은 줄 시작부터의 바이트 수."""
+    row = source.count(b"\n", 0, offset)
+    column = offset - (source.rfind(b"\n", 0, offset) + 1)
+    return row, column
+
+
+def _offset_at(source: bytes, row: int, column: int) -> int:
+    """Tree-sitter Point(row, column) → 바이트 오프셋."""
+    offset = 0
+    for _ in range(row):
+        nl = source.find(b"\n", offset)
+        if nl < 0:
+            return len(source)
+        offset = nl + 1
+    return min(offset + column, len(source))
+
+
+def _merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """겹치거나 맞닿은 (start, end) 바이트 구간 병합."""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class VhdlDocument:
+    """
+    증분 파싱 문서 (REQ-09).
+    직전 Tree 와 소스 바이트를 유지하고, 텍스트 편집을 Tree.edit 로 반영한 뒤
+    old_tree 를 재사용하여 재파싱한다. 편집은 여러 번 누적한 뒤 한 번에 reparse 가능.
+
+    위치 단위는 Tree-sitter 와 동일: 바이트 오프셋, Point(row, column) 의 column 은 바이트 기준.
+    """
+
+    def __init__(self, source: Union[str, bytes] = b""):
+        if isinstance(source, str):
+            source = source.encode("utf-8")
+        self._source: bytes = source
+        self._tree: Tree = parse_to_tree(source)
+        self._dirty = False
+        self._edited: List[Tuple[int, int]] = []
+        self.changed_ranges: List[Tuple[int, int]] = []
+
+    @property
+    def source(self) -> bytes:
+        return self._source
+
+    @property
+    def text(self) -> str:
+        return self._source.decode("utf-8", "replace")
+
+    @property
+    def tree(self) -> Tree:
+        """최신 Tree. 반영되지 않은 편집이 있으면 먼저 재파싱."""
+        if self._dirty:
+            self.reparse()
+        return self._tree
+
+    def edit(self, start_byte: int, old_end_byte: int, new_text: Union[str, bytes]) -> None:
+        """
+        source[start_byte:old_end_byte] 를 new_text 로 치환하고 Tree.edit 로 기존 트리에 반영.
+        재파싱은 tree 접근 또는 reparse() 호출 시점까지 미룬다.
+        """
+        if isinstance(new_text, str):
+            new_text = new_text.encode("utf-8")
+        if not 0 <= start_byte <= old_end_byte <= len(self._source):
+            raise ValueError(f"잘못된 편집 범위: {start_byte}..{old_end_byte} (길이 {len(self._source)})")
+        old = self._source
+        new = old[:start_byte] + new_text + old[old_end_byte:]
+        new_end_byte = start_byte + len(new_text)
+        self._tree.edit(
+            start_byte=start_byte,
+            old_end_byte=old_end_byte,
+            new_end_byte=new_end_byte,
+            start_point=_point_at(old, start_byte),
+            old_end_point=_point_at(old, old_end_byte),
+            new_end_point=_point_at(new, new_end_byte),
+        )
+        self._source = new
+        self._dirty = True
+        # 누적된 편집 구간을 새 좌표계로 이동 후 이번 편집 구간과 병합
+        delta = new_end_byte - old_end_byte
+        shifted: List[Tuple[int, int]] = [(start_byte, new_end_byte)]
+        for s, e in self._edited:
+            if e < start_byte:
+                shifted.append((s, e))
+            elif s > old_end_byte:
+                shifted.append((s + delta, e + delta))
+            else:
+                shifted.append((min(s, start_byte), max(new_end_byte, e + delta)))
+        self._edited = _merge_ranges(shifted)
+
+    def edit_point(
+        self,
+        start_point: Tuple[int, int],
+        old_end_point: Tuple[int, int],
+        new_text: Union[str, bytes],
+    ) -> None:
+        """(row, column) 범위로 지정한 편집. column 은 바이트 기준."""
+        start = _offset_at(self._source, *start_point)
+        old_end = _offset_at(self._source, *old_end_point)
+        self.edit(start, old_end, new_text)
+
+    def reparse(self) -> List[Tuple[int, int]]:
+        """
+        누적된 편집을 old_tree 재사용으로 재파싱하고 변경 구간을 반환.
+        변경 구간 = Tree.changed_ranges(구조 변경) ∪ 편집된 텍스트 구간 (새 소스 기준 바이트).
+        """
+        if not self._dirty:
+            self.changed_ranges = []
+            return self.changed_ranges
+        with get_parser_pool().parser() as parser:
+            new_tree = parser.parse(self._source, old_tree=self._tree)
+        ranges = [(r.start_byte, r.end_byte) for r in self._tree.changed_ranges(new_tree)]
+        self.changed_ranges = _merge_ranges(ranges + self._edited)
+        self._tree = new_tree
+        self._edited = []
+        self._dirty = False
+        return self.changed_ranges
+
+    def affected_design_units(self, ranges: Optional[List[Tuple[int, int]]] = None) -> List[Node]:
+        """변경 구간과 겹치는 최상위 design_unit 노드 목록 (하위 추출은 이 단위만 다시 수행)."""
+        root = self.tree.root_node
+        if ranges is None:
+            ranges = self.changed_ranges
+        out: List[Node] = []
+        for unit in root.children:
+            if unit.type != "design_unit":
+                continue
+            for start, end in ranges:
+                if start <= unit.end_byte and end >= unit.start_byte:
+                    out.append(unit)
+                    break
+        return out
+
+
+_PREVIEW_CHARS = 117
+
+
+def _node_text_preview(source: bytes, start: int, end: int) -> str:
+    """
+    덤프용 노드 텍스트: 120자 미만이면 strip 전체, 아니면 strip 후 117자 + "...".
+    긴 노드는 앞부분 창(window)만 디코드하므로 큰 노드에서도 디코드 비용이 일정하다.
+    """
+    n = end - start
+    if n < 4 * (_PREVIEW_CHARS + 3):
+        text = source[start:end].decode("utf-8", "replace")
+        return text.strip() if len(text) < 120 else text.strip()[:_PREVIEW_CHARS] + "..."
+    # UTF-8 한 글자는 최대 4바이트 → 여기서는 항상 120자 이상
+    window = 4 * (_PREVIEW_CHARS + 3)
+    while True:
+        stop = min(end, start + window)
+        chunk = source[start:stop].decode("utf-8", "replace").lstrip()
+        if stop == end:
+            return chunk.strip()[:_PREVIEW_CHARS] + "..."
+        # 117번째 이후에 공백 아닌 글자가 있으면 전체 strip 결과의 앞 117자와 같다 (창 끝의 잘린 글자는 제외됨)
+        if len(chunk.rstrip()) > _PREVIEW_CHARS:
+            return chunk[:_PREVIEW_CHARS] + "..."
+        window *= 4
 
 
 def _node_to_dict(node: Node, source: bytes) -> Dict[str, Any]:
-    """단일 노드를 type, range, text, children 포함한 dict로 변환."""
-    text = source[node.start_byte : node.end_byte].decode("utf-8", "replace")
-    d: Dict[str, Any] = {
+    """단일 노드를 type, range, text 포함한 dict로 변환 (children 제외)."""
+    return {
         "type": node.type,
         "start_byte": node.start_byte,
         "end_byte": node.end_byte,
-        "text": text.strip() if len(text) < 120 else text.strip()[:117] + "...",
+        "text": _node_text_preview(source, node.start_byte, node.end_byte),
     }
-    if node.child_count > 0:
-        d["children"] = [_node_to_dict(c, source) for c in node.children]
-    return d
 
 
 def ast_to_dict(tree: Tree, source: str) -> Dict[str, Any]:
-    """전체 AST를 JSON 직렬화 가능한 dict로 변환 (Full Dump)."""
+    """전체 AST를 JSON 직렬화 가능한 dict로 변환 (Full Dump). TreeCursor 비재귀 순회."""
     if isinstance(source, str):
         source = source.encode("utf-8")
-    return _node_to_dict(tree.root_node, source)
+    with stage("ast_dict"):
+        return _ast_to_dict(tree, source)
+
+
+def _ast_to_dict(tree: Tree, source: bytes) -> Dict[str, Any]:
+    cursor = tree.walk()
+    root = _node_to_dict(cursor.node, source)
+    stack = [root]
+    while True:
+        if cursor.goto_first_child():
+            child = _node_to_dict(cursor.node, source)
+            stack[-1]["children"] = [child]
+            stack.append(child)
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return root
+            stack.pop()
+        stack.pop()
+        child = _node_to_dict(cursor.node, source)
+        stack[-1]["children"].append(child)
+        stack.append(child)
 
 
 def ast_dump_json(tree: Tree, source: str, indent: int = 2) -> str:
@@ -62,120 +317,422 @@ def ast_dump_json(tree: Tree, source: str, indent: int = 2) -> str:
     return json.dumps(ast_to_dict(tree, source), ensure_ascii=False, indent=indent)
 
 
-def _find_first(node: Node, typ: str) -> Optional[Node]:
-    """자식 중 type이 typ인 첫 노드."""
-    for c in node.children:
-        if c.type == typ:
-            return c
-        found = _find_first(c, typ)
-        if found:
-            return found
-    return None
+def ast_dump_stream(
+    tree: Tree,
+    source: str,
+    fp: TextIO,
+    indent: Optional[int] = 2,
+    flush_every: int = 8192,
+) -> int:
+    """
+    AST 전체를 JSON 으로 fp 에 점진적으로 기록 (ast_dump_json 과 동일한 출력).
+    TreeCursor 비재귀 순회 + 조각 버퍼를 flush_every 개마다 기록하므로
+    메모리 사용량이 파일 크기와 무관하게 일정하다. 기록한 노드 수 반환.
+    """
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    enc = json.encoder.encode_basestring  # ensure_ascii=False 와 동일한 문자열 인코딩
+    preview = _node_text_preview
+    # seps[d] = 깊이 d 의 항목 구분자, opens[d] = 깊이 d 줄바꿈+들여쓰기 (indent=None 이면 한 줄)
+    seps: List[str] = []
+    opens: List[str] = []
 
+    def grow(depth: int) -> None:
+        while len(seps) <= depth:
+            d = len(seps)
+            if indent is None:
+                opens.append("")
+                seps.append(", ")
+            else:
+                opens.append("\n" + " " * (indent * d))
+                seps.append("," + opens[d])
 
-def _find_all(node: Node, typ: str) -> List[Node]:
-    """node 서브트리에서 type이 typ인 모든 노드 (자신 포함)."""
-    out: List[Node] = []
-    if node.type == typ:
-        out.append(node)
-    for c in node.children:
-        out.extend(_find_all(c, typ))
-    return out
+    buf: List[str] = []
+    write = buf.append
+    cursor = tree.walk()
+    depth = 0
+    count = 0
+    while True:
+        node = cursor.node
+        grow(depth + 2)
+        k = seps[depth + 1]
+        start, end = node.start_byte, node.end_byte
+        write(
+            "{" + opens[depth + 1]
+            + '"type": ' + enc(node.type) + k
+            + '"start_byte": ' + str(start) + k
+            + '"end_byte": ' + str(end) + k
+            + '"text": ' + enc(preview(source, start, end))
+        )
+        count += 1
+        if cursor.goto_first_child():
+            write(k + '"children": [' + opens[depth + 2])
+            depth += 2
+        else:
+            write(opens[depth] + "}")
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    fp.write("".join(buf))
+                    return count
+                depth -= 2
+                write(opens[depth + 1] + "]" + opens[depth] + "}")
+            write(seps[depth])
+        if len(buf) >= flush_every:
+            fp.write("".join(buf))
+            buf.clear()
 
 
-def _text(node: Node, source: bytes) -> str:
+def node_text(node: Node, source: bytes) -> str:
+    """노드의 원문 (UTF-8 디코딩, 앞뒤 공백 제거)."""
     return source[node.start_byte : node.end_byte].decode("utf-8", "replace").strip()
 
 
-def _get_identifier_name(node: Node, source: bytes) -> str:
-    """identifier 노드 또는 identifier_list 내 첫 identifier 텍스트."""
-    ident = _find_first(node, "identifier")
-    if ident:
-        return _text(ident, source)
-    return _text(node, source)
+def subtype_type_and_width(node: Node, source: bytes, env: Optional[Dict[str, int]] = None) -> tuple[str, int]:
+    """subtype_indication 노드에서 타입명과 비트 폭 추출. std_logic -> (std_logic, 1), vector(N downto M) -> (std_logic_vector, N-M+1).
+    범위 표현식은 const_eval 로 계산 (env: generic 등 이름 → 값)."""
+    type_name, width, _ = subtype_width(node_text(node, source), env)
+    return type_name, width
 
 
-def _get_mode(node: Optional[Node], source: bytes) -> str:
-    """simple_mode_indication 등에서 mode(in/out/inout/buffer) 추출."""
-    if not node:
-        return "in"
-    mode_node = _find_first(node, "mode")
-    if not mode_node:
-        return "in"
-    for child in mode_node.children:
+_MODES = ("in", "out", "inout", "buffer")
+
+# 단일 순회 추출에서 통째로 건너뛰는 서브트리 (entity/port/generic/signal/process 와 무관)
+_EXTRACT_SKIP_TYPES = (
+    "library_clause",
+    "use_clause",
+    "context_declaration",
+    "line_comment",
+    "block_comment",
+    "constant_declaration",
+    "type_declaration",
+    "subprogram_declaration",
+    "attribute_specification",
+    "alias_declaration",
+    "component_declaration",
+    "component_instantiation_statement",
+    "concurrent_simple_signal_assignment",
+    "concurrent_conditional_signal_assignment",
+    "concurrent_selected_signal_assignment",
+    "concurrent_assertion_statement",
+    "concurrent_procedure_call_statement",
+    "end_entity",
+    "end_architecture",
+)
+
+
+def identifier_names(ident_list: Node, source: bytes) -> List[str]:
+    """identifier_list 의 모든 이름 (X, Y : ... → [X, Y])."""
+    names = [node_text(c, source) for c in ident_list.named_children]
+    return names or [node_text(ident_list, source)]
+
+
+def parse_interface_declaration(
+    iface: Node, source: bytes
+) -> Tuple[List[str], str, Optional[Node], Optional[str]]:
+    """
+    interface_declaration 의 직속 자식만 보고 (이름 목록, mode, subtype_indication, 기본값) 반환.
+    mode 가 없으면 "in".
+    """
+    names: List[str] = []
+    direction = "in"
+    subtype: Optional[Node] = None
+    default: Optional[str] = None
+    for child in iface.children:
         t = child.type
-        if t in ("in", "out", "inout", "buffer"):
-            return t
-    return "in"
-
-
-def _get_subtype_type_and_width(node: Node, source: bytes) -> tuple[str, int]:
-    """subtype_indication 노드에서 타입명과 비트 폭 추출. std_logic -> (std_logic, 1), vector(N downto M) -> (std_logic_vector, N-M+1)."""
-    text = _text(node, source)
-    # array_type_definition 또는 name ( range ) 형태 처리
-    # 간단히: "std_logic" -> 1, "std_logic_vector(7 downto 0)" -> 8
-    import re
-    vec_match = re.search(r"(\w+)\s*\(\s*(\d+)\s+downto\s+(\d+)\s*\)", text, re.IGNORECASE)
-    if vec_match:
-        name, high, low = vec_match.group(1), int(vec_match.group(2)), int(vec_match.group(3))
-        return name, max(1, high - low + 1)
-    vec_to = re.search(r"(\w+)\s*\(\s*(\d+)\s+to\s+(\d+)\s*\)", text, re.IGNORECASE)
-    if vec_to:
-        name, low, high = vec_to.group(1), int(vec_to.group(2)), int(vec_to.group(3))
-        return name, max(1, high - low + 1)
-    # 단순 타입
-    simple = re.match(r"(\w+)", text)
-    if simple:
-        return simple.group(1), 1
-    return text or "unknown", 1
+        if t == "identifier_list":
+            names = identifier_names(child, source)
+        elif t == "identifier":
+            names = [node_text(child, source)]
+        elif t in ("simple_mode_indication", "mode_indication"):
+            for part in child.children:
+                pt = part.type
+                if pt == "mode":
+                    for m in part.children:
+                        if m.type in _MODES:
+                            direction = m.type
+                            break
+                elif pt == "subtype_indication":
+                    subtype = part
+                elif pt == "initialiser":
+                    default = node_text(part, source).lstrip(":=").strip()
+    return names, direction, subtype, default
 
 
-def extract_entity_ports_from_tree(tree: Tree, source: str) -> Optional[Entity]:
-    """AST에서 첫 entity_declaration을 찾아 Entity(이름, ports) 반환."""
-    if isinstance(source, str):
-        source_bytes = source.encode("utf-8")
-    else:
-        source_bytes = source
-    root = tree.root_node
-    entity_decl = _find_first(root, "entity_declaration")
-    if not entity_decl:
+def label_of(node: Node, source: bytes) -> Optional[str]:
+    """label_declaration 자식의 레이블 (없으면 None)."""
+    for child in node.children:
+        if child.type == "label_declaration":
+            for c in child.children:
+                if c.type == "label":
+                    return node_text(c, source)
+    return None
+
+
+def generic_env_of(entity: Node, source: bytes) -> Dict[str, int]:
+    """entity_declaration 의 generic 기본값 환경 (이름 소문자 → 값). 앞 generic 을 참조하는 기본값도 계산."""
+    env: Dict[str, int] = {}
+    for head in entity.children:
+        if head.type != "entity_head":
+            continue
+        for clause in head.children:
+            if clause.type != "generic_clause":
+                continue
+            for lst in clause.children:
+                for iface in lst.children if lst.type == "interface_list" else ():
+                    if iface.type != "interface_declaration":
+                        continue
+                    names, _, _, default = parse_interface_declaration(iface, source)
+                    value = eval_expr(default, env) if default else None
+                    if value is not None:
+                        env.update((name.lower(), value) for name in names)
+    return env
+
+
+def signals_from_declaration(node: Node, source: bytes, env: Optional[Dict[str, int]] = None) -> List[Signal]:
+    """signal_declaration → Signal 목록 (signal a, b : T → 2개). env: 소속 entity 의 generic 기본값."""
+    names: List[str] = []
+    type_name, width = "unknown", 1
+    for child in node.children:
+        if child.type == "identifier_list":
+            names = identifier_names(child, source)
+        elif child.type == "subtype_indication":
+            type_name, width = subtype_type_and_width(child, source, env)
+    return [Signal(name=name, type=type_name, width=width) for name in names]
+
+
+def process_from_node(node: Node, source: bytes) -> Process:
+    """process_statement → Process(레이블, 감지 목록)."""
+    sensitivity: List[str] = []
+    for child in node.children:
+        if child.type == "sensitivity_specification":
+            for part in child.children:
+                if part.type == "sensitivity_list":
+                    sensitivity = [node_text(n, source) for n in part.named_children]
+    return Process(label=label_of(node, source), sensitivity=sensitivity)
+
+
+@dataclass
+class DesignSummary:
+    """단일 순회 추출 결과: entity(port/generic 포함), signal, process 목록."""
+    entities: List[Entity] = field(default_factory=list)
+    signals: List[Signal] = field(default_factory=list)
+    processes: List[Process] = field(default_factory=list)
+    visits: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "entities": [e.to_dict() for e in self.entities],
+            "signals": [s.to_dict() for s in self.signals],
+            "processes": [p.to_dict() for p in self.processes],
+        }
+
+
+class _DesignCollector:
+    """NodeDispatcher 핸들러 묶음. 한 번의 TreeCursor 순회로 DesignSummary 를 채운다."""
+
+    def __init__(self, source: bytes, first_entity_only: bool = False):
+        self.source = source
+        self.summary = DesignSummary()
+        self._first_entity_only = first_entity_only
+        self._entity: Optional[Entity] = None
+        self._clause: Optional[str] = None
+        self._generic_env: Dict[str, int] = {}  # 현재 entity/architecture 의 generic 기본값 (포트·signal 폭 계산용)
+        self._entity_envs: Dict[str, Dict[str, int]] = {}  # entity 이름 소문자 → generic 기본값
+
+    def dispatcher(self) -> NodeDispatcher:
+        d = NodeDispatcher()
+        d.skip(*_EXTRACT_SKIP_TYPES)
+        d.on_enter("design_unit", self._enter_design_unit)
+        d.on_enter("entity_declaration", self._enter_entity)
+        d.on_leave("entity_declaration", self._leave_entity)
+        d.on_enter("generic_clause", self._enter_generic_clause)
+        d.on_enter("port_clause", self._enter_port_clause)
+        d.on_leave("generic_clause", self._leave_clause)
+        d.on_leave("port_clause", self._leave_clause)
+        d.on_enter("interface_declaration", self._enter_interface)
+        if not self._first_entity_only:
+            d.on_enter("architecture_definition", self._enter_architecture)
+            d.on_enter("signal_declaration", self._enter_signal)
+            d.on_enter("process_statement", self._enter_process)
+        else:
+            d.skip("architecture_definition", "package_declaration")
+        return d
+
+    def _enter_design_unit(self, node: Node) -> None:
+        # package·configuration 등은 앞 entity 의 generic 을 보지 않는다 (entity/architecture 는 진입 시 다시 설정)
+        self._generic_env = {}
+
+    def _enter_entity(self, node: Node) -> Optional[str]:
+        ident = node.child_by_field_name("entity")
+        if ident is None:
+            ident = next((c for c in node.children if c.type == "identifier"), None)
+        if ident is None:
+            return SKIP
+        self._entity = Entity(module_name=node_text(ident, self.source), ports=[])
+        self._generic_env = self._entity_envs[self._entity.module_name.lower()] = {}
+        self.summary.entities.append(self._entity)
         return None
-    # entity 이름: entity_declaration > identifier (두 번째는 end 쪽일 수 있음; entity_head 쪽 identifier가 선언 이름)
-    ident_node = _find_first(entity_decl, "identifier")
-    if not ident_node:
+
+    def _leave_entity(self, node: Node) -> Optional[str]:
+        self._entity = None
+        if self._first_entity_only and self.summary.entities:
+            return STOP
+        return None
+
+    def _enter_generic_clause(self, node: Node) -> Optional[str]:
+        self._clause = "generic"
         return None
-    module_name = _text(ident_node, source_bytes)
-    # end entity XXX 에서 이름이 나오므로, 첫 identifier가 보통 선언 이름
-    head = _find_first(entity_decl, "entity_head")
-    if head:
-        port_clause = _find_first(head, "port_clause")
-        if port_clause:
-            interface_list = _find_first(port_clause, "interface_list")
-            if interface_list:
-                ports: List[Port] = []
-                for iface in _find_all(interface_list, "interface_declaration"):
-                    name = _get_identifier_name(iface, source_bytes)
-                    mode_ind = _find_first(iface, "simple_mode_indication")
-                    if not mode_ind:
-                        mode_ind = _find_first(iface, "mode_indication")
-                    direction = _get_mode(mode_ind, source_bytes) if mode_ind else "in"
-                    subtype = _find_first(iface, "subtype_indication")
-                    type_name, width = _get_subtype_type_and_width(subtype, source_bytes) if subtype else ("unknown", 1)
-                    ports.append(Port(name=name, direction=direction, type=type_name, width=width))
-                return Entity(module_name=module_name, ports=ports)
-    return Entity(module_name=module_name, ports=[])
-
-
-def parse_vhdl(vhdl_source: str, extract_entity: bool = True) -> Dict[str, Any]:
-    """
-    한 번에 파싱 + (선택) Entity 추출.
+
+    def _enter_port_clause(self, node: Node) -> Optional[str]:
+        self._clause = "port"
+        return None
+
+    def _leave_clause(self, node: Node) -> Optional[str]:
+        self._clause = None
+        return None
+
+    def _enter_interface(self, node: Node) -> str:
+        entity = self._entity
+        if entity is None or self._clause is None:
+            return SKIP
+        names, direction, subtype, default = parse_interface_declaration(node, self.source)
+        if self._clause == "port":
+            type_name, width, rng = subtype_width(node_text(subtype, self.source), self._generic_env) if subtype else ("unknown", 1, None)
+            for name in names:
+                entity.ports.append(Port(name=name, direction=direction, type=type_name, width=width, range=rng))
+        else:
+            type_name = node_text(subtype, self.source) if subtype else "unknown"
+            value = eval_expr(default, self._generic_env) if default else None
+            for name in names:
+                entity.generics.append(Generic(name=name, type=type_name, default=default))
+                if value is not None:
+                    self._generic_env[name.lower()] = value
+        return SKIP
+
+    def _enter_architecture(self, node: Node) -> None:
+        entity = node.child_by_field_name("entity")
+        name = node_text(entity, self.source).lower() if entity is not None else ""
+        self._generic_env = self._entity_envs.get(name, {})
+        return None
+
+    def _enter_signal(self, node: Node) -> str:
+        self.summary.signals.extend(signals_from_declaration(node, self.source, self._generic_env))
+        return SKIP
+
+    def _enter_process(self, node: Node) -> str:
+        self.summary.processes.append(process_from_node(node, self.source))
+        return SKIP
+
+
+def extract_design_from_tree(tree: Tree, source: str) -> DesignSummary:
+    """
+    TreeCursor 단일 순회로 entity(port/generic), signal, process 를 모두 추출.
+    재귀 없이 O(n), 관심 없는 서브트리는 건너뛴다.
+    """
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    collector = _DesignCollector(source)
+    with stage("extract"):
+        collector.summary.visits = collector.dispatcher().walk(tree)
+    profiler = active()
+    if profiler is not None:
+        entities = collector.summary.entities
+        profiler.count("entities", len(entities))
+        profiler.count("ports", sum(len(e.ports) for e in entities))
+    return collector.summary
+
+
+def extract_entity_ports_from_tree(tree: Tree, source: str) -> Optional[Entity]:
+    """AST에서 첫 entity_declaration을 찾아 Entity(이름, ports, generics) 반환. 첫 entity 를 지나면 순회 종료."""
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    collector = _DesignCollector(source, first_entity_only=True)
+    with stage("extract"):
+        collector.dispatcher().walk(tree)
+    entities = collector.summary.entities
+    return entities[0] if entities else None
+
+
+class ParseResult:
+    """
+    parse_vhdl 결과. tree 는 파싱 즉시 보유하고, 나머지 단계는 첫 접근 시 계산 후 캐시한다.
+
+    단계(STAGES):
+        ast_dict — 전체 AST dict (Full Dump, 가장 비쌈)
+        entity   — 첫 entity (첫 entity 를 지나면 순회 종료)
+        design   — DesignSummary (entity/port/generic/signal/process 단일 순회)
+
+    기존 dict 반환과의 호환을 위해 result["tree"], result["ast_dict"], result["entity"] 도 지원.
+    """
+
+    STAGES = ("ast_dict", "entity", "design")
+
+    def __init__(self, tree: Tree, source: Union[str, bytes], extract_entity: bool = True):
+        self.tree = tree
+        self.source = source.encode("utf-8") if isinstance(source, str) else source
+        self._keys = ["ast_dict", "entity", "tree"] if extract_entity else ["ast_dict", "tree"]
+
+    @cached_property
+    def ast_dict(self) -> Dict[str, Any]:
+        return ast_to_dict(self.tree, self.source)
+
+    @cached_property
+    def entity(self) -> Optional[Entity]:
+        if "design" in self.__dict__:
+            entities = self.design.entities
+            return entities[0] if entities else None
+        return extract_entity_ports_from_tree(self.tree, self.source)
+
+    @cached_property
+    def design(self) -> DesignSummary:
+        return extract_design_from_tree(self.tree, self.source)
+
+    def computed(self) -> List[str]:
+        """이미 계산된 단계 이름."""
+        return [name for name in self.STAGES if name in self.__dict__]
+
+    def compute(self, *stages: str) -> "ParseResult":
+        """지정 단계를 미리 계산."""
+        for name in stages:
+            if name not in self.STAGES:
+                raise ValueError(f"알 수 없는 단계: {name} (가능: {', '.join(self.STAGES)})")
+            getattr(self, name)
+        return self
+
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self._keys else default
+
+
+def parse_vhdl(
+    vhdl_source: str,
+    extract_entity: bool = True,
+    stages: Optional[Sequence[str]] = None,
+) -> ParseResult:
+    """
+    한 번에 파싱 + 필요한 단계만 계산.
+
+    Args:
+        vhdl_source: VHDL 원문
+        extract_entity: False 면 호환 dict 키에서 "entity" 제외
+        stages: 즉시 계산할 단계 (ParseResult.STAGES 중). None 이면 모든 단계를 첫 접근 시 지연 계산
+
     Returns:
-        {"tree": Tree, "ast_dict": dict (JSON 가능), "entity": Entity or None}
+        ParseResult — .tree, .ast_dict, .entity, .design (result["tree"] 등 dict 방식 접근도 가능)
         참고: "tree"는 JSON 직렬화 불가; 덤프 시 ast_dict만 사용.
     """
     tree = parse_to_tree(vhdl_source)
-    out: Dict[str, Any] = {"ast_dict": ast_to_dict(tree, vhdl_source)}
-    if extract_entity:
-        out["entity"] = extract_entity_ports_from_tree(tree, vhdl_source)
-    out["tree"] = tree  # 프로그램용; json.dumps 시 제외 필요
-    return out
+    result = ParseResult(tree, vhdl_source, extract_entity=extract_entity)
+    if stages:
+        result.compute(*stages)
+    return result
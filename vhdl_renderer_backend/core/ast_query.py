@@ -0,0 +1,305 @@
+"""
+Tree-sitter 쿼리 기반 선언적 추출.
+S-expression 쿼리를 Language 별로 한 번만 컴파일(캐시)하고, 매칭은 C 엔진(QueryCursor)에서 수행한다.
+트리 전체 또는 바이트 구간(예: VhdlDocument.changed_ranges)으로 제한하여 실행 가능.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from tree_sitter import Node, Query, QueryCursor, Tree
+except ImportError:
+    Node = Query = QueryCursor = Tree = None
+
+from .ast_parser import (
+    generic_env_of,
+    label_of,
+    node_text,
+    parse_interface_declaration,
+    process_from_node,
+    signals_from_declaration,
+    subtype_type_and_width,
+)
+from .parser_pool import get_language
+
+ByteRange = Tuple[int, int]
+
+# 종류별 S-expression 쿼리. 캡처 이름 규칙: 주 캡처 = 종류 이름, 보조 캡처 = "종류.필드"
+QUERIES: Dict[str, str] = {
+    "entities": "(entity_declaration entity: (identifier) @entity.name) @entity",
+    "ports": (
+        "(entity_declaration entity: (identifier) @entity.name"
+        " (entity_head (port_clause (interface_list (interface_declaration) @port))))"
+    ),
+    "generics": (
+        "(entity_declaration entity: (identifier) @entity.name"
+        " (entity_head (generic_clause (interface_list (interface_declaration) @generic))))"
+    ),
+    "signals": "(signal_declaration) @signal",
+    "instances": "(component_instantiation_statement) @instance",
+    "processes": "(process_statement) @process",
+}
+
+_CACHE: Dict[Tuple[Any, str], Query] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+@dataclass
+class EntityMatch:
+    name: str
+    start_byte: int
+    end_byte: int
+
+
+@dataclass
+class PortMatch:
+    entity: str
+    name: str
+    direction: str
+    type: str
+    width: int
+    start_byte: int
+    end_byte: int
+
+
+@dataclass
+class GenericMatch:
+    entity: str
+    name: str
+    type: str
+    default: Optional[str]
+    start_byte: int
+    end_byte: int
+
+
+@dataclass
+class SignalMatch:
+    name: str
+    type: str
+    width: int
+    start_byte: int
+    end_byte: int
+
+
+@dataclass
+class InstanceMatch:
+    """component/entity 인스턴스. kind: "component" | "entity" | "configuration"."""
+    label: Optional[str]
+    unit: str
+    kind: str
+    library: Optional[str]
+    start_byte: int
+    end_byte: int
+
+
+@dataclass
+class ProcessMatch:
+    label: Optional[str]
+    sensitivity: List[str]
+    start_byte: int
+    end_byte: int
+
+
+@dataclass
+class QueryResult:
+    """query_design 결과 묶음."""
+    entities: List[EntityMatch] = field(default_factory=list)
+    ports: List[PortMatch] = field(default_factory=list)
+    generics: List[GenericMatch] = field(default_factory=list)
+    signals: List[SignalMatch] = field(default_factory=list)
+    instances: List[InstanceMatch] = field(default_factory=list)
+    processes: List[ProcessMatch] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {k: [asdict(m) for m in v] for k, v in self.__dict__.items()}
+
+
+def compiled_query(kind: str, language: Any = None) -> Query:
+    """QUERIES[kind] (또는 "design" = 전체 합본) 을 Language 별 1회 컴파일하여 반환."""
+    lang = language if language is not None else get_language()
+    key = (lang, kind)
+    q = _CACHE.get(key)
+    if q is None:
+        if kind == "design":
+            source = "\n".join(QUERIES.values())
+        elif kind in QUERIES:
+            source = QUERIES[kind]
+        else:
+            raise KeyError(f"알 수 없는 쿼리 종류: {kind}")
+        with _CACHE_LOCK:
+            q = _CACHE.get(key)
+            if q is None:
+                q = Query(lang, source)
+                _CACHE[key] = q
+    return q
+
+
+def run_query(
+    tree: Tree,
+    kind: str,
+    ranges: Optional[Sequence[ByteRange]] = None,
+) -> List[Tuple[int, Dict[str, List[Node]]]]:
+    """
+    쿼리 실행 → (pattern index, {캡처 이름: [노드]}) 목록.
+    ranges 지정 시 각 바이트 구간과 겹치는 매치만 (중복 제거).
+    """
+    cursor = QueryCursor(compiled_query(kind, tree.language))
+    root = tree.root_node
+    if not ranges:
+        return cursor.matches(root)
+    out: List[Tuple[int, Dict[str, List[Node]]]] = []
+    seen = set()
+    for start, end in ranges:
+        cursor.set_byte_range(start, end)
+        for pattern, caps in cursor.matches(root):
+            key = (pattern,) + tuple((name, nodes[0].start_byte, nodes[-1].end_byte) for name, nodes in sorted(caps.items()))
+            if key not in seen:
+                seen.add(key)
+                out.append((pattern, caps))
+    return out
+
+
+class _GenericEnvs:
+    """entity 별 generic 기본값 환경 (포트·signal 폭 계산용). 처음 필요할 때 계산해 쿼리 1회 동안 캐시."""
+
+    def __init__(self, tree: Tree, source: bytes):
+        self.root = tree.root_node
+        self.source = source
+        self._envs: Dict[int, Dict[str, int]] = {}  # entity_declaration start_byte → 환경
+        self._entities: Optional[Dict[str, Node]] = None  # entity 이름 소문자 → 노드 (architecture 조회용)
+
+    def of_entity(self, entity: Node) -> Dict[str, int]:
+        env = self._envs.get(entity.start_byte)
+        if env is None:
+            env = self._envs[entity.start_byte] = generic_env_of(entity, self.source)
+        return env
+
+    def of_enclosing_architecture(self, node: Node) -> Dict[str, int]:
+        """node 를 감싸는 architecture 의 entity 환경 (같은 파일에 entity 가 없으면 빈 환경)."""
+        arch = node.parent
+        while arch is not None and arch.type != "architecture_definition":
+            arch = arch.parent
+        name = arch.child_by_field_name("entity") if arch is not None else None
+        if name is None:
+            return {}
+        if self._entities is None:
+            self._entities = {}
+            for unit in self.root.children:
+                for child in unit.children if unit.type == "design_unit" else (unit,):
+                    ident = child.child_by_field_name("entity") if child.type == "entity_declaration" else None
+                    if ident is not None:
+                        self._entities.setdefault(node_text(ident, self.source).lower(), child)
+        entity = self._entities.get(node_text(name, self.source).lower())
+        return self.of_entity(entity) if entity is not None else {}
+
+
+def _decode_entity(caps: Dict[str, List[Node]], source: bytes) -> EntityMatch:
+    node = caps["entity"][0]
+    return EntityMatch(node_text(caps["entity.name"][0], source), node.start_byte, node.end_byte)
+
+
+def _decode_ports(caps: Dict[str, List[Node]], source: bytes, envs: _GenericEnvs) -> List[PortMatch]:
+    node = caps["port"][0]
+    entity_name = caps["entity.name"][0]
+    entity = node_text(entity_name, source)
+    names, direction, subtype, _ = parse_interface_declaration(node, source)
+    env = envs.of_entity(entity_name.parent)
+    type_name, width = subtype_type_and_width(subtype, source, env) if subtype else ("unknown", 1)
+    return [PortMatch(entity, n, direction, type_name, width, node.start_byte, node.end_byte) for n in names]
+
+
+def _decode_generics(caps: Dict[str, List[Node]], source: bytes) -> List[GenericMatch]:
+    node = caps["generic"][0]
+    entity = node_text(caps["entity.name"][0], source)
+    names, _, subtype, default = parse_interface_declaration(node, source)
+    type_name = node_text(subtype, source) if subtype else "unknown"
+    return [GenericMatch(entity, n, type_name, default, node.start_byte, node.end_byte) for n in names]
+
+
+def _decode_signals(caps: Dict[str, List[Node]], source: bytes, envs: _GenericEnvs) -> List[SignalMatch]:
+    node = caps["signal"][0]
+    return [SignalMatch(s.name, s.type, s.width, node.start_byte, node.end_byte)
+            for s in signals_from_declaration(node, source, envs.of_enclosing_architecture(node))]
+
+
+def _decode_instance(caps: Dict[str, List[Node]], source: bytes) -> InstanceMatch:
+    node = caps["instance"][0]
+    unit, kind, library = "", "component", None
+    for child in node.children:
+        if child.type == "name":
+            unit = node_text(child, source)
+        elif child.type == "instantiated_unit":
+            for c in child.children:
+                if c.type in ("entity", "configuration"):
+                    kind = c.type
+                elif c.type == "library_namespace":
+                    library = node_text(c, source)
+                elif c.type == "name":
+                    unit = node_text(c, source)
+    return InstanceMatch(label_of(node, source), unit, kind, library, node.start_byte, node.end_byte)
+
+
+def _decode_process(caps: Dict[str, List[Node]], source: bytes) -> ProcessMatch:
+    node = caps["process"][0]
+    process = process_from_node(node, source)
+    return ProcessMatch(process.label, process.sensitivity, node.start_byte, node.end_byte)
+
+
+def _as_bytes(source: Any) -> bytes:
+    return source.encode("utf-8") if isinstance(source, str) else source
+
+
+def query_entities(tree: Tree, source: Any, ranges: Optional[Sequence[ByteRange]] = None) -> List[EntityMatch]:
+    src = _as_bytes(source)
+    return [_decode_entity(c, src) for _, c in run_query(tree, "entities", ranges)]
+
+
+def query_ports(tree: Tree, source: Any, ranges: Optional[Sequence[ByteRange]] = None) -> List[PortMatch]:
+    src = _as_bytes(source)
+    envs = _GenericEnvs(tree, src)
+    return [p for _, c in run_query(tree, "ports", ranges) for p in _decode_ports(c, src, envs)]
+
+
+def query_generics(tree: Tree, source: Any, ranges: Optional[Sequence[ByteRange]] = None) -> List[GenericMatch]:
+    src = _as_bytes(source)
+    return [g for _, c in run_query(tree, "generics", ranges) for g in _decode_generics(c, src)]
+
+
+def query_signals(tree: Tree, source: Any, ranges: Optional[Sequence[ByteRange]] = None) -> List[SignalMatch]:
+    src = _as_bytes(source)
+    envs = _GenericEnvs(tree, src)
+    return [s for _, c in run_query(tree, "signals", ranges) for s in _decode_signals(c, src, envs)]
+
+
+def query_instances(tree: Tree, source: Any, ranges: Optional[Sequence[ByteRange]] = None) -> List[InstanceMatch]:
+    src = _as_bytes(source)
+    return [_decode_instance(c, src) for _, c in run_query(tree, "instances", ranges)]
+
+
+def query_processes(tree: Tree, source: Any, ranges: Optional[Sequence[ByteRange]] = None) -> List[ProcessMatch]:
+    src = _as_bytes(source)
+    return [_decode_process(c, src) for _, c in run_query(tree, "processes", ranges)]
+
+
+def query_design(tree: Tree, source: Any, ranges: Optional[Sequence[ByteRange]] = None) -> QueryResult:
+    """합본 쿼리 1회 실행으로 모든 종류를 한꺼번에 추출."""
+    src = _as_bytes(source)
+    result = QueryResult()
+    envs = _GenericEnvs(tree, src)
+    for _, caps in run_query(tree, "design", ranges):
+        if "port" in caps:
+            result.ports.extend(_decode_ports(caps, src, envs))
+        elif "generic" in caps:
+            result.generics.extend(_decode_generics(caps, src))
+        elif "entity" in caps:
+            result.entities.append(_decode_entity(caps, src))
+        elif "signal" in caps:
+            result.signals.extend(_decode_signals(caps, src, envs))
+        elif "instance" in caps:
+            result.instances.append(_decode_instance(caps, src))
+        elif "process" in caps:
+            result.processes.append(_decode_process(caps, src))
+    return result
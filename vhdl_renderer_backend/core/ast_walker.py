@@ -0,0 +1,88 @@
+"""
+TreeCursor 기반 단일 순회 디스패처.
+노드 type 별 핸들러를 등록해 두고 트리를 한 번만(비재귀) 순회하며 핸들러를 호출한다.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional
+
+try:
+    from tree_sitter import Node, Tree
+except ImportError:
+    Node = Tree = None
+
+# enter 핸들러 반환값: 하위 노드 방문 생략 / 순회 즉시 종료
+SKIP = "skip"
+STOP = "stop"
+
+Handler = Callable[[Any], Optional[str]]
+
+
+class NodeDispatcher:
+    """
+    type → 핸들러 매핑으로 한 번의 O(n) 순회에서 여러 추출을 동시에 수행.
+
+    - on_enter(type, fn): 노드 진입 시 fn(node). SKIP 반환 시 서브트리 생략, STOP 반환 시 순회 종료
+    - on_leave(type, fn): 서브트리 방문을 마친 뒤 fn(node). STOP 반환 시 순회 종료
+    - visits: 누적 방문 노드 수 (벤치마크/계측용)
+
+    TreeCursor 로 이동하므로 재귀 깊이 제한이 없고, children 리스트를 할당하지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self._enter: Dict[str, Handler] = {}
+        self._leave: Dict[str, Handler] = {}
+        self.visits = 0
+
+    def on_enter(self, node_type: str, fn: Handler) -> "NodeDispatcher":
+        self._enter[node_type] = fn
+        return self
+
+    def on_leave(self, node_type: str, fn: Handler) -> "NodeDispatcher":
+        self._leave[node_type] = fn
+        return self
+
+    def skip(self, *node_types: str) -> "NodeDispatcher":
+        """관심 없는 서브트리 type 들을 통째로 건너뛰도록 등록."""
+        for t in node_types:
+            self._enter[t] = _skip
+        return self
+
+    def walk(self, target: Any) -> int:
+        """Tree 또는 Node 를 루트로 순회. 이번 순회의 방문 노드 수 반환."""
+        root = target.root_node if hasattr(target, "root_node") else target
+        cursor = root.walk()
+        enter = self._enter
+        leave = self._leave
+        visits = 0
+        while True:
+            node = cursor.node
+            visits += 1
+            handler = enter.get(node.type)
+            action = handler(node) if handler is not None else None
+            if action == STOP:
+                break
+            if action != SKIP and cursor.goto_first_child():
+                continue
+            # 현재 노드 종료 → 다음 형제, 없으면 부모로 올라가며 leave 호출
+            stopped = False
+            while True:
+                if leave:
+                    current = cursor.node
+                    lh = leave.get(current.type)
+                    if lh is not None and lh(current) == STOP:
+                        stopped = True
+                        break
+                if cursor.goto_next_sibling():
+                    break
+                if not cursor.goto_parent():
+                    stopped = True
+                    break
+            if stopped:
+                break
+        self.visits += visits
+        return visits
+
+
+def _skip(node: Any) -> str:
+    return SKIP
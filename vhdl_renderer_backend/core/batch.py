@@ -0,0 +1,323 @@
+"""
+프로젝트 단위 일괄 파싱.
+디렉터리/파일 목록에서 .vhd/.vhdl 을 찾아 프로세스 풀로 청크 단위 병렬 파싱하고,
+완료되는 순서대로 파일별 결과를 내보낸다.
+"""
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    from ..models.vhdl_types import Entity
+except ImportError:
+    from models.vhdl_types import Entity
+
+from .ast_parser import extract_design_from_tree, parse_to_tree
+from .budget import CancelToken, ParseBudget, ParseBudgetExceeded
+from .cache import ParseCache, cache_options
+from .entity_parser import parse_entities
+from .preprocessor import preprocess
+from .profile import active, count, profiling, stage
+
+VHDL_SUFFIXES = (".vhd", ".vhdl")
+# batch 결과(FileResult) 의 캐시 키 옵션. 단일 파일 CLI(mode="entities") 와 같은 캐시를 써도 섞이지 않는다
+CACHE_OPTIONS = cache_options("design")
+
+
+@dataclass
+class FileResult:
+    """파일 1개 파싱 결과. error 가 있으면 실패."""
+    path: str
+    entities: List[Entity] = field(default_factory=list)
+    parser: str = "ast"          # "ast" | "regex"
+    syntax_error: bool = False   # Tree-sitter 트리에 ERROR 노드 존재
+    error: Optional[str] = None
+    elapsed_s: float = 0.0
+    cached: bool = False         # 디스크 캐시에서 복원
+    fallback: Optional[str] = None  # AST 예산 초과로 정규식 대체 시 이유 ("time" | "size")
+    cache_key: Optional[str] = field(default=None, repr=False)  # 캐시 조회에 쓴 키 (부모가 저장·통계에 사용, 출력 제외)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict:
+        d = {
+            "path": self.path,
+            "entities": [e.to_dict() for e in self.entities],
+            "parser": self.parser,
+            "syntax_error": self.syntax_error,
+            "error": self.error,
+            "elapsed_s": round(self.elapsed_s, 6),
+            "cached": self.cached,
+        }
+        if self.fallback is not None:
+            d["fallback"] = self.fallback
+        return d
+
+    def cache_payload(self) -> dict:
+        """캐시에 저장할 내용 (경로·시간 제외: 내용이 같으면 어느 경로든 재사용)."""
+        return {
+            "entities": [e.to_dict() for e in self.entities],
+            "parser": self.parser,
+            "syntax_error": self.syntax_error,
+        }
+
+    @classmethod
+    def from_cache(cls, path: str, payload: dict) -> "FileResult":
+        return cls(
+            path=path,
+            entities=[Entity.from_dict(e) for e in payload["entities"]],
+            parser=payload["parser"],
+            syntax_error=payload["syntax_error"],
+            cached=True,
+        )
+
+
+def discover_files(inputs: Iterable[Union[str, Path]]) -> List[Path]:
+    """
+    입력 경로들에서 VHDL 파일 목록 생성 (중복 제거, 정렬).
+
+    - 디렉터리: 하위까지 재귀 탐색하여 .vhd/.vhdl 수집
+    - .vhd/.vhdl 파일: 그대로 추가
+    - 그 외 파일: 파일 목록으로 간주 (한 줄에 경로 하나, 빈 줄·# 주석 무시, 상대 경로는 목록 파일 기준)
+    """
+    found = set()
+    for item in inputs:
+        p = Path(item)
+        if p.is_dir():
+            for root, _dirs, files in os.walk(p):
+                for name in files:
+                    if name.lower().endswith(VHDL_SUFFIXES):
+                        found.add(Path(root) / name)
+        elif p.suffix.lower() in VHDL_SUFFIXES:
+            found.add(p)
+        elif p.is_file():
+            for line in p.read_text(encoding="utf-8", errors="replace").splitlines():
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                entry = Path(line)
+                if not entry.is_absolute():
+                    entry = p.parent / entry
+                found.add(entry)
+        else:
+            raise FileNotFoundError(f"입력을 찾을 수 없습니다: {p}")
+    return sorted(found)
+
+
+Stamp = Tuple[int, int]  # (mtime_ns, size)
+
+
+def file_stamp(path: str) -> Optional[Stamp]:
+    """변경 감지용 (mtime_ns, size). 파일이 없거나 읽을 수 없으면 None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def scan_files(roots: Iterable[Union[str, Path]]) -> Dict[str, Stamp]:
+    """디렉터리(재귀)/개별 파일에서 .vhd/.vhdl 경로 → (mtime_ns, size) 스냅샷."""
+    state: Dict[str, Stamp] = {}
+    stack = []
+    for root in map(str, roots):
+        if os.path.isdir(root):
+            stack.append(root)
+        elif root.lower().endswith(VHDL_SUFFIXES):
+            stamp = file_stamp(root)
+            if stamp is not None:
+                state[root] = stamp
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith(VHDL_SUFFIXES):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    state[entry.path] = (st.st_mtime_ns, st.st_size)
+    return state
+
+
+def parse_file(
+    path: Union[str, Path],
+    budget: Optional[ParseBudget] = None,
+    cancel: Optional[CancelToken] = None,
+    cache: Optional[ParseCache] = None,
+) -> FileResult:
+    """
+    파일 1개 파싱: Tree-sitter 단일 순회로 모든 entity 추출.
+    tree-sitter 미설치 시, 또는 budget(시간·크기) 초과 시 전처리 + 정규식 entity_parser 로 대체
+    (예산 초과는 fallback 에 이유 기록). cancel 로 취소되면 error="cancelled".
+    cache 를 주면 내용 해시로 먼저 조회하고 (lookup 만, 통계·저장은 호출자), 키는 result.cache_key 에 남긴다.
+    """
+    t0 = time.perf_counter()
+    result = FileResult(path=str(path))
+    try:
+        with stage("read"):
+            data = Path(path).read_bytes()
+            # read_text 와 같은 결과 (universal newlines)
+            text = data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+        if cache is not None:
+            with stage("cache"):
+                key = cache.key(data, CACHE_OPTIONS)
+                try:
+                    payload = cache.lookup(key)
+                except sqlite3.Error:  # 캐시 문제로 파일을 실패 처리하지 않음
+                    payload = None
+            if payload is not None:
+                count("cache_hits")
+                result = FileResult.from_cache(str(path), payload)
+                result.cache_key = key
+                result.elapsed_s = time.perf_counter() - t0
+                return result
+            result.cache_key = key
+        count("files")
+        count("bytes_in", len(text))
+        try:
+            tree = parse_to_tree(text, budget, cancel)
+        except ParseBudgetExceeded as exc:
+            if exc.reason == "cancelled":
+                result.error = "cancelled"
+            else:
+                count("fallbacks")
+                result.parser = "regex"
+                result.fallback = exc.reason
+                result.entities = parse_entities(preprocess(text))
+        except RuntimeError:
+            result.parser = "regex"
+            result.entities = parse_entities(preprocess(text))
+        else:
+            result.syntax_error = tree.root_node.has_error
+            result.entities = extract_design_from_tree(tree, text).entities
+    except Exception as exc:  # 한 파일 실패가 배치 전체를 멈추지 않도록
+        result.error = f"{type(exc).__name__}: {exc}"
+    result.elapsed_s = time.perf_counter() - t0
+    return result
+
+
+_WORKER_CACHES: Dict[str, ParseCache] = {}
+
+
+def _worker_cache(cache_dir: Optional[str]) -> Optional[ParseCache]:
+    """워커 프로세스당 1개 읽기 전용 캐시 연결. 열 수 없으면 캐시 없이 파싱."""
+    if cache_dir is None:
+        return None
+    cache = _WORKER_CACHES.get(cache_dir)
+    if cache is None:
+        try:
+            cache = _WORKER_CACHES[cache_dir] = ParseCache(cache_dir, read_only=True)
+        except sqlite3.Error:
+            return None
+    return cache
+
+
+def _parse_chunk(
+    paths: Sequence[str], budget: Optional[ParseBudget] = None, cache_dir: Optional[str] = None
+) -> List[FileResult]:
+    cache = _worker_cache(cache_dir)
+    return [parse_file(p, budget, cache=cache) for p in paths]
+
+
+def _parse_chunk_profiled(
+    paths: Sequence[str], budget: Optional[ParseBudget], cache_dir: Optional[str], memory: bool
+) -> Tuple[List[FileResult], dict]:
+    """워커에서 계측하며 파싱, 결과와 Profiler.to_dict() 를 함께 반환 (부모가 merge)."""
+    with profiling(memory=memory) as profiler:
+        results = _parse_chunk(paths, budget, cache_dir)
+    return results, profiler.to_dict()
+
+
+def run_batch(
+    files: Sequence[Union[str, Path]],
+    jobs: Optional[int] = None,
+    chunk_size: int = 16,
+    cache: Optional[ParseCache] = None,
+    budget: Optional[ParseBudget] = None,
+    cancel: Optional[CancelToken] = None,
+) -> Iterator[FileResult]:
+    """
+    파일 목록을 병렬 파싱하여 완료 순서대로 FileResult 를 yield.
+
+    Args:
+        files: 파싱할 파일 경로
+        jobs: 프로세스 수 (None 이면 CPU 수, 1 이면 현재 프로세스에서 순차 처리)
+        chunk_size: 작업 1건당 파일 수 (프로세스 간 통신 오버헤드 분산)
+        cache: 디스크 캐시. 파일 읽기·해시·조회는 파싱과 함께 워커에서 (읽기 전용 연결) 하고,
+               통계·접근 시각·새 결과 저장은 결과가 돌아올 때 현재 프로세스에서 한다.
+        budget: 파일당 AST 파싱 예산. 초과한 파일은 정규식 결과(fallback 기록)로 대체되고 캐시에 저장하지 않는다.
+        cancel: 취소 신호. 아직 시작하지 않은 파일은 건너뛰고, 현재 프로세스에서 파싱 중인 파일은 중단한다
+                (워커 프로세스의 진행 중인 청크는 끝까지 처리)
+    """
+    paths = [str(f) for f in files]
+    if cache is None:
+        yield from _run_parse(paths, jobs, chunk_size, budget, cancel)
+        return
+    try:
+        for result in _run_parse(paths, jobs, chunk_size, budget, cancel, cache):
+            if result.cache_key is not None:
+                cache.record(result.cache_key, result.cached)
+                if not result.cached and result.ok and result.fallback is None:
+                    cache.put(result.cache_key, result.cache_payload())
+            yield result
+    finally:
+        cache.flush()
+
+
+def _run_parse(
+    paths: List[str],
+    jobs: Optional[int],
+    chunk_size: int,
+    budget: Optional[ParseBudget] = None,
+    cancel: Optional[CancelToken] = None,
+    cache: Optional[ParseCache] = None,
+) -> Iterator[FileResult]:
+    if not paths:
+        return
+    jobs = jobs or os.cpu_count() or 1
+    chunk_size = max(1, chunk_size)
+    if jobs == 1 or len(paths) <= chunk_size:
+        for p in paths:
+            if cancel is not None and cancel.cancelled:
+                return
+            yield parse_file(p, budget, cancel, cache)
+        return
+    chunks = [paths[i : i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    # 계측 중이면 워커도 계측해 단계 시간을 부모 Profiler 에 합친다 (워커 CPU 시간 합)
+    profiler = active()
+    cache_dir = str(cache.cache_dir) if cache is not None else None
+    if cache is not None:
+        cache.flush()  # 워커의 읽기 전용 연결이 이미 저장된 항목을 보도록
+    with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+        if profiler is None:
+            futures = {pool.submit(_parse_chunk, chunk, budget, cache_dir): chunk for chunk in chunks}
+        else:
+            futures = {
+                pool.submit(_parse_chunk_profiled, chunk, budget, cache_dir, profiler.memory): chunk for chunk in chunks
+            }
+        for fut in as_completed(futures):
+            if cancel is not None and cancel.cancelled:
+                for pending in futures:
+                    pending.cancel()
+                return
+            try:
+                results = fut.result()
+            except Exception as exc:  # 워커 프로세스 자체가 죽은 경우: 청크 전체를 실패로 기록
+                results = [FileResult(path=p, error=f"{type(exc).__name__}: {exc}") for p in futures[fut]]
+            else:
+                if profiler is not None:
+                    results, report = results
+                    profiler.merge(report)
+            yield from results
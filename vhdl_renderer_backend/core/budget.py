@@ -0,0 +1,45 @@
+"""
+파싱 예산과 취소.
+
+ParseBudget        파일 1개당 AST 파싱 시간(초)·크기(바이트) 상한. 프로세스 풀로 보낼 수 있도록 불변 값 객체
+CancelToken        다른 스레드에서 cancel() 하면 진행 중인 parse_to_tree 가 다음 읽기 청크에서 멈춘다
+ParseBudgetExceeded  예산 초과/취소 시 parse_to_tree 가 던지는 예외 (reason: "time" | "size" | "cancelled")
+예산 초과 시 parse_file 은 정규식 entity_parser 로 대체하고 FileResult.fallback 에 이유를 남긴다.
+"""
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+REASONS = ("time", "size", "cancelled")
+
+
+@dataclass(frozen=True)
+class ParseBudget:
+    time_s: Optional[float] = None     # AST 파싱 경과 시간 상한
+    max_bytes: Optional[int] = None    # 이보다 큰 소스는 AST 파싱을 시도하지 않음
+
+    def __bool__(self) -> bool:
+        return self.time_s is not None or self.max_bytes is not None
+
+
+class CancelToken:
+    """스레드 간 취소 신호 (threading.Event). 같은 프로세스 안에서만 유효."""
+
+    __slots__ = ("_event",)
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class ParseBudgetExceeded(Exception):
+    def __init__(self, reason: str, detail: str = ""):
+        super().__init__(f"{reason}: {detail}" if detail else reason)
+        self.reason = reason
+        self.detail = detail
@@ -0,0 +1,194 @@
+"""
+디스크 파싱 캐시 (내용 주소 기반).
+키 = 파일 내용 SHA-256 + 파서/문법 버전 + 옵션 플래그(cache_options). 값 = 추출 결과(dict) 를 zlib 압축한 JSON.
+SQLite 파일 1개에 저장하며, 총 크기가 상한을 넘으면 마지막 접근 시각이 오래된 항목부터 삭제(LRU).
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# 추출 로직/저장 형식이 바뀌면 올려서 기존 항목을 무효화
+CACHE_FORMAT = 2
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_DB_NAME = "parse_cache.sqlite3"
+
+
+def default_cache_dir() -> Path:
+    """VHDLENS_CACHE_DIR > XDG_CACHE_HOME/vhdlens > ~/.cache/vhdlens"""
+    env = os.environ.get("VHDLENS_CACHE_DIR")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "vhdlens"
+
+
+def _package_version(name: str) -> str:
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover
+        return "unknown"
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "none"
+
+
+def cache_options(mode: str, normalize: bool = True) -> Dict[str, Any]:
+    """
+    캐시 키 옵션. 단일 파일 CLI 와 batch 가 같은 캐시 디렉터리를 쓰므로 결과 형태를 가르는 값은 모두 넣는다.
+    mode: "entities" (전처리 + 정규식, 단일 파일 CLI) | "design" (AST 추출 FileResult, batch)
+    normalize: 전처리 공백 정규화 여부
+    """
+    return {"mode": mode, "normalize": normalize}
+
+
+def parser_version() -> str:
+    """캐시 키에 포함되는 파서/문법 버전 문자열."""
+    return "fmt{};ts{};vhdl{}".format(
+        CACHE_FORMAT, _package_version("tree-sitter"), _package_version("tree-sitter-vhdl")
+    )
+
+
+class ParseCache:
+    """
+    SQLite 기반 파싱 결과 캐시.
+
+    get 의 접근 시각 갱신과 put 은 모아 두었다가 flush() (또는 close/with 종료) 시 한 트랜잭션으로 기록한다.
+    쓰기는 한 프로세스에서만 한다. 병렬 파싱 워커는 read_only=True 로 열어 lookup() 만 하고,
+    부모가 결과를 받아 record()/put() 으로 통계·접근 시각·새 항목을 반영한다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        read_only: bool = False,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.read_only = read_only
+        self.version = parser_version()
+        self.hits = 0
+        self.misses = 0
+        self._touched: Dict[str, float] = {}
+        self._pending: List[Tuple[str, bytes, int, float]] = []
+        if read_only:
+            uri = (self.cache_dir / _DB_NAME).resolve().as_uri() + "?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True, timeout=30)
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.cache_dir / _DB_NAME), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, payload BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries(last_access)")
+        self._conn.commit()
+
+    def key(self, content: Union[str, bytes], options: Optional[Dict[str, Any]] = None) -> str:
+        """내용 해시 + 파서 버전 + 옵션(정렬된 JSON) → 캐시 키."""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        h = hashlib.sha256(content)
+        h.update(b"\0" + self.version.encode("ascii"))
+        if options:
+            h.update(b"\0" + json.dumps(options, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        value = self.lookup(key)
+        self.record(key, value is not None)
+        return value
+
+    def lookup(self, key: str) -> Optional[dict]:
+        """조회만 (적중 통계·접근 시각은 그대로). 읽기 전용 워커용."""
+        row = self._conn.execute("SELECT payload FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            for pending_key, payload, _, _ in self._pending:
+                if pending_key == key:
+                    row = (payload,)
+                    break
+        return json.loads(zlib.decompress(row[0])) if row is not None else None
+
+    def record(self, key: str, hit: bool) -> None:
+        """조회 결과(다른 프로세스의 lookup 포함)를 적중 통계와 LRU 접근 시각에 반영."""
+        if hit:
+            self.hits += 1
+            self._touched[key] = time.time()
+        else:
+            self.misses += 1
+
+    def put(self, key: str, value: dict) -> None:
+        payload = zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        self._pending.append((key, payload, len(payload), time.time()))
+
+    def flush(self) -> None:
+        """보류 중인 저장·접근 시각 갱신을 기록하고 크기 상한을 넘으면 LRU 삭제. read_only 면 버린다."""
+        if self.read_only:
+            self._pending = []
+            self._touched = {}
+        if not self._pending and not self._touched:
+            return
+        with self._conn:
+            if self._pending:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries(key, payload, size, last_access) VALUES (?, ?, ?, ?)",
+                    self._pending,
+                )
+            if self._touched:
+                self._conn.executemany(
+                    "UPDATE entries SET last_access = ? WHERE key = ?",
+                    [(t, k) for k, t in self._touched.items()],
+                )
+            self._evict()
+        self._pending = []
+        self._touched = {}
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        doomed = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+    def stats(self) -> Dict[str, Any]:
+        entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "path": str(self.cache_dir / _DB_NAME),
+        }
+
+    def clear(self) -> None:
+        self._pending = []
+        self._touched = {}
+        with self._conn:
+            self._conn.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        self.flush()
+        self._conn.close()
+        self._conn = None
+
+    def __enter__(self) -> "ParseCache":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,469 @@
+"""
+상수 표현식 평가 + generic 인식 포트 폭 계산.
+
+포트 subtype 의 범위 `(WIDTH-1 downto 0)` 를 generic·패키지 상수로 계산한다.
+    compile_expr   표현식 원문 → 튜플 트리. 원문 단위 lru_cache (같은 원문은 한 번만 토큰화·구문 분석)
+    evaluate       튜플 트리 + 이름 환경 → int
+                   정수 리터럴(기수 16#FF#, 지수 1E3), + - * / mod rem abs **, 괄호,
+                   X'length / 'high / 'low / 'left / 'right, maximum / minimum
+    subtype_width  subtype 원문 → (타입명, 폭, 범위 원문). 범위가 리터럴이 아니면 범위 원문을 함께 돌려줘
+                   인스턴스별 generic 으로 다시 계산할 수 있게 한다
+    WidthResolver  (entity, generic 바인딩 값) 단위 메모이즈. 같은 generic 으로 수천 번 인스턴스화된 IP 도
+                   generic 기본값·포트 범위 계산은 바인딩마다 1회
+계산할 수 없는 표현식(사용자 함수, 실수, 문자열, 모르는 이름)은 None (미해결). 이름은 대소문자 무시,
+`work.pkg.C` 처럼 선택된 이름은 마지막 이름으로 찾는다.
+"""
+import re
+from collections import ChainMap
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    from ..models.vhdl_types import Association, Constant, Entity
+except ImportError:
+    from models.vhdl_types import Association, Constant, Entity
+
+# 범위: (left, right, downto 여부)
+Bounds = Tuple[int, int, bool]
+
+_TOKEN_RE = re.compile(
+    r"\s*(?:"
+    r"(?P<num>\d[\d_]*(?:#[0-9a-fA-F_]+#)?(?:[eE]\+?\d+)?)"
+    r"|(?P<name>[A-Za-z]\w*(?:\s*\.\s*[A-Za-z]\w*)*)"
+    r"|'\s*(?P<attr>[A-Za-z]\w*)"
+    r"|(?P<op>\*\*|[-+*/(),])"
+    r")"
+)
+_DIRECTION_RE = re.compile(r"\b(downto|to)\b|[()]", re.IGNORECASE)
+_TYPE_MARK_RE = re.compile(r"\s*(?:\w+\s*\.\s*)*(\w+)\s*")
+_SPACES_RE = re.compile(r"\s+")
+
+_ATTRIBUTES = ("length", "high", "low", "left", "right")
+_FUNCTIONS = {"maximum": max, "minimum": min}
+
+
+class _Unresolved(ValueError):
+    """평가 불가 (지원하지 않는 구문 또는 모르는 이름)."""
+
+
+def _tokens(text: str) -> List[Tuple[str, str]]:
+    out: List[Tuple[str, str]] = []
+    pos, end = 0, len(text.rstrip())
+    while pos < end:
+        m = _TOKEN_RE.match(text, pos)
+        if m is None or m.end() == pos:
+            raise _Unresolved(text)
+        kind = m.lastgroup
+        out.append((kind, m.group(kind)))
+        pos = m.end()
+    return out
+
+
+def _number(text: str) -> int:
+    text = text.replace("_", "").upper()
+    if "#" in text:
+        # 16#E0#: 기수 리터럴의 지수는 닫는 # 뒤에만 오고 밑은 기수 (2#1#E3 = 8)
+        base, digits, exponent = text.split("#")
+        value = int(digits, int(base))
+        return value * int(base) ** int(exponent[1:]) if exponent else value
+    mantissa, _, exponent = text.partition("E")
+    value = int(mantissa)
+    return value * 10 ** int(exponent) if exponent else value
+
+
+def _key(name: str) -> str:
+    """선택된 이름 work.pkg.C → c."""
+    return name.rpartition(".")[2].strip().lower()
+
+
+class _ExprParser:
+    """재귀 하강: expr := [+|-] term {(+|-) term}, term := factor {(*|/|mod|rem) factor},
+    factor := abs primary | primary [** primary]."""
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.i = 0
+
+    def peek(self) -> Tuple[str, str]:
+        return self.tokens[self.i] if self.i < len(self.tokens) else ("", "")
+
+    def take(self, value: str) -> bool:
+        kind, tok = self.peek()
+        if (kind == "op" and tok == value) or (kind == "name" and tok.lower() == value):
+            self.i += 1
+            return True
+        return False
+
+    def expect(self, value: str) -> None:
+        if not self.take(value):
+            raise _Unresolved(value)
+
+    def expr(self) -> tuple:
+        if self.take("-"):
+            node = ("neg", self.term())
+        else:
+            self.take("+")
+            node = self.term()
+        while True:
+            if self.take("+"):
+                node = ("+", node, self.term())
+            elif self.take("-"):
+                node = ("-", node, self.term())
+            else:
+                return node
+
+    def term(self) -> tuple:
+        node = self.factor()
+        while True:
+            for op in ("*", "/", "mod", "rem"):
+                if self.take(op):
+                    node = (op, node, self.factor())
+                    break
+            else:
+                return node
+
+    def factor(self) -> tuple:
+        if self.take("abs"):
+            return ("abs", self.primary())
+        node = self.primary()
+        if self.take("**"):
+            node = ("**", node, self.primary())
+        return node
+
+    def primary(self) -> tuple:
+        kind, tok = self.peek()
+        self.i += 1
+        if kind == "num":
+            return ("num", _number(tok))
+        if kind == "op" and tok == "(":
+            node = self.expr()
+            self.expect(")")
+            return node
+        if kind != "name" or tok.lower() in ("mod", "rem", "abs"):
+            raise _Unresolved(tok)
+        name = _key(tok)
+        if self.take("("):
+            args = [self.expr()]
+            while self.take(","):
+                args.append(self.expr())
+            self.expect(")")
+            return ("call", name, tuple(args))
+        kind, attr = self.peek()
+        if kind == "attr":
+            self.i += 1
+            return ("attr", name, attr.lower())
+        return ("name", name)
+
+
+@lru_cache(maxsize=4096)
+def _compile(text: str) -> Optional[tuple]:
+    """원문 단위 캐시. 지원하지 않는 구문도 None 으로 캐시해 다시 분석하지 않는다."""
+    try:
+        parser = _ExprParser(_tokens(text))
+        node = parser.expr()
+    except _Unresolved:
+        return None
+    return node if parser.i == len(parser.tokens) else None
+
+
+def compile_expr(text: str) -> tuple:
+    """
+    정수 상수 표현식 원문 → 튜플 트리 (원문 단위 캐시).
+
+    Raises:
+        ValueError: 지원하지 않는 구문
+    """
+    node = _compile(text)
+    if node is None:
+        raise _Unresolved(text)
+    return node
+
+
+def _trunc_div(a: int, b: int) -> int:
+    """VHDL 정수 나눗셈 (0 쪽으로 버림)."""
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b >= 0) else -q
+
+
+def _attribute(bounds: Bounds, attr: str) -> int:
+    left, right, downto = bounds
+    if attr == "length":
+        return max(0, left - right + 1 if downto else right - left + 1)
+    if attr == "left":
+        return left
+    if attr == "right":
+        return right
+    return max(left, right) if attr == "high" else min(left, right)
+
+
+def evaluate(node: tuple, env: Mapping[str, int], ranges: Optional[Mapping[str, Bounds]] = None) -> int:
+    """
+    compile_expr 결과를 이름 환경(소문자 이름 → 값)으로 계산.
+
+    Raises:
+        ValueError: 모르는 이름/속성/함수, 0 으로 나누기
+    """
+    op = node[0]
+    if op == "num":
+        return node[1]
+    if op == "name":
+        value = env.get(node[1])
+        if value is None:
+            raise _Unresolved(node[1])
+        return value
+    if op == "attr":
+        bounds = ranges.get(node[1]) if ranges is not None else None
+        if bounds is None or node[2] not in _ATTRIBUTES:
+            raise _Unresolved(f"{node[1]}'{node[2]}")
+        return _attribute(bounds, node[2])
+    if op == "neg":
+        return -evaluate(node[1], env, ranges)
+    if op == "abs":
+        return abs(evaluate(node[1], env, ranges))
+    if op == "call":
+        fn = _FUNCTIONS.get(node[1])
+        if fn is None:
+            raise _Unresolved(node[1])
+        return fn(evaluate(a, env, ranges) for a in node[2])
+    a = evaluate(node[1], env, ranges)
+    b = evaluate(node[2], env, ranges)
+    if op == "+":
+        return a + b
+    if op == "-":
+        return a - b
+    if op == "*":
+        return a * b
+    if op == "**":
+        if b < 0:
+            raise _Unresolved("**")
+        return a ** b
+    if b == 0:
+        raise _Unresolved("0 으로 나누기")
+    if op == "/":
+        return _trunc_div(a, b)
+    if op == "mod":
+        return a % b
+    return a - b * _trunc_div(a, b)  # rem: 부호는 왼쪽 피연산자
+
+
+def eval_expr(text: str, env: Optional[Mapping[str, int]] = None, ranges: Optional[Mapping[str, Bounds]] = None) -> Optional[int]:
+    """표현식 원문 → int. 계산할 수 없으면 None."""
+    try:
+        return evaluate(compile_expr(text), env or {}, ranges)
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _compile_range(text: str) -> tuple:
+    """'L downto R' / 'L to R' → ("range", L, R, downto), `X'range` → ("attr", x, reverse).
+
+    Raises:
+        ValueError: 범위가 아님 (실패는 캐시되지 않지만 subtype 단위 캐시가 앞에 있다)
+    """
+    depth = 0
+    for m in _DIRECTION_RE.finditer(text):
+        t = m.group()
+        if t == "(":
+            depth += 1
+        elif t == ")":
+            depth -= 1
+        elif depth == 0:
+            left, right = text[: m.start()], text[m.end():]
+            return ("range", compile_expr(left), compile_expr(right), t.lower() == "downto")
+    tokens = _tokens(text)
+    if len(tokens) == 2 and tokens[0][0] == "name" and tokens[1][0] == "attr":
+        attr = tokens[1][1].lower()
+        if attr in ("range", "reverse_range"):
+            return ("attr", _key(tokens[0][1]), attr == "reverse_range")
+    raise _Unresolved(text)
+
+
+def range_bounds(
+    text: str, env: Optional[Mapping[str, int]] = None, ranges: Optional[Mapping[str, Bounds]] = None
+) -> Optional[Bounds]:
+    """이산 범위 원문 → (left, right, downto). 계산할 수 없으면 None."""
+    env = env or {}
+    try:
+        compiled = _compile_range(text)
+        if compiled[0] == "range":
+            return evaluate(compiled[1], env, ranges), evaluate(compiled[2], env, ranges), compiled[3]
+        bounds = ranges.get(compiled[1]) if ranges is not None else None
+        if bounds is None:
+            return None
+        return (bounds[1], bounds[0], not bounds[2]) if compiled[2] else bounds
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _split_subtype(text: str) -> Tuple[str, Tuple[str, ...]]:
+    """subtype 원문 → (타입명, 첫 괄호 안의 차원별 범위 원문). 선택된 타입명은 마지막 이름."""
+    mark = _TYPE_MARK_RE.match(text)
+    if mark is None or not mark.group(1):
+        return text.strip() or "unknown", ()
+    type_name = mark.group(1)
+    start = mark.end()
+    if start >= len(text) or text[start] != "(":
+        return type_name, ()
+    dims: List[str] = []
+    depth = 0
+    seg = start + 1
+    for i in range(start, len(text)):
+        c = text[i]
+        if c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+            if depth == 0:
+                dims.append(text[seg:i])
+                break
+        elif c == "," and depth == 1:
+            dims.append(text[seg:i])
+            seg = i + 1
+    return type_name, tuple(_SPACES_RE.sub(" ", d).strip() for d in dims)
+
+
+def subtype_width(
+    text: str, env: Optional[Mapping[str, int]] = None, ranges: Optional[Mapping[str, Bounds]] = None
+) -> Tuple[str, int, Optional[str]]:
+    """
+    subtype 원문 → (타입명, 비트 폭, 범위 원문).
+
+    'std_logic' → ('std_logic', 1, None), 'std_logic_vector(7 downto 0)' → ('std_logic_vector', 8, None),
+    'std_logic_vector(W-1 downto 0)' + {w: 16} → ('std_logic_vector', 16, 'W-1 downto 0').
+    범위 원문은 리터럴만으로 계산되지 않을 때만 채운다. 계산할 수 없으면 폭 1 (null 범위도 1).
+    다차원이면 차원별 길이의 곱.
+    """
+    type_name, dims = _split_subtype(text)
+    if not dims:
+        return type_name, 1, None
+    width = 1
+    literal = True
+    for dim in dims:
+        bounds = range_bounds(dim)
+        if bounds is None:
+            literal = False
+            bounds = range_bounds(dim, env, ranges) if env or ranges else None
+            if bounds is None:
+                return type_name, 1, ", ".join(dims)
+        width *= _attribute(bounds, "length")
+    return type_name, max(1, width), None if literal else ", ".join(dims)
+
+
+def dims_width(range_text: str, env: Mapping[str, int], ranges: Optional[Mapping[str, Bounds]] = None) -> Optional[int]:
+    """subtype_width 가 돌려준 범위 원문(차원은 ', ' 구분)을 환경으로 다시 계산. 미해결이면 None."""
+    _, dims = _split_subtype(f"t({range_text})")
+    width = 1
+    for dim in dims:
+        bounds = range_bounds(dim, env, ranges)
+        if bounds is None:
+            return None
+        width *= _attribute(bounds, "length")
+    return max(1, width)
+
+
+def generic_env(
+    generics: Iterable, overrides: Optional[Mapping[str, Optional[int]]] = None, scope: Optional[Mapping[str, int]] = None
+) -> Dict[str, int]:
+    """
+    generic 목록 → {소문자 이름: 값}. overrides(소문자 이름 → 값, None 은 계산 불가 실제값) 우선,
+    없으면 기본값을 앞선 generic·scope(패키지 상수) 로 계산. 정수가 아닌 generic 은 빠진다.
+    """
+    env: Dict[str, int] = {}
+    lookup = ChainMap(env, scope) if scope else env
+    for g in generics:
+        key = g.name.lower()
+        if overrides is not None and key in overrides:
+            value = overrides[key]
+        else:
+            value = eval_expr(g.default, lookup) if g.default else None
+        if value is not None:
+            env[key] = value
+    return env
+
+
+@dataclass
+class ResolvedPorts:
+    """(entity, generic 바인딩) 1개의 계산 결과. 같은 바인딩의 인스턴스가 공유한다."""
+    entity: str
+    generics: Dict[str, int] = field(default_factory=dict)
+    widths: Dict[str, Optional[int]] = field(default_factory=dict)  # 포트 이름 → 폭 (미해결 None)
+
+
+class WidthResolver:
+    """
+    generic 바인딩별 포트 폭 계산기.
+
+    패키지 상수는 생성 시 한 번 계산해 두고, resolve() 는 (선언 위치, entity, 바인딩된 generic 값) 키로 메모이즈한다.
+    바인딩 값은 실제값 표현식을 부모 환경에서 계산한 정수라, 원문이 달라도 값이 같으면 같은 항목을 쓴다.
+    선언 위치(source)를 키에 넣어 다른 파일·라이브러리의 같은 이름 entity 가 폭을 공유하지 않게 한다.
+    """
+
+    def __init__(self, constants: Iterable[Constant] = ()):
+        self.constants: Dict[str, int] = {}
+        self.ranges: Dict[str, Bounds] = {}
+        for c in constants:
+            key = c.name.lower()
+            if c.value:
+                value = eval_expr(c.value, self.constants, self.ranges)
+                if value is not None:
+                    self.constants[key] = value
+            _, dims = _split_subtype(c.type)
+            if len(dims) == 1:
+                bounds = range_bounds(dims[0], self.constants, self.ranges)
+                if bounds is not None:
+                    self.ranges[key] = bounds
+        self._cache: Dict[tuple, ResolvedPorts] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def bindings(
+        self, entity: Entity, generic_map: Sequence[Association] = (), env: Optional[Mapping[str, int]] = None
+    ) -> Dict[str, Optional[int]]:
+        """generic map → {소문자 generic 이름: 값} (위치 연결은 선언 순서, 계산 불가 실제값은 None)."""
+        if not generic_map:
+            return {}
+        lookup = ChainMap(env, self.constants) if env else self.constants
+        names = [g.name.lower() for g in entity.generics]
+        out: Dict[str, Optional[int]] = {}
+        for i, assoc in enumerate(generic_map):
+            key = assoc.formal.lower() if assoc.formal else (names[i] if i < len(names) else None)
+            if key is None or assoc.actual is None:
+                continue  # open → 기본값
+            out[key] = eval_expr(assoc.actual, lookup, self.ranges)
+        return out
+
+    def resolve(
+        self,
+        entity: Entity,
+        generic_map: Sequence[Association] = (),
+        env: Optional[Mapping[str, int]] = None,
+        source: Optional[str] = None,
+    ) -> ResolvedPorts:
+        """
+        인스턴스 1개의 generic 값·포트 폭. env 는 실제값을 계산할 부모 환경(부모 generic 등).
+        source 는 entity 선언 위치 (파일 경로 또는 라이브러리 이름).
+
+        Returns:
+            ResolvedPorts (같은 선언 위치·entity·바인딩 값이면 같은 객체)
+        """
+        overrides = self.bindings(entity, generic_map, env)
+        key = (source, entity.module_name.lower(), tuple(sorted(overrides.items())))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        generics = generic_env(entity.generics, overrides, self.constants)
+        lookup = ChainMap(generics, self.constants)
+        widths: Dict[str, Optional[int]] = {}
+        for port in entity.ports:
+            widths[port.name] = dims_width(port.range, lookup, self.ranges) if port.range else port.width
+        resolved = ResolvedPorts(entity=entity.module_name, generics=generics, widths=widths)
+        self._cache[key] = resolved
+        return resolved
+
+    def stats(self) -> Dict[str, int]:
+        return {"bindings": len(self._cache), "hits": self.hits, "misses": self.misses, "constants": len(self.constants)}
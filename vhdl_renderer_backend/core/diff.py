@@ -0,0 +1,183 @@
+"""
+구조 diff: 두 파싱 결과(to_dict / JSON) 사이의 최소 패치를 JSON Patch(RFC 6902) 연산으로 만든다.
+
+- dict 는 키 단위로 add / remove / replace, 값이 컨테이너면 재귀
+- 이름 있는 항목의 list (entity, port, generic, signal, instance, batch 파일 등) 는 안정 키
+  (KEY_FIELDS 중 모든 항목에 있고 값이 서로 다른 첫 필드) 로 짝지어, 위치가 바뀌어도 내용 변경만 낸다.
+  연산 순서: 없어진 항목 remove(뒤에서부터) → 순서 맞추기 move / 새 항목 add → 남은 항목 재귀 diff.
+  경로는 순서대로 적용할 때의 인덱스라 일반 JSON Patch 라이브러리로 그대로 적용된다
+- 키를 정할 수 없는 list (감지 목록 등 스칼라 목록) 는 다르면 통째로 replace
+ignore 로 준 키(소요 시간 등 매번 바뀌는 값)는 비교하지 않는다.
+"""
+import copy
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+# list 항목의 안정 키 후보 (앞쪽 우선)
+KEY_FIELDS = ("module_name", "path", "name", "label", "key")
+# CLI 에서 기본으로 무시하는 값 (실행마다 달라짐)
+VOLATILE_KEYS = ("elapsed_s", "elapsed_ms", "cached")
+
+Patch = List[Dict[str, Any]]
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _list_key(old: Sequence[Any], new: Sequence[Any]) -> Optional[str]:
+    """두 list 의 모든 항목이 dict 이고 값이 유일한 키 필드. 없으면 None."""
+    if not old and not new:
+        return None
+    if not all(isinstance(x, dict) for x in old) or not all(isinstance(x, dict) for x in new):
+        return None
+    for field in KEY_FIELDS:
+        for items in (old, new):
+            values = [x.get(field) for x in items]
+            if None in values or len(set(map(_hashable, values))) != len(values):
+                break
+        else:
+            return field
+    return None
+
+
+def _hashable(value: Any) -> Any:
+    return value if isinstance(value, (str, int, float, bool)) else json.dumps(value, sort_keys=True)
+
+
+class _Differ:
+    def __init__(self, ignore: Iterable[str]):
+        self.ignore = frozenset(ignore)
+        self.ops: Patch = []
+
+    def value(self, old: Any, new: Any, path: str) -> None:
+        if isinstance(old, dict) and isinstance(new, dict):
+            self.mapping(old, new, path)
+        elif isinstance(old, list) and isinstance(new, list):
+            self.sequence(old, new, path)
+        elif type(old) is not type(new) or old != new:
+            self.ops.append({"op": "replace", "path": path, "value": new})
+
+    def mapping(self, old: Dict[str, Any], new: Dict[str, Any], path: str) -> None:
+        ignore = self.ignore
+        for k in old:
+            if k not in new and k not in ignore:
+                self.ops.append({"op": "remove", "path": f"{path}/{_escape(k)}"})
+        for k, v in new.items():
+            if k in ignore:
+                continue
+            if k not in old:
+                self.ops.append({"op": "add", "path": f"{path}/{_escape(k)}", "value": v})
+            else:
+                self.value(old[k], v, f"{path}/{_escape(k)}")
+
+    def sequence(self, old: List[Any], new: List[Any], path: str) -> None:
+        if old == new:
+            return
+        field = _list_key(old, new)
+        if field is None:
+            self.ops.append({"op": "replace", "path": path, "value": new})
+            return
+        new_keys = [_hashable(x[field]) for x in new]
+        wanted = set(new_keys)
+        current = [_hashable(x[field]) for x in old]
+        by_key = {k: x for k, x in zip(current, old)}
+        # 1) 없어진 항목 (뒤에서부터 지워 앞쪽 인덱스 유지)
+        for i in range(len(current) - 1, -1, -1):
+            if current[i] not in wanted:
+                self.ops.append({"op": "remove", "path": f"{path}/{i}"})
+                del current[i]
+        # 2) 목표 순서대로 move / add
+        position = {k: i for i, k in enumerate(current)}
+        for i, (k, item) in enumerate(zip(new_keys, new)):
+            if i < len(current) and current[i] == k:
+                continue
+            if k in position:
+                j = current.index(k, i)
+                self.ops.append({"op": "move", "from": f"{path}/{j}", "path": f"{path}/{i}"})
+                current.insert(i, current.pop(j))
+            else:
+                self.ops.append({"op": "add", "path": f"{path}/{i}", "value": item})
+                current.insert(i, k)
+        # 3) 짝지은 항목 내용 diff (최종 인덱스 기준)
+        for i, (k, item) in enumerate(zip(new_keys, new)):
+            if k in position:
+                self.value(by_key[k], item, f"{path}/{i}")
+
+
+def diff(old: Any, new: Any, ignore: Iterable[str] = ()) -> Patch:
+    """
+    old → new 로 바꾸는 JSON Patch 연산 목록 (같으면 빈 목록).
+
+    Args:
+        old, new: to_dict() 결과 / JSON 값 (to_dict 를 가진 객체도 허용)
+        ignore: 비교하지 않을 dict 키 (예: VOLATILE_KEYS)
+    """
+    if hasattr(old, "to_dict"):
+        old = old.to_dict()
+    if hasattr(new, "to_dict"):
+        new = new.to_dict()
+    differ = _Differ(ignore)
+    differ.value(old, new, "")
+    return differ.ops
+
+
+def _resolve(doc: Any, path: str):
+    """포인터 → (부모 컨테이너, 마지막 토큰)."""
+    tokens = [_unescape(t) for t in path.split("/")[1:]]
+    parent = doc
+    for t in tokens[:-1]:
+        parent = parent[int(t)] if isinstance(parent, list) else parent[t]
+    return parent, tokens[-1]
+
+
+def apply_patch(doc: Any, patch: Patch) -> Any:
+    """diff 가 내는 연산(add/remove/replace/move) 을 순서대로 적용한 새 문서 (doc 은 바꾸지 않음)."""
+    doc = copy.deepcopy(doc)
+    for op in patch:
+        if op["path"] == "":
+            if op["op"] != "replace":
+                raise ValueError(f"루트에 적용할 수 없는 연산: {op['op']}")
+            doc = copy.deepcopy(op["value"])
+            continue
+        if op["op"] == "move":
+            src_parent, src = _resolve(doc, op["from"])
+            value = src_parent.pop(int(src)) if isinstance(src_parent, list) else src_parent.pop(src)
+            parent, token = _resolve(doc, op["path"])
+            if isinstance(parent, list):
+                parent.insert(int(token), value)
+            else:
+                parent[token] = value
+            continue
+        parent, token = _resolve(doc, op["path"])
+        if op["op"] == "remove":
+            if isinstance(parent, list):
+                del parent[int(token)]
+            else:
+                del parent[token]
+        elif op["op"] == "add" and isinstance(parent, list):
+            value = copy.deepcopy(op["value"])
+            if token == "-":
+                parent.append(value)
+            else:
+                parent.insert(int(token), value)
+        elif op["op"] in ("add", "replace"):
+            value = copy.deepcopy(op["value"])
+            if isinstance(parent, list):
+                parent[int(token)] = value
+            else:
+                parent[token] = value
+        else:
+            raise ValueError(f"지원하지 않는 연산: {op['op']}")
+    return doc
+
+
+def load_result(path: Union[str, Path]) -> Any:
+    """이전 결과 파일 (JSON 문서 1개) 읽기."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,418 @@
+"""
+교차 파일 계층 elaboration: top entity 부터 인스턴스 트리 구성.
+
+- DesignLibrary: 여러 파일의 entity / architecture / configuration 을 이름(대소문자 무시)으로 모음
+- elaborate(library, top): component/entity/configuration 인스턴스를 다른 파일의 entity 로 연결
+  (entity, architecture) 단위로 하위 계층을 한 번만 분석해 메모이즈 — 4,000번 인스턴스화된 entity 도 1회 분석,
+  모든 인스턴스가 같은 ElaboratedUnit 을 공유하므로 메모리는 인스턴스 수가 아닌 고유 unit 수에 비례
+- 단계별 인스턴스 수는 unit 마다 levels 를 메모이즈해 합산 (전체 트리를 펼치지 않음)
+- 포트 폭은 인스턴스마다 다를 수 있어 (generic) walk_widths 가 펼치면서 WidthResolver 로 계산 —
+  (entity, generic 바인딩 값) 단위 메모이즈. 실제값은 부모 generic·패키지 상수로 계산
+
+바인딩 규칙 (단순화):
+    component  같은 이름의 entity (기본 바인딩), 없으면 미해결(블랙박스)
+    entity     `entity lib.e(arch)` 의 arch, 생략 시 가장 나중에 분석된 architecture
+    configuration  configuration 선언의 대상 entity + 기본 architecture (block configuration 무시)
+라이브러리 이름은 구분하지 않는다 (모든 파일을 한 라이브러리로 취급). generate 안의 인스턴스는 1개로 센다.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    from ..models.vhdl_types import Architecture, Association, Constant, Entity
+except ImportError:
+    from models.vhdl_types import Architecture, Association, Constant, Entity
+
+from .arch_parser import extract_architectures_from_tree
+from .ast_parser import extract_design_from_tree, identifier_names, node_text, parse_to_tree
+from .batch import scan_files
+from .const_eval import ResolvedPorts, WidthResolver
+
+_UnitKey = Tuple[str, str]  # (entity 소문자, architecture 소문자 또는 "")
+
+
+@dataclass
+class ParsedFile:
+    """파일 1개 분석 결과 (프로세스 간 전달용)."""
+    path: str
+    entities: List[Entity] = field(default_factory=list)
+    architectures: List[Architecture] = field(default_factory=list)
+    configurations: List[Tuple[str, str]] = field(default_factory=list)  # (configuration, entity)
+    constants: List[Constant] = field(default_factory=list)  # package 상수
+    error: Optional[str] = None
+
+
+def _configurations(tree, source: bytes) -> List[Tuple[str, str]]:
+    """design_unit 직속 configuration_declaration → (configuration 이름, 대상 entity)."""
+    out = []
+    for unit in tree.root_node.children:
+        for node in unit.children:
+            if node.type != "configuration_declaration":
+                continue
+            name = node.child_by_field_name("configuration")
+            entity = node.child_by_field_name("entity")
+            if name is not None and entity is not None:
+                out.append((node_text(name, source), node_text(entity, source)))
+    return out
+
+
+def _package_constants(tree, source: bytes) -> List[Constant]:
+    """design_unit 직속 package_declaration 의 constant 선언 → Constant 목록 (선언 순서)."""
+    out = []
+    for unit in tree.root_node.children:
+        for node in unit.children:
+            if node.type != "package_declaration":
+                continue
+            ident = next((c for c in node.children if c.type == "identifier"), None)
+            package = node_text(ident, source) if ident is not None else None
+            body = next((c for c in node.children if c.type == "package_declaration_body"), None)
+            for decl in body.children if body is not None else ():
+                if decl.type != "constant_declaration":
+                    continue
+                names: List[str] = []
+                type_name, value = "unknown", None
+                for child in decl.children:
+                    if child.type == "identifier_list":
+                        names = identifier_names(child, source)
+                    elif child.type == "subtype_indication":
+                        type_name = node_text(child, source)
+                    elif child.type == "initialiser":
+                        value = node_text(child, source).lstrip(":=").strip()
+                out.extend(Constant(n, type_name, value, package) for n in names)
+    return out
+
+
+def parse_design_file(path: Union[str, Path]) -> ParsedFile:
+    """파일 1개 읽기 + 파싱 + entity/architecture/configuration 추출. 실패는 error 에 기록."""
+    record = ParsedFile(path=str(path))
+    try:
+        source = Path(path).read_bytes()
+        tree = parse_to_tree(source)
+        record.entities = extract_design_from_tree(tree, source).entities
+        record.architectures = extract_architectures_from_tree(tree, source)
+        record.configurations = _configurations(tree, source)
+        record.constants = _package_constants(tree, source)
+    except Exception as exc:  # 한 파일 실패가 전체 elaboration 을 멈추지 않도록
+        record.error = f"{type(exc).__name__}: {exc}"
+    return record
+
+
+def _parse_chunk(paths: List[str]) -> List[ParsedFile]:
+    return [parse_design_file(p) for p in paths]
+
+
+class DesignLibrary:
+    """여러 파일의 설계 단위 모음. 같은 이름이 여러 번 나오면 나중에 추가된 것이 우선 (재분석과 동일)."""
+
+    def __init__(self):
+        self.entities: Dict[str, Entity] = {}
+        self.entity_files: Dict[str, str] = {}
+        self.architectures: Dict[str, List[Tuple[Architecture, str]]] = {}
+        self.configurations: Dict[str, str] = {}
+        self.constants: List[Constant] = []
+        self.errors: Dict[str, str] = {}
+        self.files = 0
+
+    def add(self, record: ParsedFile) -> None:
+        self.files += 1
+        if record.error is not None:
+            self.errors[record.path] = record.error
+        for entity in record.entities:
+            key = entity.module_name.lower()
+            self.entities[key] = entity
+            self.entity_files[key] = record.path
+        for arch in record.architectures:
+            self.architectures.setdefault(arch.entity.lower(), []).append((arch, record.path))
+        for config, entity in record.configurations:
+            self.configurations[config.lower()] = entity.lower()
+        self.constants.extend(record.constants)
+
+    def add_source(self, source: Union[str, bytes], path: str = "<memory>") -> None:
+        """메모리 상 소스 1개 추가 (테스트·편집기 버퍼용)."""
+        if isinstance(source, str):
+            source = source.encode("utf-8")
+        tree = parse_to_tree(source)
+        self.add(ParsedFile(
+            path=path,
+            entities=extract_design_from_tree(tree, source).entities,
+            architectures=extract_architectures_from_tree(tree, source),
+            configurations=_configurations(tree, source),
+            constants=_package_constants(tree, source),
+        ))
+
+    @classmethod
+    def from_paths(
+        cls,
+        roots: Iterable[Union[str, Path]],
+        jobs: Optional[int] = 1,
+        chunk_size: int = 16,
+    ) -> "DesignLibrary":
+        """roots 아래 .vhd/.vhdl 을 (경로 순으로) 분석해 라이브러리 구성. jobs>1 이면 프로세스 풀."""
+        paths = sorted(scan_files(roots))
+        library = cls()
+        jobs = jobs or os.cpu_count() or 1
+        if jobs == 1 or len(paths) <= chunk_size:
+            for path in paths:
+                library.add(parse_design_file(path))
+            return library
+        chunks = [paths[i : i + chunk_size] for i in range(0, len(paths), chunk_size)]
+        with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+            for records in pool.map(_parse_chunk, chunks):
+                for record in records:
+                    library.add(record)
+        return library
+
+    def architecture_of(self, entity: str, name: Optional[str] = None) -> Optional[Tuple[Architecture, str]]:
+        """entity 의 architecture (name 생략 시 가장 나중에 분석된 것)."""
+        candidates = self.architectures.get(entity.lower(), [])
+        if name is None:
+            return candidates[-1] if candidates else None
+        return next((c for c in reversed(candidates) if c[0].name.lower() == name.lower()), None)
+
+
+@dataclass
+class ChildInstance:
+    """architecture 안의 인스턴스 1개. target 이 None 이면 미해결 (reason 에 사유)."""
+    label: str
+    unit: str
+    kind: str
+    target: Optional["ElaboratedUnit"] = None
+    reason: Optional[str] = None
+    generic_map: List[Association] = field(default_factory=list)
+
+
+@dataclass
+class ElaboratedUnit:
+    """(entity, architecture) 하나의 하위 계층. 여러 인스턴스가 같은 객체를 공유."""
+    entity: str
+    architecture: Optional[str]
+    path: Optional[str]
+    children: List[ChildInstance] = field(default_factory=list)
+    levels: List[int] = field(default_factory=list)  # levels[d] = 이 unit 아래 깊이 d+1 의 인스턴스 수
+
+    @property
+    def key(self) -> str:
+        return f"{self.entity}({self.architecture})" if self.architecture else self.entity
+
+    @property
+    def instance_count(self) -> int:
+        return sum(self.levels)
+
+
+@dataclass
+class Elaboration:
+    """elaborate() 결과: 공유 unit 표 + 단계별 인스턴스 수 + 소요 시간. 포트 폭은 walk_widths."""
+    top: ElaboratedUnit
+    units: Dict[_UnitKey, ElaboratedUnit]
+    elapsed_s: float
+    library: Optional[DesignLibrary] = None
+    resolver: Optional[WidthResolver] = None
+
+    @property
+    def levels(self) -> List[int]:
+        """단계별 인스턴스 수. levels[0] = top 자신(1)."""
+        return [1] + self.top.levels
+
+    @property
+    def instance_count(self) -> int:
+        return self.top.instance_count
+
+    def unresolved(self) -> List[Tuple[str, ChildInstance]]:
+        """미해결 인스턴스 (정의 위치 기준 1회씩): (포함 unit key, ChildInstance)."""
+        return [(u.key, c) for u in self.units.values() for c in u.children if c.target is None]
+
+    def walk(self, max_depth: Optional[int] = None) -> Iterator[Tuple[str, int, ChildInstance]]:
+        """펼친 인스턴스 트리를 (계층 경로, 깊이, ChildInstance) 로 지연 생성 (전위 순회, 명시적 스택)."""
+        stack = [(self.top.entity, 1, c) for c in reversed(self.top.children)]
+        while stack:
+            prefix, depth, child = stack.pop()
+            path = f"{prefix}.{child.label}"
+            yield path, depth, child
+            if child.target is not None and (max_depth is None or depth < max_depth):
+                stack.extend((path, depth + 1, c) for c in reversed(child.target.children))
+
+    def walk_widths(
+        self, max_depth: Optional[int] = None
+    ) -> Iterator[Tuple[str, int, ChildInstance, Optional[ResolvedPorts]]]:
+        """
+        walk 와 같은 순서로 인스턴스별 generic 값·포트 폭까지 생성.
+
+        generic map 실제값은 부모 인스턴스의 generic 값으로 계산한다. 같은 entity·같은 바인딩 값의
+        인스턴스는 같은 ResolvedPorts 를 공유 (resolver.stats() 의 hits). 미해결 인스턴스는 None.
+        """
+        library, resolver = self.library, self.resolver
+        if library is None or resolver is None:
+            raise ValueError("walk_widths 는 elaborate() 결과에서만 사용할 수 있습니다")
+        top = self.top.entity.lower()
+        decl = library.entities.get(top)
+        top_env = resolver.resolve(decl, source=library.entity_files.get(top)).generics if decl is not None else {}
+        stack = [(self.top.entity, 1, c, top_env) for c in reversed(self.top.children)]
+        while stack:
+            prefix, depth, child, env = stack.pop()
+            path = f"{prefix}.{child.label}"
+            name = child.target.entity.lower() if child.target is not None else ""
+            decl = library.entities.get(name)
+            resolved = (
+                resolver.resolve(decl, child.generic_map, env, library.entity_files.get(name)) if decl is not None else None
+            )
+            yield path, depth, child, resolved
+            if child.target is not None and (max_depth is None or depth < max_depth):
+                child_env = resolved.generics if resolved is not None else {}
+                stack.extend((path, depth + 1, c, child_env) for c in reversed(child.target.children))
+
+    def _summary(self) -> dict:
+        return {
+            "top": self.top.key,
+            "levels": self.levels,
+            "instances": self.instance_count,
+            "unique_units": len(self.units),
+            "elapsed_s": round(self.elapsed_s, 6),
+        }
+
+    @staticmethod
+    def _unit_dict(u: ElaboratedUnit) -> dict:
+        return {
+            "entity": u.entity,
+            "architecture": u.architecture,
+            "path": u.path,
+            "instances": u.instance_count,
+            "children": [
+                {"label": c.label, "unit": c.unit, "kind": c.kind,
+                 "target": c.target.key if c.target is not None else None, "reason": c.reason}
+                for c in u.children
+            ],
+        }
+
+    def _unresolved_dicts(self) -> List[dict]:
+        return [{"in": key, "label": c.label, "unit": c.unit, "reason": c.reason} for key, c in self.unresolved()]
+
+    def _tree_rows(self, tree_depth: int) -> Iterator[dict]:
+        if self.resolver is None:
+            for path, depth, c in self.walk(tree_depth):
+                yield {"path": path, "depth": depth, "unit": c.target.key if c.target is not None else c.unit}
+            return
+        for path, depth, c, r in self.walk_widths(tree_depth):
+            yield {
+                "path": path, "depth": depth, "unit": c.target.key if c.target is not None else c.unit,
+                "generics": r.generics if r is not None else {}, "widths": r.widths if r is not None else {},
+            }
+
+    def to_dict(self, tree_depth: int = 0) -> dict:
+        """요약 + 고유 unit 표. tree_depth>0 이면 그 깊이까지 펼친 인스턴스 경로 목록 (+ generic 값·포트 폭) 포함."""
+        out = self._summary()
+        out["units"] = {u.key: self._unit_dict(u) for u in self.units.values()}
+        out["unresolved"] = self._unresolved_dicts()
+        if tree_depth > 0:
+            out["tree"] = list(self._tree_rows(tree_depth))
+            if self.resolver is not None:
+                out["width_cache"] = self.resolver.stats()
+        return out
+
+    def records(self, tree_depth: int = 0) -> Iterator[dict]:
+        """
+        to_dict 와 같은 내용을 NDJSON 레코드로 지연 생성 ("type": summary → unit → unresolved → instance).
+        펼친 트리를 목록으로 만들지 않아 인스턴스 수가 많아도 메모리가 늘지 않는다.
+        """
+        yield {"type": "summary", **self._summary()}
+        for u in self.units.values():
+            yield {"type": "unit", "key": u.key, **self._unit_dict(u)}
+        for d in self._unresolved_dicts():
+            yield {"type": "unresolved", **d}
+        if tree_depth > 0:
+            for row in self._tree_rows(tree_depth):
+                yield {"type": "instance", **row}
+
+
+class _Elaborator:
+    def __init__(self, library: DesignLibrary):
+        self.library = library
+        self.units: Dict[_UnitKey, ElaboratedUnit] = {}
+        self._active: set = set()
+
+    def resolve(self, entity: str, arch_name: Optional[str] = None) -> Union[ElaboratedUnit, str]:
+        """(entity, architecture) → ElaboratedUnit (메모이즈). 실패 시 사유 문자열."""
+        lib = self.library
+        ekey = entity.lower()
+        if ekey not in lib.entities and ekey not in lib.architectures:
+            return f"entity '{entity}' 없음"
+        found = lib.architecture_of(ekey, arch_name)
+        if arch_name is not None and found is None:
+            return f"architecture '{entity}({arch_name})' 없음"
+        key = (ekey, found[0].name.lower() if found else "")
+        unit = self.units.get(key)
+        if unit is not None:
+            return unit
+        if key in self._active:
+            return "재귀 인스턴스화"
+        decl = lib.entities.get(ekey)
+        unit = ElaboratedUnit(
+            entity=decl.module_name if decl else found[0].entity,
+            architecture=found[0].name if found else None,
+            path=found[1] if found else lib.entity_files.get(ekey),
+        )
+        self._active.add(key)
+        try:
+            for i, inst in enumerate(found[0].instances if found else ()):
+                child = ChildInstance(
+                    label=inst.label or f"{inst.unit}_{i}", unit=inst.unit, kind=inst.kind, generic_map=inst.generic_map
+                )
+                target = self._bind(inst)
+                if isinstance(target, ElaboratedUnit):
+                    child.target = target
+                else:
+                    child.reason = target
+                unit.children.append(child)
+        finally:
+            self._active.discard(key)
+        levels = [len(unit.children)] if unit.children else []
+        for child in unit.children:
+            if child.target is None:
+                continue
+            for depth, count in enumerate(child.target.levels, start=1):
+                if depth == len(levels):
+                    levels.append(0)
+                levels[depth] += count
+        unit.levels = levels
+        self.units[key] = unit
+        return unit
+
+    def _bind(self, inst) -> Union[ElaboratedUnit, str]:
+        if inst.kind == "configuration":
+            entity = self.library.configurations.get(inst.unit.lower())
+            return self.resolve(entity) if entity is not None else f"configuration '{inst.unit}' 없음"
+        if inst.kind == "entity":
+            return self.resolve(inst.unit, inst.architecture)
+        unit = inst.unit.lower()
+        if unit not in self.library.entities and unit not in self.library.architectures:
+            return f"component '{inst.unit}' 에 바인딩할 entity 없음 (블랙박스)"
+        return self.resolve(inst.unit)
+
+
+def elaborate(library: DesignLibrary, top: str, architecture: Optional[str] = None) -> Elaboration:
+    """
+    top entity 부터 인스턴스 계층을 구성한다.
+
+    Args:
+        library: DesignLibrary (여러 파일)
+        top: 최상위 entity 이름 (대소문자 무시)
+        architecture: top 의 architecture (생략 시 가장 나중에 분석된 것)
+
+    Returns:
+        Elaboration (top, 고유 unit 표, 단계별 인스턴스 수, 소요 시간)
+
+    Raises:
+        KeyError: top entity/architecture 를 찾을 수 없거나 재귀 인스턴스화로 시작하는 경우
+    """
+    t0 = time.perf_counter()
+    elaborator = _Elaborator(library)
+    unit = elaborator.resolve(top, architecture)
+    if isinstance(unit, str):
+        raise KeyError(unit)
+    return Elaboration(
+        top=unit, units=elaborator.units, elapsed_s=time.perf_counter() - t0,
+        library=library, resolver=WidthResolver(library.constants),
+    )
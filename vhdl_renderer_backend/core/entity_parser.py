@@ -1,173 +1,178 @@
 """
 Entity 파서: 정제된 VHDL에서 entity 이름과 port 목록 추출.
 Input: 정제된 VHDL 텍스트 → Output: Entity 데이터 모델.
+
+파일 전체를 컴파일된 정규식으로 한 번만 앞으로 훑는다 (되돌아가거나 같은 구간을 다시 자르지 않음).
+    entity 머리  `entity <이름> is` 검색
+    clause      generic ( ... ) / port ( ... ) 를 [();] 와 리터럴 토큰으로 괄호 짝 맞춤,
+                깊이 0 의 ; 에서만 선언 단위로 잘라 각 선언을 정규식 1회로 해석
+    끝          `end [entity] [<이름>];` (entity 문장부의 `end process;` 등은 건너뜀)
+포트 폭은 const_eval 로 계산 (`WIDTH-1 downto 0` 은 앞서 나온 generic 기본값 기준, 범위 원문은 Port.range).
 """
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 try:
-    from ..models.vhdl_types import Entity, Port
+    from ..models.vhdl_types import Entity, Generic, Port
 except ImportError:
-    from models.vhdl_types import Entity, Port
+    from models.vhdl_types import Entity, Generic, Port
+
+from .const_eval import eval_expr, subtype_width
+from .profile import active, stage
 
 
 # entity 이름: entity \s+ <name> \s+ is
 ENTITY_NAME_RE = re.compile(
-    r"\bentity\s+(\w+)\s+is",
+    r"\bentity\s+(\w+)\s+is\b",
     re.IGNORECASE
 )
 
-# port ( ... );  괄호 짝 맞춰서 블록 추출
-PORT_BLOCK_RE = re.compile(
-    r"\bport\s*\(",
+# entity 머리 안에서 다음 관심 지점: generic/port clause 시작 또는 entity 끝
+_HEADER_ITEM_RE = re.compile(
+    r"\b(?:(?P<clause>generic|port)\s*\(|end(?:\s+(?P<kw>entity))?(?:\s+(?P<name>\w+))?\s*;)",
     re.IGNORECASE
 )
 
+# clause 내부 토큰: 괄호, 세미콜론, 리터럴(안의 괄호·; 무시). 식별자 뒤 ' 는 속성 틱이라 문자 리터럴 아님
+_CLAUSE_TOKEN_RE = re.compile(r'"(?:[^"]|"")*"|(?<![\w)])\'.\'|[();]')
 
-def parse_entity(vhdl_text: str) -> Optional[Entity]:
+# 선언 1개의 머리: 이름 목록 : [mode]  (나머지는 subtype [:= 기본값])
+_DECL_HEAD_RE = re.compile(
+    r"\s*(?:signal\s+|constant\s+)?(\w+(?:\s*,\s*\w+)*)\s*:(?!=)\s*(?:(inout|buffer|linkage|in|out)\b\s*)?",
+    re.IGNORECASE
+)
+_SPACES_RE = re.compile(r"\s+")
+
+
+def parse_entities(vhdl_text: str) -> List[Entity]:
     """
-    정제된 VHDL 텍스트에서 첫 번째 entity 블록을 찾아 모듈 이름과 port 목록을 추출한다.
+    정제된 VHDL 텍스트의 모든 entity 를 파일 순서대로 추출한다 (port, generic 포함).
 
     Args:
         vhdl_text: 전처리된(주석 제거 등) VHDL 문자열
 
     Returns:
-        Entity 인스턴스. entity/port를 찾지 못하면 None 또는 불완전한 Entity.
+        Entity 목록. port 선언의 `A, B : in bit` 는 포트 2개로 분리, mode 생략 시 "in"
     """
-    if not vhdl_text or not vhdl_text.strip():
-        return None
-
-    # 1) entity 이름 추출
-    match = ENTITY_NAME_RE.search(vhdl_text)
-    if not match:
-        return None
-    module_name = match.group(1)
+    entities: List[Entity] = []
+    if not vhdl_text:
+        return entities
+    pos = 0
+    with stage("extract"):
+        while True:
+            head = ENTITY_NAME_RE.search(vhdl_text, pos)
+            if head is None:
+                break
+            entity = Entity(module_name=head.group(1))
+            entities.append(entity)
+            pos = _scan_entity_body(vhdl_text, head.end(), entity)
+    profiler = active()
+    if profiler is not None:
+        profiler.count("entities", len(entities))
+        profiler.count("ports", sum(len(e.ports) for e in entities))
+    return entities
+
+
+def _scan_entity_body(text: str, pos: int, entity: Entity) -> int:
+    """entity 머리 뒤부터 clause 를 채우고, entity 끝 다음 위치를 반환."""
+    name = entity.module_name.lower()
+    env: Dict[str, int] = {}  # generic 기본값 (포트 폭 계산용)
+    while True:
+        item = _HEADER_ITEM_RE.search(text, pos)
+        if item is None:
+            return len(text)
+        if item.group("clause") is None:
+            end_name = item.group("name")
+            if item.group("kw") or end_name is None or end_name.lower() == name:
+                return item.end()
+            pos = item.end()  # entity 문장부의 end process; 등
+            continue
+        decls, pos = _split_clause(text, item.end())
+        if item.group("clause").lower() == "port":
+            for decl in decls:
+                entity.ports.extend(_parse_port_decl(decl, env))
+        else:
+            for decl in decls:
+                entity.generics.extend(_parse_generic_decl(decl, env))
 
-    # 2) port ( ... ); 블록 내용 추출 (괄호 밸런스)
-    port_start = PORT_BLOCK_RE.search(vhdl_text)
-    if not port_start:
-        return Entity(module_name=module_name, ports=[])
 
-    start = port_start.end()
+def _split_clause(text: str, start: int) -> Tuple[List[str], int]:
+    """
+    '(' 직후 start 부터 짝이 맞는 ')' 까지, 깊이 0 의 ';' 로 나눈 선언 문자열 목록과 ')' 다음 위치.
+    각 문자 구간은 한 번씩만 잘라낸다.
+    """
+    decls: List[str] = []
     depth = 1
-    i = start
-    while i < len(vhdl_text) and depth > 0:
-        c = vhdl_text[i]
-        if c == "(":
+    seg = start
+    for tok in _CLAUSE_TOKEN_RE.finditer(text, start):
+        t = tok.group()
+        if t == "(":
             depth += 1
-        elif c == ")":
+        elif t == ")":
             depth -= 1
-        i += 1
-    port_block = vhdl_text[start : i - 1].strip()
+            if depth == 0:
+                decls.append(text[seg : tok.start()])
+                return decls, tok.end()
+        elif t == ";" and depth == 1:
+            decls.append(text[seg : tok.start()])
+            seg = tok.end()
+    decls.append(text[seg:])
+    return decls, len(text)
+
+
+def _split_decl(decl: str) -> Optional[Tuple[List[str], Optional[str], str, Optional[str]]]:
+    """선언 1개 → (이름 목록, mode, subtype 원문, 기본값 원문). 선언이 아니면 None."""
+    head = _DECL_HEAD_RE.match(decl)
+    if head is None:
+        return None
+    names, mode = head.groups()
+    subtype, sep, default = decl[head.end():].partition(":=")
+    subtype = subtype.strip()
+    if not subtype:
+        return None
+    return names.replace(" ", "").split(","), mode, subtype, default.strip() if sep else None
 
-    # 3) 포트 선언 파싱 (; 로 구분, 쉼표는 레벨 0에서만 구분자로 사용하지 않고 ; 로만 구분)
-    ports = _parse_port_declarations(port_block)
 
-    return Entity(module_name=module_name, ports=ports)
+def _parse_port_decl(decl: str, env: Dict[str, int]) -> List[Port]:
+    """포트 선언 1개 → Port 목록 (다중 이름 분리)."""
+    parts = _split_decl(decl)
+    if parts is None:
+        return []
+    names, mode, subtype, _ = parts
+    type_name, width, rng = subtype_width(subtype, env)
+    direction = mode.lower() if mode else "in"
+    return [Port(name=n, direction=direction, type=type_name, width=width, range=rng) for n in names]
 
 
-def _parse_port_declarations(port_block: str) -> List[Port]:
-    """port 블록 문자열을 파싱하여 Port 리스트 반환."""
-    ports = []
-    # 괄호 깊이 0인 세미콜론으로 선언 단위 분리
-    decls = _split_top_level(port_block, ";")
-    for decl in decls:
-        decl = decl.strip()
-        if not decl:
-            continue
-        port = _parse_single_port(decl)
-        if port:
-            ports.append(port)
-    return ports
-
-
-def _split_top_level(text: str, sep: str) -> List[str]:
-    """괄호 밸런스를 유지하면서 sep 로만 최상위 분리."""
-    parts = []
-    depth = 0
-    start = 0
-    i = 0
-    while i <= len(text) - len(sep):
-        if text[i] in "()":
-            if text[i] == "(":
-                depth += 1
-            else:
-                depth -= 1
-            i += 1
-            continue
-        if depth == 0 and text[i : i + len(sep)] == sep:
-            parts.append(text[start:i].strip())
-            start = i + len(sep)
-            i = start
-            continue
-        i += 1
-    if start <= len(text):
-        parts.append(text[start:].strip())
-    return parts
+def _parse_generic_decl(decl: str, env: Dict[str, int]) -> List[Generic]:
+    """generic 선언 1개 → Generic 목록 (타입은 공백 정리한 원문, 기본값은 원문 표현식). 정수 기본값은 env 에 기록."""
+    parts = _split_decl(decl)
+    if parts is None:
+        return []
+    names, _, subtype, default = parts
+    type_text = _SPACES_RE.sub(" ", subtype)
+    value = eval_expr(default, env) if default else None
+    if value is not None:
+        env.update((n.lower(), value) for n in names)
+    return [Generic(name=n, type=type_text, default=default) for n in names]
 
 
-def _parse_single_port(decl: str) -> Optional[Port]:
+def parse_entity(vhdl_text: str) -> Optional[Entity]:
     """
-    단일 포트 선언 파싱.
-    예: "A : in std_logic" / "DATA : out std_logic_vector(7 downto 0)"
+    정제된 VHDL 텍스트에서 첫 번째 entity 블록을 찾아 모듈 이름과 port 목록을 추출한다.
+
+    Args:
+        vhdl_text: 전처리된(주석 제거 등) VHDL 문자열
+
+    Returns:
+        Entity 인스턴스. entity 를 찾지 못하면 None (파일의 모든 entity 는 parse_entities)
     """
-    # 첫 번째 " : " 로 이름과 (direction type...) 분리
-    if ":" not in decl:
-        return None
-    name_part, rest = decl.split(":", 1)
-    name = name_part.strip()
-    rest = rest.strip()
-    if not name or not rest:
+    if not vhdl_text or not vhdl_text.strip():
         return None
-
-    # direction: in | out | inout | buffer
-    direction = ""
-    for d in ("inout", "buffer", "in", "out"):
-        if rest.lower().startswith(d + " ") or rest.lower().startswith(d + "\t"):
-            direction = d.lower()
-            rest = rest[len(d):].strip()
-            break
-    if not direction:
+    head = ENTITY_NAME_RE.search(vhdl_text)
+    if not head:
         return None
+    entity = Entity(module_name=head.group(1))
+    _scan_entity_body(vhdl_text, head.end(), entity)
+    return entity
 
-    # type + optional ( ... )  → type 이름과 width 추출
-    type_name, width = _parse_port_type(rest)
-    if not type_name:
-        type_name = rest.split()[0] if rest.split() else "unknown"
-
-    return Port(name=name, direction=direction, type=type_name, width=width or 1)
-
-
-def _parse_port_type(rest: str) -> tuple:
-    """'std_logic' -> ('std_logic', 1), 'std_logic_vector(7 downto 0)' -> ('std_logic_vector', 8)."""
-    rest = rest.strip()
-    # std_logic_vector ( N downto M ) → width = N - M + 1
-    vec_match = re.match(
-        r"(\w+)\s*\(\s*(\d+)\s+downto\s+(\d+)\s*\)",
-        rest,
-        re.IGNORECASE
-    )
-    if vec_match:
-        type_name = vec_match.group(1)
-        high, low = int(vec_match.group(2)), int(vec_match.group(3))
-        width = high - low + 1
-        return type_name, max(1, width)
-
-    # std_logic_vector ( N to M )
-    vec_to = re.match(
-        r"(\w+)\s*\(\s*(\d+)\s+to\s+(\d+)\s*\)",
-        rest,
-        re.IGNORECASE
-    )
-    if vec_to:
-        type_name = vec_to.group(1)
-        low, high = int(vec_to.group(2)), int(vec_to.group(3))
-        width = high - low + 1
-        return type_name, max(1, width)
-
-    # 단순 타입 (std_logic, bit 등)
-    simple = re.match(r"(\w+)", rest)
-    if simple:
-        return simple.group(1), 1
-    first_word = rest.split()[0] if rest.split() else "unknown"
-    return first_word, 1
@@ -0,0 +1,498 @@
+"""
+stdio JSON-RPC 언어 서버 (LSP 기본 프로토콜, VS Code 확장 연동용 — REQ-08).
+
+- 열린 문서는 VhdlDocument 로 메모리에 유지, didChange 편집은 Tree.edit 로 증분 반영
+- 구조 결과(query_design)는 문서 내용이 바뀔 때까지 캐시하여 반복 요청은 재계산 없음
+- 요청 debounce: 한 번에 도착한 메시지를 묶어 처리, 뒤따르는 didChange 로 낡은 요청은
+  ContentModified 로 응답, 진단(구문 오류) 발행은 편집이 잠잠해진 뒤 1회
+
+지원 메서드:
+    initialize, initialized, shutdown, exit, $/cancelRequest
+    textDocument/didOpen, didChange(증분/전체), didClose, documentSymbol
+    vhdl/entities, vhdl/ports, vhdl/processes, vhdl/design  (params: {"textDocument": {"uri"}})
+"""
+import json
+import queue
+import sys
+import threading
+import time
+from bisect import bisect_right
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from .ast_parser import VhdlDocument, node_text
+from .ast_query import QueryResult, query_design
+
+# JSON-RPC / LSP 오류 코드
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+REQUEST_CANCELLED = -32800
+CONTENT_MODIFIED = -32801
+
+# LSP SymbolKind
+_KIND_CLASS = 5
+_KIND_FIELD = 8
+_KIND_FUNCTION = 12
+_KIND_VARIABLE = 13
+_KIND_CONSTANT = 14
+_KIND_MODULE = 2
+_KIND_OBJECT = 19
+
+_SYNC_INCREMENTAL = 2
+
+
+class _PositionMap:
+    """바이트 오프셋 ↔ LSP Position(line, character). character 단위는 utf-16(기본) 또는 utf-8."""
+
+    def __init__(self, source: bytes, encoding: str = "utf-16"):
+        self.source = source
+        self.encoding = encoding
+        self.line_starts = [0]
+        pos = source.find(b"\n")
+        while pos >= 0:
+            self.line_starts.append(pos + 1)
+            pos = source.find(b"\n", pos + 1)
+
+    def position(self, offset: int) -> Dict[str, int]:
+        line = bisect_right(self.line_starts, offset) - 1
+        start = self.line_starts[line]
+        if self.encoding == "utf-8":
+            return {"line": line, "character": offset - start}
+        prefix = self.source[start:offset].decode("utf-8", "replace")
+        return {"line": line, "character": len(prefix.encode("utf-16-le")) // 2}
+
+    def offset(self, position: Dict[str, int]) -> int:
+        line, character = position["line"], position["character"]
+        if line >= len(self.line_starts):
+            return len(self.source)
+        start = self.line_starts[line]
+        end = self.line_starts[line + 1] - 1 if line + 1 < len(self.line_starts) else len(self.source)
+        if self.encoding == "utf-8":
+            return min(start + character, end)
+        units = 0
+        pos = start
+        for ch in self.source[start:end].decode("utf-8", "replace"):
+            if units >= character:
+                break
+            units += 2 if ord(ch) > 0xFFFF else 1
+            pos += len(ch.encode("utf-8"))
+        return min(pos, end)
+
+    def range(self, start: int, end: int) -> Dict[str, Dict[str, int]]:
+        return {"start": self.position(start), "end": self.position(end)}
+
+
+class OpenDocument:
+    """열린 문서 1개: 증분 파싱 문서 + 버전별 결과 캐시."""
+
+    def __init__(self, uri: str, text: str, version: int, encoding: str):
+        self.uri = uri
+        self.version = version
+        self.encoding = encoding
+        self.doc = VhdlDocument(text)
+        self._positions: Optional[_PositionMap] = None
+        self._revision = 0  # 편집마다 증가 (클라이언트 version 과 무관하게 캐시 무효화)
+        self._cache: Dict[str, Any] = {}
+        self._cache_revision: Optional[int] = None
+
+    def positions(self) -> _PositionMap:
+        if self._positions is None:
+            self._positions = _PositionMap(self.doc.source, self.encoding)
+        return self._positions
+
+    def apply_changes(self, changes: List[Dict[str, Any]], version: Optional[int]) -> None:
+        """contentChanges 를 순서대로 반영. range 가 있으면 증분, 없으면 전체 치환 (둘 다 old_tree 재사용)."""
+        for change in changes:
+            if "range" in change:
+                pm = self.positions()
+                start = pm.offset(change["range"]["start"])
+                end = pm.offset(change["range"]["end"])
+            else:
+                start, end = 0, len(self.doc.source)
+            self.doc.edit(start, end, change["text"])
+            self._positions = None
+            self._revision += 1
+        if version is not None:
+            self.version = version
+
+    def cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """현재 내용의 결과를 캐시에서 반환 (편집이 있었으면 캐시 비움)."""
+        if self._cache_revision != self._revision:
+            self._cache = {}
+            self._cache_revision = self._revision
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def design(self) -> QueryResult:
+        return self.cached("design", lambda: query_design(self.doc.tree, self.doc.source))
+
+    def architectures(self) -> List[Tuple[str, str, int, int]]:
+        """(architecture 이름, entity 이름, start_byte, end_byte) 목록."""
+        def compute() -> List[Tuple[str, str, int, int]]:
+            out = []
+            source = self.doc.source
+            for unit in self.doc.tree.root_node.children:
+                for node in unit.children:
+                    if node.type != "architecture_definition":
+                        continue
+                    name = node.child_by_field_name("architecture")
+                    entity = node.child_by_field_name("entity")
+                    out.append((
+                        node_text(name, source) if name is not None else "",
+                        node_text(entity, source) if entity is not None else "",
+                        node.start_byte,
+                        node.end_byte,
+                    ))
+            return out
+        return self.cached("architectures", compute)
+
+    def diagnostics(self) -> List[Dict[str, Any]]:
+        """ERROR/MISSING 노드 → LSP Diagnostic 목록."""
+        def compute() -> List[Dict[str, Any]]:
+            root = self.doc.tree.root_node
+            if not root.has_error:
+                return []
+            pm = self.positions()
+            out = []
+            cursor = root.walk()
+            while True:
+                node = cursor.node
+                if node.is_error or node.is_missing:
+                    message = f"'{node.type}' 누락" if node.is_missing else "구문 오류"
+                    out.append({
+                        "range": pm.range(node.start_byte, node.end_byte),
+                        "severity": 1,
+                        "source": "vhdlens",
+                        "message": message,
+                    })
+                elif node.has_error and cursor.goto_first_child():
+                    continue
+                while not cursor.goto_next_sibling():
+                    if not cursor.goto_parent():
+                        return out
+        return self.cached("diagnostics", compute)
+
+
+def _symbol(name: str, kind: int, rng: Dict[str, Any], detail: str = "", children: Optional[list] = None) -> dict:
+    sym = {"name": name or "(anonymous)", "kind": kind, "range": rng, "selectionRange": rng}
+    if detail:
+        sym["detail"] = detail
+    if children is not None:
+        sym["children"] = children
+    return sym
+
+
+def document_symbols(od: OpenDocument) -> List[dict]:
+    """entity(포트/generic) 와 architecture(signal/instance/process) 계층의 DocumentSymbol 목록."""
+    d = od.design()
+    pm = od.positions()
+    out: List[dict] = []
+    for e in d.entities:
+        children = [
+            _symbol(g.name, _KIND_CONSTANT, pm.range(g.start_byte, g.end_byte), g.type)
+            for g in d.generics if g.entity == e.name and e.start_byte <= g.start_byte < e.end_byte
+        ] + [
+            _symbol(p.name, _KIND_FIELD, pm.range(p.start_byte, p.end_byte), f"{p.direction} {p.type}")
+            for p in d.ports if p.entity == e.name and e.start_byte <= p.start_byte < e.end_byte
+        ]
+        out.append(_symbol(e.name, _KIND_CLASS, pm.range(e.start_byte, e.end_byte), "entity", children))
+    archs = [(name, entity, s, e, []) for name, entity, s, e in od.architectures()]
+
+    def place(start: int, sym: dict) -> None:
+        for _name, _entity, s, e, children in archs:
+            if s <= start < e:
+                children.append(sym)
+                return
+        out.append(sym)
+
+    for s in d.signals:
+        place(s.start_byte, _symbol(s.name, _KIND_VARIABLE, pm.range(s.start_byte, s.end_byte), s.type))
+    for i in d.instances:
+        place(i.start_byte, _symbol(i.label or i.unit, _KIND_OBJECT, pm.range(i.start_byte, i.end_byte), f"{i.kind} {i.unit}"))
+    for p in d.processes:
+        place(p.start_byte, _symbol(p.label or "process", _KIND_FUNCTION, pm.range(p.start_byte, p.end_byte), "process"))
+    for name, entity, s, e, children in archs:
+        out.append(_symbol(name, _KIND_MODULE, pm.range(s, e), f"architecture of {entity}", children))
+    return out
+
+
+def _with_ranges(od: OpenDocument, matches: List[Any]) -> List[dict]:
+    """쿼리 결과 dataclass → dict (start_byte/end_byte 대신 LSP range)."""
+    pm = od.positions()
+    out = []
+    for m in matches:
+        d = dict(m.__dict__)
+        d["range"] = pm.range(d.pop("start_byte"), d.pop("end_byte"))
+        out.append(d)
+    return out
+
+
+class LanguageServer:
+    """
+    Content-Length 헤더로 구분된 JSON-RPC 메시지를 reader 에서 읽어 writer 로 응답.
+    읽기는 별도 스레드가 큐에 넣고, 메인 루프가 도착한 메시지를 묶음 단위로 처리한다.
+    """
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO, debounce: float = 0.15):
+        self.reader = reader
+        self.writer = writer
+        self.debounce = debounce
+        self.documents: Dict[str, OpenDocument] = {}
+        self.encoding = "utf-16"
+        self._shutdown = False
+        self._exit_code: Optional[int] = None
+        self._write_lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[dict]]" = queue.Queue()
+        self._resync = False  # 직전 헤더가 잘못되어 다음 Content-Length 까지 건너뛰는 중
+        self._diag_due: Dict[str, float] = {}  # uri → 진단 발행 예정 시각
+        self._handlers: Dict[str, Callable[[dict], Any]] = {
+            "initialize": self._initialize,
+            "initialized": lambda p: None,
+            "shutdown": self._shutdown_request,
+            "exit": self._exit,
+            "textDocument/didOpen": self._did_open,
+            "textDocument/didChange": self._did_change,
+            "textDocument/didClose": self._did_close,
+            "textDocument/didSave": lambda p: None,
+            "textDocument/documentSymbol": lambda p: document_symbols(self._doc(p)),
+            "vhdl/entities": lambda p: _with_ranges(self._doc(p), self._doc(p).design().entities),
+            "vhdl/ports": lambda p: _with_ranges(self._doc(p), self._doc(p).design().ports),
+            "vhdl/processes": lambda p: _with_ranges(self._doc(p), self._doc(p).design().processes),
+            "vhdl/design": self._design,
+        }
+
+    # ---- 전송 계층 ----
+
+    def _read_message(self) -> Optional[dict]:
+        """
+        헤더 + 본문 1개 → dict. 입력 종료면 None.
+        Content-Length 가 없거나 잘못되면 본문 경계를 알 수 없으므로 _parse_error 를 돌려주고,
+        다음 호출은 Content-Length 헤더가 다시 나올 때까지 입력을 버린다 (재동기화).
+        """
+        line = self.reader.readline()
+        if self._resync:
+            while line:
+                start = line.lower().find(b"content-length")
+                if start >= 0:
+                    line = line[start:]  # 본문 뒤에 줄바꿈 없이 붙은 헤더
+                    break
+                line = self.reader.readline()
+            self._resync = False
+        length: Optional[int] = None
+        error: Optional[str] = None
+        while True:
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.decode("ascii", "replace").partition(":")
+            if name.strip().lower() == "content-length":
+                try:
+                    length = int(value.strip())
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    length, error = None, f"잘못된 Content-Length: {value.strip()!r}"
+            line = self.reader.readline()
+        if error is not None or length is None:
+            self._resync = True
+            return {"_parse_error": error or "Content-Length 헤더 없음"}
+        body = self.reader.read(length)
+        try:
+            return json.loads(body.decode("utf-8"))
+        except ValueError as exc:
+            return {"_parse_error": str(exc)}
+
+    def _reader_loop(self) -> None:
+        # 읽기 스레드가 어떤 이유로 끝나도 serve() 가 큐에서 영원히 기다리지 않도록 종료 표시는 항상 넣는다
+        try:
+            while True:
+                msg = self._read_message()
+                if msg is None:
+                    return
+                self._queue.put(msg)
+        except OSError as exc:  # 입력 파이프 오류는 입력 종료로 취급
+            print(f"vhdlens-lsp: 입력 읽기 실패: {exc}", file=sys.stderr)
+        finally:
+            self._queue.put(None)
+
+    def send(self, message: dict) -> None:
+        message["jsonrpc"] = "2.0"
+        body = json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        with self._write_lock:
+            self.writer.write(b"Content-Length: %d\r\n\r\n" % len(body))
+            self.writer.write(body)
+            self.writer.flush()
+
+    def _error(self, msg_id: Any, code: int, message: str) -> None:
+        self.send({"id": msg_id, "error": {"code": code, "message": message}})
+
+    # ---- 메인 루프 ----
+
+    def serve(self) -> int:
+        """exit 알림 또는 입력 종료까지 처리. 반환값: 프로세스 종료 코드 (shutdown 후 exit 이면 0)."""
+        threading.Thread(target=self._reader_loop, daemon=True).start()
+        while self._exit_code is None:
+            timeout = None
+            if self._diag_due:
+                timeout = max(0.0, min(self._diag_due.values()) - time.monotonic())
+            try:
+                first = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._publish_due_diagnostics()
+                continue
+            batch = [first]
+            while batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            eof = batch[-1] is None
+            self.process_batch([m for m in batch if m is not None])
+            self._publish_due_diagnostics()
+            if eof and self._exit_code is None:
+                self._exit_code = 0 if self._shutdown else 1
+        return self._exit_code
+
+    def process_batch(self, batch: List[dict]) -> None:
+        """
+        한꺼번에 도착한 메시지 묶음 처리.
+        - $/cancelRequest 로 취소된 요청은 RequestCancelled
+        - 같은 문서에 대한 didChange 가 뒤따르는 요청은 ContentModified (낡은 결과 계산 생략)
+        - 객체가 아닌 메시지(배열 등)는 InvalidRequest, 필드가 빠진 메시지는 사전 검사에서 무시하고 handle() 에 맡김
+        """
+        cancelled = set()
+        later_change: Dict[str, int] = {}
+        for index, m in enumerate(batch):
+            if not isinstance(m, dict):
+                continue
+            params = m.get("params")
+            params = params if isinstance(params, dict) else {}
+            if m.get("method") == "$/cancelRequest" and params.get("id") is not None:
+                cancelled.add(params["id"])
+            elif m.get("method") == "textDocument/didChange":
+                td = params.get("textDocument")
+                if isinstance(td, dict) and td.get("uri") is not None:
+                    later_change[td["uri"]] = index
+        for index, m in enumerate(batch):
+            if not isinstance(m, dict):
+                self._error(None, INVALID_REQUEST, "JSON-RPC 메시지는 객체여야 합니다")
+                continue
+            if "_parse_error" in m:
+                self._error(None, PARSE_ERROR, m["_parse_error"])
+                continue
+            if m.get("method") == "$/cancelRequest":
+                continue
+            msg_id = m.get("id")
+            if msg_id is not None and "method" in m:
+                if msg_id in cancelled:
+                    self._error(msg_id, REQUEST_CANCELLED, "요청이 취소되었습니다")
+                    continue
+                params = m.get("params")
+                td = params.get("textDocument") if isinstance(params, dict) else None
+                uri = td.get("uri") if isinstance(td, dict) else None
+                if uri is not None and later_change.get(uri, -1) > index:
+                    self._error(msg_id, CONTENT_MODIFIED, "문서가 변경되었습니다")
+                    continue
+            self.handle(m)
+            if self._exit_code is not None:
+                return
+
+    def handle(self, message: dict) -> None:
+        """메시지 1개 처리. 요청이면 응답을 보낸다 (알림은 응답 없음)."""
+        method = message.get("method")
+        msg_id = message.get("id")
+        if method is None:
+            return  # 클라이언트 응답 (서버→클라이언트 요청 없음)
+        handler = self._handlers.get(method)
+        if handler is None:
+            if msg_id is not None:
+                self._error(msg_id, METHOD_NOT_FOUND, f"지원하지 않는 메서드: {method}")
+            return
+        try:
+            result = handler(message.get("params") or {})
+        except KeyError as exc:
+            if msg_id is not None:
+                self._error(msg_id, INVALID_PARAMS, f"잘못된 인자: {exc}")
+            return
+        except Exception as exc:  # 한 요청 실패가 서버를 멈추지 않도록
+            if msg_id is not None:
+                self._error(msg_id, INTERNAL_ERROR, f"{type(exc).__name__}: {exc}")
+            return
+        if msg_id is not None:
+            self.send({"id": msg_id, "result": result})
+
+    # ---- 핸들러 ----
+
+    def _doc(self, params: dict) -> OpenDocument:
+        uri = params["textDocument"]["uri"]
+        od = self.documents.get(uri)
+        if od is None:
+            raise KeyError(f"열려 있지 않은 문서: {uri}")
+        return od
+
+    def _initialize(self, params: dict) -> dict:
+        offered = ((params.get("capabilities") or {}).get("general") or {}).get("positionEncodings") or []
+        self.encoding = "utf-8" if "utf-8" in offered else "utf-16"
+        return {
+            "capabilities": {
+                "positionEncoding": self.encoding,
+                "textDocumentSync": {"openClose": True, "change": _SYNC_INCREMENTAL},
+                "documentSymbolProvider": True,
+            },
+            "serverInfo": {"name": "vhdlens"},
+        }
+
+    def _shutdown_request(self, params: dict) -> None:
+        self._shutdown = True
+        return None
+
+    def _exit(self, params: dict) -> None:
+        self._exit_code = 0 if self._shutdown else 1
+
+    def _did_open(self, params: dict) -> None:
+        td = params["textDocument"]
+        self.documents[td["uri"]] = OpenDocument(td["uri"], td["text"], td.get("version", 0), self.encoding)
+        self._schedule_diagnostics(td["uri"])
+
+    def _did_change(self, params: dict) -> None:
+        od = self._doc(params)
+        od.apply_changes(params["contentChanges"], params["textDocument"].get("version"))
+        self._schedule_diagnostics(od.uri)
+
+    def _did_close(self, params: dict) -> None:
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        self._diag_due.pop(uri, None)
+        self.send({"method": "textDocument/publishDiagnostics", "params": {"uri": uri, "diagnostics": []}})
+
+    def _design(self, params: dict) -> dict:
+        od = self._doc(params)
+        d = od.design()
+        return {kind: _with_ranges(od, getattr(d, kind)) for kind in d.__dict__}
+
+    # ---- 진단 (debounce) ----
+
+    def _schedule_diagnostics(self, uri: str) -> None:
+        self._diag_due[uri] = time.monotonic() + self.debounce
+
+    def _publish_due_diagnostics(self) -> None:
+        now = time.monotonic()
+        for uri in [u for u, due in self._diag_due.items() if due <= now]:
+            del self._diag_due[uri]
+            od = self.documents.get(uri)
+            if od is None:
+                continue
+            self.send({
+                "method": "textDocument/publishDiagnostics",
+                "params": {"uri": uri, "version": od.version, "diagnostics": od.diagnostics()},
+            })
+
+
+def serve_stdio(debounce: float = 0.15) -> int:
+    """표준 입출력으로 언어 서버 실행."""
+    return LanguageServer(sys.stdin.buffer, sys.stdout.buffer, debounce=debounce).serve()
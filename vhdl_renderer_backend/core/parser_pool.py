@@ -0,0 +1,115 @@
+"""
+Tree-sitter Parser 풀.
+VHDL Language 는 프로세스당 한 번만 생성하고, Parser 는 체크아웃/반납 방식으로 재사용한다.
+체크아웃된 Parser 는 반납 전까지 한 스레드만 사용하므로 스레드 간 공유가 없다.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    from tree_sitter import Language, Parser
+    from tree_sitter_vhdl import language as vhdl_language
+except ImportError:
+    Language = Parser = None
+    vhdl_language = None
+
+_MISSING_MSG = "tree-sitter, tree-sitter-vhdl 패키지가 필요합니다. pip install tree-sitter tree-sitter-vhdl"
+
+
+class ParserPool:
+    """
+    Language 1개 + 유휴 Parser 목록.
+
+    - acquire(): 유휴 Parser 가 있으면 재사용(hit), 없으면 새로 생성
+    - release(): reset 후 유휴 목록에 반납 (max_idle 초과분은 버림)
+    - stats(): hits / created / 생성 소요 시간 카운터
+    """
+
+    def __init__(self, max_idle: Optional[int] = None):
+        self._lock = threading.Lock()
+        self._idle: List[Parser] = []
+        self._language: Optional[Language] = None
+        self._max_idle = max_idle
+        self._hits = 0
+        self._created = 0
+        self._language_init_s = 0.0
+        self._parser_init_s = 0.0
+
+    def language(self) -> Language:
+        """캐시된 VHDL Language (최초 1회 생성)."""
+        if self._language is None:
+            if Parser is None or vhdl_language is None:
+                raise RuntimeError(_MISSING_MSG)
+            with self._lock:
+                if self._language is None:
+                    t0 = time.perf_counter()
+                    self._language = Language(vhdl_language())
+                    self._language_init_s += time.perf_counter() - t0
+        return self._language
+
+    def acquire(self) -> Parser:
+        """Parser 체크아웃. 반드시 release() 로 반납."""
+        lang = self.language()
+        with self._lock:
+            if self._idle:
+                self._hits += 1
+                return self._idle.pop()
+        t0 = time.perf_counter()
+        parser = Parser(lang)
+        elapsed = time.perf_counter() - t0
+        with self._lock:
+            self._created += 1
+            self._parser_init_s += elapsed
+        return parser
+
+    def release(self, parser: Parser) -> None:
+        """Parser 반납. 중단된 파싱 상태가 남지 않도록 reset 한다."""
+        parser.reset()
+        with self._lock:
+            if self._max_idle is None or len(self._idle) < self._max_idle:
+                self._idle.append(parser)
+
+    @contextmanager
+    def parser(self) -> Iterator[Parser]:
+        """with pool.parser() as p: ... — 블록 종료 시 자동 반납."""
+        p = self.acquire()
+        try:
+            yield p
+        finally:
+            self.release(p)
+
+    def stats(self) -> Dict[str, Any]:
+        """카운터 스냅샷."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "created": self._created,
+                "idle": len(self._idle),
+                "language_init_s": self._language_init_s,
+                "parser_init_s": self._parser_init_s,
+            }
+
+    def clear(self) -> None:
+        """유휴 Parser 폐기 및 카운터 초기화 (Language 캐시는 유지)."""
+        with self._lock:
+            self._idle.clear()
+            self._hits = 0
+            self._created = 0
+            self._parser_init_s = 0.0
+
+
+_DEFAULT_POOL = ParserPool()
+
+
+def get_parser_pool() -> ParserPool:
+    """모든 AST 진입점이 공유하는 기본 풀."""
+    return _DEFAULT_POOL
+
+
+def get_language() -> Language:
+    """캐시된 VHDL Language."""
+    return _DEFAULT_POOL.language()
@@ -1,15 +1,142 @@
 """
 VHDL 전처리기: 주석 제거 및 텍스트 정규화.
 Input: 원본 VHDL 문자열 → Output: 정제된 VHDL 문자열.
+
+컴파일된 정규식 토크나이저로 원문을 한 번만 훑는다 (줄 분할·문자 단위 Python 루프 없음).
+    - 문자열 리터럴 "..."("" 이스케이프), 문자 리터럴 'x' 내부의 -- 와 공백은 그대로 보존
+    - `--` 줄 주석, VHDL-2008 `/* */` 블록 주석 제거 (블록 주석은 구분자로 취급)
+    - normalize_whitespace=True 면 주석·공백 연속 구간을 공백 1개로 (앞뒤는 제거)
+preprocess_with_offsets 는 정제본 위치 → 원문 오프셋/(줄, 열) 을 돌려주는 OffsetMap 을 함께 만든다.
 """
 import re
+from array import array
+from bisect import bisect_right
+from typing import Tuple
+
+from .profile import stage
+
+# 리터럴은 건너뛰기만 하고(내부 보존), gap(주석/공백) 만 치환 대상
+_LITERAL = r'"(?:[^"\n]|"")*"?|\'[^\n]\''
+_COMMENT = r"--[^\n]*|/\*[\s\S]*?(?:\*/|\Z)"
+_MORE_COMMENTS = rf"(?:(?:{_COMMENT})\s*)*"
+# 정규화 gap: 주석이 섞인 공백 구간, 2자 이상 공백, 공백 1개가 아닌 공백 문자.
+# " " 1개는 바꿀 필요가 없어 매치하지 않는다 (매치 수가 곧 Python 처리 횟수). 각 분기 첫 글자가 고정되어 엔진이 빨리 건너뜀
+_GAP_NORMALIZE = rf"(?:[^\S ]| (?=\s|--|/\*))\s*{_MORE_COMMENTS}|(?:{_COMMENT})\s*{_MORE_COMMENTS}"
+_TOKEN_NORMALIZE = re.compile(rf"(?P<lit>{_LITERAL})|(?P<gap>{_GAP_NORMALIZE})")
+_TOKEN_KEEP = re.compile(rf"(?P<lit>{_LITERAL})|(?P<gap>{_COMMENT})")
+_NEWLINE = re.compile(r"\n")
+
+
+def _comment_replacement(gap: str) -> str:
+    """정규화 없이 주석만 제거할 때: 블록 주석은 줄 수를 유지(줄 번호 보존), 줄 주석은 빈 문자열."""
+    newlines = gap.count("\n")
+    if newlines:
+        return "\n" * newlines
+    return "" if gap.startswith("--") else " "
+
+
+class OffsetMap:
+    """
+    정제본 위치 → 원문 위치 대응표.
+
+    원문과 정제본의 오프셋 차이가 바뀌는 지점만 (정제본 시작, 원문 시작) 쌍으로 기록한다.
+    공백 1개로 바뀐 gap 내부 위치는 gap 시작으로 대응. (줄, 열) 은 0 기준 (tree-sitter Point 와 동일).
+    """
+
+    __slots__ = ("_clean", "_orig", "_line_starts")
+
+    def __init__(self, clean_starts: array, orig_starts: array, line_starts: array):
+        self._clean = clean_starts
+        self._orig = orig_starts
+        self._line_starts = line_starts
+
+    def original_offset(self, pos: int) -> int:
+        """정제본 문자 오프셋 → 원문 문자 오프셋."""
+        i = bisect_right(self._clean, pos) - 1
+        return self._orig[i] + (pos - self._clean[i])
+
+    def position(self, pos: int) -> Tuple[int, int]:
+        """정제본 문자 오프셋 → 원문 (줄, 열), 0 기준."""
+        offset = self.original_offset(pos)
+        line = bisect_right(self._line_starts, offset) - 1
+        return line, offset - self._line_starts[line]
+
+    def __len__(self) -> int:
+        return len(self._clean)
+
+    def nbytes(self) -> int:
+        return sum(a.itemsize * len(a) for a in (self._clean, self._orig, self._line_starts))
+
+
+def _bounds(text: str, normalize: bool) -> Tuple[int, int]:
+    """정규화 시 앞뒤 공백을 뺀 스캔 구간."""
+    if not normalize:
+        return 0, len(text)
+    return len(text) - len(text.lstrip()), len(text.rstrip())
+
+
+def _clean(text: str, normalize: bool) -> str:
+    """OffsetMap 없는 경로: re.split 이 C 에서 토큰을 자르고, Python 은 구분자 목록만 한 번 훑는다."""
+    lo, hi = _bounds(text, normalize)
+    parts = (_TOKEN_NORMALIZE if normalize else _TOKEN_KEEP).split(text[lo:hi])
+    # parts = [본문, lit, gap, 본문, lit, gap, ..., 본문]
+    if normalize:
+        seps = [" " if lit is None else lit for lit in parts[1::3]]
+        if seps:
+            # 앞뒤 끝에 붙은 gap(주석) 은 제거
+            if parts[0] == "" and parts[1] is None:
+                seps[0] = ""
+            if parts[-1] == "" and parts[-3] is None:
+                seps[-1] = ""
+    else:
+        seps = [_comment_replacement(gap) if lit is None else lit for lit, gap in zip(parts[1::3], parts[2::3])]
+    out = [""] * (len(seps) * 2 + 1)
+    out[0::2] = parts[0::3]
+    out[1::2] = seps
+    return "".join(out)
+
+
+def _clean_with_map(text: str, normalize: bool) -> Tuple[str, "OffsetMap"]:
+    """OffsetMap 경로: gap 마다 (정제본 위치, 원문 위치) 를 기록하며 한 번 순회."""
+    lo, hi = _bounds(text, normalize)
+    pattern = _TOKEN_NORMALIZE if normalize else _TOKEN_KEEP
+    out = []
+    append = out.append
+    clean_starts = array("I", [0])
+    orig_starts = array("I", [lo])
+    last = lo    # 원문에서 아직 복사하지 않은 시작 위치
+    clean = 0    # 정제본 길이
+    for m in pattern.finditer(text, lo, hi):
+        if m.lastgroup == "lit":
+            continue
+        start, stop = m.span()
+        if normalize:
+            repl = "" if start == lo or stop == hi else " "
+        else:
+            repl = _comment_replacement(m.group())
+        append(text[last:start])
+        append(repl)
+        clean += start - last
+        # gap 내부(대체 문자열 포함) 는 gap 시작으로, 이후 구간은 stop 부터 선형 대응.
+        # 같은 정제본 위치에 항목이 겹치면 bisect_right 가 마지막(원문상 뒤) 항목을 고른다
+        if repl:
+            clean_starts.append(clean)
+            orig_starts.append(start)
+            clean += len(repl)
+        clean_starts.append(clean)
+        orig_starts.append(stop)
+        last = stop
+    append(text[last:hi])
+    line_starts = array("I", [0])
+    line_starts.extend(m.end() for m in _NEWLINE.finditer(text))
+    return "".join(out), OffsetMap(clean_starts, orig_starts, line_starts)
 
 
 def preprocess(vhdl_text: str, normalize_whitespace: bool = True) -> str:
     """
     VHDL 소스에서 주석을 제거하고, 선택적으로 공백을 정규화한다.
 
-    - `--` 부터 해당 줄 끝까지 제거 (인라인 주석 포함).
+    - `--` 부터 해당 줄 끝까지, `/* ... */` 블록 주석 제거 (문자열/문자 리터럴 안은 보존).
     - normalize_whitespace=True 이면 연속 공백/탭/줄바꿈을 단일 공백으로 치환.
 
     Args:
@@ -21,46 +148,18 @@ def preprocess(vhdl_text: str, normalize_whitespace: bool = True) -> str:
     """
     if not vhdl_text or not vhdl_text.strip():
         return vhdl_text
+    with stage("preprocess"):
+        return _clean(vhdl_text, normalize_whitespace)
 
-    # 1) 줄 단위로 -- 부터 끝까지 제거 (문자열 내 -- 는 고려하지 않음; VHDL에서는 "--" 가 문자열 안에 올 수 있으나 1단계에서는 단순화)
-    lines = vhdl_text.split("\n")
-    stripped = []
-    for line in lines:
-        # VHDL 주석: -- 이후 제거. 따옴표 안의 -- 는 보존하려면 복잡해지므로, 여기서는 첫 번째 -- 부터 제거
-        idx = _find_comment_start(line)
-        if idx >= 0:
-            line = line[:idx]
-        stripped.append(line)
-
-    text = "\n".join(stripped)
 
-    if normalize_whitespace:
-        # 연속 공백·탭·줄바꿈을 단일 공백으로 (줄 구조는 무시하고 한 덩어리로 만듦)
-        text = re.sub(r"\s+", " ", text)
-        text = text.strip()
-
-    return text
-
-
-def _find_comment_start(line: str) -> int:
+def preprocess_with_offsets(vhdl_text: str, normalize_whitespace: bool = True) -> Tuple[str, OffsetMap]:
     """
-    줄에서 주석 시작 위치(--)를 찾는다.
-    단순 버전: 문자열 리터럑 내부의 -- 는 구분하지 않고, 첫 -- 의 인덱스를 반환.
+    preprocess 와 같은 정제본 + 정제본 위치 → 원문 (줄, 열) OffsetMap.
+
+    오류 보고·정의 이동 시 원문을 다시 읽거나 재스캔하지 않고 위치를 복원할 수 있다.
     """
-    i = 0
-    in_double = False
-    in_single = False
-    while i < len(line):
-        c = line[i]
-        if c == '"' and not in_single:
-            in_double = not in_double
-            i += 1
-            continue
-        if c == "'" and not in_double:
-            in_single = not in_single
-            i += 1
-            continue
-        if not in_double and not in_single and i + 1 < len(line) and line[i : i + 2] == "--":
-            return i
-        i += 1
-    return -1
+    if not vhdl_text or not vhdl_text.strip():
+        text = vhdl_text or ""
+        return text, OffsetMap(array("I", [0]), array("I", [0]), array("I", [0]))
+    with stage("preprocess"):
+        return _clean_with_map(vhdl_text, normalize_whitespace)
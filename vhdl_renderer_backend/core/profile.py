@@ -0,0 +1,209 @@
+"""
+단계별 계측: 단계 타이머, 개수 카운터, 선택적 tracemalloc 최대 메모리.
+
+라이브러리 코드는 stage("이름") / count("이름", n) 만 호출한다. 활성 Profiler 가 없으면
+stage 는 공유 no-op 객체를 돌려주므로 비용은 ContextVar 조회 1회.
+    with profiling(memory=True) as prof:
+        entities = parse_entities(preprocess(text))
+    print(prof.format_table())
+
+단계 이름은 중첩 경로("parse_tree", "export" 또는 "cache/read")로 모이며 share 는 전체 경과 시간 대비 비율.
+계측 지점: read, cache, preprocess, parse_tree, extract, ast_dict, export
+카운터: files, bytes_in, nodes, entities, ports, cache_hits
+hooks 에 (단계 경로, 경과 초) 를 받는 콜러블을 넣으면 단계가 끝날 때마다 호출된다 (외부 로깅·트레이싱 연동).
+"""
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+Hook = Callable[[str, float], None]
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    total_s: float = 0.0
+    peak_bytes: int = 0  # memory=True 일 때 단계 진입 시점 대비 최대 할당 증가량
+
+
+class _Frame:
+    __slots__ = ("path", "t0", "mem0", "peak")
+
+    def __init__(self, path: str, t0: float, mem0: int):
+        self.path = path
+        self.t0 = t0
+        self.mem0 = mem0
+        self.peak = mem0
+
+
+class _StageContext:
+    __slots__ = ("profiler", "name", "frame")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> "_StageContext":
+        self.frame = self.profiler._enter(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.profiler._exit(self.frame)
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Profiler:
+    """단계별 누적 시간·호출 수·최대 메모리와 카운터. 스레드/태스크별로는 profiling() 으로 따로 활성화."""
+
+    def __init__(self, memory: bool = False, hooks: Iterable[Hook] = ()):
+        self.memory = memory
+        self.hooks: List[Hook] = list(hooks)
+        self.stages: Dict[str, StageStats] = {}
+        self.counters: Dict[str, int] = {}
+        self.wall_s = 0.0
+        self._stack: List[_Frame] = []
+        self._t0: Optional[float] = None
+        self._owns_tracemalloc = False
+
+    def start(self) -> None:
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self._t0 = time.perf_counter()
+
+    def stop(self) -> None:
+        if self._t0 is not None:
+            self.wall_s += time.perf_counter() - self._t0
+            self._t0 = None
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def stage(self, name: str) -> _StageContext:
+        return _StageContext(self, name)
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def _enter(self, name: str) -> _Frame:
+        stack = self._stack
+        path = f"{stack[-1].path}/{name}" if stack else name
+        mem0 = 0
+        if self.memory and tracemalloc.is_tracing():
+            mem0, peak = tracemalloc.get_traced_memory()
+            if stack:
+                # reset_peak 전에 바깥 단계가 지금까지 본 최댓값을 보존
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+        frame = _Frame(path, time.perf_counter(), mem0)
+        stack.append(frame)
+        return frame
+
+    def _exit(self, frame: _Frame) -> None:
+        elapsed = time.perf_counter() - frame.t0
+        stack = self._stack
+        while stack and stack.pop() is not frame:
+            pass
+        stats = self.stages.get(frame.path)
+        if stats is None:
+            stats = self.stages[frame.path] = StageStats()
+        stats.calls += 1
+        stats.total_s += elapsed
+        if self.memory and tracemalloc.is_tracing():
+            peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+            stats.peak_bytes = max(stats.peak_bytes, peak - frame.mem0)
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+        for hook in self.hooks:
+            hook(frame.path, elapsed)
+
+    def merge(self, report: Dict[str, Any]) -> None:
+        """다른 Profiler 의 to_dict() (예: 워커 프로세스) 를 더한다. 합친 시간은 CPU 시간 합이라 경과 시간보다 클 수 있다."""
+        for row in report.get("stages", []):
+            stats = self.stages.setdefault(row["stage"], StageStats())
+            stats.calls += row["calls"]
+            stats.total_s += row["total_s"]
+            stats.peak_bytes = max(stats.peak_bytes, row.get("peak_bytes", 0))
+        for name, n in report.get("counters", {}).items():
+            self.count(name, n)
+
+    def to_dict(self) -> Dict[str, Any]:
+        wall = self.wall_s + (time.perf_counter() - self._t0 if self._t0 is not None else 0.0)
+        stages = []
+        for path, s in self.stages.items():
+            row: Dict[str, Any] = {
+                "stage": path,
+                "calls": s.calls,
+                "total_s": round(s.total_s, 6),
+                "share": round(s.total_s / wall, 4) if wall > 0 else None,
+            }
+            if self.memory:
+                row["peak_bytes"] = s.peak_bytes
+            stages.append(row)
+        return {"wall_s": round(wall, 6), "stages": stages, "counters": dict(self.counters)}
+
+    def format_table(self) -> str:
+        """단계 표 + 카운터 (사람이 읽기용)."""
+        report = self.to_dict()
+        header = f"{'stage':28} {'calls':>7} {'total ms':>10} {'share':>7}" + (f" {'peak MB':>9}" if self.memory else "")
+        lines = [header, "-" * len(header)]
+        for row in report["stages"]:
+            depth = row["stage"].count("/")
+            name = "  " * depth + row["stage"].rsplit("/", 1)[-1]
+            share = f"{row['share']:7.1%}" if row["share"] is not None else f"{'-':>7}"
+            line = f"{name:28} {row['calls']:7d} {row['total_s'] * 1000:10.2f} {share}"
+            if self.memory:
+                line += f" {row['peak_bytes'] / (1024 * 1024):9.2f}"
+            lines.append(line)
+        lines.append(f"{'(wall)':28} {'':7} {report['wall_s'] * 1000:10.2f}")
+        if report["counters"]:
+            lines.append("  ".join(f"{k}={v:,}" for k, v in report["counters"].items()))
+        return "\n".join(lines)
+
+
+_active: ContextVar[Optional[Profiler]] = ContextVar("vhdlens_profiler", default=None)
+
+
+def active() -> Optional[Profiler]:
+    """현재 컨텍스트의 Profiler (없으면 None). 비싼 카운터 계산 전에 확인용."""
+    return _active.get()
+
+
+def stage(name: str):
+    """활성 Profiler 의 단계 컨텍스트, 없으면 no-op."""
+    profiler = _active.get()
+    return _NULL_STAGE if profiler is None else _StageContext(profiler, name)
+
+
+def count(name: str, n: int = 1) -> None:
+    profiler = _active.get()
+    if profiler is not None:
+        profiler.count(name, n)
+
+
+@contextmanager
+def profiling(profiler: Optional[Profiler] = None, memory: bool = False, hooks: Iterable[Hook] = ()) -> Iterator[Profiler]:
+    """블록 안의 라이브러리 호출을 계측. profiler 를 주면 이어서 누적."""
+    profiler = profiler if profiler is not None else Profiler(memory=memory, hooks=hooks)
+    token = _active.set(profiler)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        _active.reset(token)
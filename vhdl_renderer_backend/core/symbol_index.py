@@ -0,0 +1,418 @@
+"""
+설계 라이브러리 교차 파일 심볼 인덱스.
+
+파일마다 선언한 design unit(entity/architecture/package/package body/configuration/component)과
+참조(instance 의 entity/component/configuration, use 절의 package)를 기록한다.
+이름(소문자) → {파일 → 항목} 역색인을 메모리에 유지하여 "entity X 를 정의한 파일",
+"component Y 를 인스턴스화한 곳" 조회가 O(1). 파일 1개 변경 시 그 파일의 항목만 교체하며,
+SQLite 에 파일별 레코드로 저장하여 다음 실행에서는 (mtime, size) 가 바뀐 파일만 다시 파싱한다.
+"""
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    from tree_sitter import Node, Tree
+except ImportError:
+    Node = Tree = None
+
+from .ast_parser import node_text, parse_to_tree
+from .ast_walker import SKIP, NodeDispatcher
+from .batch import scan_files
+from .cache import parser_version
+
+# 선언 종류 / 참조 종류
+DECL_KINDS = ("entity", "architecture", "package", "package_body", "configuration", "component")
+REF_KINDS = ("entity", "component", "configuration", "package")
+
+_Key = Tuple[str, str]  # (종류, 소문자 이름)
+
+
+@dataclass
+class UnitDecl:
+    """선언 1개. of = architecture/configuration 의 대상 entity."""
+    kind: str
+    name: str
+    line: int
+    of: Optional[str] = None
+
+
+@dataclass
+class UnitRef:
+    """참조 1개. label = instance 레이블, context = 감싼 architecture 이름."""
+    kind: str
+    name: str
+    line: int
+    library: Optional[str] = None
+    label: Optional[str] = None
+    context: Optional[str] = None
+
+
+@dataclass
+class FileSymbols:
+    """파일 1개의 선언·참조 레코드. stamp = 인덱싱 시점 (mtime_ns, size)."""
+    path: str
+    declarations: List[UnitDecl] = field(default_factory=list)
+    references: List[UnitRef] = field(default_factory=list)
+    stamp: Tuple[int, int] = (0, 0)
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "declarations": [asdict(d) for d in self.declarations],
+            "references": [asdict(r) for r in self.references],
+            "stamp": list(self.stamp),
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "FileSymbols":
+        return cls(
+            path=d["path"],
+            declarations=[UnitDecl(**x) for x in d["declarations"]],
+            references=[UnitRef(**x) for x in d["references"]],
+            stamp=tuple(d["stamp"]),
+            error=d.get("error"),
+        )
+
+
+def _split_name(text: str) -> Tuple[Optional[str], str]:
+    """"work.cfg1" → ("work", "cfg1"), "e2" → (None, "e2")."""
+    if "." in text:
+        library, _, name = text.rpartition(".")
+        return library, name
+    return None, text
+
+
+class _SymbolCollector:
+    """NodeDispatcher 핸들러 묶음. 한 번의 순회로 선언과 참조를 모은다."""
+
+    def __init__(self, source: bytes):
+        self.source = source
+        self.declarations: List[UnitDecl] = []
+        self.references: List[UnitRef] = []
+        self._arch: Optional[str] = None
+
+    def dispatcher(self) -> NodeDispatcher:
+        d = NodeDispatcher()
+        d.skip(
+            "line_comment", "block_comment", "process_statement", "subprogram_declaration",
+            "subprogram_body", "constant_declaration", "signal_declaration", "type_declaration",
+            "entity_head", "port_clause", "generic_clause",
+        )
+        d.on_enter("entity_declaration", self._enter_entity)
+        d.on_enter("architecture_definition", self._enter_architecture)
+        d.on_leave("architecture_definition", self._leave_architecture)
+        d.on_enter("package_declaration", self._enter_package)
+        d.on_enter("package_definition", self._enter_package_body)
+        d.on_enter("configuration_declaration", self._enter_configuration)
+        d.on_enter("component_declaration", self._enter_component)
+        d.on_enter("component_instantiation_statement", self._enter_instance)
+        d.on_enter("use_clause", self._enter_use)
+        return d
+
+    def _line(self, node: Node) -> int:
+        return node.start_point[0] + 1
+
+    def _first_identifier(self, node: Node) -> Optional[str]:
+        ident = next((c for c in node.children if c.type == "identifier"), None)
+        return node_text(ident, self.source) if ident is not None else None
+
+    def _enter_entity(self, node: Node) -> None:
+        name = self._first_identifier(node)
+        if name:
+            self.declarations.append(UnitDecl("entity", name, self._line(node)))
+        return None
+
+    def _enter_architecture(self, node: Node) -> None:
+        name = self._first_identifier(node)
+        entity = node.child_by_field_name("entity")
+        of = node_text(entity, self.source) if entity is not None else None
+        self.declarations.append(UnitDecl("architecture", name or "", self._line(node), of))
+        if of:
+            self.references.append(UnitRef("entity", of, self._line(node), context=name))
+        self._arch = name
+        return None
+
+    def _leave_architecture(self, node: Node) -> None:
+        self._arch = None
+        return None
+
+    def _enter_package(self, node: Node) -> None:
+        name = self._first_identifier(node)
+        if name:
+            self.declarations.append(UnitDecl("package", name, self._line(node)))
+        return None
+
+    def _enter_package_body(self, node: Node) -> None:
+        name = self._first_identifier(node)
+        if name:
+            self.declarations.append(UnitDecl("package_body", name, self._line(node)))
+        return None
+
+    def _enter_configuration(self, node: Node) -> str:
+        name = self._first_identifier(node)
+        entity = node.child_by_field_name("entity")
+        of = node_text(entity, self.source) if entity is not None else None
+        self.declarations.append(UnitDecl("configuration", name or "", self._line(node), of))
+        if of:
+            self.references.append(UnitRef("entity", of, self._line(node), context=name))
+        return SKIP
+
+    def _enter_component(self, node: Node) -> str:
+        name = self._first_identifier(node)
+        if name:
+            self.declarations.append(UnitDecl("component", name, self._line(node), self._arch))
+        return SKIP
+
+    def _enter_instance(self, node: Node) -> str:
+        label = None
+        kind, library, unit = "component", None, None
+        for child in node.children:
+            if child.type == "label_declaration":
+                lab = next((c for c in child.children if c.type == "label"), None)
+                if lab is not None:
+                    label = node_text(lab, self.source)
+            elif child.type == "name":
+                library, unit = _split_name(node_text(child, self.source))
+            elif child.type == "instantiated_unit":
+                for c in child.children:
+                    if c.type in ("entity", "component", "configuration"):
+                        kind = c.type
+                    elif c.type == "library_namespace":
+                        library = node_text(c, self.source)
+                    elif c.type == "name":
+                        lib, unit = _split_name(node_text(c, self.source))
+                        library = library or lib
+        if unit:
+            self.references.append(UnitRef(kind, unit, self._line(node), library, label, self._arch))
+        return SKIP
+
+    def _enter_use(self, node: Node) -> str:
+        for child in node.children:
+            if child.type != "selected_name_list":
+                continue
+            for sel in child.named_children:
+                lib = sel.child_by_field_name("library")
+                pkg = sel.child_by_field_name("package")
+                if pkg is None:
+                    continue
+                self.references.append(UnitRef(
+                    "package",
+                    node_text(pkg, self.source),
+                    self._line(sel),
+                    node_text(lib, self.source) if lib is not None else None,
+                ))
+        return SKIP
+
+
+def extract_symbols(tree: Tree, source: Union[str, bytes]) -> Tuple[List[UnitDecl], List[UnitRef]]:
+    """트리 1회 순회로 design unit 선언과 참조 목록 추출."""
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    collector = _SymbolCollector(source)
+    collector.dispatcher().walk(tree)
+    return collector.declarations, collector.references
+
+
+def index_file(path: Union[str, Path]) -> FileSymbols:
+    """파일 1개 읽기 + 파싱 + 심볼 추출. 실패는 error 에 기록."""
+    path = str(path)
+    record = FileSymbols(path=path)
+    try:
+        st = os.stat(path)
+        record.stamp = (st.st_mtime_ns, st.st_size)
+        source = Path(path).read_bytes()
+        record.declarations, record.references = extract_symbols(parse_to_tree(source), source)
+    except Exception as exc:  # 한 파일 실패가 인덱싱 전체를 멈추지 않도록
+        record.error = f"{type(exc).__name__}: {exc}"
+    return record
+
+
+def _index_chunk(paths: List[str]) -> List[FileSymbols]:
+    return [index_file(p) for p in paths]
+
+
+class SymbolIndex:
+    """
+    교차 파일 심볼 인덱스.
+
+    - update_file / remove_file: 파일 1개 단위 증분 갱신 (해당 파일 항목만 역색인에서 교체)
+    - refresh(roots): (mtime, size) 가 바뀐 파일만 재인덱싱, 사라진 파일 제거
+    - definitions / references / instantiations: (종류, 이름) 해시 조회 O(1)
+    - save / open: SQLite 파일에 파일별 레코드 저장, 변경된 레코드만 기록
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        self.db_path = Path(db_path) if db_path is not None else None
+        self.files: Dict[str, FileSymbols] = {}
+        self._defs: Dict[_Key, Dict[str, List[UnitDecl]]] = {}
+        self._refs: Dict[_Key, Dict[str, List[UnitRef]]] = {}
+        self._dirty: set = set()
+        self._removed: set = set()
+        if self.db_path is not None and self.db_path.exists():
+            self._load()
+
+    # ---- 증분 갱신 ----
+
+    def add_record(self, record: FileSymbols) -> None:
+        """레코드 등록 (같은 경로의 기존 항목은 먼저 제거)."""
+        self._unlink(record.path)
+        self.files[record.path] = record
+        for d in record.declarations:
+            self._defs.setdefault((d.kind, d.name.lower()), {}).setdefault(record.path, []).append(d)
+        for r in record.references:
+            self._refs.setdefault((r.kind, r.name.lower()), {}).setdefault(record.path, []).append(r)
+        self._dirty.add(record.path)
+        self._removed.discard(record.path)
+
+    def update_file(self, path: Union[str, Path]) -> FileSymbols:
+        """파일 1개 재인덱싱."""
+        record = index_file(path)
+        self.add_record(record)
+        return record
+
+    def remove_file(self, path: Union[str, Path]) -> None:
+        path = str(path)
+        if path in self.files:
+            self._unlink(path)
+            del self.files[path]
+            self._dirty.discard(path)
+            self._removed.add(path)
+
+    def _unlink(self, path: str) -> None:
+        old = self.files.get(path)
+        if old is None:
+            return
+        for table, items in ((self._defs, old.declarations), (self._refs, old.references)):
+            for item in items:
+                key = (item.kind, item.name.lower())
+                bucket = table.get(key)
+                if bucket is not None:
+                    bucket.pop(path, None)
+                    if not bucket:
+                        del table[key]
+
+    def refresh(
+        self,
+        roots: Iterable[Union[str, Path]],
+        jobs: Optional[int] = 1,
+        chunk_size: int = 32,
+    ) -> Dict[str, int]:
+        """
+        roots 아래 .vhd/.vhdl 과 인덱스를 동기화. 반환: added/updated/removed/unchanged 개수.
+        roots 밖의 기존 레코드도 (roots 에 포함되지 않으면) 제거된다.
+        """
+        current = scan_files(roots)
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        for path in [p for p in self.files if p not in current]:
+            self.remove_file(path)
+            stats["removed"] += 1
+        todo = []
+        for path, stamp in current.items():
+            old = self.files.get(path)
+            if old is not None and tuple(old.stamp) == stamp and old.error is None:
+                stats["unchanged"] += 1
+                continue
+            stats["updated" if old is not None else "added"] += 1
+            todo.append(path)
+        jobs = jobs or os.cpu_count() or 1
+        if jobs == 1 or len(todo) <= chunk_size:
+            for path in todo:
+                self.add_record(index_file(path))
+            return stats
+        chunks = [todo[i : i + chunk_size] for i in range(0, len(todo), chunk_size)]
+        with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+            for records in pool.map(_index_chunk, chunks):
+                for record in records:
+                    self.add_record(record)
+        return stats
+
+    # ---- 조회 (O(1)) ----
+
+    def definitions(self, name: str, kind: Optional[str] = "entity") -> List[Tuple[str, UnitDecl]]:
+        """이름(대소문자 무시)의 선언 (파일 경로, 선언) 목록. kind=None 이면 모든 종류."""
+        return self._lookup(self._defs, DECL_KINDS, name, kind)
+
+    def references(self, name: str, kind: Optional[str] = None) -> List[Tuple[str, UnitRef]]:
+        """이름의 참조 (파일 경로, 참조) 목록. kind=None 이면 모든 종류."""
+        return self._lookup(self._refs, REF_KINDS, name, kind)
+
+    def defining_files(self, name: str, kind: str = "entity") -> List[str]:
+        return list(self._defs.get((kind, name.lower()), {}))
+
+    def instantiations(self, name: str) -> List[Tuple[str, UnitRef]]:
+        """entity/component/configuration 이름으로 인스턴스화된 위치 (architecture/configuration 의 of 제외)."""
+        return [(p, r) for p, r in self.references(name) if r.kind != "package" and r.label is not None]
+
+    def file_units(self, path: Union[str, Path]) -> Optional[FileSymbols]:
+        return self.files.get(str(path))
+
+    @staticmethod
+    def _lookup(table: Dict[_Key, Dict[str, list]], kinds: Tuple[str, ...], name: str, kind: Optional[str]) -> list:
+        lname = name.lower()
+        out = []
+        for k in (kinds if kind is None else (kind,)):
+            for path, items in table.get((k, lname), {}).items():
+                out.extend((path, item) for item in items)
+        return out
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "files": len(self.files),
+            "declarations": sum(len(f.declarations) for f in self.files.values()),
+            "references": sum(len(f.references) for f in self.files.values()),
+            "errors": sum(1 for f in self.files.values() if f.error),
+        }
+
+    # ---- 저장 ----
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.execute("CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, record TEXT NOT NULL)")
+        return conn
+
+    def _load(self) -> None:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or row[0] != parser_version():
+                return  # 파서/문법 버전이 다르면 전체 재인덱싱
+            for (record,) in conn.execute("SELECT record FROM files"):
+                self.add_record(FileSymbols.from_dict(json.loads(record)))
+        finally:
+            conn.close()
+        self._dirty.clear()
+
+    def save(self, db_path: Optional[Union[str, Path]] = None) -> None:
+        """변경된 파일 레코드만 기록 (다른 경로로 저장하면 전체 기록)."""
+        full = db_path is not None and Path(db_path) != self.db_path
+        if db_path is not None:
+            self.db_path = Path(db_path)
+        if self.db_path is None:
+            raise ValueError("저장 경로(db_path)가 없습니다")
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+                if row is None or row[0] != parser_version():
+                    conn.execute("DELETE FROM files")
+                    conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (parser_version(),))
+                    full = True
+                paths = self.files.keys() if full else self._dirty
+                conn.executemany(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?)",
+                    [(p, json.dumps(self.files[p].to_dict(), ensure_ascii=False, separators=(",", ":"))) for p in paths],
+                )
+                conn.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in self._removed])
+        finally:
+            conn.close()
+        self._dirty.clear()
+        self._removed.clear()
@@ -0,0 +1,300 @@
+"""
+감시 모드: 디렉터리의 .vhd/.vhdl 변경을 감지해 바뀐 파일만 재파싱하고,
+파일별 entity/port 변경분(delta) 이벤트를 NDJSON 한 줄씩 출력한다.
+
+- PollingWatcher: (mtime_ns, size) 스냅샷 비교 (의존성 없음)
+- InotifyWatcher: inotify_simple 설치 시(Linux) 이벤트로 깨어나 해당 경로만 stat
+- wait_for_changes: 연속 저장(burst)을 debounce 하여 한 묶음으로 반환
+"""
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, TextIO, Union
+
+try:
+    from ..models.vhdl_types import Entity
+except ImportError:
+    from models.vhdl_types import Entity
+
+from .batch import VHDL_SUFFIXES, Stamp, file_stamp, parse_file, scan_files
+from .diff import diff
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    _INOTIFY_MASK = (
+        inotify_flags.CLOSE_WRITE | inotify_flags.MODIFY | inotify_flags.CREATE | inotify_flags.DELETE
+        | inotify_flags.MOVED_FROM | inotify_flags.MOVED_TO | inotify_flags.DELETE_SELF
+    )
+except ImportError:
+    INotify = inotify_flags = None
+    _INOTIFY_MASK = 0
+
+
+class PollingWatcher:
+    """감시 대상(디렉터리 재귀 또는 개별 파일)의 (mtime, size) 스냅샷을 주기적으로 비교."""
+
+    def __init__(self, roots: Iterable[Union[str, Path]]):
+        self.roots = [str(r) for r in roots]
+        self._state: Dict[str, Stamp] = self._scan()
+
+    def _scan(self) -> Dict[str, Stamp]:
+        return scan_files(self.roots)
+
+    def files(self) -> List[str]:
+        return sorted(self._state)
+
+    def wait(self, timeout: float) -> None:
+        time.sleep(timeout)
+
+    def poll(self) -> Set[str]:
+        """직전 poll 이후 추가/삭제/수정된 파일 경로."""
+        new = self._scan()
+        old = self._state
+        self._state = new
+        return {p for p in old.keys() | new.keys() if old.get(p) != new.get(p)}
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher(PollingWatcher):
+    """
+    inotify 로 변경 통지를 받아 wait() 가 즉시 깨어나고, poll() 은 통지된 파일만 stat 한다.
+    디렉터리 생성/삭제/이동이나 큐 넘침이 있으면 전체 스캔으로 대체.
+    """
+
+    def __init__(self, roots: Iterable[Union[str, Path]]):
+        if INotify is None:
+            raise RuntimeError("inotify_simple 패키지가 필요합니다. pip install inotify_simple")
+        self._inotify = INotify()
+        self._wds: Dict[int, str] = {}
+        self._dirty: Set[str] = set()
+        self._rescan = False
+        self._single: Dict[int, Set[str]] = {}  # 개별 파일 감시: 상위 디렉터리 wd → 감시 파일
+        # 감시 등록 후 스냅샷: 그 사이의 변경도 이벤트로 잡히도록
+        self.roots = [str(r) for r in roots]
+        for root in self.roots:
+            if os.path.isdir(root):
+                self._watch_tree(root)
+            else:
+                wd = self._add_watch(os.path.dirname(root) or ".")
+                if wd is not None:
+                    self._single.setdefault(wd, set()).add(root)
+        self._state = self._scan()
+
+    def _add_watch(self, dirpath: str) -> Optional[int]:
+        try:
+            wd = self._inotify.add_watch(dirpath, _INOTIFY_MASK)
+        except OSError:
+            return None
+        self._wds[wd] = dirpath
+        return wd
+
+    def _watch_tree(self, root: str) -> None:
+        for dirpath, _dirs, _files in os.walk(root):
+            self._add_watch(dirpath)
+
+    def wait(self, timeout: float) -> None:
+        for ev in self._inotify.read(timeout=int(timeout * 1000)):
+            if ev.mask & (inotify_flags.Q_OVERFLOW | inotify_flags.DELETE_SELF | inotify_flags.IGNORED):
+                self._rescan = True
+                continue
+            base = self._wds.get(ev.wd)
+            if base is None:
+                continue
+            path = os.path.join(base, ev.name)
+            single = self._single.get(ev.wd)
+            if single is not None and path not in single:
+                continue
+            if ev.mask & inotify_flags.ISDIR:
+                if ev.mask & (inotify_flags.CREATE | inotify_flags.MOVED_TO):
+                    self._watch_tree(path)
+                self._rescan = True
+            elif ev.name.lower().endswith(VHDL_SUFFIXES):
+                self._dirty.add(path)
+
+    def poll(self) -> Set[str]:
+        if self._rescan:
+            self._rescan = False
+            self._dirty.clear()
+            return super().poll()
+        changed = set()
+        for path in self._dirty:
+            stamp = file_stamp(path)
+            if stamp != self._state.get(path):
+                changed.add(path)
+                if stamp is None:
+                    self._state.pop(path, None)
+                else:
+                    self._state[path] = stamp
+        self._dirty.clear()
+        return changed
+
+    def close(self) -> None:
+        self._inotify.close()
+
+
+def make_watcher(roots: Iterable[Union[str, Path]], backend: str = "auto") -> PollingWatcher:
+    """backend: "poll" | "inotify" | "auto" (inotify 사용 가능하면 inotify, 아니면 poll)."""
+    if backend == "poll" or (backend == "auto" and INotify is None):
+        return PollingWatcher(roots)
+    if backend not in ("auto", "inotify"):
+        raise ValueError(f"알 수 없는 backend: {backend}")
+    return InotifyWatcher(roots)
+
+
+def wait_for_changes(
+    watcher: PollingWatcher,
+    interval: float = 0.2,
+    debounce: float = 0.05,
+    max_delay: float = 1.0,
+    timeout: Optional[float] = None,
+) -> Set[str]:
+    """
+    변경이 생길 때까지 대기 후, debounce 동안 추가 변경이 없을 때까지 모아서 반환.
+    연속 저장이 max_delay 이상 이어지면 그 시점까지의 묶음을 반환한다. timeout 초과 시 빈 집합.
+    """
+    start = time.monotonic()
+    first = last = 0.0  # 첫/마지막 변경 시각 (changed 가 비어 있지 않을 때만 의미)
+    changed: Set[str] = set()
+    while True:
+        if changed:
+            # 변경 없는 통지(이미 반영한 파일의 MODIFY/CLOSE_WRITE 등)로 깨어나도 조용한 시간은 마지막 변경부터 잰다
+            watcher.wait(max(0.0, min(last + debounce, first + max_delay) - time.monotonic()))
+        else:
+            watcher.wait(interval)
+        batch = watcher.poll()
+        now = time.monotonic()
+        if batch:
+            if not changed:
+                first = now
+            changed |= batch
+            last = now
+        if changed and (now - last >= debounce or now - first >= max_delay):
+            return changed
+        if not changed and timeout is not None and now - start >= timeout:
+            return changed
+
+
+def _named_delta(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, list]:
+    """이름 → to_dict 매핑 두 개의 차이: added(dict), removed(이름), modified(새 dict)."""
+    return {
+        "added": [new[k] for k in new if k not in old],
+        "removed": [k for k in old if k not in new],
+        "modified": [new[k] for k in new if k in old and old[k] != new[k]],
+    }
+
+
+def entity_delta(old: List[Entity], new: List[Entity]) -> Dict[str, list]:
+    """
+    파일 1개의 entity 목록 변경분.
+    modified 항목은 {"module_name", "ports": delta, "generics": delta} (포트/generic 은 이름 기준).
+    """
+    old_map = {e.module_name: e for e in old}
+    new_map = {e.module_name: e for e in new}
+    modified = []
+    for name, entity in new_map.items():
+        prev = old_map.get(name)
+        if prev is None or prev == entity:
+            continue
+        modified.append({
+            "module_name": name,
+            "ports": _named_delta({p.name: p.to_dict() for p in prev.ports}, {p.name: p.to_dict() for p in entity.ports}),
+            "generics": _named_delta(
+                {g.name: g.to_dict() for g in prev.generics}, {g.name: g.to_dict() for g in entity.generics}
+            ),
+        })
+    return {
+        "added": [new_map[k].to_dict() for k in new_map if k not in old_map],
+        "removed": [k for k in old_map if k not in new_map],
+        "modified": modified,
+    }
+
+
+class WatchSession:
+    """
+    감시 상태: 파일별 마지막 entity 목록을 메모리에 유지하고, 변경 경로 묶음을 이벤트로 변환.
+
+    이벤트 (dict, NDJSON 한 줄):
+        {"event": "added"|"modified"|"removed", "path", "entities": entity_delta, "syntax_error", "elapsed_ms"}
+        {"event": "error", "path", "error"}   — 파싱 실패 시 (이전 상태 유지)
+    patch=True 면 "entities" 대신 "patch": 파일의 entity 목록(to_dict 배열) 에 대한 JSON Patch (core.diff).
+    """
+
+    def __init__(self, roots: Iterable[Union[str, Path]], backend: str = "auto", patch: bool = False):
+        self.watcher = make_watcher(roots, backend)
+        self.patch = patch
+        self.entities: Dict[str, List[Entity]] = {}
+
+    def load(self) -> List[dict]:
+        """현재 파일 전체 파싱 (초기 상태). 각 파일의 "added" 이벤트 목록 반환."""
+        return self.apply(self.watcher.files())
+
+    def apply(self, paths: Iterable[str]) -> List[dict]:
+        events = []
+        for path in sorted(paths):
+            t0 = time.perf_counter()
+            old = self.entities.get(path)
+            if not os.path.exists(path):
+                if old is None:
+                    continue
+                del self.entities[path]
+                kind, new, syntax_error = "removed", [], False
+            else:
+                result = parse_file(path)
+                if not result.ok:
+                    events.append({"event": "error", "path": path, "error": result.error})
+                    continue
+                kind = "added" if old is None else "modified"
+                new, syntax_error = result.entities, result.syntax_error
+                self.entities[path] = new
+            if self.patch:
+                field = "patch"
+                delta = diff([e.to_dict() for e in old or []], [e.to_dict() for e in new])
+            else:
+                field = "entities"
+                delta = entity_delta(old or [], new)
+            if kind == "modified" and not (delta if self.patch else any(delta.values())):
+                continue  # 저장만 하고 entity/port 변화 없음
+            events.append({
+                "event": kind,
+                "path": path,
+                field: delta,
+                "syntax_error": syntax_error,
+                "elapsed_ms": round((time.perf_counter() - t0) * 1000, 3),
+            })
+        return events
+
+    def run(
+        self,
+        out: TextIO = sys.stdout,
+        interval: float = 0.2,
+        debounce: float = 0.05,
+        emit_initial: bool = False,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        감시 루프. 이벤트를 out 에 NDJSON 으로 출력 (줄마다 flush).
+        timeout 지정 시 마지막 변경 이후 그 시간 동안 변경이 없으면 종료 (테스트/스크립트용).
+        """
+        initial = self.load()
+        if emit_initial:
+            for ev in initial:
+                _write_event(out, ev)
+        _write_event(out, {"event": "ready", "files": len(self.entities)})
+        try:
+            while True:
+                changed = wait_for_changes(self.watcher, interval, debounce, timeout=timeout)
+                if not changed:
+                    return
+                for ev in self.apply(changed):
+                    _write_event(out, ev)
+        finally:
+            self.watcher.close()
+
+
+def _write_event(out: TextIO, event: dict) -> None:
+    out.write(json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n")
+    out.flush()
@@ -1 +1 @@
-# JSON / Dot exporters (스켈레톤)
+# JSON / 바이너리 AST / Dot exporters
@@ -0,0 +1,314 @@
+"""
+AST → 압축 바이너리 파일 (.vast). 대용량 설계의 AST 를 웹뷰/도구가 즉시 열 수 있도록.
+
+레이아웃 (리틀 엔디언, 각 섹션 8바이트 정렬):
+    헤더     magic "VHDLAST\\0", version, node_count, type_count, flags, 섹션 오프셋/길이
+    타입표   type 문자열 (u16 길이 + UTF-8) — 노드는 type id 로만 참조
+    노드 배열 (평탄한 typed array, 전위 순회 순서)
+             type_id u16, start_byte u32, end_byte u32,
+             parent i32, first_child i32, next_sibling i32 (-1 = 없음), flags u8
+    소스     원문 바이트 1회 저장 — 노드 텍스트는 (start_byte, end_byte) 오프셋으로 참조
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+MAGIC = b"VHDLAST\0"
+VERSION = 1
+
+# magic, version, node_count, type_count, flags,
+# types_off, nodes_off, source_off, source_len
+_HEADER = struct.Struct("<8sIIIIQQQQ")
+
+FLAG_NAMED = 1
+FLAG_ERROR = 2
+FLAG_MISSING = 4
+
+# (배열 이름, array typecode, 원소 바이트 수) — 파일 내 순서
+_COLUMNS = (
+    ("type_id", "H", 2),
+    ("start_byte", "I", 4),
+    ("end_byte", "I", 4),
+    ("parent", "i", 4),
+    ("first_child", "i", 4),
+    ("next_sibling", "i", 4),
+    ("flags", "B", 1),
+)
+
+_LITTLE = sys.byteorder == "little"
+
+
+def _pad8(n: int) -> int:
+    return (8 - n % 8) % 8
+
+
+def export_ast_binary(tree: Any, source: Union[str, bytes], output_path: Union[str, Path]) -> str:
+    """
+    Tree-sitter Tree 를 압축 바이너리 형식으로 저장한다.
+
+    Args:
+        tree: parse_to_tree 결과
+        source: 파싱한 원문 (str 또는 bytes)
+        output_path: 저장 경로
+
+    Returns:
+        저장된 파일 경로 문자열
+    """
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    cols: Dict[str, array] = {name: array(code) for name, code, _ in _COLUMNS}
+    type_id, start_byte, end_byte = cols["type_id"], cols["start_byte"], cols["end_byte"]
+    parent, first_child, next_sibling, flags = cols["parent"], cols["first_child"], cols["next_sibling"], cols["flags"]
+    types: Dict[str, int] = {}
+
+    def add(node: Any, parent_index: int) -> int:
+        t = node.type
+        tid = types.get(t)
+        if tid is None:
+            tid = types[t] = len(types)
+        type_id.append(tid)
+        start_byte.append(node.start_byte)
+        end_byte.append(node.end_byte)
+        parent.append(parent_index)
+        first_child.append(-1)
+        next_sibling.append(-1)
+        flags.append(
+            (FLAG_NAMED if node.is_named else 0)
+            | (FLAG_ERROR if node.is_error else 0)
+            | (FLAG_MISSING if node.is_missing else 0)
+        )
+        return len(type_id) - 1
+
+    # 전위 순회: 부모 인덱스 스택 + 직전 형제 인덱스로 링크 구성
+    cursor = tree.walk()
+    current = add(cursor.node, -1)
+    stack: List[int] = []
+    while True:
+        if cursor.goto_first_child():
+            stack.append(current)
+            child = add(cursor.node, current)
+            first_child[current] = child
+            current = child
+            continue
+        done = False
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                done = True
+                break
+            current = stack.pop()
+        if done:
+            break
+        sibling = add(cursor.node, stack[-1])
+        next_sibling[current] = sibling
+        current = sibling
+
+    type_table = bytearray()
+    for name in sorted(types, key=types.__getitem__):
+        raw = name.encode("utf-8")
+        type_table += struct.pack("<H", len(raw)) + raw
+
+    n = len(type_id)
+    types_off = _HEADER.size + _pad8(_HEADER.size)
+    nodes_off = types_off + len(type_table) + _pad8(len(type_table))
+    columns_size = 0
+    for _, _, size in _COLUMNS:
+        columns_size += n * size + _pad8(n * size)
+    source_off = nodes_off + columns_size
+
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, n, len(types), 0, types_off, nodes_off, source_off, len(source)))
+        f.write(b"\0" * _pad8(_HEADER.size))
+        f.write(type_table)
+        f.write(b"\0" * _pad8(len(type_table)))
+        for name, _, size in _COLUMNS:
+            col = cols[name]
+            if not _LITTLE:
+                col.byteswap()
+            f.write(col.tobytes())
+            f.write(b"\0" * _pad8(n * size))
+        f.write(source)
+    return str(path.resolve())
+
+
+class BinaryNode:
+    """BinaryAst 의 노드 뷰. 필드는 접근 시점에 배열에서 읽는다."""
+
+    __slots__ = ("_ast", "index")
+
+    def __init__(self, ast: "BinaryAst", index: int):
+        self._ast = ast
+        self.index = index
+
+    @property
+    def type(self) -> str:
+        return self._ast.types[self._ast.type_id[self.index]]
+
+    @property
+    def start_byte(self) -> int:
+        return self._ast.start_byte[self.index]
+
+    @property
+    def end_byte(self) -> int:
+        return self._ast.end_byte[self.index]
+
+    @property
+    def is_named(self) -> bool:
+        return bool(self._ast.flags[self.index] & FLAG_NAMED)
+
+    @property
+    def is_error(self) -> bool:
+        return bool(self._ast.flags[self.index] & FLAG_ERROR)
+
+    @property
+    def is_missing(self) -> bool:
+        return bool(self._ast.flags[self.index] & FLAG_MISSING)
+
+    @property
+    def parent(self) -> Optional["BinaryNode"]:
+        p = self._ast.parent[self.index]
+        return BinaryNode(self._ast, p) if p >= 0 else None
+
+    @property
+    def children(self) -> List["BinaryNode"]:
+        return list(self.iter_children())
+
+    def iter_children(self) -> Iterator["BinaryNode"]:
+        c = self._ast.first_child[self.index]
+        nxt = self._ast.next_sibling
+        while c >= 0:
+            yield BinaryNode(self._ast, c)
+            c = nxt[c]
+
+    @property
+    def child_count(self) -> int:
+        return sum(1 for _ in self.iter_children())
+
+    @property
+    def text(self) -> bytes:
+        """원문 바이트 (소스 섹션 오프셋 참조)."""
+        return bytes(self._ast.source[self.start_byte : self.end_byte])
+
+    def __repr__(self) -> str:
+        return f"<BinaryNode {self.index} {self.type} [{self.start_byte}, {self.end_byte})>"
+
+
+class BinaryAst:
+    """
+    .vast 파일 리더. 파일을 mmap 하고 각 배열을 memoryview 로 캐스팅하므로
+    파일 크기와 무관하게 즉시 열리며, 노드는 접근 시점에 BinaryNode 로 생성된다.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self._views: List[memoryview] = []
+        self._mm: Optional[mmap.mmap] = None
+        self._file = open(path, "rb")
+        try:
+            self._load(path)
+        except BaseException:
+            self.close()
+            raise
+
+    def _load(self, path: Union[str, Path]) -> None:
+        """헤더·섹션 범위를 파일 크기와 대조한 뒤 배열 view 를 만든다. 어긋나면 ValueError."""
+        if os.fstat(self._file.fileno()).st_size < _HEADER.size:
+            # 헤더보다 짧으면 (빈 파일 포함) mmap/unpack 전에 거른다
+            raise ValueError(f"VHDLAST 파일이 아닙니다: {path}")
+        mm = self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        size = len(mm)
+        magic, version, n, type_count, _, types_off, nodes_off, source_off, source_len = _HEADER.unpack_from(mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"VHDLAST 파일이 아닙니다: {path}")
+        if version != VERSION:
+            raise ValueError(f"지원하지 않는 버전: {version}")
+
+        def truncated(section: str) -> ValueError:
+            return ValueError(f"잘린 VHDLAST 파일: {section} 구간이 파일 크기 {size}B 를 넘습니다: {path}")
+
+        # view 를 만들기 전에 검사를 끝내야 실패 시 mmap 을 바로 닫을 수 있다
+        self.types: List[str] = []
+        pos = types_off
+        for _ in range(type_count):
+            if pos + 2 > size:
+                raise truncated("타입표")
+            (length,) = struct.unpack_from("<H", mm, pos)
+            if pos + 2 + length > size:
+                raise truncated("타입표")
+            self.types.append(mm[pos + 2 : pos + 2 + length].decode("utf-8"))
+            pos += 2 + length
+        pos = nodes_off
+        for name, _, width in _COLUMNS:
+            if pos + n * width > size:
+                raise truncated(f"노드 배열({name})")
+            pos += n * width + _pad8(n * width)
+        if source_off + source_len > size:
+            raise truncated("소스")
+        self.node_count = n
+
+        buf = memoryview(mm)
+        self._views.append(buf)
+        pos = nodes_off
+        for name, code, width in _COLUMNS:
+            raw = buf[pos : pos + n * width]
+            if _LITTLE:
+                col: Any = raw.cast(code)
+                self._views.append(col)
+            else:
+                col = array(code, raw.tobytes())
+                col.byteswap()
+            self._views.append(raw)
+            setattr(self, name, col)
+            pos += n * width + _pad8(n * width)
+        self.source = buf[source_off : source_off + source_len]
+        self._views.append(self.source)
+
+    @property
+    def root(self) -> BinaryNode:
+        return BinaryNode(self, 0)
+
+    def node(self, index: int) -> BinaryNode:
+        if not 0 <= index < self.node_count:
+            raise IndexError(index)
+        return BinaryNode(self, index)
+
+    def __len__(self) -> int:
+        return self.node_count
+
+    def iter_nodes(self, node_type: Optional[str] = None) -> Iterator[BinaryNode]:
+        """전위 순회 순서로 노드 나열 (node_type 지정 시 해당 type 만)."""
+        if node_type is None:
+            for i in range(self.node_count):
+                yield BinaryNode(self, i)
+            return
+        if node_type not in self.types:
+            return
+        tid = self.types.index(node_type)
+        ids = self.type_id
+        for i in range(self.node_count):
+            if ids[i] == tid:
+                yield BinaryNode(self, i)
+
+    def close(self) -> None:
+        for v in reversed(self._views):
+            v.release()
+        self._views = []
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self) -> "BinaryAst":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def load_ast_binary(path: Union[str, Path]) -> BinaryAst:
+    """export_ast_binary 로 저장한 파일을 지연 로딩 리더로 연다."""
+    return BinaryAst(path)
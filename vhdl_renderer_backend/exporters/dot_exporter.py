@@ -1,23 +1,210 @@
 """
-파서 결과 → Graphviz DOT/이미지. 시각적 디버깅용.
-(1단계 스켈레톤 — graph_model 연동 후 구현)
+파서 결과 → Graphviz DOT/이미지. 시각적 디버깅용 (REQ-07).
+
+ConnectivityGraph 를 한 번 훑으며 DOT 텍스트를 파일에 바로 기록한다 (전체 문자열을 메모리에 만들지 않음).
+    클러스터    entity / instance 계층마다 subgraph cluster
+    포트 색     in / out / inout(buffer) 별로 다른 색
+    LOD 옵션    max_depth, collapse_ports(포트 많은 인스턴스는 노드 1개), hide_internal_signals
+이미지(png/svg 등)는 `dot` 실행 파일이 있을 때만 렌더링하고, 없으면 .dot 만 남긴다.
 """
+import shutil
+import subprocess
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Dict, List, Optional, TextIO, Union
+
+try:
+    from ..models.graph_model import (
+        EDGE_CONNECT, NODE_ENTITY, NODE_INSTANCE, NODE_PORT, NODE_SIGNAL, ConnectivityGraph, build_graph,
+    )
+    from ..models.vhdl_types import Architecture, Entity
+except ImportError:
+    from models.graph_model import (
+        EDGE_CONNECT, NODE_ENTITY, NODE_INSTANCE, NODE_PORT, NODE_SIGNAL, ConnectivityGraph, build_graph,
+    )
+    from models.vhdl_types import Architecture, Entity
+
+# 포트 방향별 (채우기 색, 모양)
+PORT_STYLE = {
+    "in": ("#c8e6c9", "rarrow"),
+    "out": ("#bbdefb", "larrow"),
+    "inout": ("#ffe0b2", "hexagon"),
+    "buffer": ("#ffe0b2", "hexagon"),
+    "linkage": ("#eeeeee", "box"),
+    "": ("#eeeeee", "box"),
+}
+
+_HIDDEN = -1
+
+
+def _quote(s: str) -> str:
+    return '"' + s.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _as_graph(data: Any) -> ConnectivityGraph:
+    """ConnectivityGraph / Entity / Architecture / (entities, architectures) → ConnectivityGraph."""
+    if isinstance(data, ConnectivityGraph):
+        return data
+    if isinstance(data, tuple) and len(data) == 2:
+        return build_graph(*data)
+    items = data if isinstance(data, list) else [data]
+    entities = [d for d in items if isinstance(d, Entity)]
+    archs = [d for d in items if isinstance(d, Architecture)]
+    if not entities and not archs:
+        raise TypeError(f"DOT 로 변환할 수 없는 데이터: {type(data).__name__}")
+    return build_graph(entities, archs)
+
+
+def write_dot(
+    graph: ConnectivityGraph,
+    out: TextIO,
+    max_depth: Optional[int] = None,
+    collapse_ports: Optional[int] = None,
+    hide_internal_signals: bool = False,
+    rankdir: str = "LR",
+) -> Dict[str, int]:
+    """
+    그래프를 DOT 텍스트로 out 에 순차 기록한다.
+
+    Args:
+        graph: ConnectivityGraph
+        out: 쓰기 가능한 텍스트 스트림
+        max_depth: 클러스터로 펼칠 인스턴스 계층 깊이 (entity 직속 인스턴스 = 1). 바로 아래 단계는
+                   노드 1개로 접고, 그보다 깊은 노드는 그 노드로 합침 (0 = 최상위 인스턴스부터 접음)
+        collapse_ports: 포트 수가 이 값을 넘는 인스턴스는 포트 없이 노드 1개로 표시
+        hide_internal_signals: architecture 내부 signal 노드 생략 (driver → reader 포트를 직접 연결)
+        rankdir: Graphviz rankdir ("LR" = in 왼쪽, out 오른쪽)
+
+    Returns:
+        {"nodes", "edges", "clusters"} 기록한 개수
+    """
+    n = graph.node_count
+    kind = graph.kind
+    # rep[v] = v 를 대표해 그려지는 DOT 노드 id (_HIDDEN = 생략된 signal)
+    rep: List[int] = list(range(n))
+    counts = {"nodes": 0, "edges": 0, "clusters": 0}
+    w = out.write
+    w(f"digraph vhdl {{\n  rankdir={rankdir};\n  compound=true;\n")
+    w('  node [fontname="Helvetica", fontsize=10];\n  edge [arrowsize=0.6];\n')
+
+    # 계층 DFS (명시적 스택): ("enter", node, depth) / ("leave",)
+    stack: List[tuple] = [("enter", r, 0) for r in reversed(graph.roots())]
+    indent = "  "
+    while stack:
+        item = stack.pop()
+        if item[0] == "leave":
+            indent = indent[:-2]
+            w(f"{indent}}}\n")
+            continue
+        _, node, depth = item
+        k = kind[node]
+        name = graph.node_name(node)
+        if k in (NODE_ENTITY, NODE_INSTANCE):
+            children = graph.children(node)
+            ports = [c for c in children if kind[c] == NODE_PORT]
+            collapsed = k == NODE_INSTANCE and (
+                (collapse_ports is not None and len(ports) > collapse_ports)
+                or (max_depth is not None and depth > max_depth)
+            )
+            if collapsed:
+                label = f"{name}\\n{graph.node_ref(node) or ''} ({len(ports)} ports)"
+                w(f'{indent}n{node} [label={_quote(label)}, shape=box3d, style=filled, fillcolor="#f5f5f5"];\n')
+                counts["nodes"] += 1
+                # 서브트리 전체를 이 노드로 합침
+                sub = list(children)
+                while sub:
+                    c = sub.pop()
+                    rep[c] = node
+                    sub.extend(graph.children(c))
+                continue
+            title = name if k == NODE_ENTITY else f"{name} : {graph.node_ref(node) or '?'}"
+            style = 'style="rounded,bold"; color="#424242"' if k == NODE_ENTITY else 'style=rounded; color="#9e9e9e"'
+            w(f"{indent}subgraph cluster_{node} {{\n{indent}  label={_quote(title)}; {style};\n")
+            counts["clusters"] += 1
+            rep[node] = _HIDDEN
+            stack.append(("leave",))
+            for c in reversed(children):
+                stack.append(("enter", c, depth + 1 if kind[c] == NODE_INSTANCE else depth))
+            indent += "  "
+        elif k == NODE_PORT:
+            fill, shape = PORT_STYLE.get(graph.node_direction(node), PORT_STYLE[""])
+            w(f"{indent}n{node} [label={_quote(name)}, shape={shape}, style=filled, fillcolor=\"{fill}\"];\n")
+            counts["nodes"] += 1
+        elif k == NODE_SIGNAL:
+            if hide_internal_signals:
+                rep[node] = _HIDDEN
+                continue
+            w(f'{indent}n{node} [label={_quote(name)}, shape=ellipse, color="#757575", fontcolor="#424242"];\n')
+            counts["nodes"] += 1
+
+    # 엣지: 대표 노드 기준, 자기 루프·중복 제거. 숨긴 signal 은 driver → reader 로 건너뜀
+    seen = set()
 
+    def emit(s: int, d: int) -> None:
+        if s == d or s == _HIDDEN or d == _HIDDEN:
+            return
+        key = s * n + d
+        if key in seen:
+            return
+        seen.add(key)
+        w(f"  n{s} -> n{d};\n")
+        counts["edges"] += 1
 
-def export_dot(data: Any, output_path: Union[str, Path], format: str = "png") -> str:
+    for v in range(n):
+        if kind[v] == NODE_SIGNAL and hide_internal_signals:
+            drivers = [rep[p] for p in graph.predecessors(v, EDGE_CONNECT)]
+            for t in graph.successors(v, EDGE_CONNECT):
+                for s in drivers:
+                    emit(s, rep[t])
+            continue
+        rs = rep[v]
+        if rs == _HIDDEN:
+            continue
+        for t in graph.successors(v, EDGE_CONNECT):
+            if kind[t] == NODE_SIGNAL and hide_internal_signals:
+                continue
+            emit(rs, rep[t])
+    w("}\n")
+    return counts
+
+
+def render_dot(dot_path: Union[str, Path], output_path: Union[str, Path], format: str = "png") -> Optional[str]:
+    """`dot -T<format>` 으로 이미지 렌더링. dot 실행 파일이 없으면 None (건너뜀)."""
+    dot = shutil.which("dot")
+    if dot is None:
+        return None
+    subprocess.run([dot, f"-T{format}", str(dot_path), "-o", str(output_path)], check=True)
+    return str(Path(output_path).resolve())
+
+
+def export_dot(
+    data: Any,
+    output_path: Union[str, Path],
+    format: str = "png",
+    max_depth: Optional[int] = None,
+    collapse_ports: Optional[int] = None,
+    hide_internal_signals: bool = False,
+) -> str:
     """
     데이터 모델을 Graphviz로 렌더링하여 파일로 저장한다.
 
     Args:
-        data: Entity 등 데이터 모델
+        data: ConnectivityGraph, Entity/Architecture (또는 목록), (entities, architectures) 튜플
         output_path: 저장 경로 (확장자 없이 지정 시 format 으로 붙음)
         format: "png", "svg", "dot" 등
+        max_depth, collapse_ports, hide_internal_signals: write_dot 의 LOD 옵션
 
     Returns:
-        저장된 파일 경로
+        저장된 파일 경로 (이미지, 또는 format="dot"·dot 미설치 시 .dot 경로)
     """
-    # TODO: graphviz 라이브러리 연동, in/out 노드 배치
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    return str(Path(output_path).resolve())
+    graph = _as_graph(data)
+    path = Path(output_path)
+    if not path.suffix:
+        path = path.with_suffix(f".{format}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    dot_path = path.with_suffix(".dot")
+    with open(dot_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        write_dot(graph, f, max_depth=max_depth, collapse_ports=collapse_ports, hide_internal_signals=hide_internal_signals)
+    if format == "dot" or path == dot_path:
+        return str(dot_path.resolve())
+    rendered = render_dot(dot_path, path, format)
+    return rendered if rendered is not None else str(dot_path.resolve())
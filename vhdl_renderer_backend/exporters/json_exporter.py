@@ -1,26 +1,187 @@
 """
 데이터 모델 → JSON 파일. 웹 프론트엔드 / VS Code Webview 연동용.
+
+형식 (FORMATS):
+    pretty   indent=4 문서 1개 (기본, 사람이 읽기용)
+    compact  구분자 공백 없는 문서 1개 (`,` `:`) — 같은 내용에서 크기·쓰기 시간 최소
+    ndjson   레코드 1개 = 한 줄. 결과가 나오는 대로 기록·flush 하므로 소비자가 파일 완성 전부터 읽을 수 있다
+문서 형식은 같은 디렉터리의 임시 파일에 쓴 뒤 os.replace 로 바꿔 넣어(atomic), 읽는 쪽이
+반쯤 쓰인 파일을 보지 않는다. NDJSON 은 점진 소비가 목적이라 기본적으로 최종 경로에 바로 쓴다.
 """
 import json
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Iterable, Iterator, Optional, TextIO, Union
+
+try:
+    from ..core.profile import stage
+except ImportError:
+    from core.profile import stage
+
+FORMATS = ("pretty", "compact", "ndjson")
+_COMPACT = (",", ":")
+
+
+def _plain(data: Any) -> Any:
+    return data.to_dict() if hasattr(data, "to_dict") else data
+
+
+def _new_file_mode(directory: Path) -> int:
+    """
+    새 파일이 기본으로 받을 권한 (0o666 & ~umask).
+    os.umask 로 읽으면 잠시 프로세스 전역 umask 가 바뀌어 다른 스레드가 만드는 파일에 영향을 주므로,
+    Linux 는 /proc/self/status 의 Umask, 그 외에는 같은 디렉터리에 탐침 파일을 만들어 권한을 읽는다.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return 0o666 & ~int(line.split(":", 1)[1].strip(), 8)
+    except (OSError, ValueError):
+        pass
+    fd, probe = tempfile.mkstemp(prefix=".umask.", dir=str(directory))
+    try:
+        os.close(fd)
+        os.unlink(probe)
+        fd = os.open(probe, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            return os.fstat(fd).st_mode & 0o777
+        finally:
+            os.close(fd)
+    finally:
+        try:
+            os.unlink(probe)
+        except FileNotFoundError:
+            pass
+
+
+def _target_mode(path: Path) -> int:
+    try:
+        return path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        return _new_file_mode(path.parent)
+
+
+@contextmanager
+def atomic_open(output_path: Union[str, Path], fsync: bool = False) -> Iterator[TextIO]:
+    """
+    같은 디렉터리 임시 파일에 쓰고, 정상 종료 시 os.replace 로 output_path 를 교체한다.
+    예외가 나면 임시 파일을 지우고 기존 파일은 그대로 둔다.
+    """
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+            yield f
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        # mkstemp 는 0600 으로 만들므로 기존 파일 권한(없으면 umask 기본값) 으로 맞춤
+        os.chmod(tmp, _target_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
 
 
-def export_json(data: Any, output_path: Union[str, Path]) -> str:
+def export_json(
+    data: Any,
+    output_path: Union[str, Path],
+    format: str = "pretty",
+    atomic: Optional[bool] = None,
+) -> str:
     """
     파이썬 데이터 모델을 JSON 파일로 저장한다.
 
     Args:
-        data: to_dict() 를 지원하는 객체 또는 dict
+        data: to_dict() 를 지원하는 객체 또는 dict. format="ndjson" 이면 레코드 iterable
+              (dict/객체 1개를 주면 한 줄짜리 파일)
         output_path: 저장 경로
+        format: "pretty" | "compact" | "ndjson"
+        atomic: 임시 파일에 쓴 뒤 교체. 생략 시 문서 형식은 True, ndjson 은 False (점진 소비)
 
     Returns:
         저장된 파일 경로 문자열
     """
-    if hasattr(data, "to_dict"):
-        data = data.to_dict()
+    if format not in FORMATS:
+        raise ValueError(f"지원하지 않는 JSON 형식: {format} (가능: {', '.join(FORMATS)})")
+    if format == "ndjson":
+        records = [data] if isinstance(data, dict) or hasattr(data, "to_dict") else data
+        export_ndjson(records, output_path, atomic=bool(atomic))
+        return str(Path(output_path).resolve())
     path = Path(output_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+    with stage("export"):
+        data = _plain(data)
+        if atomic is None or atomic:
+            opener = atomic_open(path)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            opener = open(path, "w", encoding="utf-8")
+        with opener as f:
+            if format == "compact":
+                json.dump(data, f, ensure_ascii=False, separators=_COMPACT)
+            else:
+                json.dump(data, f, ensure_ascii=False, indent=4)
     return str(path.resolve())
+
+
+class NdjsonWriter:
+    """
+    NDJSON 스트림 기록기. write() 마다 한 줄(구분자 공백 없음)을 쓰고 flush 해
+    다른 프로세스가 tail 하듯 바로 읽을 수 있다.
+
+    atomic=True 면 임시 파일에 모았다가 close() 에서 교체 (점진 소비 대신 완결성 우선).
+    """
+
+    def __init__(self, output_path: Union[str, Path], atomic: bool = False, flush: bool = True):
+        self.path = Path(output_path)
+        self.count = 0
+        self._flush = flush
+        if atomic:
+            self._ctx = atomic_open(self.path)
+            self._f = self._ctx.__enter__()
+        else:
+            self._ctx = None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._f = open(self.path, "w", encoding="utf-8", newline="\n")
+
+    def write(self, record: Any) -> None:
+        with stage("export"):
+            self._f.write(json.dumps(_plain(record), ensure_ascii=False, separators=_COMPACT))
+            self._f.write("\n")
+            if self._flush:
+                self._f.flush()
+        self.count += 1
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        if self._f is None:
+            return
+        f, self._f = self._f, None
+        if self._ctx is not None:
+            # 오류로 닫히면 임시 파일만 지우고 기존 파일 유지
+            if error is None:
+                self._ctx.__exit__(None, None, None)
+            else:
+                self._ctx.__exit__(type(error), error, error.__traceback__)
+        else:
+            f.close()
+
+    def __enter__(self) -> "NdjsonWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(exc)
+
+
+def export_ndjson(records: Iterable[Any], output_path: Union[str, Path], atomic: bool = False) -> int:
+    """레코드(dict 또는 to_dict() 객체) 를 하나씩 NDJSON 한 줄로 기록. 기록한 줄 수 반환."""
+    with NdjsonWriter(output_path, atomic=atomic) as writer:
+        for record in records:
+            writer.write(record)
+    return writer.count
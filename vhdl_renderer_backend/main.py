@@ -1,21 +1,571 @@
 """
 프로그램 진입점 (CLI).
 .vhd 파일 로드 → 전처리 → Entity(및 추후 Arch) 파싱 → JSON/Dot 출력.
+
+하위 명령:
+    batch <디렉터리|파일목록|파일...>  프로젝트 단위 병렬 파싱
+    watch <디렉터리|파일...>           변경 감시, 파일별 entity/port 변경분을 NDJSON 으로 stdout 출력
+    serve                              stdio JSON-RPC 언어 서버 (VS Code 확장 연동)
+    index <디렉터리|파일...>           교차 파일 심볼 인덱스 갱신 + 정의/인스턴스 위치 조회
+    elaborate <디렉터리|파일...> --top NAME  파일 간 인스턴스 계층 구성, 단계별 인스턴스 수 보고
 """
 import argparse
+import json
+import sqlite3
 import sys
+import time
+from dataclasses import asdict
 from pathlib import Path
 
 # 패키지 루트 기준 임포트 (실행: python -m vhdl_renderer_backend.main 또는 python main.py)
 try:
-    from vhdl_renderer_backend.core import preprocess, parse_entity
-    from vhdl_renderer_backend.exporters.json_exporter import export_json
+    from vhdl_renderer_backend.core import ParseBudget, preprocess, parse_entities
+    from vhdl_renderer_backend.core.batch import discover_files, run_batch
+    from vhdl_renderer_backend.core.cache import DEFAULT_MAX_BYTES, ParseCache, cache_options
+    from vhdl_renderer_backend.core.diff import VOLATILE_KEYS, diff, load_result
+    from vhdl_renderer_backend.core.profile import count, profiling, stage
+    from vhdl_renderer_backend.core.watch import WatchSession
+    from vhdl_renderer_backend.exporters.json_exporter import FORMATS, NdjsonWriter, export_json
+    from vhdl_renderer_backend.models.port_table import PortTable
+    from vhdl_renderer_backend.models.vhdl_types import Entity
 except ImportError:
-    from core import preprocess, parse_entity
-    from exporters.json_exporter import export_json
+    from core import ParseBudget, preprocess, parse_entities
+    from core.batch import discover_files, run_batch
+    from core.cache import DEFAULT_MAX_BYTES, ParseCache, cache_options
+    from core.diff import VOLATILE_KEYS, diff, load_result
+    from core.profile import count, profiling, stage
+    from core.watch import WatchSession
+    from exporters.json_exporter import FORMATS, NdjsonWriter, export_json
+    from models.port_table import PortTable
+    from models.vhdl_types import Entity
+
+
+def _add_format_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="pretty",
+        help="JSON 출력 형식: pretty(들여쓰기, 기본), compact(공백 없음), ndjson(레코드마다 한 줄, 결과가 나오는 대로 기록)",
+    )
+
+
+def _add_cache_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="디스크 파싱 캐시 사용 안 함",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="캐시 디렉터리 (기본: $VHDLENS_CACHE_DIR 또는 ~/.cache/vhdlens)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=DEFAULT_MAX_BYTES / (1024 * 1024),
+        help="캐시 최대 크기 MB, 초과 시 오래된 항목부터 삭제 (기본: 256)",
+    )
+
+
+def _add_diff_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--diff-from",
+        type=Path,
+        default=None,
+        help="이전 결과 JSON 과 비교한 JSON Patch(RFC 6902) 도 저장 (소요 시간·캐시 여부는 비교 제외, ndjson 형식과 함께 쓸 수 없음)",
+    )
+    parser.add_argument(
+        "--patch-output",
+        type=Path,
+        default=None,
+        help="패치 저장 경로 (기본: <output 이름>.patch.json)",
+    )
+
+
+def _load_previous(args: argparse.Namespace):
+    """--diff-from 결과 읽기 (출력이 같은 파일을 덮어쓰기 전에 호출). 없으면 None, 읽을 수 없으면 ValueError."""
+    if args.diff_from is None:
+        return None
+    if args.format == "ndjson":
+        raise ValueError("--diff-from 은 pretty/compact 형식에서만 사용할 수 있습니다.")
+    try:
+        return load_result(args.diff_from)
+    except (OSError, json.JSONDecodeError) as exc:
+        raise ValueError(f"이전 결과를 읽을 수 없습니다. {args.diff_from} ({exc})") from exc
+
+
+def _write_patch(args: argparse.Namespace, previous, doc, output: Path) -> None:
+    """이전 결과 → doc 패치를 저장하고 연산 수·크기 출력 (output: 함께 저장한 스냅샷)."""
+    patch = diff(previous, doc, ignore=VOLATILE_KEYS)
+    patch_path = args.patch_output or output.with_name(output.stem + ".patch.json")
+    export_json(patch, patch_path, format=args.format)
+    print(f"패치: 연산 {len(patch)}개 ({patch_path.stat().st_size:,} B, 스냅샷 {output.stat().st_size:,} B): {patch_path}")
+
+
+def _add_profile_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="단계별(read/cache/preprocess/parse_tree/extract/export) 시간·호출 수와 카운터 표 출력",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="단계별 최대 메모리도 측정 (tracemalloc, 느려짐. --profile 포함)",
+    )
+    parser.add_argument(
+        "--profile-json",
+        type=Path,
+        default=None,
+        help="계측 결과를 JSON 으로 저장 (--profile 포함)",
+    )
+
+
+def _run_profiled(args: argparse.Namespace, body) -> int:
+    """계측 옵션이 있으면 body(args) 를 profiling 컨텍스트에서 실행하고 단계 표 출력 / JSON 저장."""
+    if not (args.profile or args.profile_memory or args.profile_json):
+        return body(args)
+    with profiling(memory=args.profile_memory) as profiler:
+        rc = body(args)
+    print(profiler.format_table())
+    if args.profile_json is not None:
+        export_json(profiler.to_dict(), args.profile_json)
+        print(f"계측 결과: {args.profile_json}")
+    return rc
+
+
+def _open_cache(args: argparse.Namespace):
+    """CLI 옵션으로 ParseCache 생성. --no-cache 이거나 열 수 없으면 None (캐시 없이 진행)."""
+    if args.no_cache:
+        return None
+    try:
+        return ParseCache(args.cache_dir, max_bytes=int(args.cache_max_mb * 1024 * 1024))
+    except (OSError, sqlite3.Error) as exc:
+        print(f"경고: 캐시를 열 수 없어 캐시 없이 진행합니다. ({exc})", file=sys.stderr)
+        return None
+
+
+def batch_main(argv: list) -> int:
+    """batch 하위 명령: 디렉터리(재귀)/파일 목록의 모든 VHDL 파일을 병렬 파싱."""
+    parser = argparse.ArgumentParser(
+        prog="vhdl_renderer_backend.main batch",
+        description="프로젝트 단위 일괄 파싱: .vhd/.vhdl 재귀 탐색 → 프로세스 풀 병렬 파싱 → 통합 JSON + 실패 보고서",
+    )
+    parser.add_argument(
+        "inputs",
+        type=Path,
+        nargs="+",
+        help="디렉터리, .vhd/.vhdl 파일, 또는 파일 목록(.txt 등, 한 줄에 경로 하나)",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        default=Path("batch_output.json"),
+        help="통합 JSON 출력 경로 (기본: batch_output.json)",
+    )
+    parser.add_argument(
+        "--failures",
+        type=Path,
+        default=None,
+        help="실패 보고서 경로 (기본: <output 이름>_failures.json)",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="프로세스 수 (기본: CPU 수, 1 이면 순차)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=16,
+        help="작업 1건당 파일 수 (기본: 16)",
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="파일별 진행 출력 생략",
+    )
+    parser.add_argument(
+        "--ports-csv",
+        type=Path,
+        default=None,
+        help="전체 포트 인벤토리를 열 형식 PortTable 로 모아 CSV 로 저장 (entity, path, name, direction, type, width, range)",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="파일당 AST 파싱 시간 상한 초. 초과 파일은 정규식 파서로 대체하고 결과에 fallback 기록 (기본: 제한 없음)",
+    )
+    parser.add_argument(
+        "--max-file-mb",
+        type=float,
+        default=None,
+        help="이보다 큰 파일은 AST 파싱 없이 정규식 파서로 처리 (기본: 제한 없음)",
+    )
+    _add_format_arg(parser)
+    _add_cache_args(parser)
+    _add_diff_args(parser)
+    _add_profile_args(parser)
+    return _run_profiled(parser.parse_args(argv), _batch)
+
+
+def _batch(args: argparse.Namespace) -> int:
+    """batch 본문 (인자 해석 후)."""
+    try:
+        files = discover_files(args.inputs)
+        previous = _load_previous(args)
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"오류: {exc}", file=sys.stderr)
+        return 1
+    if not files:
+        print("경고: VHDL 파일(.vhd/.vhdl)이 없습니다.", file=sys.stderr)
+
+    budget = ParseBudget(
+        time_s=args.time_budget,
+        max_bytes=int(args.max_file_mb * 1024 * 1024) if args.max_file_mb is not None else None,
+    )
+    t0 = time.perf_counter()
+    results = []
+    cache = _open_cache(args)
+    # ndjson: 파일 1개 = 한 줄 (완료 순서), 마지막 줄은 요약. 소비자는 배치가 끝나기 전부터 읽을 수 있다
+    writer = NdjsonWriter(args.output) if args.format == "ndjson" else None
+    try:
+        for result in run_batch(files, jobs=args.jobs, chunk_size=args.chunk_size, cache=cache, budget=budget or None):
+            results.append(result)
+            if writer is not None:
+                writer.write({"type": "file", **result.to_dict()})
+            if args.quiet:
+                continue
+            if result.ok:
+                names = ", ".join(e.module_name for e in result.entities) or "-"
+                tag = "HIT " if result.cached else "OK: "
+                if result.fallback is not None:
+                    names += f"  (정규식 대체: {result.fallback} 예산 초과)"
+                print(f"  {tag}  {result.path}  entities={names}", flush=True)
+            else:
+                print(f"  FAIL: {result.path}  ({result.error})", flush=True)
+    except BaseException as exc:
+        if writer is not None:
+            writer.close(exc)
+        raise
+    finally:
+        if cache is not None:
+            cache.close()
+    elapsed = time.perf_counter() - t0
+
+    results.sort(key=lambda r: r.path)
+    failures = [r for r in results if not r.ok]
+    summary = {
+        "files": len(results),
+        "failed": len(failures),
+        "entities": sum(len(r.entities) for r in results),
+        "cache_hits": sum(1 for r in results if r.cached),
+        "fallbacks": sum(1 for r in results if r.fallback is not None),
+        "elapsed_s": round(elapsed, 3),
+    }
+    if writer is not None:
+        writer.write({"type": "summary", **summary})
+        writer.close()
+    else:
+        doc = {"summary": summary, "files": [r.to_dict() for r in results]}
+        export_json(doc, args.output, format=args.format)
+    failures_path = args.failures or args.output.with_name(args.output.stem + "_failures.json")
+    export_json(
+        {"failed": len(failures), "files": [{"path": r.path, "error": r.error} for r in failures]},
+        failures_path,
+        format="compact" if args.format == "compact" else "pretty",
+    )
+
+    print(
+        f"파일 {summary['files']}개, entity {summary['entities']}개, 실패 {summary['failed']}개, "
+        f"캐시 적중 {summary['cache_hits']}개, 정규식 대체 {summary['fallbacks']}개 ({elapsed:.2f}s)"
+    )
+    print(f"저장: {args.output}")
+    if previous is not None:
+        _write_patch(args, previous, doc, args.output)
+    if args.ports_csv is not None:
+        table = PortTable()
+        for r in results:
+            table.extend(r.entities, r.path)
+        args.ports_csv.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.ports_csv, "w", encoding="utf-8", newline="") as f:
+            table.write_csv(f)
+        print(f"포트 {len(table)}개 ({table.nbytes() / 1024:.1f} KiB 열 배열): {args.ports_csv}")
+    if failures:
+        print(f"실패 보고서: {failures_path}", file=sys.stderr)
+        return 1
+    return 0
 
 
-def main() -> int:
+def watch_main(argv: list) -> int:
+    """watch 하위 명령: 변경된 파일만 재파싱하여 NDJSON 이벤트 출력 (Ctrl+C 로 종료)."""
+    parser = argparse.ArgumentParser(
+        prog="vhdl_renderer_backend.main watch",
+        description="감시 모드: .vhd/.vhdl 변경 감지 → 바뀐 파일만 재파싱 → entity/port 변경분 NDJSON (stdout)",
+    )
+    parser.add_argument(
+        "inputs",
+        type=Path,
+        nargs="+",
+        help="감시할 디렉터리(재귀) 또는 .vhd/.vhdl 파일",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("auto", "poll", "inotify"),
+        default="auto",
+        help="변경 감지 방식 (기본: inotify_simple 설치 시 inotify, 아니면 poll)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.2,
+        help="polling 주기 초 (기본: 0.2)",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.05,
+        help="연속 저장을 하나로 묶는 대기 시간 초 (기본: 0.05)",
+    )
+    parser.add_argument(
+        "--initial",
+        action="store_true",
+        help="시작 시 기존 파일 전체를 added 이벤트로 출력",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="이 시간(초) 동안 변경이 없으면 종료 (기본: 계속 감시)",
+    )
+    parser.add_argument(
+        "--patch",
+        action="store_true",
+        help="변경분을 entities 대신 파일 entity 목록에 대한 JSON Patch(\"patch\") 로 출력",
+    )
+    args = parser.parse_args(argv)
+
+    missing = [p for p in args.inputs if not p.exists()]
+    if missing:
+        print(f"오류: 경로를 찾을 수 없습니다. {missing[0]}", file=sys.stderr)
+        return 1
+    try:
+        session = WatchSession(args.inputs, backend=args.backend, patch=args.patch)
+    except RuntimeError as exc:
+        print(f"오류: {exc}", file=sys.stderr)
+        return 1
+    try:
+        session.run(
+            interval=args.interval,
+            debounce=args.debounce,
+            emit_initial=args.initial,
+            timeout=args.timeout,
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def serve_main(argv: list) -> int:
+    """serve 하위 명령: stdio 언어 서버. 편집기 확장이 프로세스를 띄워 stdin/stdout 으로 통신."""
+    parser = argparse.ArgumentParser(
+        prog="vhdl_renderer_backend.main serve",
+        description="stdio JSON-RPC 언어 서버: 열린 문서 증분 파싱, entity/port/process/문서 심볼 응답",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.15,
+        help="마지막 편집 후 진단(구문 오류) 발행까지 대기 시간 초 (기본: 0.15)",
+    )
+    args = parser.parse_args(argv)
+    # 지연 임포트: tree-sitter 없이도 다른 하위 명령은 동작하도록
+    try:
+        from vhdl_renderer_backend.core.lsp_server import serve_stdio
+    except ImportError:
+        from core.lsp_server import serve_stdio
+    return serve_stdio(debounce=args.debounce)
+
+
+def index_main(argv: list) -> int:
+    """index 하위 명령: 심볼 인덱스를 증분 갱신하고 조회 결과를 JSON 으로 stdout 출력."""
+    parser = argparse.ArgumentParser(
+        prog="vhdl_renderer_backend.main index",
+        description="교차 파일 심볼 인덱스: 바뀐 파일만 재인덱싱 → entity 정의 파일 / 인스턴스 위치 조회",
+    )
+    parser.add_argument(
+        "inputs",
+        type=Path,
+        nargs="+",
+        help="인덱싱할 디렉터리(재귀) 또는 .vhd/.vhdl 파일",
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=Path(".vhdlens_index.sqlite3"),
+        help="인덱스 저장 파일 (기본: .vhdlens_index.sqlite3)",
+    )
+    parser.add_argument(
+        "--defines",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="이름을 선언한 위치 조회 (여러 번 지정 가능)",
+    )
+    parser.add_argument(
+        "--kind",
+        default="entity",
+        help="--defines 의 선언 종류 (entity|architecture|package|package_body|configuration|component|all, 기본: entity)",
+    )
+    parser.add_argument(
+        "--uses",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="entity/component/configuration 이 인스턴스화된 위치 조회 (여러 번 지정 가능)",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="재인덱싱 프로세스 수 (기본: CPU 수, 1 이면 순차)",
+    )
+    args = parser.parse_args(argv)
+    # 지연 임포트: tree-sitter 없이도 다른 하위 명령은 동작하도록
+    try:
+        from vhdl_renderer_backend.core.symbol_index import SymbolIndex
+    except ImportError:
+        from core.symbol_index import SymbolIndex
+
+    missing = [p for p in args.inputs if not p.exists()]
+    if missing:
+        print(f"오류: 경로를 찾을 수 없습니다. {missing[0]}", file=sys.stderr)
+        return 1
+    t0 = time.perf_counter()
+    index = SymbolIndex(args.db)
+    changes = index.refresh(args.inputs, jobs=args.jobs)
+    index.save()
+    stats = index.stats()
+    print(
+        f"인덱스: 파일 {stats['files']}개 (추가 {changes['added']}, 갱신 {changes['updated']}, "
+        f"삭제 {changes['removed']}, 유지 {changes['unchanged']}) {time.perf_counter() - t0:.2f}s → {args.db}",
+        file=sys.stderr,
+    )
+    if not args.defines and not args.uses:
+        return 0
+    kind = None if args.kind == "all" else args.kind
+    result = {
+        "defines": {
+            name: [dict(path=path, **asdict(d)) for path, d in index.definitions(name, kind)] for name in args.defines
+        },
+        "uses": {
+            name: [dict(path=path, **asdict(r)) for path, r in index.instantiations(name)] for name in args.uses
+        },
+    }
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+def elaborate_main(argv: list) -> int:
+    """elaborate 하위 명령: 여러 파일을 분석해 top 부터 인스턴스 계층 구성 (entity 별 하위 계층 공유)."""
+    parser = argparse.ArgumentParser(
+        prog="vhdl_renderer_backend.main elaborate",
+        description="계층 elaboration: 파일 간 component/entity 인스턴스 연결 → 단계별 인스턴스 수, 소요 시간",
+    )
+    parser.add_argument(
+        "inputs",
+        type=Path,
+        nargs="+",
+        help="분석할 디렉터리(재귀) 또는 .vhd/.vhdl 파일",
+    )
+    parser.add_argument(
+        "--top",
+        required=True,
+        help="최상위 entity 이름",
+    )
+    parser.add_argument(
+        "--arch",
+        default=None,
+        help="최상위 architecture (기본: 가장 나중에 분석된 것)",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        default=None,
+        help="결과 JSON 경로 (고유 unit 표, 미해결 인스턴스)",
+    )
+    parser.add_argument(
+        "--tree-depth",
+        type=int,
+        default=0,
+        help="JSON 에 펼친 인스턴스 경로(+ generic 값·포트 폭)를 이 깊이까지 포함 (기본: 0 = 생략)",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="파싱 프로세스 수 (기본: CPU 수, 1 이면 순차)",
+    )
+    _add_format_arg(parser)
+    args = parser.parse_args(argv)
+    # 지연 임포트: tree-sitter 없이도 다른 하위 명령은 동작하도록
+    try:
+        from vhdl_renderer_backend.core.elaborate import DesignLibrary, elaborate
+    except ImportError:
+        from core.elaborate import DesignLibrary, elaborate
+
+    missing = [p for p in args.inputs if not p.exists()]
+    if missing:
+        print(f"오류: 경로를 찾을 수 없습니다. {missing[0]}", file=sys.stderr)
+        return 1
+    t0 = time.perf_counter()
+    library = DesignLibrary.from_paths(args.inputs, jobs=args.jobs)
+    parse_s = time.perf_counter() - t0
+    for path, error in library.errors.items():
+        print(f"  FAIL: {path}  ({error})", file=sys.stderr)
+    try:
+        result = elaborate(library, args.top, args.arch)
+    except KeyError as exc:
+        print(f"오류: {exc.args[0]}", file=sys.stderr)
+        return 1
+
+    print(f"top: {result.top.key}  (파일 {library.files}개 파싱 {parse_s:.2f}s, elaboration {result.elapsed_s * 1000:.1f}ms)")
+    print(f"{'level':>5} {'instances':>10}")
+    for level, count in enumerate(result.levels):
+        print(f"{level:5d} {count:10d}")
+    unresolved = result.unresolved()
+    print(f"인스턴스 {result.instance_count}개, 고유 unit {len(result.units)}개, 미해결 {len(unresolved)}개")
+    for key, child in unresolved:
+        print(f"  미해결: {key}.{child.label} ({child.unit}): {child.reason}", file=sys.stderr)
+    if args.output is not None:
+        if args.format == "ndjson":
+            export_json(result.records(tree_depth=args.tree_depth), args.output, format="ndjson")
+        else:
+            export_json(result.to_dict(tree_depth=args.tree_depth), args.output, format=args.format)
+        if args.tree_depth > 0:
+            stats = result.resolver.stats()
+            print(f"포트 폭: 고유 generic 바인딩 {stats['bindings']}개 (재사용 {stats['hits']}회)")
+        print(f"저장: {args.output}")
+    return 0
+
+
+def main(argv: list = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "elaborate":
+        return elaborate_main(argv[1:])
+    if argv and argv[0] == "index":
+        return index_main(argv[1:])
+    if argv and argv[0] == "serve":
+        return serve_main(argv[1:])
+    if argv and argv[0] == "batch":
+        return batch_main(argv[1:])
+    if argv and argv[0] == "watch":
+        return watch_main(argv[1:])
+
     parser = argparse.ArgumentParser(
         description="VHDL 파서 (1단계): Entity/Port 추출 후 JSON 출력"
     )
@@ -35,27 +585,59 @@ def main() -> int:
         action="store_true",
         help="공백 정규화 없이 주석만 제거",
     )
-    args = parser.parse_args()
+    _add_format_arg(parser)
+    _add_cache_args(parser)
+    _add_diff_args(parser)
+    _add_profile_args(parser)
+    return _run_profiled(parser.parse_args(argv), _parse_single)
+
 
+def _parse_single(args: argparse.Namespace) -> int:
+    """단일 파일 파싱 본문 (인자 해석 후)."""
     if not args.input.exists():
         print(f"오류: 파일을 찾을 수 없습니다. {args.input}", file=sys.stderr)
         return 1
+    try:
+        previous = _load_previous(args)
+    except ValueError as exc:
+        print(f"오류: {exc}", file=sys.stderr)
+        return 1
 
-    text = args.input.read_text(encoding="utf-8", errors="replace")
-    cleaned = preprocess(text, normalize_whitespace=not args.no_normalize)
-    entity = parse_entity(cleaned)
+    with stage("read"):
+        data = args.input.read_bytes()
+    count("files")
+    count("bytes_in", len(data))
+    cache = _open_cache(args)
+    with stage("cache"):
+        key = cache.key(data, cache_options("entities", normalize=not args.no_normalize)) if cache else None
+        payload = cache.get(key) if cache else None
+    if payload is not None:
+        count("cache_hits")
+        entities = [Entity.from_dict(e) for e in payload["entities"]]
+    else:
+        text = data.decode("utf-8", errors="replace")
+        cleaned = preprocess(text, normalize_whitespace=not args.no_normalize)
+        entities = parse_entities(cleaned)
+        if cache:
+            cache.put(key, {"entities": [e.to_dict() for e in entities]})
+    if cache:
+        cache.close()
 
-    if entity is None:
+    out_path = args.output or args.input.parent / ("output.ndjson" if args.format == "ndjson" else "output.json")
+    if not entities:
         print("경고: entity를 찾지 못했습니다.", file=sys.stderr)
-        out_path = args.output or args.input.parent / "output.json"
-        export_json({"module_name": "", "ports": []}, out_path)
+        doc = [] if args.format == "ndjson" else {"module_name": "", "ports": []}
+        export_json(doc, out_path, format=args.format)
         print(f"빈 구조 저장: {out_path}")
-        return 0
-
-    out_path = args.output or args.input.parent / "output.json"
-    export_json(entity, out_path)
-    print(f"Entity: {entity.module_name}, Port 수: {len(entity.ports)}")
-    print(f"저장: {out_path}")
+    else:
+        # pretty/compact: 첫 entity 문서 1개 (기존 형식), ndjson: 파일의 entity 마다 한 줄
+        entity = entities[0]
+        doc = entity.to_dict()
+        export_json(entities if args.format == "ndjson" else doc, out_path, format=args.format)
+        print(f"Entity: {entity.module_name}, Port 수: {len(entity.ports)}")
+        print(f"저장: {out_path}")
+    if previous is not None:
+        _write_patch(args, previous, doc, out_path)
     return 0
 
 
@@ -1,3 +1,10 @@
-from .vhdl_types import Port, Entity
+from .vhdl_types import Port, Entity, Generic, Constant, Signal, Process, Association, Component, Instance, Architecture
+from .vhdl_types import CompactPort, CompactGeneric, CompactEntity
+from .graph_model import ConnectivityGraph, GraphBuilder, StringTable, build_graph
+from .port_table import PortTable
 
-__all__ = ["Port", "Entity"]
+__all__ = [
+    "Port", "Entity", "Generic", "Constant", "Signal", "Process", "Association", "Component", "Instance", "Architecture",
+    "CompactPort", "CompactGeneric", "CompactEntity",
+    "ConnectivityGraph", "GraphBuilder", "StringTable", "build_graph", "PortTable",
+]
@@ -1,10 +1,385 @@
 """
 노드·엣지 기반 그래프 모델 (시각화/연동용).
-(1단계 스켈레톤 — 추후 구현)
+
+수백만 연결 규모를 위해 객체 대신 정수 인덱스 배열로 저장한다.
+    이름     StringTable 에 1회 intern, 노드는 문자열 id 만 보관
+    노드     kind(B), name(I), parent(i), direction(B), ref(i) 평탄 배열 — 노드 id = 배열 인덱스
+             ref = 인스턴스가 가리키는 unit 이름의 문자열 id (없으면 -1)
+    엣지     CSR 인접 배열: offsets[n]..offsets[n+1] 구간의 targets/kinds. 정방향·역방향 모두 보관
+엣지 종류:
+    EDGE_CONTAINS  부모 → 자식 (entity → port/signal/instance, instance → 인스턴스 포트)
+    EDGE_CONNECT   port map 연결, 데이터 흐름 방향(driver → reader).
+                   in 포트: net → 포트, out 포트: 포트 → net, inout/방향 미상: 양방향
+net 은 architecture 의 signal 또는 entity 자신의 port 노드.
 """
+from array import array
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from .vhdl_types import Architecture, Entity, Port
+except ImportError:
+    from models.vhdl_types import Architecture, Entity, Port
+
+NODE_ENTITY = 0
+NODE_INSTANCE = 1
+NODE_PORT = 2
+NODE_SIGNAL = 3
+NODE_KINDS = ("entity", "instance", "port", "signal")
+
+EDGE_CONTAINS = 1
+EDGE_CONNECT = 2
+EDGE_ALL = EDGE_CONTAINS | EDGE_CONNECT
+
+DIRECTIONS = ("", "in", "out", "inout", "buffer", "linkage")
+_DIRECTION_CODE = {d: i for i, d in enumerate(DIRECTIONS)}
+_DIR_NONE, _DIR_IN, _DIR_OUT = 0, 1, 2
+
+
+class StringTable:
+    """문자열 intern 표: 같은 문자열은 한 번만 저장하고 정수 id 로 참조."""
+
+    __slots__ = ("_ids", "_strings")
+
+    def __init__(self, strings: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self._strings: List[str] = []
+        for s in strings:
+            self.intern(s)
+
+    def intern(self, s: str) -> int:
+        sid = self._ids.get(s)
+        if sid is None:
+            sid = self._ids[s] = len(self._strings)
+            self._strings.append(s)
+        return sid
+
+    def lookup(self, s: str) -> Optional[int]:
+        """이미 intern 된 문자열의 id (없으면 None, 새로 추가하지 않음)."""
+        return self._ids.get(s)
+
+    def __getitem__(self, sid: int) -> str:
+        return self._strings[sid]
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._strings)
+
+
+class GraphBuilder:
+    """노드/엣지를 append-only 배열에 모은 뒤 build() 에서 CSR 로 변환."""
+
+    def __init__(self, strings: Optional[StringTable] = None):
+        self.strings = strings if strings is not None else StringTable()
+        self.kind = array("B")
+        self.name = array("I")
+        self.parent = array("i")
+        self.direction = array("B")
+        self.ref = array("i")
+        self._src = array("I")
+        self._dst = array("I")
+        self._edge_kind = array("B")
+
+    def add_node(self, kind: int, name: str, parent: int = -1, direction: str = "", ref: Optional[str] = None) -> int:
+        """노드 추가 후 id 반환. parent 지정 시 EDGE_CONTAINS 도 함께 추가."""
+        nid = len(self.kind)
+        self.kind.append(kind)
+        self.name.append(self.strings.intern(name))
+        self.parent.append(parent)
+        self.direction.append(_DIRECTION_CODE.get(direction.lower(), 0))
+        self.ref.append(self.strings.intern(ref) if ref is not None else -1)
+        if parent >= 0:
+            self.add_edge(parent, nid, EDGE_CONTAINS)
+        return nid
+
+    def add_edge(self, src: int, dst: int, kind: int = EDGE_CONNECT) -> None:
+        self._src.append(src)
+        self._dst.append(dst)
+        self._edge_kind.append(kind)
+
+    def connect(self, port: int, net: int) -> None:
+        """port map 연결 1개를 port 방향에 맞춰 driver → reader 엣지로 추가."""
+        d = self.direction[port]
+        if d != _DIR_OUT:
+            self.add_edge(net, port)
+        if d != _DIR_IN:
+            self.add_edge(port, net)
+
+    def build(self) -> "ConnectivityGraph":
+        n = len(self.kind)
+        fwd = _csr(n, self._src, self._dst, self._edge_kind)
+        rev = _csr(n, self._dst, self._src, self._edge_kind)
+        return ConnectivityGraph(self.strings, self.kind, self.name, self.parent, self.direction, self.ref, fwd, rev)
+
+
+def _csr(n: int, src: array, dst: array, kinds: array) -> Tuple[array, array, array]:
+    """(src, dst, kind) 엣지 목록 → (offsets, targets, kinds). 계수 정렬이라 O(V+E), 같은 src 내 순서 유지."""
+    offsets = array("I", bytes(4 * (n + 1)))
+    for s in src:
+        offsets[s + 1] += 1
+    total = 0
+    for i in range(n + 1):
+        total += offsets[i]
+        offsets[i] = total
+    cursor = array("I", offsets[:n])
+    targets = array("I", bytes(4 * len(dst)))
+    out_kinds = array("B", bytes(len(kinds)))
+    for s, t, k in zip(src, dst, kinds):
+        pos = cursor[s]
+        targets[pos] = t
+        out_kinds[pos] = k
+        cursor[s] = pos + 1
+    return offsets, targets, out_kinds
+
+
+class ConnectivityGraph:
+    """불변 CSR 연결 그래프. 노드/엣지 조회는 모두 배열 인덱싱."""
+
+    def __init__(
+        self,
+        strings: StringTable,
+        kind: array,
+        name: array,
+        parent: array,
+        direction: array,
+        ref: array,
+        fwd: Tuple[array, array, array],
+        rev: Tuple[array, array, array],
+    ):
+        self.strings = strings
+        self.kind = kind
+        self.name = name
+        self.parent = parent
+        self.direction = direction
+        self.ref = ref
+        self._out_off, self._out_dst, self._out_kind = fwd
+        self._in_off, self._in_src, self._in_kind = rev
+
+    # ---- 노드 정보 ----
+
+    @property
+    def node_count(self) -> int:
+        return len(self.kind)
 
+    @property
+    def edge_count(self) -> int:
+        return len(self._out_dst)
 
-def build_graph(entity_result, arch_result):  # noqa: D401
-    """Entity/Arch 파서 결과로부터 노드·간선 그래프 구성."""
-    # TODO: graph_model 구현
+    def node_name(self, node: int) -> str:
+        return self.strings[self.name[node]]
+
+    def node_kind(self, node: int) -> str:
+        return NODE_KINDS[self.kind[node]]
+
+    def node_direction(self, node: int) -> str:
+        return DIRECTIONS[self.direction[node]]
+
+    def node_ref(self, node: int) -> Optional[str]:
+        """인스턴스 노드의 대상 unit 이름 (그 외 None)."""
+        r = self.ref[node]
+        return self.strings[r] if r >= 0 else None
+
+    def path(self, node: int) -> str:
+        """루트 entity 부터 '.' 로 이은 계층 경로 (예: top.u_uart.TX)."""
+        parts = []
+        while node >= 0:
+            parts.append(self.strings[self.name[node]])
+            node = self.parent[node]
+        return ".".join(reversed(parts))
+
+    def roots(self) -> List[int]:
+        return [i for i, p in enumerate(self.parent) if p < 0]
+
+    def children(self, node: int) -> List[int]:
+        return self.successors(node, EDGE_CONTAINS)
+
+    def find(self, path: str) -> Optional[int]:
+        """계층 경로(대소문자 무시) → 노드 id. 단계마다 자식 목록만 훑는다."""
+        parts = path.lower().split(".")
+        candidates: Sequence[int] = self.roots()
+        node = None
+        for part in parts:
+            node = next((c for c in candidates if self.node_name(c).lower() == part), None)
+            if node is None:
+                return None
+            candidates = self.children(node)
+        return node
+
+    # ---- 인접 조회 ----
+
+    def successors(self, node: int, kinds: int = EDGE_CONNECT) -> List[int]:
+        lo, hi = self._out_off[node], self._out_off[node + 1]
+        dst, k = self._out_dst, self._out_kind
+        return [dst[i] for i in range(lo, hi) if k[i] & kinds]
+
+    def predecessors(self, node: int, kinds: int = EDGE_CONNECT) -> List[int]:
+        lo, hi = self._in_off[node], self._in_off[node + 1]
+        src, k = self._in_src, self._in_kind
+        return [src[i] for i in range(lo, hi) if k[i] & kinds]
+
+    def neighbors(self, node: int, kinds: int = EDGE_CONNECT) -> List[int]:
+        """방향 무시 인접 노드 (중복 제거, 등장 순서 유지)."""
+        return list(dict.fromkeys(self.successors(node, kinds) + self.predecessors(node, kinds)))
+
+    def fan_out(self, node: int) -> int:
+        """node 가 구동하는 연결 수 (net 이면 읽는 포트 수)."""
+        lo, hi = self._out_off[node], self._out_off[node + 1]
+        k = self._out_kind
+        return sum(1 for i in range(lo, hi) if k[i] & EDGE_CONNECT)
+
+    def fan_in(self, node: int) -> int:
+        """node 를 구동하는 연결 수 (net 이면 driver 수)."""
+        lo, hi = self._in_off[node], self._in_off[node + 1]
+        k = self._in_kind
+        return sum(1 for i in range(lo, hi) if k[i] & EDGE_CONNECT)
+
+    def reachable(
+        self,
+        start: int,
+        max_depth: Optional[int] = None,
+        reverse: bool = False,
+        through_instances: bool = True,
+    ) -> List[int]:
+        """
+        start 에서 데이터 흐름(EDGE_CONNECT)을 따라 도달 가능한 노드 (BFS 순, start 제외).
+
+        Args:
+            max_depth: 최대 홉 수 (None = 무제한)
+            reverse: True 면 역방향 (start 를 구동하는 쪽, fan-in cone)
+            through_instances: 인스턴스 입력 포트에 도달하면 같은 인스턴스의 출력 포트로 통과
+                               (내부 구조를 모르는 블랙박스 가정, reverse 시 출력 → 입력)
+        """
+        off, adj, kinds = (self._in_off, self._in_src, self._in_kind) if reverse else (
+            self._out_off, self._out_dst, self._out_kind
+        )
+        enter_dir = _DIR_OUT if reverse else _DIR_IN
+        seen = bytearray(self.node_count)
+        seen[start] = 1
+        order: List[int] = []
+        queue = deque([(start, 0)])
+        while queue:
+            node, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            nxt = [adj[i] for i in range(off[node], off[node + 1]) if kinds[i] & EDGE_CONNECT]
+            if (
+                through_instances
+                and self.kind[node] == NODE_PORT
+                and self.direction[node] == enter_dir
+                and self.parent[node] >= 0
+                and self.kind[self.parent[node]] == NODE_INSTANCE
+            ):
+                nxt.extend(p for p in self.children(self.parent[node]) if self.direction[p] != enter_dir)
+            for t in nxt:
+                if not seen[t]:
+                    seen[t] = 1
+                    order.append(t)
+                    queue.append((t, depth + 1))
+        return order
+
+    # ---- 요약 ----
+
+    def nbytes(self) -> int:
+        """노드·엣지 배열이 차지하는 바이트 수 (문자열 표 제외)."""
+        arrays = (
+            self.kind, self.name, self.parent, self.direction, self.ref,
+            self._out_off, self._out_dst, self._out_kind, self._in_off, self._in_src, self._in_kind,
+        )
+        return sum(a.itemsize * len(a) for a in arrays)
+
+    def stats(self) -> dict:
+        counts = [0] * len(NODE_KINDS)
+        for k in self.kind:
+            counts[k] += 1
+        return {
+            "nodes": self.node_count,
+            "edges": self.edge_count,
+            "strings": len(self.strings),
+            "bytes": self.nbytes(),
+            **{name: c for name, c in zip(("entities", "instances", "ports", "signals"), counts)},
+        }
+
+
+def _net_name(actual: Optional[str]) -> Optional[str]:
+    """actual 표현식에서 net 이름 추출: 's1(3 downto 0)' → 's1'. 리터럴/표현식이면 None."""
+    if not actual:
+        return None
+    head = actual.split("(", 1)[0].strip()
+    if head and head[0].isalpha() and head.replace("_", "a").isalnum():
+        return head
     return None
+
+
+def _as_list(result: Any) -> list:
+    if result is None:
+        return []
+    return list(result) if isinstance(result, (list, tuple)) else [result]
+
+
+def build_graph(entity_result, arch_result) -> ConnectivityGraph:
+    """
+    Entity/Arch 파서 결과로부터 노드·간선 그래프 구성.
+
+    계층은 한 단계만 연결한다: architecture 마다 자기 port/signal 과 인스턴스 포트(pin) 사이 간선을 만들고,
+    인스턴스 내부(하위 unit 의 architecture)는 펼치지 않는다. 하위 unit 은 인스턴스의 ref 이름으로
+    같은 그래프의 해당 entity 노드를 찾아갈 수 있다 (인스턴스별 계층 전개는 core.elaborate).
+
+    Args:
+        entity_result: Entity 또는 Entity 목록 (없으면 None). architecture 의 entity 포트와
+                       entity 인스턴스의 포트 방향을 얻는 데 사용
+        arch_result: Architecture 또는 Architecture 목록 (parse_architecture 결과)
+
+    Returns:
+        ConnectivityGraph. architecture 가 있는 entity 는 signal/instance 까지, 없으면 port 만 포함
+    """
+    entities: Dict[str, Entity] = {e.module_name.lower(): e for e in _as_list(entity_result)}
+    archs: List[Architecture] = _as_list(arch_result)
+    builder = GraphBuilder()
+    covered = set()
+    for arch in archs:
+        key = arch.entity.lower()
+        covered.add(key)
+        entity = entities.get(key)
+        root = builder.add_node(NODE_ENTITY, entity.module_name if entity else arch.entity)
+        nets: Dict[str, int] = {}
+        for port in entity.ports if entity else ():
+            nets[port.name.lower()] = builder.add_node(NODE_PORT, port.name, root, port.direction)
+        for signal in arch.signals:
+            if signal.name.lower() not in nets:
+                nets[signal.name.lower()] = builder.add_node(NODE_SIGNAL, signal.name, root)
+        declared: Dict[str, List[Port]] = {c.name.lower(): c.ports for c in arch.components}
+        for i, inst in enumerate(arch.instances):
+            inst_node = builder.add_node(NODE_INSTANCE, inst.label or f"{inst.unit}_{i}", root, ref=inst.unit)
+            unit = inst.unit.lower()
+            unit_ports = declared.get(unit) if inst.kind == "component" else None
+            if unit_ports is None and unit in entities:
+                unit_ports = entities[unit].ports
+            unit_ports = unit_ports or []
+            by_name = {p.name.lower(): p for p in unit_ports}
+            pins: Dict[str, int] = {}
+            for pos, assoc in enumerate(inst.port_map):
+                if assoc.formal is not None:
+                    formal = assoc.formal.split("(", 1)[0].strip()
+                    decl = by_name.get(formal.lower())
+                elif pos < len(unit_ports):
+                    decl = unit_ports[pos]
+                    formal = decl.name
+                else:
+                    decl, formal = None, f"#{pos}"
+                pin = pins.get(formal.lower())
+                if pin is None:
+                    pin = pins[formal.lower()] = builder.add_node(
+                        NODE_PORT, decl.name if decl else formal, inst_node, decl.direction if decl else ""
+                    )
+                net = nets.get((_net_name(assoc.actual) or "").lower())
+                if net is not None:
+                    builder.connect(pin, net)
+    for key, entity in entities.items():
+        if key in covered:
+            continue
+        root = builder.add_node(NODE_ENTITY, entity.module_name)
+        for port in entity.ports:
+            builder.add_node(NODE_PORT, port.name, root, port.direction)
+    return builder.build()
@@ -0,0 +1,203 @@
+"""
+프로젝트 단위 열(column) 형식 포트 표.
+
+라이브러리 전체 포트 목록을 Port 객체 대신 평행 배열로 보관한다 (포트 1개 ≈ 21바이트 + 고유 문자열).
+    문자열   이름·타입·범위·entity 이름·경로는 StringTable(graph_model) 에 1회 intern, 열에는 id 만
+    entity   entity_name(I), entity_path(i), entity_offsets(I) — entity e 의 포트는 offsets[e]..offsets[e+1]
+    포트     entity(I), name(I), direction(B, graph_model.DIRECTIONS 코드), type(I), width(I), range(i, 없으면 -1)
+대량 내보내기: columns()(열 단위 목록), to_dict()/from_dict()(열 형식 JSON), write_csv()(행 단위 CSV).
+"""
+import csv
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+try:
+    from .graph_model import DIRECTIONS, StringTable
+    from .vhdl_types import CompactEntity, CompactPort, Entity
+except ImportError:
+    from models.graph_model import DIRECTIONS, StringTable
+    from models.vhdl_types import CompactEntity, CompactPort, Entity
+
+_DIRECTION_CODE = {d: i for i, d in enumerate(DIRECTIONS)}
+
+PORT_COLUMNS = ("entity", "name", "direction", "type", "width", "range")
+CSV_HEADER = ("entity", "path", "name", "direction", "type", "width", "range")
+
+
+class PortTable:
+    """append-only 열 형식 포트 표. entity 단위로 추가하며 포트 행은 entity 순서대로 연속 저장."""
+
+    __slots__ = (
+        "strings", "entity_name", "entity_path", "entity_offsets",
+        "entity", "name", "direction", "type", "width", "range",
+    )
+
+    def __init__(self, strings: Optional[StringTable] = None):
+        self.strings = strings if strings is not None else StringTable()
+        self.entity_name = array("I")
+        self.entity_path = array("i")
+        self.entity_offsets = array("I", [0])
+        self.entity = array("I")
+        self.name = array("I")
+        self.direction = array("B")
+        self.type = array("I")
+        self.width = array("I")
+        self.range = array("i")
+
+    @classmethod
+    def from_entities(cls, entities: Iterable[Union[Entity, CompactEntity]], path: Optional[str] = None) -> "PortTable":
+        table = cls()
+        table.extend(entities, path)
+        return table
+
+    def add_entity(self, entity: Union[Entity, CompactEntity], path: Optional[str] = None) -> int:
+        """entity 1개와 포트 전체를 추가하고 entity id 반환."""
+        intern = self.strings.intern
+        eid = len(self.entity_name)
+        self.entity_name.append(intern(entity.module_name))
+        self.entity_path.append(intern(path) if path is not None else -1)
+        ports = entity.ports
+        self.entity.extend([eid] * len(ports))
+        self.name.extend([intern(p.name) for p in ports])
+        self.direction.extend([_DIRECTION_CODE.get(p.direction, 0) for p in ports])
+        self.type.extend([intern(p.type) for p in ports])
+        self.width.extend([p.width for p in ports])
+        self.range.extend([intern(p.range) if p.range is not None else -1 for p in ports])
+        self.entity_offsets.append(len(self.name))
+        return eid
+
+    def extend(self, entities: Iterable[Union[Entity, CompactEntity]], path: Optional[str] = None) -> None:
+        for entity in entities:
+            self.add_entity(entity, path)
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    @property
+    def entity_count(self) -> int:
+        return len(self.entity_name)
+
+    def entity_of(self, eid: int) -> str:
+        return self.strings[self.entity_name[eid]]
+
+    def path_of(self, eid: int) -> Optional[str]:
+        sid = self.entity_path[eid]
+        return self.strings[sid] if sid >= 0 else None
+
+    def ports_of(self, eid: int) -> range:
+        """entity 의 포트 행 번호 구간."""
+        return range(self.entity_offsets[eid], self.entity_offsets[eid + 1])
+
+    def find_entity(self, name: str) -> Optional[int]:
+        """entity 이름(대소문자 무시) → 마지막으로 추가된 entity id."""
+        sid = self.strings.lookup(name)
+        if sid is not None:
+            for eid in range(len(self.entity_name) - 1, -1, -1):
+                if self.entity_name[eid] == sid:
+                    return eid
+        key = name.lower()
+        for eid in range(len(self.entity_name) - 1, -1, -1):
+            if self.strings[self.entity_name[eid]].lower() == key:
+                return eid
+        return None
+
+    def port(self, row: int) -> CompactPort:
+        """행 1개 → CompactPort (문자열은 표의 intern 객체를 그대로 사용)."""
+        s = self.strings
+        rng = self.range[row]
+        return CompactPort(
+            s[self.name[row]], DIRECTIONS[self.direction[row]], s[self.type[row]], self.width[row],
+            s[rng] if rng >= 0 else None,
+        )
+
+    def compact_entity(self, eid: int) -> CompactEntity:
+        """entity 1개 복원 (표에 generic 은 없으므로 빈 튜플)."""
+        return CompactEntity(self.entity_of(eid), tuple(self.port(r) for r in self.ports_of(eid)))
+
+    def select(
+        self,
+        direction: Optional[str] = None,
+        type_name: Optional[str] = None,
+        min_width: Optional[int] = None,
+    ) -> List[int]:
+        """조건에 맞는 포트 행 번호 (열 단위 비교, 객체 생성 없음)."""
+        rows: Iterable[int] = range(len(self.name))
+        if direction is not None:
+            code = _DIRECTION_CODE.get(direction.lower(), -1)
+            col = self.direction
+            rows = [r for r in rows if col[r] == code]
+        if type_name is not None:
+            sid = self.strings.lookup(type_name)
+            col = self.type
+            rows = [r for r in rows if col[r] == sid] if sid is not None else []
+        if min_width is not None:
+            col = self.width
+            rows = [r for r in rows if col[r] >= min_width]
+        return list(rows)
+
+    def columns(self) -> Dict[str, List[Any]]:
+        """포트 열을 디코드한 목록들 (열 단위 대량 내보내기, 행 객체 생성 없음)."""
+        s = list(self.strings)
+        return {
+            "entity": [s[self.entity_name[e]] for e in self.entity],
+            "name": [s[i] for i in self.name],
+            "direction": [DIRECTIONS[d] for d in self.direction],
+            "type": [s[i] for i in self.type],
+            "width": self.width.tolist(),
+            "range": [s[i] if i >= 0 else None for i in self.range],
+        }
+
+    def rows(self) -> Iterator[tuple]:
+        """CSV_HEADER 순서의 행 튜플을 지연 생성."""
+        s = list(self.strings)
+        for eid in range(len(self.entity_name)):
+            entity = s[self.entity_name[eid]]
+            pid = self.entity_path[eid]
+            path = s[pid] if pid >= 0 else ""
+            for r in self.ports_of(eid):
+                rng = self.range[r]
+                yield (
+                    entity, path, s[self.name[r]], DIRECTIONS[self.direction[r]], s[self.type[r]],
+                    self.width[r], s[rng] if rng >= 0 else "",
+                )
+
+    def write_csv(self, out: TextIO) -> int:
+        """행 단위 CSV (헤더 포함). 기록한 포트 수 반환."""
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(CSV_HEADER)
+        writer.writerows(self.rows())
+        return len(self.name)
+
+    def to_dict(self) -> dict:
+        """열 형식 JSON (문자열 표 + id 배열). from_dict 로 복원."""
+        return {
+            "strings": list(self.strings),
+            "entities": {
+                "name": self.entity_name.tolist(),
+                "path": self.entity_path.tolist(),
+                "offsets": self.entity_offsets.tolist(),
+            },
+            "ports": {col: getattr(self, col).tolist() for col in PORT_COLUMNS},
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "PortTable":
+        table = cls(StringTable(d["strings"]))
+        entities = d["entities"]
+        table.entity_name.extend(entities["name"])
+        table.entity_path.extend(entities["path"])
+        table.entity_offsets = array("I", entities["offsets"])
+        for col in PORT_COLUMNS:
+            getattr(table, col).extend(d["ports"][col])
+        return table
+
+    def nbytes(self) -> int:
+        """배열 본문 크기 (문자열 표 제외)."""
+        arrays = (
+            self.entity_name, self.entity_path, self.entity_offsets,
+            self.entity, self.name, self.direction, self.type, self.width, self.range,
+        )
+        return sum(a.itemsize * len(a) for a in arrays)
+
+    def stats(self) -> Dict[str, int]:
+        return {"entities": self.entity_count, "ports": len(self), "strings": len(self.strings), "bytes": self.nbytes()}
@@ -1,36 +1,263 @@
 """
 VHDL 도메인 데이터 클래스.
-Port, Entity 등 파서/Export 공통 자료구조 정의.
+Port, Entity, Architecture 등 파서/Export 공통 자료구조 정의.
+CompactPort / CompactGeneric / CompactEntity 는 대규모 라이브러리 보관용 불변·__slots__ 판
+(인스턴스별 __dict__ 없음, 방향·타입 등 반복 문자열은 sys.intern 으로 1개 객체 공유).
 """
+import sys
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional, Tuple
 
 
 @dataclass
 class Port:
-    """단일 포트: 이름, 방향, 타입, 비트 폭."""
+    """단일 포트: 이름, 방향, 타입, 비트 폭, (폭이 generic/상수에 의존하면) 범위 원문."""
     name: str
     direction: str   # "in" | "out" | "inout" | "buffer"
     type: str        # "std_logic" | "std_logic_vector" 등
-    width: int       # std_logic=1, vector=비트 수
+    width: int       # std_logic=1, vector=비트 수 (범위가 generic 이면 기본값 기준, 계산 불가 시 1)
+    range: Optional[str] = None  # "WIDTH-1 downto 0" (리터럴 범위면 None)
 
     def to_dict(self) -> dict:
-        return {
+        d = {
             "name": self.name,
             "direction": self.direction,
             "type": self.type,
             "width": self.width,
         }
+        if self.range is not None:
+            d["range"] = self.range
+        return d
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Port":
+        return cls(d["name"], d["direction"], d["type"], d["width"], d.get("range"))
+
+
+@dataclass
+class Generic:
+    """generic 선언: 이름, 타입, 기본값(원문 표현식, 없으면 None)."""
+    name: str
+    type: str
+    default: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "default": self.default,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Generic":
+        return cls(d["name"], d["type"], d.get("default"))
+
+
+@dataclass
+class Constant:
+    """package 의 constant 선언: 이름, 타입, 값(원문 표현식, deferred constant 면 None), 소속 package."""
+    name: str
+    type: str
+    value: Optional[str] = None
+    package: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "value": self.value,
+            "package": self.package,
+        }
 
 
 @dataclass
 class Entity:
-    """Entity 블록: 모듈 이름 + 포트 목록."""
+    """Entity 블록: 모듈 이름 + 포트 목록 + generic 목록."""
     module_name: str
     ports: List[Port] = field(default_factory=list)
+    generics: List[Generic] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "module_name": self.module_name,
+            "ports": [p.to_dict() for p in self.ports],
+            "generics": [g.to_dict() for g in self.generics],
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Entity":
+        """to_dict 결과(캐시·JSON)로부터 복원."""
+        return cls(
+            d["module_name"],
+            [Port.from_dict(p) for p in d.get("ports", [])],
+            [Generic.from_dict(g) for g in d.get("generics", [])],
+        )
+
+
+@dataclass
+class Signal:
+    """signal 선언: 이름, 타입, 비트 폭."""
+    name: str
+    type: str
+    width: int
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "width": self.width,
+        }
+
+
+@dataclass
+class Process:
+    """process 문: 레이블(없으면 None) + 감지 목록."""
+    label: Optional[str]
+    sensitivity: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "label": self.label,
+            "sensitivity": list(self.sensitivity),
+        }
+
+
+@dataclass
+class Association:
+    """port map / generic map 연결 1개: formal(이름 지정 연결의 좌변, 위치 연결이면 None) => actual(open 이면 None)."""
+    formal: Optional[str]
+    actual: Optional[str]
+
+    def to_dict(self) -> dict:
+        return {
+            "formal": self.formal,
+            "actual": self.actual,
+        }
+
+
+@dataclass
+class Component:
+    """component 선언: 이름 + 포트 + generic."""
+    name: str
+    ports: List[Port] = field(default_factory=list)
+    generics: List[Generic] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "ports": [p.to_dict() for p in self.ports],
+            "generics": [g.to_dict() for g in self.generics],
+        }
+
+
+@dataclass
+class Instance:
+    """인스턴스화 문: 레이블, 대상 unit, 종류("component" | "entity" | "configuration"), 라이브러리,
+    entity 인스턴스의 architecture 지정(`entity work.e(rtl)`), generic/port map."""
+    label: Optional[str]
+    unit: str
+    kind: str = "component"
+    library: Optional[str] = None
+    architecture: Optional[str] = None
+    generic_map: List[Association] = field(default_factory=list)
+    port_map: List[Association] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "label": self.label,
+            "unit": self.unit,
+            "kind": self.kind,
+            "library": self.library,
+            "architecture": self.architecture,
+            "generic_map": [a.to_dict() for a in self.generic_map],
+            "port_map": [a.to_dict() for a in self.port_map],
+        }
+
+
+@dataclass
+class Architecture:
+    """architecture 블록: 이름, 대상 entity, signal/component 선언, 인스턴스, process."""
+    name: str
+    entity: str
+    signals: List[Signal] = field(default_factory=list)
+    components: List[Component] = field(default_factory=list)
+    instances: List[Instance] = field(default_factory=list)
+    processes: List[Process] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "entity": self.entity,
+            "signals": [s.to_dict() for s in self.signals],
+            "components": [c.to_dict() for c in self.components],
+            "instances": [i.to_dict() for i in self.instances],
+            "processes": [p.to_dict() for p in self.processes],
+        }
+
+
+def _intern(s: Optional[str]) -> Optional[str]:
+    return sys.intern(s) if s is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class CompactPort:
+    """Port 의 불변·__slots__ 판. 이름·방향·타입·범위 문자열은 intern 되어 같은 값이면 같은 객체."""
+    name: str
+    direction: str
+    type: str
+    width: int
+    range: Optional[str] = None
+
+    @classmethod
+    def from_port(cls, port: Port) -> "CompactPort":
+        return cls(sys.intern(port.name), sys.intern(port.direction), sys.intern(port.type), port.width, _intern(port.range))
+
+    def to_port(self) -> Port:
+        return Port(self.name, self.direction, self.type, self.width, self.range)
+
+    def to_dict(self) -> dict:
+        return self.to_port().to_dict()
+
+
+@dataclass(frozen=True, slots=True)
+class CompactGeneric:
+    """Generic 의 불변·__slots__ 판."""
+    name: str
+    type: str
+    default: Optional[str] = None
+
+    @classmethod
+    def from_generic(cls, generic: Generic) -> "CompactGeneric":
+        return cls(sys.intern(generic.name), sys.intern(generic.type), _intern(generic.default))
+
+    def to_generic(self) -> Generic:
+        return Generic(self.name, self.type, self.default)
+
+    def to_dict(self) -> dict:
+        return self.to_generic().to_dict()
+
+
+@dataclass(frozen=True, slots=True)
+class CompactEntity:
+    """Entity 의 불변·__slots__ 판. ports/generics 는 튜플 (리스트보다 작고 변경 불가)."""
+    module_name: str
+    ports: Tuple[CompactPort, ...] = ()
+    generics: Tuple[CompactGeneric, ...] = ()
+
+    @classmethod
+    def from_entity(cls, entity: Entity) -> "CompactEntity":
+        return cls(
+            sys.intern(entity.module_name),
+            tuple(CompactPort.from_port(p) for p in entity.ports),
+            tuple(CompactGeneric.from_generic(g) for g in entity.generics),
+        )
+
+    def to_entity(self) -> Entity:
+        return Entity(self.module_name, [p.to_port() for p in self.ports], [g.to_generic() for g in self.generics])
 
     def to_dict(self) -> dict:
         return {
             "module_name": self.module_name,
             "ports": [p.to_dict() for p in self.ports],
+            "generics": [g.to_dict() for g in self.generics],
         }
@@ -1,15 +1,15 @@
 """
-VHDL 파일을 Tree-sitter로 파싱하여 AST 전체를 JSON 파일로 덤프.
+VHDL 파일을 Tree-sitter로 파싱하여 AST 전체를 JSON 파일로 덤프 (스트리밍 기록, 메모리 일정).
 사용: python run_ast_dump.py <file.vhd> [output_ast_tree.json]
 """
 import sys
 from pathlib import Path
 
 try:
-    from vhdl_renderer_backend.core.ast_parser import parse_to_tree, ast_dump_json, extract_entity_ports_from_tree
+    from vhdl_renderer_backend.core.ast_parser import parse_to_tree, ast_dump_stream, extract_entity_ports_from_tree
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    from core.ast_parser import parse_to_tree, ast_dump_json, extract_entity_ports_from_tree
+    from core.ast_parser import parse_to_tree, ast_dump_stream, extract_entity_ports_from_tree
 
 def main():
     if len(sys.argv) < 2:
@@ -23,8 +23,8 @@ def main():
     code = path.read_text(encoding="utf-8", errors="replace")
     tree = parse_to_tree(code)
     entity = extract_entity_ports_from_tree(tree, code)
-    json_str = ast_dump_json(tree, code)
-    out_path.write_text(json_str, encoding="utf-8")
+    with open(out_path, "w", encoding="utf-8") as f:
+        ast_dump_stream(tree, code, f)
     print(f"AST 노드 수(대략): {tree.root_node.descendant_count}")
     if entity:
         print(f"Entity: {entity.module_name}, Ports: {len(entity.ports)}")
@@ -0,0 +1,87 @@
+"""
+Architecture 파서 테스트.
+- signal/component/instance(generic map, port map)/process 추출, entity 필터, 순회 방문 수 선형성
+"""
+from pathlib import Path
+
+try:
+    from vhdl_renderer_backend.benchmarks.arch_scaling import synthetic_architecture
+    from vhdl_renderer_backend.core.arch_parser import _ArchCollector, parse_architecture
+    from vhdl_renderer_backend.core.ast_parser import parse_to_tree
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from benchmarks.arch_scaling import synthetic_architecture
+    from core.arch_parser import _ArchCollector, parse_architecture
+    from core.ast_parser import parse_to_tree
+
+DIR = Path(__file__).resolve().parent / "test_data"
+
+CODE = """
+entity e1 is end entity;
+architecture rtl of e1 is
+  component comp_y is
+    generic ( W : integer := 2 );
+    port ( a : in bit; b : out bit_vector(3 downto 0) );
+  end component;
+  signal s1, s2 : std_logic_vector(7 downto 0);
+begin
+  u1 : comp_y generic map ( W => 8 ) port map ( a => s1(0), b => open );
+  u2 : entity work.e2 port map ( s1, open, x(1) => clk );
+  g : for i in 0 to 3 generate
+    signal t : bit;
+  begin
+    ug : comp_y port map ( a => t, b => open );
+  end generate;
+  p : process (clk) begin end process;
+end architecture;
+architecture sim of other is begin end architecture;
+"""
+
+
+def test_parse_architecture_extracts_all_kinds():
+    arch, other = parse_architecture(CODE)
+    assert (arch.name, arch.entity) == ("rtl", "e1") and (other.name, other.entity) == ("sim", "other")
+    assert [(s.name, s.width) for s in arch.signals] == [("s1", 8), ("s2", 8), ("t", 1)]
+    [comp] = arch.components
+    assert comp.name == "comp_y" and [(p.name, p.direction, p.width) for p in comp.ports] == [("a", "in", 1), ("b", "out", 4)]
+    assert [(g.name, g.default) for g in comp.generics] == [("W", "2")]
+    u1, u2, ug = arch.instances
+    assert (u1.label, u1.unit, u1.kind) == ("u1", "comp_y", "component")
+    assert [(a.formal, a.actual) for a in u1.generic_map] == [("W", "8")]
+    assert [(a.formal, a.actual) for a in u1.port_map] == [("a", "s1(0)"), ("b", None)]
+    assert (u2.unit, u2.kind, u2.library) == ("e2", "entity", "work")
+    assert [(a.formal, a.actual) for a in u2.port_map] == [(None, "s1"), (None, None), ("x(1)", "clk")]
+    assert ug.label == "ug"
+    assert [(p.label, p.sensitivity) for p in arch.processes] == [("p", ["clk"])]
+    assert arch.to_dict()["instances"][0]["port_map"][1] == {"formal": "b", "actual": None}
+
+
+def test_parse_architecture_filters_by_entity():
+    """entity_result 지정 시 해당 entity 의 architecture 만 (대소문자 무시)."""
+    assert [a.name for a in parse_architecture(CODE, "E1")] == ["rtl"]
+
+
+def test_parse_architecture_top_project():
+    """top.vhd: component 6개 선언, 6개 인스턴스, 인스턴스마다 이름 지정 port map."""
+    code = (DIR / "vhdl_project" / "top.vhd").read_text(encoding="utf-8")
+    [arch] = parse_architecture(code)
+    assert [c.name for c in arch.components] == [
+        "uart_rs232", "memory_interface", "led_controller", "spi_master", "bus_arbiter", "fifo_sync",
+    ]
+    assert [i.unit for i in arch.instances] == [c.name for c in arch.components]
+    uart = arch.instances[0]
+    assert uart.label == "u_uart" and uart.port_map[0].formal == "CLK" and uart.port_map[0].actual == "CLK_50"
+    assert all(a.formal for i in arch.instances for a in i.port_map)
+    assert len(arch.signals) >= 40
+
+
+def test_arch_extraction_visits_linear():
+    """규모 2배 → 방문 노드 수도 (상수항 제외) 정확히 2배: 단일 순회."""
+    visits = []
+    for n in (200, 400):
+        src = synthetic_architecture(n, n // 5).encode("utf-8")
+        visits.append(_ArchCollector(src).dispatcher().walk(parse_to_tree(src)))
+    small = synthetic_architecture(0, 0).encode("utf-8")
+    const = _ArchCollector(small).dispatcher().walk(parse_to_tree(small))
+    assert visits[1] - const == 2 * (visits[0] - const)
@@ -15,8 +15,13 @@ try:
         ast_dump_json,
         extract_entity_ports_from_tree,
         parse_vhdl,
+        VhdlDocument,
+        extract_design_from_tree,
+        ast_dump_stream,
     )
+    from vhdl_renderer_backend.core.ast_walker import NodeDispatcher, SKIP
     from vhdl_renderer_backend.core.entity_parser import parse_entity
+    from vhdl_renderer_backend.core.parser_pool import ParserPool, get_parser_pool
     from vhdl_renderer_backend.models import Entity, Port
 except ImportError:
     import sys
@@ -28,8 +33,13 @@ except ImportError:
         ast_dump_json,
         extract_entity_ports_from_tree,
         parse_vhdl,
+        VhdlDocument,
+        extract_design_from_tree,
+        ast_dump_stream,
     )
+    from core.ast_walker import NodeDispatcher, SKIP
     from core.entity_parser import parse_entity
+    from core.parser_pool import ParserPool, get_parser_pool
     from models import Entity, Port
 
 DIR = Path(__file__).resolve().parent / "test_data"
@@ -210,3 +220,165 @@ def test_micro_process_fsm_ast_has_case_flow():
     assert _ast_has_type(d, "case_statement") or _ast_has_type(d, "case_statement_block") or "case" in str(d), "case/when FSM 흐름"
     entity = extract_entity_ports_from_tree(tree, code)
     assert entity is not None and entity.module_name == "FSM" and len(entity.ports) == 4
+
+
+def test_incremental_document_edit_reparse():
+    """VhdlDocument: 편집 후 old_tree 재사용 재파싱, 결과가 전체 재파싱과 동일한지."""
+    code = (
+        "entity A is port ( X : in std_logic ); end entity;\n"
+        "architecture rtl of A is begin end architecture;\n"
+    )
+    doc = VhdlDocument(code)
+    start = code.index("X :")
+    doc.edit(start, start + 1, "XY")
+    ranges = doc.reparse()
+    assert ranges and ranges[0][0] <= start < ranges[0][1]
+    fresh = parse_to_tree(doc.text)
+    assert str(doc.tree.root_node) == str(fresh.root_node)
+    entity = extract_entity_ports_from_tree(doc.tree, doc.source)
+    assert entity.ports[0].name == "XY"
+    units = doc.affected_design_units()
+    assert len(units) == 1 and units[0].children[0].type == "entity_declaration"
+
+
+def test_incremental_document_point_edits_accumulate():
+    """(row, column) 편집 여러 개를 누적한 뒤 한 번에 재파싱."""
+    code = "entity A is\n  port ( X : in std_logic );\nend entity;\n"
+    doc = VhdlDocument(code)
+    doc.edit_point((1, 13), (1, 15), "out")
+    doc.edit_point((0, 7), (0, 8), "B")
+    entity = extract_entity_ports_from_tree(doc.tree, doc.source)
+    assert entity.module_name == "B"
+    assert entity.ports[0].direction == "out"
+    assert doc.text.startswith("entity B is\n  port ( X : out std_logic );")
+
+
+def test_parser_pool_reuses_parsers():
+    """ParserPool: 반납된 Parser 재사용(hit), Language 는 1회만 생성."""
+    pool = ParserPool()
+    with pool.parser() as p1:
+        assert p1.parse(b"entity A is end;").root_node.type == "design_file"
+    with pool.parser() as p2:
+        assert p2 is p1
+    stats = pool.stats()
+    assert stats["created"] == 1 and stats["hits"] == 1 and stats["idle"] == 1
+    assert pool.language() is pool.language()
+
+
+def test_parser_pool_threads_get_distinct_parsers():
+    """동시에 체크아웃된 Parser 는 스레드마다 서로 다른 인스턴스."""
+    import threading
+
+    pool = ParserPool()
+    barrier = threading.Barrier(4)
+    seen = []
+
+    def work():
+        with pool.parser() as p:
+            barrier.wait()
+            seen.append(id(p))
+            p.parse(b"entity A is port ( X : in std_logic ); end;")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(set(seen)) == 4
+    assert pool.stats()["created"] == 4
+
+
+def test_parse_to_tree_uses_shared_pool():
+    """parse_to_tree 반복 호출 시 공유 풀의 Parser 재사용."""
+    before = get_parser_pool().stats()["hits"]
+    parse_to_tree("entity A is end;")
+    parse_to_tree("entity B is end;")
+    assert get_parser_pool().stats()["hits"] >= before + 1
+
+
+def test_dispatcher_single_pass_visits_every_node_once():
+    """NodeDispatcher: 핸들러 없으면 모든 노드를 정확히 한 번 방문, SKIP 시 서브트리 생략."""
+    path = MICRO / "test_process.vhd"
+    code = path.read_text(encoding="utf-8")
+    tree = parse_to_tree(code)
+    entered, left = [], []
+    d = NodeDispatcher()
+    d.on_enter("process_statement", lambda n: entered.append(n.type))
+    d.on_leave("process_statement", lambda n: left.append(n.type))
+    assert d.walk(tree) == tree.root_node.descendant_count
+    assert entered == left == ["process_statement"]
+    skipping = NodeDispatcher().on_enter("architecture_definition", lambda n: SKIP)
+    assert skipping.walk(tree) < tree.root_node.descendant_count
+
+
+def test_extract_design_single_pass():
+    """entity/port/generic/signal/process 를 한 번의 순회로 추출, 다중 이름 선언 분리."""
+    code = """
+    entity child is
+      generic ( WIDTH : integer := 8 );
+      port ( CLK : in std_logic; X, Y : out bit );
+    end entity;
+    architecture rtl of child is
+      signal a, b : std_logic_vector(3 downto 0);
+    begin
+      p_main : process (CLK, a) begin b <= a; end process p_main;
+      process begin wait; end process;
+    end architecture;
+    """
+    tree = parse_to_tree(code)
+    summary = extract_design_from_tree(tree, code)
+    assert [e.module_name for e in summary.entities] == ["child"]
+    entity = summary.entities[0]
+    assert [p.name for p in entity.ports] == ["CLK", "X", "Y"]
+    assert entity.ports[2].direction == "out"
+    assert entity.generics[0].name == "WIDTH" and entity.generics[0].default == "8"
+    assert [(s.name, s.width) for s in summary.signals] == [("a", 4), ("b", 4)]
+    assert summary.processes[0].label == "p_main"
+    assert summary.processes[0].sensitivity == ["CLK", "a"]
+    assert summary.processes[1].label is None
+    assert summary.visits < tree.root_node.descendant_count
+
+
+def test_ast_dump_stream_matches_json_dump():
+    """스트리밍 덤프 출력이 ast_dump_json 과 바이트 단위로 동일 (들여쓰기 유무 모두)."""
+    import io
+
+    code = (MICRO / "test_process_fsm.vhd").read_text(encoding="utf-8")
+    tree = parse_to_tree(code)
+    for indent in (None, 2):
+        buf = io.StringIO()
+        count = ast_dump_stream(tree, code, buf, indent=indent, flush_every=16)
+        assert buf.getvalue() == ast_dump_json(tree, code, indent=indent)
+        assert count == tree.root_node.descendant_count
+
+
+def test_ast_dump_deep_tree_no_recursion_limit():
+    """깊게 중첩된 식도 재귀 한도 없이 덤프 (ast_to_dict / 스트리밍 모두)."""
+    import io
+    import sys
+
+    depth = sys.getrecursionlimit() + 100
+    code = "entity A is end; architecture r of A is begin x <= " + "(" * depth + "a" + ")" * depth + "; end;"
+    tree = parse_to_tree(code)
+    buf = io.StringIO()
+    ast_dump_stream(tree, code, buf, indent=None)
+    assert buf.getvalue().startswith('{"type": "design_file"')
+    assert ast_to_dict(tree, code)["type"] == "design_file"
+
+
+def test_parse_vhdl_lazy_stages():
+    """parse_vhdl: 단계는 첫 접근 시 계산·캐시, stages 로 일부만 즉시 계산."""
+    code = "entity Foo is port ( A : in std_logic ); end entity;"
+    result = parse_vhdl(code)
+    assert result.computed() == []
+    assert result.entity.module_name == "Foo"
+    assert result.computed() == ["entity"]
+    assert result["ast_dict"] is result.ast_dict
+    assert result["tree"] is result.tree
+    only = parse_vhdl(code, stages=["design"])
+    assert only.computed() == ["design"]
+    assert only.entity is only.design.entities[0]
+    no_entity = parse_vhdl(code, extract_entity=False)
+    assert "entity" not in no_entity and no_entity.get("entity") is None
+    with pytest.raises(ValueError):
+        parse_vhdl(code, stages=["bogus"])
@@ -0,0 +1,105 @@
+"""
+Tree-sitter 쿼리 계층 테스트.
+- 컴파일 캐시, 종류별 타입 결과, 바이트 구간 제한 실행
+"""
+from pathlib import Path
+
+try:
+    from vhdl_renderer_backend.core.ast_parser import parse_to_tree, extract_design_from_tree, VhdlDocument
+    from vhdl_renderer_backend.core.ast_query import (
+        compiled_query,
+        query_design,
+        query_instances,
+        query_ports,
+        query_signals,
+    )
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.ast_parser import parse_to_tree, extract_design_from_tree, VhdlDocument
+    from core.ast_query import (
+        compiled_query,
+        query_design,
+        query_instances,
+        query_ports,
+        query_signals,
+    )
+
+DIR = Path(__file__).resolve().parent / "test_data"
+
+CODE = """
+entity child is
+  generic ( N : integer := 4 );
+  port ( I : in std_logic; O1, O2 : out std_logic_vector(3 downto 0) );
+end entity;
+architecture rtl of child is
+  signal a, b : std_logic;
+begin
+  u0 : sub generic map ( N => 8 ) port map ( I => a, O => b );
+  u1 : entity work.leaf port map ( X => a );
+  p_main : process (a) begin b <= a; end process;
+end architecture;
+"""
+
+
+def test_query_compiled_once():
+    """같은 종류의 쿼리는 Language 별로 한 번만 컴파일."""
+    assert compiled_query("ports") is compiled_query("ports")
+    assert compiled_query("design") is not compiled_query("ports")
+
+
+def test_query_design_typed_results():
+    """합본 쿼리: entity/port/generic/signal/instance/process 타입 결과."""
+    tree = parse_to_tree(CODE)
+    r = query_design(tree, CODE)
+    assert [e.name for e in r.entities] == ["child"]
+    assert [(p.name, p.direction, p.width) for p in r.ports] == [("I", "in", 1), ("O1", "out", 4), ("O2", "out", 4)]
+    assert r.generics[0].name == "N" and r.generics[0].default == "4"
+    assert [s.name for s in r.signals] == ["a", "b"]
+    assert [(i.label, i.unit, i.kind, i.library) for i in r.instances] == [
+        ("u0", "sub", "component", None),
+        ("u1", "leaf", "entity", "work"),
+    ]
+    assert r.processes[0].label == "p_main" and r.processes[0].sensitivity == ["a"]
+    assert query_instances(tree, CODE) == r.instances
+
+
+def test_query_matches_single_pass_extraction():
+    """쿼리 결과가 TreeCursor 단일 순회 추출과 동일 (top.vhd)."""
+    code = (DIR / "vhdl_project" / "top.vhd").read_text(encoding="utf-8")
+    tree = parse_to_tree(code)
+    summary = extract_design_from_tree(tree, code)
+    ports = query_ports(tree, code)
+    assert [(p.name, p.direction, p.type, p.width) for p in ports] == [
+        (p.name, p.direction, p.type, p.width) for p in summary.entities[0].ports
+    ]
+    assert [s.name for s in query_signals(tree, code)] == [s.name for s in summary.signals]
+
+
+def test_query_widths_use_generic_defaults():
+    """generic 기본값으로 계산한 포트·signal 폭이 단일 순회 추출과 동일."""
+    code = """
+    entity a is generic ( WIDTH : integer := 16; D : integer := WIDTH / 4 );
+      port ( x : in std_logic_vector(WIDTH-1 downto 0); y : out unsigned(D downto 0) ); end entity;
+    entity b is generic ( WIDTH : integer := 2 ); port ( x : in std_logic_vector(WIDTH-1 downto 0) ); end entity;
+    architecture rtl of a is signal s : std_logic_vector(WIDTH-1 downto 0); begin end architecture;
+    architecture rtl of b is signal s : std_logic_vector(WIDTH downto 0); begin end architecture;
+    """
+    tree = parse_to_tree(code)
+    summary = extract_design_from_tree(tree, code)
+    r = query_design(tree, code)
+    assert [(p.entity, p.name, p.width) for p in r.ports] == [
+        (e.module_name, p.name, p.width) for e in summary.entities for p in e.ports
+    ] == [("a", "x", 16), ("a", "y", 5), ("b", "x", 2)]
+    assert [(s.name, s.width) for s in r.signals] == [(s.name, s.width) for s in summary.signals] == [("s", 16), ("s", 3)]
+    assert query_ports(tree, code) == r.ports and query_signals(tree, code) == r.signals
+
+def test_query_restricted_to_changed_ranges():
+    """VhdlDocument 변경 구간으로 제한하면 해당 구간의 선언만 매칭."""
+    doc = VhdlDocument(CODE)
+    pos = CODE.index("signal a, b")
+    doc.edit(pos + len("signal a, b"), pos + len("signal a, b"), ", c")
+    ranges = doc.reparse()
+    r = query_design(doc.tree, doc.source, ranges)
+    assert [s.name for s in r.signals] == ["a", "b", "c"]
+    assert r.ports == [] and r.instances == []
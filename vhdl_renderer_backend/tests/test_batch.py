@@ -0,0 +1,52 @@
+"""
+일괄 파싱(batch) 테스트.
+- 파일 탐색, 병렬/순차 결과 동일성, CLI 통합 출력·실패 보고서
+"""
+import json
+from pathlib import Path
+
+try:
+    from vhdl_renderer_backend.core.batch import discover_files, run_batch
+    from vhdl_renderer_backend.main import main
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.batch import discover_files, run_batch
+    from main import main
+
+DIR = Path(__file__).resolve().parent / "test_data"
+
+
+def test_discover_files_recursive_and_filelist(tmp_path):
+    """디렉터리 재귀 탐색 + 파일 목록(상대 경로) 입력."""
+    files = discover_files([DIR])
+    names = {p.name for p in files}
+    assert "top.vhd" in names and "test_process_fsm.vhd" in names
+    listing = tmp_path / "files.txt"
+    listing.write_text(f"# 목록\n{DIR / 'and_gate.vhd'}\n\nrel.vhd\n", encoding="utf-8")
+    listed = discover_files([listing])
+    assert listed == sorted([DIR / "and_gate.vhd", tmp_path / "rel.vhd"])
+
+
+def test_run_batch_parallel_matches_serial():
+    """프로세스 풀 병렬 결과가 순차 결과와 동일 (완료 순서만 다름)."""
+    files = discover_files([DIR / "vhdl_project"])
+    serial = {r.path: r.to_dict()["entities"] for r in run_batch(files, jobs=1)}
+    parallel = {r.path: r.to_dict()["entities"] for r in run_batch(files, jobs=2, chunk_size=2)}
+    assert serial == parallel
+    assert len(serial) == len(files)
+
+
+def test_batch_cli_writes_output_and_failures(tmp_path):
+    """batch CLI: 통합 JSON + 실패 보고서, 실패가 있으면 종료 코드 1."""
+    listing = tmp_path / "files.txt"
+    listing.write_text(f"{DIR / 'and_gate.vhd'}\nmissing.vhd\n", encoding="utf-8")
+    out = tmp_path / "out.json"
+    rc = main(["batch", str(listing), "-o", str(out), "-j", "1", "-q", "--no-cache"])
+    assert rc == 1
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert data["summary"]["files"] == 2 and data["summary"]["failed"] == 1
+    ok = next(f for f in data["files"] if f["error"] is None)
+    assert ok["entities"][0]["module_name"] == "AND_GATE"
+    failures = json.loads((tmp_path / "out_failures.json").read_text(encoding="utf-8"))
+    assert failures["failed"] == 1 and failures["files"][0]["path"].endswith("missing.vhd")
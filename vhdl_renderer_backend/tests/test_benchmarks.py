@@ -0,0 +1,43 @@
+"""
+벤치마크 묶음 테스트 (측정값이 아니라 동작만 확인).
+- 합성 코퍼스 결정성·파싱 가능, 작은 규모 run_suite 결과 형식, 기준 결과 비교 회귀 판정
+"""
+from pathlib import Path
+
+try:
+    from vhdl_renderer_backend.benchmarks.corpus import CorpusSpec, generate_to_size, generate_vhdl
+    from vhdl_renderer_backend.benchmarks.suite import compare, run_suite
+    from vhdl_renderer_backend.core import parse_entities, preprocess
+    from vhdl_renderer_backend.core.ast_parser import parse_to_tree
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from benchmarks.corpus import CorpusSpec, generate_to_size, generate_vhdl
+    from benchmarks.suite import compare, run_suite
+    from core import parse_entities, preprocess
+    from core.ast_parser import parse_to_tree
+
+
+def test_corpus_is_deterministic_and_parses():
+    spec = CorpusSpec(entities=4, ports=5, signals=3, processes=2, depth=4, seed=3)
+    code = generate_vhdl(spec)
+    assert code == generate_vhdl(spec) and code != generate_vhdl(CorpusSpec(entities=4, seed=4))
+    assert not parse_to_tree(code).root_node.has_error
+    entities = parse_entities(preprocess(code))
+    assert [e.module_name for e in entities] == ["ent_0", "ent_1", "ent_2", "ent_3"]
+    assert all(len(e.ports) == 7 for e in entities)  # clk, rst + ports
+    big = generate_to_size(50_000, spec)
+    assert len(big.encode("utf-8")) >= 50_000 and big.startswith(code[: len(code) // 2])
+
+
+def test_run_suite_rows_and_regression_compare():
+    result = run_suite([0.01], ["preprocess", "parse_to_tree"], CorpusSpec(), repeat=1)
+    rows = result["results"]
+    assert [r["case"] for r in rows] == ["preprocess", "parse_to_tree"]
+    assert all(r["bytes"] >= 10_000 and r["mb_s"] > 0 and r["peak_bytes"] >= 0 for r in rows)
+    assert "nodes_s" not in rows[0] and rows[1]["nodes"] > 0
+    assert result["meta"]["spec"]["ports"] == CorpusSpec.ports
+
+    slower = {"results": [dict(r, best_s=r["best_s"] * 2) for r in rows]}
+    assert [c["regression"] for c in compare(result, slower, tolerance=0.5)] == [True, True]
+    assert not any(c["regression"] for c in compare(result, result))
@@ -0,0 +1,93 @@
+"""
+파싱 예산·취소 테스트.
+- 시간/크기 예산 초과, 다른 스레드에서 취소, 예산 파싱 후 Parser 풀 상태, 정규식 대체와 결과 기록(캐시 제외), batch CLI
+"""
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+try:
+    from vhdl_renderer_backend.benchmarks.corpus import generate_to_size
+    from vhdl_renderer_backend.core import CancelToken, ParseBudget, ParseBudgetExceeded, parse_entities, preprocess
+    from vhdl_renderer_backend.core.ast_parser import parse_to_tree
+    from vhdl_renderer_backend.core.batch import parse_file, run_batch
+    from vhdl_renderer_backend.core.cache import ParseCache
+    from vhdl_renderer_backend.main import main
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from benchmarks.corpus import generate_to_size
+    from core import CancelToken, ParseBudget, ParseBudgetExceeded, parse_entities, preprocess
+    from core.ast_parser import parse_to_tree
+    from core.batch import parse_file, run_batch
+    from core.cache import ParseCache
+    from main import main
+
+DIR = Path(__file__).resolve().parent / "test_data"
+BIG = generate_to_size(1 << 20)
+
+
+def test_budget_time_and_size_limits():
+    code = (DIR / "vhdl_project" / "top.vhd").read_text(encoding="utf-8")
+    plain = parse_to_tree(code)
+    bounded = parse_to_tree(code, ParseBudget(time_s=30, max_bytes=1 << 20))
+    assert str(bounded.root_node) == str(plain.root_node)
+
+    with pytest.raises(ParseBudgetExceeded) as exc:
+        parse_to_tree(code, ParseBudget(max_bytes=100))
+    assert exc.value.reason == "size"
+    t0 = time.perf_counter()
+    with pytest.raises(ParseBudgetExceeded) as exc:
+        parse_to_tree(BIG, ParseBudget(time_s=0.01))
+    assert exc.value.reason == "time" and time.perf_counter() - t0 < 0.2
+
+    # 중단 후에도 풀의 Parser 는 제한 없이 처음부터 파싱 (timeout 이 남아 있으면 ValueError)
+    assert not parse_to_tree(BIG).root_node.has_error
+    assert str(parse_to_tree(code).root_node) == str(plain.root_node)
+
+
+def test_cancel_from_another_thread():
+    token = CancelToken()
+    threading.Timer(0.02, token.cancel).start()
+    t0 = time.perf_counter()
+    with pytest.raises(ParseBudgetExceeded) as exc:
+        parse_to_tree(BIG, cancel=token)
+    assert exc.value.reason == "cancelled" and time.perf_counter() - t0 < 0.2
+    with pytest.raises(ParseBudgetExceeded):
+        parse_to_tree("entity a is end entity;", cancel=token)  # 이미 취소됨
+
+
+def test_parse_file_falls_back_and_skips_cache(tmp_path):
+    src = tmp_path / "a.vhd"
+    src.write_text("entity a is port ( x : in bit; y : out bit_vector(3 downto 0) ); end entity;", encoding="utf-8")
+    result = parse_file(src, ParseBudget(max_bytes=10))
+    assert result.ok and result.parser == "regex" and result.fallback == "size"
+    assert [e.to_dict() for e in result.entities] == [e.to_dict() for e in parse_entities(preprocess(src.read_text()))]
+    assert result.to_dict()["fallback"] == "size" and "fallback" not in parse_file(src).to_dict()
+
+    token = CancelToken()
+    token.cancel()
+    assert parse_file(src, cancel=token).error == "cancelled"
+    assert list(run_batch([src], jobs=1, cancel=token)) == []
+
+    cache = ParseCache(tmp_path / "cache")
+    [first] = run_batch([src], jobs=1, cache=cache, budget=ParseBudget(max_bytes=10))
+    [second] = run_batch([src], jobs=1, cache=cache)
+    assert first.fallback == "size" and not second.cached and second.parser == "ast"
+    cache.close()
+
+
+def test_batch_cli_time_budget(tmp_path):
+    project = tmp_path / "proj"
+    project.mkdir()
+    (project / "big.vhd").write_text(BIG, encoding="utf-8")
+    (project / "and_gate.vhd").write_text((DIR / "and_gate.vhd").read_text(encoding="utf-8"), encoding="utf-8")
+    out = tmp_path / "out.json"
+    rc = main(["batch", str(project), "-o", str(out), "-j", "1", "-q", "--no-cache", "--time-budget", "0.01"])
+    doc = json.loads(out.read_text(encoding="utf-8"))
+    assert rc == 0 and doc["summary"]["fallbacks"] == 1
+    big = next(f for f in doc["files"] if f["path"].endswith("big.vhd"))
+    assert big["fallback"] == "time" and big["parser"] == "regex" and len(big["entities"]) > 100
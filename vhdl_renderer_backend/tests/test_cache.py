@@ -0,0 +1,105 @@
+"""
+디스크 파싱 캐시 테스트.
+- 키 구성(내용/옵션), 저장·복원, LRU 크기 상한, batch 재실행 적중 (병렬 워커 조회), 단일 파일/batch 키 분리
+"""
+import json
+from pathlib import Path
+
+try:
+    from vhdl_renderer_backend.core.batch import discover_files, run_batch
+    from vhdl_renderer_backend.core.cache import ParseCache
+    from vhdl_renderer_backend.main import main
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.batch import discover_files, run_batch
+    from core.cache import ParseCache
+    from main import main
+
+DIR = Path(__file__).resolve().parent / "test_data"
+
+
+def test_cache_key_depends_on_content_and_options(tmp_path):
+    """같은 내용·옵션이면 같은 키, 하나라도 다르면 다른 키."""
+    with ParseCache(tmp_path) as cache:
+        k = cache.key(b"entity a is end;")
+        assert k == cache.key("entity a is end;")
+        assert k != cache.key(b"entity b is end;")
+        assert cache.key(b"x", {"normalize": True}) != cache.key(b"x", {"normalize": False})
+
+
+def test_cache_roundtrip_persists(tmp_path):
+    """put → flush 후 새 인스턴스에서 조회 가능."""
+    with ParseCache(tmp_path) as cache:
+        key = cache.key(b"data")
+        assert cache.get(key) is None
+        cache.put(key, {"entities": [], "n": 1})
+    with ParseCache(tmp_path) as cache:
+        assert cache.get(key) == {"entities": [], "n": 1}
+        assert cache.stats()["hits"] == 1
+
+
+def test_cache_lru_eviction(tmp_path):
+    """크기 상한 초과 시 가장 오래 접근하지 않은 항목부터 삭제."""
+    import os
+
+    blob = os.urandom(2000).hex()  # 압축 후에도 수 KB
+    with ParseCache(tmp_path) as cache:
+        keys = [cache.key(str(i)) for i in range(3)]
+        for k in keys[:2]:
+            cache.put(k, {"v": blob})
+        cache.flush()
+        cache.max_bytes = limit = cache.stats()["bytes"] * 5 // 4  # 2개까지만 수용
+        cache.get(keys[0])  # keys[0] 최근 접근 → keys[1] 이 가장 오래됨
+        cache.flush()
+        cache.put(keys[2], {"v": blob})
+        cache.flush()
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+        assert cache.stats()["bytes"] <= limit
+
+
+def test_run_batch_warm_cache_hits(tmp_path):
+    """두 번째 실행은 전부 캐시 적중, 결과는 첫 실행과 동일."""
+    files = discover_files([DIR / "vhdl_project"])
+    with ParseCache(tmp_path) as cache:
+        cold = {r.path: r.to_dict()["entities"] for r in run_batch(files, jobs=1, cache=cache)}
+    with ParseCache(tmp_path) as cache:
+        warm = list(run_batch(files, jobs=1, cache=cache))
+    assert all(r.cached for r in warm)
+    assert {r.path: r.to_dict()["entities"] for r in warm} == cold
+
+
+def test_single_file_cli_uses_cache(tmp_path):
+    """단일 파일 CLI: --cache-dir 로 저장 후 재실행 시 같은 출력."""
+    src = DIR / "and_gate.vhd"
+    out1, out2 = tmp_path / "o1.json", tmp_path / "o2.json"
+    assert main([str(src), "-o", str(out1), "--cache-dir", str(tmp_path / "c")]) == 0
+    assert main([str(src), "-o", str(out2), "--cache-dir", str(tmp_path / "c")]) == 0
+    assert json.loads(out1.read_text(encoding="utf-8")) == json.loads(out2.read_text(encoding="utf-8"))
+    with ParseCache(tmp_path / "c") as cache:
+        assert cache.stats()["entries"] == 1
+
+
+def test_run_batch_workers_look_up_cache(tmp_path):
+    """병렬 실행: 워커가 읽기 전용으로 조회하고 부모가 적중 통계·새 항목을 기록."""
+    files = discover_files([DIR / "vhdl_project"])
+    with ParseCache(tmp_path) as cache:
+        cold = list(run_batch(files, jobs=2, chunk_size=1, cache=cache))
+        assert not any(r.cached for r in cold) and cache.misses == len(files)
+    with ParseCache(tmp_path) as cache:
+        warm = list(run_batch(files, jobs=2, chunk_size=1, cache=cache))
+        assert all(r.cached for r in warm) and cache.hits == len(files) and cache.misses == 0
+    assert {r.path: r.to_dict()["entities"] for r in warm} == {r.path: r.to_dict()["entities"] for r in cold}
+    assert "cache_key" not in warm[0].to_dict()
+
+
+def test_single_file_and_batch_keys_do_not_mix(tmp_path):
+    """같은 캐시 디렉터리라도 단일 파일 CLI(정규식) 결과를 batch(AST) 에 돌려주지 않는다."""
+    src = DIR / "and_gate.vhd"
+    assert main([str(src), "-o", str(tmp_path / "o.json"), "--cache-dir", str(tmp_path / "c")]) == 0
+    with ParseCache(tmp_path / "c") as cache:
+        [first] = run_batch([src], jobs=1, cache=cache)
+        [second] = run_batch([src], jobs=1, cache=cache)
+        assert not first.cached and second.cached and second.parser == "ast"
+        assert cache.stats()["entries"] == 2
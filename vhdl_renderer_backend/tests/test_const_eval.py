@@ -0,0 +1,124 @@
+"""
+상수 표현식 평가·generic 인식 포트 폭 테스트.
+- 산술/속성/기수 리터럴, 파싱 시 generic 기본값 기준 폭, 인스턴스별 바인딩 메모이즈 (패키지 상수, 부모 generic 전달)
+"""
+from pathlib import Path
+
+try:
+    from vhdl_renderer_backend.core import parse_entities, preprocess
+    from vhdl_renderer_backend.core.arch_parser import extract_architectures_from_tree
+    from vhdl_renderer_backend.core.ast_parser import extract_design_from_tree, parse_to_tree
+    from vhdl_renderer_backend.core.const_eval import WidthResolver, eval_expr, subtype_width
+    from vhdl_renderer_backend.core.elaborate import DesignLibrary, elaborate
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core import parse_entities, preprocess
+    from core.arch_parser import extract_architectures_from_tree
+    from core.ast_parser import extract_design_from_tree, parse_to_tree
+    from core.const_eval import WidthResolver, eval_expr, subtype_width
+    from core.elaborate import DesignLibrary, elaborate
+
+
+def test_eval_expr_arithmetic_and_attributes():
+    """VHDL 정수 의미: / 는 0 쪽 버림, mod/rem 부호, ** 우선순위, 'length, 미해결은 None."""
+    env = {"w": 12, "c_bus": 32}
+    assert eval_expr("W-1", env) == 11
+    assert eval_expr("2**W / 1_024 + work.pkg.C_BUS", env) == 36
+    assert [eval_expr(e) for e in ("-7 / 2", "7 mod (-2)", "-7 rem 2", "16#FF#", "2E3")] == [-3, -1, -1, 255, 2000]
+    assert eval_expr("maximum(W, 3) * abs(-2)", env) == 24
+    assert [eval_expr(e) for e in ("16#E0#", "16#FE#", "16#0E#", "2#1#E3", "16#E#e1")] == [224, 254, 14, 8, 224]
+    assert subtype_width("std_logic_vector(16#0E# downto 0)") == ("std_logic_vector", 15, None)
+    assert eval_expr("d'length - 1", ranges={"d": (15, 8, True)}) == 7
+    assert eval_expr("clog2(W)", env) is None and eval_expr("UNKNOWN + 1", env) is None and eval_expr("1.5") is None
+    assert subtype_width("ieee.numeric_std.unsigned ( 4*8-1 downto 0 )") == ("unsigned", 32, None)
+    assert subtype_width("std_logic_vector(W - 1 downto 0)", env) == ("std_logic_vector", 12, "W - 1 downto 0")
+    assert subtype_width("std_logic_vector(W - 1 downto 0)") == ("std_logic_vector", 1, "W - 1 downto 0")
+
+
+def test_port_width_uses_generic_defaults_in_both_parsers():
+    """파싱 시 폭은 generic 기본값 기준, 범위 원문은 Port.range. AST·정규식 추출이 동일."""
+    code = """
+    entity fifo is
+      generic ( DW : positive := 8; AW : natural := DW / 2; NAME : string := "f" );
+      port ( d : in std_logic_vector(DW-1 downto 0); a : in unsigned(AW downto 0);
+             c : out std_logic_vector(7 downto 0); x : out std_logic_vector(XW-1 downto 0) );
+    end entity;
+    """
+    ast = extract_design_from_tree(parse_to_tree(code), code).entities[0]
+    assert [(p.name, p.width, p.range) for p in ast.ports] == [
+        ("d", 8, "DW-1 downto 0"), ("a", 5, "AW downto 0"), ("c", 8, None), ("x", 1, "XW-1 downto 0"),
+    ]
+    assert "range" not in ast.ports[2].to_dict()
+    assert [e.to_dict() for e in parse_entities(preprocess(code))] == [ast.to_dict()]
+
+
+def test_signal_width_uses_owning_entity_generics():
+    """architecture 의 signal 폭은 자기 entity 의 generic 기본값 기준 (단일 순회·architecture 추출 동일)."""
+    code = """
+    entity a is generic ( WIDTH : integer := 16 ); port ( d : in std_logic_vector(WIDTH-1 downto 0) ); end entity;
+    entity b is generic ( WIDTH : integer := 4 ); port ( d : in std_logic_vector(WIDTH-1 downto 0) ); end entity;
+    architecture rtl of a is signal s, t : std_logic_vector(WIDTH-1 downto 0); begin end architecture;
+    architecture rtl of b is signal s : unsigned(2*WIDTH-1 downto 0); begin end architecture;
+    architecture rtl of c is signal s : std_logic_vector(WIDTH-1 downto 0); begin end architecture;
+    """
+    tree = parse_to_tree(code)
+    design = extract_design_from_tree(tree, code)
+    assert [(s.name, s.width) for s in design.signals] == [("s", 16), ("t", 16), ("s", 8), ("s", 1)]
+    archs = extract_architectures_from_tree(tree, code)
+    assert [(s.name, s.width) for a in archs for s in a.signals] == [(s.name, s.width) for s in design.signals]
+
+
+def test_package_signal_width_ignores_previous_entity_generics():
+    """package 안 signal 은 앞 entity 의 generic 기본값을 쓰지 않는다."""
+    code = """
+    entity a is generic ( WIDTH : integer := 16 ); port ( d : in std_logic_vector(WIDTH-1 downto 0) ); end entity;
+    package p is signal s : std_logic_vector(WIDTH-1 downto 0); end package;
+    """
+    design = extract_design_from_tree(parse_to_tree(code), code)
+    assert design.entities[0].ports[0].width == 16
+    assert [(s.name, s.width) for s in design.signals] == [("s", 1)]
+
+
+def test_width_cache_keyed_by_declaration_source():
+    """다른 파일의 같은 이름 entity 는 폭 캐시를 공유하지 않는다."""
+    narrow, wide = (
+        parse_entities(f"entity ip is port ( d : in std_logic_vector({n} downto 0) ); end entity;")[0] for n in (3, 31)
+    )
+    resolver = WidthResolver()
+    assert resolver.resolve(narrow, source="a/ip.vhd").widths == {"d": 4}
+    assert resolver.resolve(wide, source="b/ip.vhd").widths == {"d": 32}
+    assert resolver.resolve(narrow, source="a/ip.vhd").widths == {"d": 4}
+
+
+def test_instance_widths_memoized_by_generic_binding():
+    """같은 바인딩 값의 인스턴스 1,000개는 계산 1회 공유. 부모 generic·패키지 상수로 실제값 계산."""
+    library = DesignLibrary()
+    library.add_source(
+        "package cfg is constant C_BUS : integer := 16; constant C_WIDE : integer := C_BUS * 2; end package;\n"
+        "entity ip is generic ( W : integer := 4; D : integer := W * 2 );\n"
+        "  port ( din : in std_logic_vector(W-1 downto 0); dd : out std_logic_vector(D-1 downto 0) ); end entity;\n"
+        "architecture rtl of ip is begin end architecture;\n"
+    )
+    many = "\n".join(f"  u{i} : entity work.ip generic map ( W => P ) port map ( din => open );" for i in range(1000))
+    library.add_source(
+        "entity mid is generic ( P : integer := 2 ); port ( a : in bit ); end entity;\n"
+        f"architecture rtl of mid is begin\n{many}\nend architecture;\n"
+        "entity top is end entity;\n"
+        "architecture rtl of top is begin\n"
+        "  m0 : entity work.mid generic map ( P => work.cfg.C_BUS / 2 );\n"
+        "  m1 : entity work.mid generic map ( 8 );\n"
+        "  w0 : entity work.ip generic map ( W => C_WIDE, D => open );\n"
+        "end architecture;\n"
+    )
+    result = elaborate(library, "top")
+    rows = {path: r for path, _, _, r in result.walk_widths()}
+    assert rows["top.m0.u0"].widths == {"din": 8, "dd": 16}
+    assert rows["top.m1.u999"].widths == {"din": 8, "dd": 16}
+    assert rows["top.m0.u0"] is rows["top.m1.u999"]
+    assert rows["top.w0"].generics == {"w": 32, "d": 64}
+    stats = result.resolver.stats()
+    assert stats["bindings"] == 4 and stats["hits"] == 2000  # top, mid(P=8) 공유, ip(W=8), ip(W=32)
+    tree = result.to_dict(tree_depth=1)["tree"]
+    assert tree[2] == {"path": "top.w0", "depth": 1, "unit": "ip(rtl)", "generics": {"w": 32, "d": 64},
+                       "widths": {"din": 32, "dd": 64}}
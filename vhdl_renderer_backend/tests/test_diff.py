@@ -0,0 +1,105 @@
+"""
+구조 diff (JSON Patch) 테스트.
+- 안정 키 매칭 최소 연산, 임의 변경 왕복(apply_patch), 단일/batch CLI --diff-from, watch patch 모드
+"""
+import json
+import random
+from pathlib import Path
+
+try:
+    from vhdl_renderer_backend.core import apply_patch, diff, parse_entities, preprocess
+    from vhdl_renderer_backend.core.watch import WatchSession
+    from vhdl_renderer_backend.main import main
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core import apply_patch, diff, parse_entities, preprocess
+    from core.watch import WatchSession
+    from main import main
+
+DIR = Path(__file__).resolve().parent / "test_data"
+
+
+def _entity(name, ports):
+    return {"module_name": name, "ports": [{"name": n, "direction": "in", "type": "std_logic", "width": w}
+                                           for n, w in ports], "generics": []}
+
+
+def test_diff_matches_by_stable_keys():
+    """이름으로 짝지어 위치 이동·폭 변경만 최소 연산으로, 스칼라 목록은 통째로 교체."""
+    old = [_entity("a", [("clk", 1), ("d", 8), ("q", 8)]), _entity("b/c~", [("x", 1)])]
+    new = [_entity("b/c~", [("x", 1)]), _entity("a", [("clk", 1), ("q", 16), ("d", 8), ("en", 1)])]
+    patch = diff(old, new)
+    assert patch == [
+        {"op": "move", "from": "/1", "path": "/0"},
+        {"op": "move", "from": "/1/ports/2", "path": "/1/ports/1"},
+        {"op": "add", "path": "/1/ports/3", "value": new[1]["ports"][3]},
+        {"op": "replace", "path": "/1/ports/1/width", "value": 16},
+    ]
+    assert apply_patch(old, patch) == new and old[0]["ports"][1]["width"] == 8
+    assert diff(old, old) == []
+
+    doc = {"summary": {"files": 1, "elapsed_s": 0.1}, "files": [{"path": "x/y.vhd", "sensitivity": ["a"]}]}
+    changed = {"summary": {"files": 1, "elapsed_s": 0.7}, "files": [{"path": "x/y.vhd", "sensitivity": ["a", "b"]}]}
+    assert diff(doc, changed, ignore=("elapsed_s",)) == [
+        {"op": "replace", "path": "/files/0/sensitivity", "value": ["a", "b"]},
+    ]
+    assert diff({"a~b/c": 1}, {}) == [{"op": "remove", "path": "/a~0b~1c"}]
+
+
+def test_diff_roundtrip_random_edits():
+    """임의 추가/삭제/순서 변경/값 변경 후에도 apply_patch(old, diff(old, new)) == new."""
+    rng = random.Random(7)
+    for _ in range(200):
+        old = [_entity(f"e{i}", [(f"p{j}", rng.randint(1, 4)) for j in range(rng.randint(0, 5))])
+               for i in range(rng.randint(0, 6))]
+        new = json.loads(json.dumps(old))
+        rng.shuffle(new)
+        for e in new:
+            rng.shuffle(e["ports"])
+            e["ports"] = [p for p in e["ports"] if rng.random() > 0.2]
+            e["ports"] += [{"name": f"n{k}", "direction": "out", "type": "bit", "width": 1} for k in range(rng.randint(0, 2))]
+            for p in e["ports"]:
+                if rng.random() < 0.3:
+                    p["width"] += 1
+        new = [e for e in new if rng.random() > 0.15] + [_entity(f"new{rng.randint(0, 3)}", [("z", 2)])][: rng.randint(0, 1)]
+        patch = diff(old, new)
+        assert apply_patch(old, patch) == new
+        assert all(op["op"] in ("add", "remove", "replace", "move") for op in patch)
+
+
+def test_cli_diff_from_writes_small_patch(tmp_path):
+    """같은 출력 파일을 이전 결과로 주면 바뀐 포트만 패치로 저장, 변경 없으면 빈 패치."""
+    src = tmp_path / "top.vhd"
+    src.write_text("entity top is port ( a : in bit; q : out bit_vector(3 downto 0) ); end entity;", encoding="utf-8")
+    out = tmp_path / "top.json"
+    assert main([str(src), "-o", str(out), "--no-cache"]) == 0
+    previous = json.loads(out.read_text(encoding="utf-8"))
+    src.write_text("entity top is port ( a : in bit; q : out bit_vector(7 downto 0) ); end entity;", encoding="utf-8")
+    assert main([str(src), "-o", str(out), "--no-cache", "--diff-from", str(out)]) == 0
+    patch = json.loads((tmp_path / "top.patch.json").read_text(encoding="utf-8"))
+    assert patch == [{"op": "replace", "path": "/ports/1/width", "value": 8}]
+    assert apply_patch(previous, patch) == json.loads(out.read_text(encoding="utf-8"))
+
+    batch_out = tmp_path / "batch.json"
+    project = str(DIR / "vhdl_project")
+    assert main(["batch", project, "-o", str(batch_out), "-j", "1", "-q", "--no-cache"]) == 0
+    assert main(["batch", project, "-o", str(batch_out), "-j", "1", "-q", "--no-cache", "--format", "compact",
+                 "--diff-from", str(batch_out), "--patch-output", str(tmp_path / "p.json")]) == 0
+    assert json.loads((tmp_path / "p.json").read_text(encoding="utf-8")) == []
+    assert main([str(src), "--format", "ndjson", "--diff-from", str(out)]) == 1
+
+
+def test_watch_session_patch_mode(tmp_path):
+    a = tmp_path / "a.vhd"
+    code = "entity a is port ( clk : in std_logic; q : out std_logic ); end entity;"
+    a.write_text(code, encoding="utf-8")
+    session = WatchSession([tmp_path], backend="poll", patch=True)
+    [ev] = session.load()
+    assert "entities" not in ev and ev["patch"][0]["op"] == "add"
+    before = [e.to_dict() for e in session.entities[str(a)]]
+    a.write_text(code.replace("q : out std_logic", "q : out std_logic_vector(3 downto 0)"), encoding="utf-8")
+    [ev] = session.apply([str(a)])
+    after = [e.to_dict() for e in parse_entities(preprocess(a.read_text(encoding="utf-8")))]
+    assert apply_patch(before, ev["patch"]) == after
+    assert {"op": "replace", "path": "/0/ports/1/width", "value": 4} in ev["patch"]
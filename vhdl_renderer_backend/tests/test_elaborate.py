@@ -0,0 +1,101 @@
+"""
+계층 elaboration 테스트.
+- 파일 간 인스턴스 연결, entity 별 하위 계층 공유(메모이즈), 단계별 인스턴스 수, 미해결/재귀, CLI
+"""
+import json
+from pathlib import Path
+
+try:
+    from vhdl_renderer_backend.core.elaborate import DesignLibrary, elaborate
+    from vhdl_renderer_backend.main import main
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.elaborate import DesignLibrary, elaborate
+    from main import main
+
+DIR = Path(__file__).resolve().parent / "test_data"
+
+
+def _write_hierarchy(root: Path, fanout: int = 20) -> None:
+    """top → mid ×10 (entity 인스턴스) → leaf ×fanout (component 인스턴스), 파일 3개."""
+    (root / "leaf.vhd").write_text(
+        "entity leaf is port ( a : in bit; y : out bit ); end entity;\n"
+        "architecture rtl of leaf is begin end architecture;\n",
+        encoding="utf-8",
+    )
+    insts = "\n".join(f"  l{i} : leaf port map ( a => a, y => open );" for i in range(fanout))
+    (root / "mid.vhd").write_text(
+        "entity mid is port ( a : in bit ); end entity;\n"
+        "architecture rtl of mid is\n"
+        "  component leaf is port ( a : in bit; y : out bit ); end component;\n"
+        f"begin\n{insts}\nend architecture;\n",
+        encoding="utf-8",
+    )
+    mids = "\n".join(f"  m{i} : entity work.mid(rtl) port map ( a => a );" for i in range(10))
+    (root / "top.vhd").write_text(
+        "entity top is port ( a : in bit ); end entity;\n"
+        f"architecture rtl of top is begin\n{mids}\n  bb : black_box port map ( x => a );\nend architecture;\n",
+        encoding="utf-8",
+    )
+
+
+def test_elaborate_shares_sub_hierarchy(tmp_path):
+    """mid 10개 × leaf 400개: 인스턴스 4,011개지만 unit 은 3개만 분석·공유."""
+    _write_hierarchy(tmp_path, fanout=400)
+    library = DesignLibrary.from_paths([tmp_path])
+    result = elaborate(library, "TOP")
+    assert result.levels == [1, 11, 4000]
+    assert result.instance_count == 4011
+    assert len(result.units) == 3
+    mids = [c.target for c in result.top.children if c.target is not None]
+    assert len(mids) == 10 and all(m is mids[0] for m in mids)
+    assert mids[0].architecture == "rtl" and Path(mids[0].path).name == "mid.vhd"
+    [(where, child)] = result.unresolved()
+    assert where == "top(rtl)" and child.unit == "black_box" and "블랙박스" in child.reason
+    paths = [p for p, _, _ in result.walk(max_depth=2)]
+    assert len(paths) == 4011 and paths[:2] == ["top.m0", "top.m0.l0"]
+    assert result.elapsed_s >= 0
+
+
+def test_elaborate_configuration_architecture_and_recursion():
+    """configuration 인스턴스, architecture 명시 선택, 재귀 인스턴스화는 미해결로 기록."""
+    library = DesignLibrary()
+    library.add_source(
+        "entity cell is end entity;\n"
+        "architecture a1 of cell is begin end architecture;\n"
+        "architecture a2 of cell is begin u : entity work.cell(a1); end architecture;\n"
+        "configuration cfg of cell is for a2 end for; end configuration;\n"
+    )
+    library.add_source(
+        "entity top is end entity;\n"
+        "architecture rtl of top is begin\n"
+        "  c0 : configuration work.cfg;\n"
+        "  c1 : entity work.cell(a1);\n"
+        "  r0 : entity work.top;\n"
+        "end architecture;\n"
+    )
+    result = elaborate(library, "top")
+    c0, c1, r0 = result.top.children
+    assert c0.target.key == "cell(a2)" and c1.target.key == "cell(a1)"
+    assert c0.target.children[0].target is c1.target
+    assert r0.target is None and r0.reason == "재귀 인스턴스화"
+    assert result.levels == [1, 3, 1]
+
+
+def test_elaborate_project_and_cli(tmp_path, capsys):
+    """vhdl_project: top 아래 6개 인스턴스가 각 파일의 entity 로 연결. CLI 는 단계별 표 + JSON."""
+    library = DesignLibrary.from_paths([DIR / "vhdl_project"])
+    result = elaborate(library, "top")
+    assert result.levels == [1, 6] and result.unresolved() == []
+    assert {Path(c.target.path).name for c in result.top.children} == {
+        "uart_rs232.vhd", "memory_interface.vhd", "led_controller.vhd",
+        "spi_master.vhd", "bus_arbiter.vhd", "fifo_sync.vhd",
+    }
+
+    out = tmp_path / "elab.json"
+    assert main(["elaborate", str(DIR / "vhdl_project"), "--top", "top", "-o", str(out), "--tree-depth", "1", "-j", "1"]) == 0
+    assert "인스턴스 6개" in capsys.readouterr().out
+    data = json.loads(out.read_text(encoding="utf-8"))
+    assert data["levels"] == [1, 6] and [t["path"] for t in data["tree"]][0] == "top.u_uart"
+    assert main(["elaborate", str(DIR / "vhdl_project"), "--top", "nope"]) == 1
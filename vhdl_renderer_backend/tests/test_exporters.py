@@ -0,0 +1,242 @@
+"""
+Exporter 테스트.
+- 바이너리 AST (.vast) 저장/지연 로딩
+- Graphviz DOT 스트리밍 (클러스터, 포트 색, LOD 옵션, dot 미설치 시 건너뜀)
+- JSON 형식 (pretty/compact/ndjson), 원자적 교체, CLI --format
+"""
+import io
+import json
+import os
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+try:
+    from vhdl_renderer_backend.core.ast_parser import parse_to_tree
+    from vhdl_renderer_backend.core.arch_parser import parse_architecture
+    from vhdl_renderer_backend.core.ast_parser import extract_design_from_tree
+    from vhdl_renderer_backend.exporters.binary_exporter import export_ast_binary, load_ast_binary
+    from vhdl_renderer_backend.exporters.dot_exporter import PORT_STYLE, export_dot, write_dot
+    from vhdl_renderer_backend.exporters.json_exporter import NdjsonWriter, atomic_open, export_json
+    from vhdl_renderer_backend.main import main
+    from vhdl_renderer_backend.models.graph_model import NODE_ENTITY, NODE_INSTANCE, NODE_PORT, GraphBuilder, build_graph
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.ast_parser import parse_to_tree
+    from core.arch_parser import parse_architecture
+    from core.ast_parser import extract_design_from_tree
+    from exporters.binary_exporter import export_ast_binary, load_ast_binary
+    from exporters.dot_exporter import PORT_STYLE, export_dot, write_dot
+    from exporters.json_exporter import NdjsonWriter, atomic_open, export_json
+    from main import main
+    from models.graph_model import NODE_ENTITY, NODE_INSTANCE, NODE_PORT, GraphBuilder, build_graph
+
+DIR = Path(__file__).resolve().parent / "test_data"
+
+
+def test_binary_ast_roundtrip(tmp_path):
+    """바이너리 AST 가 원본 트리와 type/범위/부모-자식 구조가 동일한지."""
+    code = (DIR / "micro" / "test_process.vhd").read_text(encoding="utf-8")
+    tree = parse_to_tree(code)
+    out = export_ast_binary(tree, code, tmp_path / "ast.vast")
+    with load_ast_binary(out) as ast:
+        assert len(ast) == tree.root_node.descendant_count
+        stack = [(ast.root, tree.root_node)]
+        while stack:
+            b, t = stack.pop()
+            assert (b.type, b.start_byte, b.end_byte, b.is_named) == (t.type, t.start_byte, t.end_byte, t.is_named)
+            b_children, t_children = b.children, t.children
+            assert len(b_children) == len(t_children)
+            for bc in b_children:
+                assert bc.parent.index == b.index
+            stack.extend(zip(b_children, t_children))
+        entity = next(ast.iter_nodes("entity_declaration"))
+        assert entity.text.startswith(b"entity REG is")
+        assert ast.types.count("entity_declaration") == 1
+
+
+def test_binary_ast_rejects_other_files(tmp_path):
+    """magic 이 다른 파일·헤더보다 짧은 파일은 ValueError."""
+    bad = tmp_path / "bad.vast"
+    for data in (b"not an ast" * 20, b"VHDLAST", b""):
+        bad.write_bytes(data)
+        with pytest.raises(ValueError):
+            load_ast_binary(bad)
+
+
+def test_binary_ast_rejects_truncated_sections(tmp_path):
+    """타입표·노드 배열·소스 중간에서 잘린 파일은 ValueError, 파일 핸들을 남기지 않는다."""
+    code = (DIR / "micro" / "test_process.vhd").read_text(encoding="utf-8")
+    data = Path(export_ast_binary(parse_to_tree(code), code, tmp_path / "ast.vast")).read_bytes()
+    _, _, n, _, _, types_off, nodes_off, source_off, source_len = struct.unpack_from("<8sIIIIQQQQ", data, 0)
+    fd_dir = Path("/proc/self/fd")
+    open_fds = len(list(fd_dir.iterdir())) if fd_dir.is_dir() else None
+    bad = tmp_path / "cut.vast"
+    for cut in (types_off + 3, nodes_off + n * 2 + 5, source_off - 1, source_off + source_len // 2):
+        bad.write_bytes(data[:cut])
+        with pytest.raises(ValueError, match="잘린"):
+            load_ast_binary(bad)
+    if open_fds is not None:
+        assert len(list(fd_dir.iterdir())) == open_fds
+
+def _top_design():
+    code = (DIR / "vhdl_project" / "top.vhd").read_text(encoding="utf-8")
+    return extract_design_from_tree(parse_to_tree(code), code).entities, parse_architecture(code)
+
+
+def _build_top_graph():
+    return build_graph(*_top_design())
+
+
+def test_dot_clusters_and_port_colors():
+    """entity/인스턴스마다 cluster, 방향별 포트 색, signal 경유 연결."""
+    out = io.StringIO()
+    counts = write_dot(_build_top_graph(), out)
+    text = out.getvalue()
+    assert text.startswith("digraph vhdl {") and text.rstrip().endswith("}")
+    assert text.count("subgraph cluster_") == counts["clusters"] == 1 + 6
+    assert 'label="u_uart : uart_rs232"' in text
+    for direction in ("in", "out", "inout"):
+        assert f'fillcolor="{PORT_STYLE[direction][0]}"' in text
+    assert text.count("{") == text.count("}")
+    assert counts["edges"] == text.count(" -> ")
+
+
+def test_dot_level_of_detail():
+    """포트 수 초과 인스턴스 접기, 내부 signal 숨기기 → 노드 감소, 연결은 접힌 노드/포트끼리 직접."""
+    graph = _build_top_graph()
+    full = write_dot(graph, io.StringIO())
+    out = io.StringIO()
+    lod = write_dot(graph, out, collapse_ports=10, hide_internal_signals=True)
+    text = out.getvalue()
+    assert lod["nodes"] < full["nodes"] and lod["clusters"] < full["clusters"]
+    assert "shape=ellipse" not in text and "shape=box3d" in text
+    assert f"n{graph.find('top.CLK_50')} -> n{graph.find('top.u_uart')};" in text
+
+    code = """
+entity chain is port ( din : in bit ); end entity;
+architecture rtl of chain is
+  component buf is port ( a : in bit; y : out bit ); end component;
+  signal s1 : bit;
+begin
+  u0 : buf port map ( a => din, y => s1 );
+  u1 : buf port map ( a => s1, y => open );
+end architecture;
+"""
+    chain = build_graph(extract_design_from_tree(parse_to_tree(code), code).entities, parse_architecture(code))
+    out = io.StringIO()
+    write_dot(chain, out, hide_internal_signals=True)
+    assert f"n{chain.find('chain.u0.y')} -> n{chain.find('chain.u1.a')};" in out.getvalue()
+
+
+def test_dot_max_depth_merges_deeper_instances():
+    """max_depth 아래 단계는 노드 1개, 더 깊은 포트의 연결은 그 노드로 합쳐짐."""
+    b = GraphBuilder()
+    top = b.add_node(NODE_ENTITY, "top")
+    clk = b.add_node(NODE_PORT, "clk", top, "in")
+    parent = top
+    for level in range(4):
+        parent = b.add_node(NODE_INSTANCE, f"u{level}", parent, ref=f"lvl{level}")
+        pin = b.add_node(NODE_PORT, "clk", parent, "in")
+        b.connect(pin, clk)
+    graph = b.build()
+    out = io.StringIO()
+    counts = write_dot(graph, out, max_depth=1)
+    text = out.getvalue()
+    u1 = graph.find("top.u0.u1")
+    assert counts["clusters"] == 2 and f"n{u1} [label=" in text
+    assert text.count(f"n{clk} -> n{u1};") == 1
+    assert graph.find("top.u0.u1.u2.clk") is not None and "u2" not in text
+
+
+def test_export_dot_skips_render_without_graphviz(tmp_path, monkeypatch):
+    """dot 실행 파일이 없으면 이미지 대신 .dot 경로를 반환."""
+    import shutil
+
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+    entities, archs = _top_design()
+    out = export_dot((entities, archs), tmp_path / "debug_graph", format="png")
+    assert out.endswith("debug_graph.dot") and Path(out).read_text(encoding="utf-8").startswith("digraph")
+    assert not (tmp_path / "debug_graph.png").exists()
+
+
+def test_json_formats_and_atomic_replace(tmp_path):
+    """compact 는 공백 없는 같은 내용, 쓰기 중 오류면 기존 파일 유지·임시 파일 없음."""
+    data = {"module_name": "이름", "ports": [{"name": "a", "width": 8}]}
+    pretty = Path(export_json(data, tmp_path / "p.json"))
+    compact = Path(export_json(data, tmp_path / "c.json", format="compact"))
+    assert json.loads(pretty.read_text(encoding="utf-8")) == json.loads(compact.read_text(encoding="utf-8")) == data
+    assert compact.read_text(encoding="utf-8") == '{"module_name":"이름","ports":[{"name":"a","width":8}]}'
+    assert "\n    " in pretty.read_text(encoding="utf-8")
+    with pytest.raises(ValueError):
+        export_json(data, tmp_path / "x.json", format="yaml")
+
+    with pytest.raises(RuntimeError):
+        with atomic_open(compact) as f:
+            f.write("{broken")
+            raise RuntimeError("중단")
+    assert json.loads(compact.read_text(encoding="utf-8")) == data
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["c.json", "p.json"]
+
+
+def test_atomic_write_mode_without_touching_umask(tmp_path, monkeypatch):
+    """새 파일은 umask 기본 권한, 기존 파일은 권한 유지. 프로세스 umask 는 바꾸지 않는다 (/proc 없으면 탐침 파일)."""
+    old = os.umask(0o027)
+    os.umask(old)
+    module = sys.modules[export_json.__module__]
+    try:
+        os.umask(0o027)
+        monkeypatch.setattr(os, "umask", lambda mask: pytest.fail("os.umask 호출"))
+        assert Path(export_json({}, tmp_path / "a.json")).stat().st_mode & 0o777 == 0o640
+        (tmp_path / "a.json").chmod(0o600)
+        assert Path(export_json({"x": 1}, tmp_path / "a.json")).stat().st_mode & 0o777 == 0o600
+
+        def no_proc(file, *args, **kwargs):
+            if file == "/proc/self/status":
+                raise OSError(file)
+            return open(file, *args, **kwargs)
+
+        monkeypatch.setattr(module, "open", no_proc, raising=False)
+        assert Path(export_json({}, tmp_path / "b.json")).stat().st_mode & 0o777 == 0o640
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.json", "b.json"]
+    finally:
+        monkeypatch.undo()
+        os.umask(old)
+
+def test_ndjson_lines_visible_before_close(tmp_path):
+    """NDJSON 은 한 줄씩 flush — 닫기 전에도 다른 리더가 완성된 줄을 읽을 수 있다."""
+    path = tmp_path / "out.ndjson"
+    with NdjsonWriter(path) as writer:
+        writer.write({"i": 0})
+        writer.write({"i": 1})
+        assert [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()] == [{"i": 0}, {"i": 1}]
+    assert writer.count == 2
+    export_json(({"i": i} for i in range(3)), path, format="ndjson")
+    assert path.read_text(encoding="utf-8") == '{"i":0}\n{"i":1}\n{"i":2}\n'
+
+
+def test_cli_format_option(tmp_path):
+    """batch/단일 파일/elaborate 의 --format: ndjson 은 레코드마다 한 줄 + 마지막 요약."""
+    project = DIR / "vhdl_project"
+    out = tmp_path / "batch.ndjson"
+    assert main(["batch", str(project), "-o", str(out), "-j", "1", "-q", "--no-cache", "--format", "ndjson"]) == 0
+    lines = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert [r["type"] for r in lines] == ["file"] * 7 + ["summary"]
+    assert lines[-1]["files"] == 7 and {Path(r["path"]).name for r in lines[:-1]} >= {"top.vhd", "fifo_sync.vhd"}
+
+    src = tmp_path / "two.vhd"
+    src.write_text("entity a is port ( x : in bit ); end;\nentity b is end;\n", encoding="utf-8")
+    single = tmp_path / "two.ndjson"
+    assert main([str(src), "-o", str(single), "--no-cache", "--format", "ndjson"]) == 0
+    assert [json.loads(line)["module_name"] for line in single.read_text(encoding="utf-8").splitlines()] == ["a", "b"]
+    assert main([str(src), "-o", str(tmp_path / "a.json"), "--no-cache", "--format", "compact"]) == 0
+    assert (tmp_path / "a.json").read_text(encoding="utf-8").startswith('{"module_name":"a","ports":[{')
+
+    elab = tmp_path / "elab.ndjson"
+    assert main(["elaborate", str(project), "--top", "top", "-o", str(elab), "--tree-depth", "1", "-j", "1",
+                 "--format", "ndjson"]) == 0
+    records = [json.loads(line) for line in elab.read_text(encoding="utf-8").splitlines()]
+    assert records[0]["type"] == "summary" and records[0]["levels"] == [1, 6]
+    assert [r["path"] for r in records if r["type"] == "instance"][0] == "top.u_uart"
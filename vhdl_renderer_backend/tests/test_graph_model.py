@@ -0,0 +1,111 @@
+"""
+CSR 연결 그래프 테스트.
+- Entity/Architecture 결과 → 그래프, fan-in/fan-out, 이웃, 도달 가능성, 배열 메모리 규모
+"""
+from pathlib import Path
+
+try:
+    from vhdl_renderer_backend.core.arch_parser import parse_architecture
+    from vhdl_renderer_backend.core.ast_parser import extract_design_from_tree, parse_to_tree
+    from vhdl_renderer_backend.models.graph_model import (
+        NODE_ENTITY, NODE_INSTANCE, NODE_PORT, NODE_SIGNAL, GraphBuilder, StringTable, build_graph,
+    )
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.arch_parser import parse_architecture
+    from core.ast_parser import extract_design_from_tree, parse_to_tree
+    from models.graph_model import (
+        NODE_ENTITY, NODE_INSTANCE, NODE_PORT, NODE_SIGNAL, GraphBuilder, StringTable, build_graph,
+    )
+
+DIR = Path(__file__).resolve().parent / "test_data"
+
+CODE = """
+entity chain is port ( din : in bit; dout : out bit ); end entity;
+architecture rtl of chain is
+  component buf is port ( a : in bit; y : out bit ); end component;
+  signal s1, s2 : bit;
+begin
+  u0 : buf port map ( a => din, y => s1 );
+  u1 : buf port map ( s1, s2 );
+  u2 : buf port map ( a => s2, y => dout );
+  u3 : buf port map ( a => s1, y => open );
+end architecture;
+"""
+
+
+def _graph(code):
+    tree = parse_to_tree(code)
+    return build_graph(extract_design_from_tree(tree, code).entities, parse_architecture(code))
+
+
+def test_string_table_interns_once():
+    table = StringTable(["clk", "rst"])
+    assert table.intern("clk") == 0 and table.intern("d") == 2 and len(table) == 3
+    assert table[1] == "rst" and table.lookup("q") is None
+
+
+def test_build_graph_nodes_and_fan():
+    g = _graph(CODE)
+    assert g.stats()["instances"] == 4 and g.stats()["signals"] == 2
+    s1 = g.find("chain.s1")
+    assert g.node_kind(s1) == "signal" and g.path(s1) == "chain.s1"
+    # s1: u0.y 가 구동, u1.a(위치 연결) 와 u3.a 가 읽음
+    assert g.fan_in(s1) == 1 and g.fan_out(s1) == 2
+    assert [g.path(n) for n in g.successors(s1)] == ["chain.u1.a", "chain.u3.a"]
+    assert [g.path(n) for n in g.neighbors(s1)] == ["chain.u1.a", "chain.u3.a", "chain.u0.y"]
+    y = g.find("CHAIN.U1.Y")
+    assert g.node_direction(y) == "out" and g.predecessors(y) == []
+
+
+def test_repeated_signal_name_is_one_net():
+    """generate 블록마다 같은 이름의 signal 을 선언해도 net 노드는 하나 (고아 노드 없음)."""
+    code = """
+    entity gen is port ( a : in bit ); end entity;
+    architecture rtl of gen is
+    begin
+      g0 : if true generate signal t : bit; begin end generate;
+      g1 : if false generate signal t : bit; begin end generate;
+    end architecture;
+    """
+    stats = _graph(code).stats()
+    assert stats["signals"] == 1 and stats["nodes"] == 3
+
+def test_reachability_through_instances():
+    g = _graph(CODE)
+    forward = {g.path(n) for n in g.reachable(g.find("chain.din"))}
+    assert "chain.dout" in forward and "chain.u3.y" in forward
+    assert g.find("chain.dout") not in g.reachable(g.find("chain.din"), through_instances=False)
+    assert g.reachable(g.find("chain.din"), max_depth=1) == [g.find("chain.u0.a")]
+    backward = {g.path(n) for n in g.reachable(g.find("chain.dout"), reverse=True)}
+    assert {"chain.s2", "chain.s1", "chain.din"} <= backward and "chain.u3.a" not in backward
+
+
+def test_top_project_graph():
+    """vhdl_project 전체: top 포트/signal 과 6개 인스턴스 포트가 방향대로 연결."""
+    entities, archs = [], []
+    for path in sorted((DIR / "vhdl_project").glob("*.vhd")):
+        code = path.read_text(encoding="utf-8")
+        entities += extract_design_from_tree(parse_to_tree(code), code).entities
+        archs += parse_architecture(code)
+    g = build_graph(entities, archs)
+    clk = g.find("top.CLK_50")
+    assert g.node_direction(clk) == "in" and g.fan_out(clk) == 6 and g.fan_in(clk) == 0
+    assert [g.path(n) for n in g.predecessors(g.find("top.uart_tx_s"))] == ["top.u_uart.TX"]
+    assert len(g.roots()) == len(entities)
+
+
+def test_builder_scales_in_compact_arrays():
+    """연결 20만 개: 노드·엣지 배열이 엣지당 수십 바이트 이내 (객체/dict 없이)."""
+    b = GraphBuilder()
+    root = b.add_node(NODE_ENTITY, "soc")
+    nets = [b.add_node(NODE_SIGNAL, f"n{i}", root) for i in range(1000)]
+    for i in range(50_000):
+        inst = b.add_node(NODE_INSTANCE, f"u{i}", root)
+        for j, d in enumerate(("in", "in", "in", "out")):
+            b.connect(b.add_node(NODE_PORT, "abcy"[j], inst, d), nets[(i + j) % 1000])
+    g = b.build()
+    assert g.stats()["edges"] == 1000 + 50_000 * 9
+    assert g.nbytes() / g.edge_count < 24
+    assert len(g.strings) == 1000 + 50_000 + 1 + 4
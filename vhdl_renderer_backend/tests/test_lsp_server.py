@@ -0,0 +1,192 @@
+"""
+stdio 언어 서버 테스트.
+- Content-Length 프레이밍, 증분 didChange, 버전별 캐시, 문서 심볼, 낡은 요청 처리, 진단 debounce
+"""
+import io
+import json
+from pathlib import Path
+
+try:
+    from vhdl_renderer_backend.core.lsp_server import CONTENT_MODIFIED, INVALID_REQUEST, PARSE_ERROR, LanguageServer, _PositionMap
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.lsp_server import CONTENT_MODIFIED, INVALID_REQUEST, PARSE_ERROR, LanguageServer, _PositionMap
+
+URI = "file:///work/top.vhd"
+CODE = """entity top is
+  generic ( N : integer := 4 );
+  port ( clk : in std_logic; q : out std_logic_vector(3 downto 0) );
+end entity;
+architecture rtl of top is
+  signal s : std_logic;
+begin
+  u0 : entity work.leaf port map ( a => s );
+  p_main : process (clk) begin s <= clk; end process;
+end architecture;
+"""
+
+
+def _frame(msg: dict) -> bytes:
+    body = json.dumps(msg).encode("utf-8")
+    return b"Content-Length: %d\r\n\r\n" % len(body) + body
+
+
+def _parse_frames(data: bytes) -> list:
+    out = []
+    while data:
+        header, _, rest = data.partition(b"\r\n\r\n")
+        length = int(header.split(b":")[1])
+        out.append(json.loads(rest[:length]))
+        data = rest[length:]
+    return out
+
+
+def _run(messages: list, debounce: float = 0.0) -> tuple:
+    reader = io.BytesIO(b"".join(_frame(dict(m, jsonrpc="2.0")) for m in messages))
+    writer = io.BytesIO()
+    code = LanguageServer(reader, writer, debounce=debounce).serve()
+    return code, _parse_frames(writer.getvalue())
+
+
+def _open(text: str = CODE) -> dict:
+    return {"method": "textDocument/didOpen", "params": {"textDocument": {"uri": URI, "version": 1, "text": text}}}
+
+
+def _request(msg_id: int, method: str) -> dict:
+    return {"id": msg_id, "method": method, "params": {"textDocument": {"uri": URI}}}
+
+
+def _responses(frames: list) -> dict:
+    return {f["id"]: f for f in frames if "id" in f}
+
+
+def test_position_map_utf16():
+    """LSP utf-16 character ↔ 바이트 오프셋 (한글 3바이트, 서로게이트 2 units)."""
+    src = "a\n한글x😀y\n".encode("utf-8")
+    pm = _PositionMap(src)
+    y = src.index(b"y")
+    assert pm.position(y) == {"line": 1, "character": 5}
+    assert pm.offset({"line": 1, "character": 5}) == y
+    assert pm.offset({"line": 1, "character": 99}) == src.index(b"y") + 1
+    assert _PositionMap(src, "utf-8").position(y) == {"line": 1, "character": y - 2}
+
+
+def test_lsp_session_symbols_and_incremental_change():
+    """initialize → didOpen → 쿼리 → 증분 didChange → 갱신된 포트 → shutdown/exit."""
+    port_line = CODE.splitlines()[2]
+    col = port_line.index("q : out")
+    writer = io.BytesIO()
+    server = LanguageServer(io.BytesIO(), writer, debounce=0.0)
+    for m in [
+        {"id": 1, "method": "initialize", "params": {"capabilities": {}}},
+        {"method": "initialized", "params": {}},
+        _open(),
+        _request(2, "vhdl/ports"),
+        _request(3, "textDocument/documentSymbol"),
+        {"method": "textDocument/didChange", "params": {
+            "textDocument": {"uri": URI, "version": 2},
+            "contentChanges": [{"range": {"start": {"line": 2, "character": col},
+                                          "end": {"line": 2, "character": col + 1}}, "text": "dout"}],
+        }},
+        _request(4, "vhdl/ports"),
+        _request(5, "vhdl/processes"),
+        {"id": 6, "method": "shutdown"},
+        {"method": "exit"},
+    ]:
+        server.process_batch([m])  # 메시지가 하나씩 도착하는 경우
+    server._publish_due_diagnostics()
+    frames = _parse_frames(writer.getvalue())
+    r = _responses(frames)
+    assert server._exit_code == 0
+    assert r[1]["result"]["capabilities"]["textDocumentSync"]["change"] == 2
+    assert [p["name"] for p in r[2]["result"]] == ["clk", "q"]
+    assert r[2]["result"][1]["range"]["start"]["line"] == 2
+    symbols = r[3]["result"]
+    entity, arch = symbols
+    assert (entity["name"], [c["name"] for c in entity["children"]]) == ("top", ["N", "clk", "q"])
+    assert (arch["name"], [c["name"] for c in arch["children"]]) == ("rtl", ["s", "u0", "p_main"])
+    assert [p["name"] for p in r[4]["result"]] == ["clk", "dout"]
+    assert r[5]["result"][0]["sensitivity"] == ["clk"]
+    diags = [f for f in frames if f.get("method") == "textDocument/publishDiagnostics"]
+    assert diags and diags[-1]["params"]["diagnostics"] == []
+
+
+def test_lsp_stale_request_and_diagnostics():
+    """같은 묶음에서 didChange 앞에 밀린 요청은 ContentModified, 구문 오류는 진단으로 1회 발행."""
+    broken = CODE.replace("end entity;", "end entity")
+    writer = io.BytesIO()
+    server = LanguageServer(io.BytesIO(), writer, debounce=0.0)
+    server.process_batch([
+        _open(),
+        _request(1, "vhdl/entities"),
+        {"method": "textDocument/didChange", "params": {
+            "textDocument": {"uri": URI, "version": 2}, "contentChanges": [{"text": broken}]}},
+        _request(2, "vhdl/entities"),
+        _request(3, "vhdl/unknown"),
+    ])
+    server._publish_due_diagnostics()
+    frames = _parse_frames(writer.getvalue())
+    r = _responses(frames)
+    assert r[1]["error"]["code"] == CONTENT_MODIFIED
+    assert "result" in r[2]
+    assert r[3]["error"]["code"] == -32601
+    diags = [f for f in frames if f.get("method") == "textDocument/publishDiagnostics"]
+    assert len(diags) == 1 and diags[0]["params"]["version"] == 2
+    assert diags[0]["params"]["diagnostics"]
+
+
+def test_lsp_serve_stdio_framing():
+    """Content-Length 프레임 입출력, shutdown 후 exit 면 0 / 입력 종료면 1."""
+    code, frames = _run([
+        {"id": 1, "method": "initialize", "params": {"capabilities": {"general": {"positionEncodings": ["utf-8"]}}}},
+        {"id": 2, "method": "shutdown"},
+        {"method": "exit"},
+    ])
+    assert code == 0
+    assert _responses(frames)[1]["result"]["capabilities"]["positionEncoding"] == "utf-8"
+    code, _ = _run([_open()])
+    assert code == 1
+
+
+def test_lsp_malformed_messages_do_not_stop_server():
+    """필드가 빠진 cancel/didChange, 배열 본문 각각 뒤에도 shutdown/exit 까지 처리."""
+    for bad in (
+        {"jsonrpc": "2.0", "method": "$/cancelRequest", "params": {}},
+        {"jsonrpc": "2.0", "method": "textDocument/didChange", "params": {"contentChanges": []}},
+        [{"jsonrpc": "2.0", "id": 9, "method": "shutdown"}],
+    ):
+        frames = [
+            _frame(dict(_open(), jsonrpc="2.0")), _frame(bad),
+            _frame({"jsonrpc": "2.0", "id": 1, "method": "vhdl/ports", "params": {"textDocument": {"uri": URI}}}),
+            _frame({"jsonrpc": "2.0", "id": 2, "method": "shutdown"}), _frame({"jsonrpc": "2.0", "method": "exit"}),
+        ]
+        writer = io.BytesIO()
+        code = LanguageServer(io.BytesIO(b"".join(frames)), writer, debounce=0.0).serve()
+        out = _parse_frames(writer.getvalue())
+        responses = _responses(out)
+        assert code == 0 and "result" in responses[1] and 9 not in responses
+        if isinstance(bad, list):
+            assert responses[None]["error"]["code"] == INVALID_REQUEST
+
+
+def test_lsp_bad_headers_resync_and_reader_failure():
+    """잘못된/빠진 Content-Length 는 ParseError 후 다음 헤더로 재동기화, 읽기 스레드 예외에도 serve() 가 끝난다."""
+    body = json.dumps({"jsonrpc": "2.0", "id": 7, "method": "shutdown"}).encode("utf-8")
+    for header in (b"Content-Length: abc\r\n\r\n", b"Content-Length: -5\r\n\r\n", b"Content-Type: x\r\n\r\n"):
+        data = b"".join([
+            _frame(dict(_open(), jsonrpc="2.0")), header, body,
+            _frame({"jsonrpc": "2.0", "id": 1, "method": "vhdl/ports", "params": {"textDocument": {"uri": URI}}}),
+            _frame({"jsonrpc": "2.0", "id": 2, "method": "shutdown"}), _frame({"jsonrpc": "2.0", "method": "exit"}),
+        ])
+        writer = io.BytesIO()
+        code = LanguageServer(io.BytesIO(data), writer, debounce=0.0).serve()
+        responses = _responses(_parse_frames(writer.getvalue()))
+        assert code == 0 and 7 not in responses and "result" in responses[1]
+        assert responses[None]["error"]["code"] == PARSE_ERROR
+
+    class Broken(io.BytesIO):
+        def readline(self, *args):
+            raise OSError("pipe closed")
+
+    assert LanguageServer(Broken(), io.BytesIO(), debounce=0.0).serve() == 1
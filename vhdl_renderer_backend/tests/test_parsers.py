@@ -6,12 +6,12 @@ from pathlib import Path
 
 # 프로젝트 루트에서 pytest 시 상위 경로에 backend 가 있음
 try:
-    from vhdl_renderer_backend.core import preprocess, parse_entity
+    from vhdl_renderer_backend.core import preprocess, preprocess_with_offsets, parse_entity, parse_entities
     from vhdl_renderer_backend.models import Entity, Port
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    from core import preprocess, parse_entity
+    from core import preprocess, preprocess_with_offsets, parse_entity, parse_entities
     from models import Entity, Port
 
 
@@ -32,6 +32,33 @@ def test_preprocess_preserves_entity_port():
     assert "AND_GATE" in out and "port" in out and "std_logic" in out
 
 
+def test_preprocess_literals_and_block_comments():
+    """문자열/문자 리터럴 안의 -- 와 공백 보존, VHDL-2008 블록 주석 제거, 속성 틱(') 은 리터럴 아님."""
+    raw = 's <= "a -- b  c"; -- tail\nt <= \'-\'; /* block\n comment */ n := x\'length;'
+    assert preprocess(raw) == 's <= "a -- b  c"; t <= \'-\'; n := x\'length;'
+    assert preprocess(raw, normalize_whitespace=False) == 's <= "a -- b  c"; \nt <= \'-\'; \n n := x\'length;'
+    assert preprocess("a/*x*/b") == "a b"
+
+
+def test_preprocess_offset_map_points_to_original():
+    """정제본의 모든 식별자 위치가 원문의 같은 식별자 (줄, 열) 로 대응."""
+    import re
+
+    raw = (DIR / "vhdl_project" / "top.vhd").read_text(encoding="utf-8")
+    lines = raw.split("\n")
+    for normalize in (True, False):
+        cleaned, offsets = preprocess_with_offsets(raw, normalize_whitespace=normalize)
+        assert cleaned == preprocess(raw, normalize_whitespace=normalize)
+        for m in re.finditer(r"\w+", cleaned):
+            line, col = offsets.position(m.start())
+            assert lines[line][col : col + len(m.group())] == m.group()
+        assert len(offsets) < len(cleaned) // 4
+    cleaned, offsets = preprocess_with_offsets("entity e is\n  port (a : in bit); -- x\nend;")
+    assert cleaned == "entity e is port (a : in bit); end;"
+    assert offsets.position(cleaned.index("port")) == (1, 2)
+    assert offsets.position(cleaned.index("end")) == (2, 0)
+
+
 def test_parse_entity_and_gate():
     path = DIR / "and_gate.vhd"
     if not path.exists():
@@ -86,3 +113,40 @@ def test_parse_entity_vhdl_project_top():
     assert any(p.name == "MEM_DQ" for p in inout_ports)
     assert any(p.name == "DBG_GPIO" for p in inout_ports)
     assert len(entity.ports) >= 15
+
+
+def test_parse_entities_returns_every_entity():
+    """한 파일의 entity 전부: generic, 다중 이름 포트, mode 생략(in), 리터럴/속성 안의 괄호, entity 문장부."""
+    raw = """
+    entity first is
+      generic ( W : integer := 8; INIT : std_logic_vector(3 downto 0) := (others => '0') );
+      port ( A, B : in std_logic_vector(W-1 downto 0); Y : out std_logic; EN : bit := '(' );
+    end entity first;
+    architecture rtl of first is begin end architecture;
+    entity second is
+      port ( D : inout std_logic_vector(0 to 15); Q : buffer bit );
+    begin
+      chk : process begin wait; end process;
+    end second;
+    entity third is end;
+    """
+    first, second, third = parse_entities(preprocess(raw))
+    assert [g.name for g in first.generics] == ["W", "INIT"]
+    assert first.generics[1].default == "(others => '0')" and first.generics[0].type == "integer"
+    assert [(p.name, p.direction) for p in first.ports] == [("A", "in"), ("B", "in"), ("Y", "out"), ("EN", "in")]
+    assert [(p.name, p.direction, p.width) for p in second.ports] == [("D", "inout", 16), ("Q", "buffer", 1)]
+    assert third.module_name == "third" and third.ports == []
+    assert parse_entity(preprocess(raw)).module_name == "first"
+
+
+def test_parse_entities_matches_ast_on_test_data():
+    """test_data 전체에서 AST 단일 순회 추출과 동일한 entity/port/generic."""
+    try:
+        from vhdl_renderer_backend.core.ast_parser import extract_design_from_tree, parse_to_tree
+    except ImportError:
+        from core.ast_parser import extract_design_from_tree, parse_to_tree
+    for path in sorted(DIR.rglob("*.vhd")):
+        text = path.read_text(encoding="utf-8")
+        regex = [e.to_dict() for e in parse_entities(preprocess(text))]
+        ast = [e.to_dict() for e in extract_design_from_tree(parse_to_tree(text), text).entities]
+        assert regex == ast, path.name
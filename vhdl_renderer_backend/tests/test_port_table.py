@@ -0,0 +1,82 @@
+"""
+불변·__slots__ 모델과 열 형식 PortTable 테스트.
+- Compact* 왕복·불변·문자열 공유, PortTable 조회/선택/열·JSON·CSV 내보내기, batch --ports-csv
+"""
+import csv
+import dataclasses
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+try:
+    from vhdl_renderer_backend.core.batch import run_batch
+    from vhdl_renderer_backend.main import main
+    from vhdl_renderer_backend.models import CompactEntity, Entity, Generic, Port, PortTable
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.batch import run_batch
+    from main import main
+    from models import CompactEntity, Entity, Generic, Port, PortTable
+
+DIR = Path(__file__).resolve().parent / "test_data"
+
+
+def _entity(name: str, n: int) -> Entity:
+    # 파서처럼 문자열을 매번 새로 만들어 중복 객체가 생기게 함
+    return Entity(
+        name,
+        [Port("".join(["p", str(i)]), "".join(["o", "ut"]), "".join(["std_logic", "_vector"]), 8, None) for i in range(n)]
+        + [Port("d", "in", "unsigned", 4, "W-1 downto 0")],
+        [Generic("W", "integer", "4")],
+    )
+
+
+def test_compact_entity_roundtrip_immutable_and_interned():
+    a, b = CompactEntity.from_entity(_entity("a", 3)), CompactEntity.from_entity(_entity("b", 3))
+    assert a.to_entity() == _entity("a", 3) and a.to_dict() == _entity("a", 3).to_dict()
+    assert a.ports[0].direction is b.ports[1].direction and a.ports[0].type is b.ports[2].type
+    assert not hasattr(a.ports[0], "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        a.ports[0].width = 1
+
+
+def test_port_table_columns_select_and_export():
+    table = PortTable.from_entities([_entity("a", 3), _entity("B_Ent", 2)], path="x.vhd")
+    assert len(table) == 7 and table.entity_count == 2
+    eid = table.find_entity("b_ent")
+    assert eid == 1 and list(table.ports_of(eid)) == [4, 5, 6] and table.path_of(eid) == "x.vhd"
+    assert table.compact_entity(eid).to_dict()["ports"] == _entity("B_Ent", 2).to_dict()["ports"]
+    assert table.select(direction="out", min_width=8) == [0, 1, 2, 4, 5]
+    assert table.select(type_name="unsigned") == [3, 6] and table.select(type_name="nope") == []
+    cols = table.columns()
+    assert cols["entity"][3:5] == ["a", "B_Ent"] and cols["range"][6] == "W-1 downto 0"
+    # 고유 문자열만 (방향은 코드): a, x.vhd, p0..p2, std_logic_vector, d, unsigned, W-1 downto 0, B_Ent
+    assert len(table.strings) == 10 and table.nbytes() == 7 * 21 + 2 * 8 + 3 * 4  # 포트 21B + entity 8B + offsets
+
+    restored = PortTable.from_dict(json.loads(json.dumps(table.to_dict())))
+    assert restored.columns() == cols and restored.select(direction="in") == [3, 6]
+
+    buf = io.StringIO()
+    assert table.write_csv(buf) == 7
+    rows = list(csv.reader(io.StringIO(buf.getvalue())))
+    assert rows[0] == ["entity", "path", "name", "direction", "type", "width", "range"]
+    assert rows[4] == ["a", "x.vhd", "d", "in", "unsigned", "4", "W-1 downto 0"]
+
+
+def test_batch_ports_csv_matches_results(tmp_path):
+    """batch --ports-csv: 파일별 entity 포트가 경로 순으로 열 형식 표 → CSV."""
+    project = DIR / "vhdl_project"
+    csv_path = tmp_path / "ports.csv"
+    rc = main(["batch", str(project), "-o", str(tmp_path / "out.json"), "-j", "1", "-q", "--no-cache",
+               "--ports-csv", str(csv_path)])
+    assert rc == 0
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    results = sorted(run_batch(sorted(project.glob("*.vhd")), jobs=1), key=lambda r: r.path)
+    expected = [(e.module_name, p.name, p.width) for r in results for e in r.entities for p in e.ports]
+    assert [(r["entity"], r["name"], int(r["width"])) for r in rows] == expected
+    fifo = [r for r in rows if r["entity"] == "fifo_sync" and r["name"] == "DATA_IN"]
+    assert fifo[0]["range"] == "DATA_WIDTH - 1 downto 0" and fifo[0]["width"] == "8"
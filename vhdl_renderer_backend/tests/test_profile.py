@@ -0,0 +1,76 @@
+"""
+단계별 계측 테스트.
+- 중첩 단계 경로·카운터·hook·tracemalloc 최대 메모리, 비활성 시 no-op, CLI --profile-json, 병렬 batch 워커 합산
+"""
+import json
+from pathlib import Path
+
+try:
+    from vhdl_renderer_backend.core import parse_entities, preprocess
+    from vhdl_renderer_backend.core.ast_parser import extract_design_from_tree, parse_to_tree
+    from vhdl_renderer_backend.core.batch import run_batch
+    from vhdl_renderer_backend.core.profile import Profiler, active, count, profiling, stage
+    from vhdl_renderer_backend.main import main
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core import parse_entities, preprocess
+    from core.ast_parser import extract_design_from_tree, parse_to_tree
+    from core.batch import run_batch
+    from core.profile import Profiler, active, count, profiling, stage
+    from main import main
+
+DIR = Path(__file__).resolve().parent / "test_data"
+CODE = "entity a is port ( x : in bit; y : out bit_vector(3 downto 0) ); end entity; -- c\nentity b is end entity;"
+
+
+def test_profiling_stages_counters_and_memory():
+    seen = []
+    with profiling(memory=True, hooks=[lambda path, s: seen.append(path)]) as prof:
+        entities = parse_entities(preprocess(CODE))
+        tree = parse_to_tree(CODE)
+        extract_design_from_tree(tree, CODE)
+        with stage("outer"):
+            with stage("inner"):
+                blob = [bytearray(1 << 20)]
+            count("custom", 2)
+        del blob
+    report = prof.to_dict()
+    stages = {r["stage"]: r for r in report["stages"]}
+    assert list(stages) == ["preprocess", "extract", "parse_tree", "outer/inner", "outer"]
+    assert stages["extract"]["calls"] == 2 and seen[-2:] == ["outer/inner", "outer"]
+    assert stages["outer"]["peak_bytes"] >= 1 << 20 and stages["outer/inner"]["peak_bytes"] >= 1 << 20
+    assert report["counters"] == {"entities": 4, "ports": 4, "nodes": tree.root_node.descendant_count, "custom": 2}
+    assert len(entities) == 2 and report["wall_s"] >= stages["outer"]["total_s"]
+    assert "outer" in prof.format_table() and "    inner" not in prof.format_table()
+
+    # 비활성: 전역 상태 없음, 공유 no-op
+    assert active() is None and stage("x") is stage("y")
+    count("ignored")
+
+
+def test_profiler_merge_and_parallel_batch():
+    files = sorted((DIR / "vhdl_project").glob("*.vhd"))
+    with profiling() as prof:
+        results = list(run_batch(files, jobs=2, chunk_size=2))
+    counters = prof.to_dict()["counters"]
+    assert counters["files"] == len(files) == len(results)
+    assert counters["entities"] == sum(len(r.entities) for r in results)
+    stages = {r["stage"]: r["calls"] for r in prof.to_dict()["stages"]}
+    assert stages["parse_tree"] == len(files) and stages["read"] == len(files)
+
+    merged = Profiler()
+    merged.merge(prof.to_dict())
+    merged.merge(prof.to_dict())
+    assert merged.counters["files"] == 2 * len(files) and merged.stages["read"].calls == 2 * len(files)
+
+
+def test_cli_profile_json(tmp_path, capsys):
+    src = tmp_path / "a.vhd"
+    src.write_text(CODE, encoding="utf-8")
+    report_path = tmp_path / "prof.json"
+    rc = main([str(src), "-o", str(tmp_path / "out.json"), "--no-cache", "--profile-json", str(report_path)])
+    assert rc == 0 and "preprocess" in capsys.readouterr().out
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert [r["stage"] for r in report["stages"]] == ["read", "cache", "preprocess", "extract", "export"]
+    assert report["counters"]["bytes_in"] == len(CODE.encode("utf-8")) and report["counters"]["entities"] == 2
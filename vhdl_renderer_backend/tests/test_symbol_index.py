@@ -0,0 +1,104 @@
+"""
+교차 파일 심볼 인덱스 테스트.
+- 선언/참조 추출, 정의·인스턴스 조회, 파일 단위 증분 갱신, 저장 후 재사용
+"""
+from pathlib import Path
+
+try:
+    from vhdl_renderer_backend.core.ast_parser import parse_to_tree
+    from vhdl_renderer_backend.core.symbol_index import SymbolIndex, extract_symbols
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.ast_parser import parse_to_tree
+    from core.symbol_index import SymbolIndex, extract_symbols
+
+DIR = Path(__file__).resolve().parent / "test_data"
+
+CODE = """
+library mylib; use mylib.pkg_a.all; use work.pkg_b.CONST_X;
+package pkg_b is
+  constant CONST_X : integer := 3;
+  component shared_c is port (a : in bit); end component;
+end package;
+package body pkg_b is end package body;
+entity e1 is end entity;
+architecture rtl of e1 is
+  component comp_y is port (a : in bit); end component;
+begin
+  u1 : comp_y port map (a => open);
+  u2 : entity work.e2(rtl) port map (x => open);
+  u3 : configuration work.cfg1;
+end architecture;
+configuration cfg1 of e1 is for rtl end for; end configuration;
+"""
+
+
+def test_extract_symbols_declarations_and_references():
+    decls, refs = extract_symbols(parse_to_tree(CODE), CODE)
+    assert [(d.kind, d.name, d.of) for d in decls] == [
+        ("package", "pkg_b", None),
+        ("component", "shared_c", None),
+        ("package_body", "pkg_b", None),
+        ("entity", "e1", None),
+        ("architecture", "rtl", "e1"),
+        ("component", "comp_y", "rtl"),
+        ("configuration", "cfg1", "e1"),
+    ]
+    assert [(r.kind, r.name, r.library, r.label) for r in refs] == [
+        ("package", "pkg_a", "mylib", None),
+        ("package", "pkg_b", "work", None),
+        ("entity", "e1", None, None),
+        ("component", "comp_y", None, "u1"),
+        ("entity", "e2", "work", "u2"),
+        ("configuration", "cfg1", "work", "u3"),
+        ("entity", "e1", None, None),
+    ]
+    assert refs[3].context == "rtl" and refs[3].line == 12
+
+
+def test_index_lookups_on_project():
+    """정의 파일 / 인스턴스 위치 조회 (대소문자 무시)."""
+    index = SymbolIndex()
+    stats = index.refresh([DIR / "vhdl_project"])
+    assert stats["added"] == len(index.files) and stats["unchanged"] == 0
+    assert [Path(p).name for p in index.defining_files("UART_RS232")] == ["uart_rs232.vhd"]
+    [(path, ref)] = index.instantiations("uart_rs232")
+    assert Path(path).name == "top.vhd" and ref.label == "u_uart" and ref.context == "rtl"
+    assert index.definitions("top", kind=None)[0][1].kind == "entity"
+
+
+def test_index_incremental_update_and_persistence(tmp_path):
+    """파일 1개 수정/삭제 시 그 파일 항목만 교체, 저장 후 재오픈하면 변경 없는 파일은 재파싱 없음."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "leaf.vhd").write_text("entity leaf is end entity;\n", encoding="utf-8")
+    top = src / "top.vhd"
+    top.write_text(
+        "entity top is end entity;\narchitecture a of top is begin u0 : entity work.leaf; end architecture;\n",
+        encoding="utf-8",
+    )
+    db = tmp_path / "index.sqlite3"
+    index = SymbolIndex(db)
+    index.refresh([src])
+    assert [r.label for _, r in index.instantiations("leaf")] == ["u0"]
+    index.save()
+
+    reopened = SymbolIndex(db)
+    assert reopened.refresh([src]) == {"added": 0, "updated": 0, "removed": 0, "unchanged": 2}
+
+    top.write_text(
+        "entity top is end entity;\narchitecture a of top is begin u9 : entity work.other; end architecture;\n",
+        encoding="utf-8",
+    )
+    reopened.update_file(top)
+    assert reopened.instantiations("leaf") == []
+    assert [r.label for _, r in reopened.instantiations("other")] == ["u9"]
+    (src / "leaf.vhd").unlink()
+    assert reopened.refresh([src])["removed"] == 1
+    assert reopened.defining_files("leaf") == []
+    reopened.save()
+
+    again = SymbolIndex(db)
+    assert sorted(Path(p).name for p in again.files) == ["top.vhd"]
+    assert [r.label for _, r in again.instantiations("other")] == ["u9"]
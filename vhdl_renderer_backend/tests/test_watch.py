@@ -0,0 +1,121 @@
+"""
+감시 모드 테스트.
+- polling/inotify 변경 감지, debounce 묶음, entity/port 변경분 이벤트, CLI NDJSON 출력
+"""
+import io
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+try:
+    from vhdl_renderer_backend.core.watch import PollingWatcher, WatchSession, make_watcher, wait_for_changes
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.watch import PollingWatcher, WatchSession, make_watcher, wait_for_changes
+
+ENTITY = """
+entity {name} is
+  port ( clk : in std_logic; {ports} );
+end entity;
+"""
+
+
+def _write(path: Path, name: str, ports: str) -> None:
+    path.write_text(ENTITY.format(name=name, ports=ports), encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))  # mtime 해상도와 무관하게 변경 보장
+
+
+def test_polling_watcher_detects_add_modify_remove(tmp_path):
+    a = tmp_path / "a.vhd"
+    _write(a, "a", "q : out std_logic")
+    (tmp_path / "notes.txt").write_text("x")
+    w = PollingWatcher([tmp_path])
+    assert w.files() == [str(a)]
+    assert w.poll() == set()
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    b = sub / "b.vhdl"
+    _write(b, "b", "q : out std_logic")
+    _write(a, "a", "q : out std_logic_vector(3 downto 0)")
+    assert w.poll() == {str(a), str(b)}
+    b.unlink()
+    assert w.poll() == {str(b)}
+
+
+def test_watch_session_emits_port_delta(tmp_path):
+    """수정 시 바뀐 포트만 이벤트에 포함, 내용 변화 없는 저장은 이벤트 없음."""
+    a = tmp_path / "a.vhd"
+    _write(a, "a", "q : out std_logic; r : out std_logic")
+    session = WatchSession([tmp_path], backend="poll")
+    [ev] = session.load()
+    assert ev["event"] == "added" and ev["entities"]["added"][0]["module_name"] == "a"
+
+    _write(a, "a", "q : out std_logic_vector(7 downto 0); s : in std_logic")
+    [ev] = session.apply(session.watcher.poll())
+    ports = ev["entities"]["modified"][0]["ports"]
+    assert ev["event"] == "modified"
+    assert [p["name"] for p in ports["added"]] == ["s"]
+    assert ports["removed"] == ["r"]
+    assert [(p["name"], p["width"]) for p in ports["modified"]] == [("q", 8)]
+
+    _write(a, "a", "q : out std_logic_vector(7 downto 0); s : in std_logic")
+    assert session.apply(session.watcher.poll()) == []
+
+    a.unlink()
+    [ev] = session.apply(session.watcher.poll())
+    assert ev["event"] == "removed" and ev["entities"]["removed"] == ["a"]
+
+
+@pytest.mark.parametrize("backend", ["poll", "inotify"])
+def test_wait_for_changes_debounces_burst(tmp_path, backend):
+    """짧은 간격의 연속 저장이 한 묶음으로 반환. 부하가 있어도 저장 간격(~10ms)이 debounce 를 넘지 않도록 여유를 크게 둔다."""
+    if backend == "inotify":
+        pytest.importorskip("inotify_simple")
+    files = [tmp_path / f"f{i}.vhd" for i in range(3)]
+    w = make_watcher([tmp_path], backend)
+
+    def burst():
+        time.sleep(0.05)
+        for f in files:
+            _write(f, f.stem, "q : out std_logic")
+            time.sleep(0.01)
+
+    t = threading.Thread(target=burst)
+    t.start()
+    changed = wait_for_changes(w, interval=0.02, debounce=0.5, max_delay=10.0, timeout=10.0)
+    t.join()
+    w.close()
+    assert changed == {str(f) for f in files}
+
+
+def test_wait_for_changes_ignores_wakeups_without_changes():
+    """변경 없는 통지로 깨어나도 debounce 는 마지막 변경부터 잰다 (inotify: CREATE 뒤 MODIFY/CLOSE_WRITE)."""
+
+    class Scripted(PollingWatcher):
+        def __init__(self, batches):
+            self.batches = list(batches)
+
+        def wait(self, timeout):
+            time.sleep(min(timeout, 0.005))  # 통지가 계속 와서 곧바로 깨어나는 상황
+
+        def poll(self):
+            return self.batches.pop(0) if self.batches else set()
+
+    w = Scripted([{"a"}, set(), set(), {"b"}, set()])
+    assert wait_for_changes(w, interval=0.01, debounce=0.5, max_delay=10.0) == {"a", "b"}
+
+def test_watch_session_run_writes_ndjson(tmp_path):
+    a = tmp_path / "a.vhd"
+    _write(a, "a", "q : out std_logic")
+    out = io.StringIO()
+    session = WatchSession([tmp_path], backend="poll")
+    session.run(out=out, interval=0.01, emit_initial=True, timeout=0.05)
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [ev["event"] for ev in lines] == ["added", "ready"]
+    assert lines[1]["files"] == 1